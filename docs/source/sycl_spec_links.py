@@ -53,4 +53,16 @@ sycl_ext_links = {
         "https://registry.khronos.org/SYCL/specs/sycl-2020/html/sycl-2020.html#_address_space_classes%s",
         None,
     ),
+    "sycl_sub_group": (
+        "https://registry.khronos.org/SYCL/specs/sycl-2020/html/sycl-2020.html#sub-group-class%s",
+        None,
+    ),
+    "sycl_device_event": (
+        "https://registry.khronos.org/SYCL/specs/sycl-2020/html/sycl-2020.html#sec:device-event-class%s",
+        None,
+    ),
+    "sycl_vec": (
+        "https://registry.khronos.org/SYCL/specs/sycl-2020/html/sycl-2020.html#sec:vector.type%s",
+        None,
+    ),
 }
@@ -96,7 +96,10 @@ from numba_dpex.dpnp_iface import dpnpimpl  # noqa E402
 from numba_dpex.kernel_api import NdRange, Range  # noqa E402
 
 from .core.decorators import device_func, dpjit, kernel  # noqa E402
+from .core.host_array_cache import mark_host_array_dirty  # noqa E402
+from .core.kernel_fusion import fuse  # noqa E402
 from .core.kernel_launcher import call_kernel, call_kernel_async  # noqa E402
+from .core.streaming import stream_map  # noqa E402
 from .core.targets import dpjit_target  # noqa E402
 
 load_dpctl_sycl_interface()
@@ -116,8 +119,11 @@ __all__ = types.__all__ + [
     "call_kernel_async",
     "device_func",
     "dpjit",
+    "fuse",
     "kernel",
+    "mark_host_array_dirty",
     "prange",
     "Range",
     "NdRange",
+    "stream_map",
 ]
@@ -51,7 +51,12 @@ def unbox_dpnp_nd_array(typ, obj, c):
     # FIXME : We need to check if Numba_RT as well as DPEX RT are enabled.
     if c.context.enable_nrt:
         dpexrtCtx = dpexrt.DpexRTContext(c.context)
-        errcode = dpexrtCtx.arraystruct_from_python(c.pyapi, obj, ptr)
+        errcode = dpexrtCtx.arraystruct_from_python(
+            c.pyapi,
+            obj,
+            ptr,
+            borrowed=getattr(c.context, "borrow_unboxed_args", False),
+        )
     else:
         raise UnreachableError
 
@@ -172,3 +172,125 @@ INLINE_THRESHOLD: Annotated[
     "default = 2",
     "ENVIRONMENT_FLAG: NUMBA_DPEX_INLINE_THRESHOLD",
 ] = _readenv("NUMBA_DPEX_INLINE_THRESHOLD", int, 2)
+
+HOST_ARRAY_ARGS: Annotated[
+    int,
+    "Allows NumPy arrays to be passed as arguments to numba_dpex.call_kernel. "
+    "The arrays are mirrored to USM device memory through a transfer cache, "
+    "and arrays that the kernel may write to are copied back to the host once "
+    "the kernel finishes. Unchanged read-only inputs are uploaded only once. "
+    "Writes to a host array made outside of a kernel are not detected and "
+    "have to be announced with numba_dpex.mark_host_array_dirty, otherwise "
+    "kernels keep reading the stale device copy.",
+    "default = 0",
+    "ENVIRONMENT_FLAG: NUMBA_DPEX_HOST_ARRAY_ARGS",
+] = _readenv("NUMBA_DPEX_HOST_ARRAY_ARGS", int, 0)
+
+HOST_ARRAY_CACHE_SIZE: Annotated[
+    int,
+    "Upper bound in bytes for the device copies of NumPy arrays kept by the "
+    "transfer cache of the HOST_ARRAY_ARGS mode. The least recently used "
+    "copies are dropped once the bound is exceeded.",
+    "default = 268435456",
+    "ENVIRONMENT_FLAG: NUMBA_DPEX_HOST_ARRAY_CACHE_SIZE",
+] = _readenv("NUMBA_DPEX_HOST_ARRAY_CACHE_SIZE", int, 1 << 28)
+
+REDUCTION_MAX_WORK_GROUP_SIZE: Annotated[
+    int,
+    "Upper bound for the work-group size of the kernels generated for parfor "
+    "reductions. The actual size is the largest power of two that does not "
+    "exceed this value and the maximum work-group size of the device.",
+    "default = 256",
+    "ENVIRONMENT_FLAG: NUMBA_DPEX_REDUCTION_MAX_WORK_GROUP_SIZE",
+] = _readenv("NUMBA_DPEX_REDUCTION_MAX_WORK_GROUP_SIZE", int, 256)
+
+PARFOR_ND_RANGE: Annotated[
+    int,
+    "Submits the kernels generated for parfors without reductions as "
+    "nd-range kernels. The local size of every dimension is chosen at run "
+    "time from the loop extents and the global range is padded to a multiple "
+    "of it. If set to 0, the kernels are submitted as range kernels and the "
+    "local size is left to the SYCL runtime.",
+    "default = 1",
+    "ENVIRONMENT_FLAG: NUMBA_DPEX_PARFOR_ND_RANGE",
+] = _readenv("NUMBA_DPEX_PARFOR_ND_RANGE", int, 1)
+
+PARFOR_MAX_WORK_GROUP_SIZE: Annotated[
+    int,
+    "Upper bound for the work-group size of the nd-range kernels generated "
+    "for parfors without reductions. The actual bound is the largest power of "
+    "two that does not exceed this value and the maximum work-group size of "
+    "the device.",
+    "default = 256",
+    "ENVIRONMENT_FLAG: NUMBA_DPEX_PARFOR_MAX_WORK_GROUP_SIZE",
+] = _readenv("NUMBA_DPEX_PARFOR_MAX_WORK_GROUP_SIZE", int, 256)
+
+PARFOR_HOST_THRESHOLD: Annotated[
+    int,
+    "Number of iterations below which a parfor without reductions is "
+    "executed as a serial loop on the host instead of as a kernel on the "
+    "device. Only parfors whose arrays are accessible from the host, i.e., "
+    "shared or host USM arrays or arrays on a CPU device, get a host loop. "
+    "The examples/dpjit/parfor_host_threshold.py benchmark measures the "
+    "break-even point of a device, which is a good value to set. If set to "
+    "0, parfors are always offloaded and no host loop is compiled. As the "
+    "host loop is serial, values above 65536 are capped at 65536.",
+    "default = 0",
+    "ENVIRONMENT_FLAG: NUMBA_DPEX_PARFOR_HOST_THRESHOLD",
+] = _readenv("NUMBA_DPEX_PARFOR_HOST_THRESHOLD", int, 0)
+
+REDUCTION_GROUP_BUILTINS: Annotated[
+    int,
+    "Makes the kernels generated for parfor reductions combine the values of "
+    "a work-group using SPIR-V group reduce instructions. If set to 0, or if "
+    "the reduction operator or type are not supported by the instructions, a "
+    "tree reduction in local memory is used instead.",
+    "default = 1",
+    "ENVIRONMENT_FLAG: NUMBA_DPEX_REDUCTION_GROUP_BUILTINS",
+] = _readenv("NUMBA_DPEX_REDUCTION_GROUP_BUILTINS", int, 1)
+
+REDUCTION_KHR_GROUP_BUILTINS: Annotated[
+    int,
+    "Makes the kernels generated for parfor reductions also use the SPIR-V "
+    "group reduce instructions of the SPV_KHR_uniform_group_instructions "
+    "extension, i.e., the instructions for the *=, &=, |= and ^= operators. "
+    "Only set it if the devices the reductions are offloaded to support the "
+    "extension. If set to 0, these reductions use a tree reduction in local "
+    "memory. Has no effect if REDUCTION_GROUP_BUILTINS is 0.",
+    "default = 0",
+    "ENVIRONMENT_FLAG: NUMBA_DPEX_REDUCTION_KHR_GROUP_BUILTINS",
+] = _readenv("NUMBA_DPEX_REDUCTION_KHR_GROUP_BUILTINS", int, 0)
+
+PARFOR_KERNEL_CACHE_SIZE: Annotated[
+    int,
+    "Number of compiled parfor kernels kept for reuse by structurally "
+    "identical parfors, i.e., parfors whose kernels only differ in the names "
+    "of their variables, in the same or in other dpjit functions. If set to "
+    "0, every parfor kernel is compiled anew.",
+    "default = 128",
+    "ENVIRONMENT_FLAG: NUMBA_DPEX_PARFOR_KERNEL_CACHE_SIZE",
+] = _readenv("NUMBA_DPEX_PARFOR_KERNEL_CACHE_SIZE", int, 128)
+
+APPROX_MATH_BUILTINS: Annotated[
+    str,
+    "The OpenCL builtins that float32 transcendental functions of kernels are "
+    "lowered to when the fastmath flags of the kernel allow approximate "
+    'functions, i.e., include "afn" or "fast". Set to "native" for the '
+    'native_* builtins, "half" for the half_* builtins that have about 11 '
+    "bits of precision, or an empty string to keep the full-precision "
+    "builtins.",
+    "default = native",
+    "ENVIRONMENT_FLAG: NUMBA_DPEX_APPROX_MATH_BUILTINS",
+] = _readenv("NUMBA_DPEX_APPROX_MATH_BUILTINS", str, "native")
+
+NATIVE_FP_ATOMICS: Annotated[
+    int,
+    "If set to 0, the fetch_add, fetch_sub, fetch_min and fetch_max "
+    "operations of float32 and float64 AtomicRef objects are generated as "
+    "compare-exchange loops on the bits of the values instead of the "
+    "instructions of the SPV_EXT_shader_atomic_float_add and "
+    "SPV_EXT_shader_atomic_float_min_max SPIR-V extensions. Set to 0 for "
+    "devices that do not support the extensions.",
+    "default = 1",
+    "ENVIRONMENT_FLAG: NUMBA_DPEX_NATIVE_FP_ATOMICS",
+] = _readenv("NUMBA_DPEX_NATIVE_FP_ATOMICS", int, 1)
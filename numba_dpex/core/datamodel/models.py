@@ -8,15 +8,18 @@ from numba.core.datamodel.models import OpaqueModel, PrimitiveModel, StructModel
 
 from numba_dpex.core.exceptions import UnreachableError
 from numba_dpex.core.types.kernel_api.atomic_ref import AtomicRefType
+from numba_dpex.core.types.kernel_api.device_event import DeviceEventType
 from numba_dpex.core.types.kernel_api.index_space_ids import (
     GroupType,
     ItemType,
     NdItemType,
+    SubGroupType,
 )
 from numba_dpex.core.types.kernel_api.local_accessor import (
     DpctlMDLocalAccessorType,
     LocalAccessorType,
 )
+from numba_dpex.core.types.kernel_api.vec import VecType
 from numba_dpex.kernel_api.memory_enums import AddressSpace as address_space
 
 from ..types import (
@@ -67,6 +70,39 @@ class GenericPointerModel(PrimitiveModel):
         super(GenericPointerModel, self).__init__(dmm, fe_type, be_type)
 
 
+class FloatModel(PrimitiveModel):
+    """Data model for the Float types that adds float16 to the float32 and
+    float64 types supported by Numba's FloatModel.
+
+    A float16 value is represented as an LLVM ``half``, so that arithmetic on
+    float16 values compiles to half precision instructions and arrays of
+    float16 elements can be passed to and indexed in a kernel.
+    """
+
+    def __init__(self, dmm, fe_type):
+        if fe_type == types.float16:
+            be_type = llvmir.HalfType()
+        elif fe_type == types.float32:
+            be_type = llvmir.FloatType()
+        elif fe_type == types.float64:
+            be_type = llvmir.DoubleType()
+        else:
+            raise NotImplementedError(fe_type)
+        super().__init__(dmm, fe_type, be_type)
+
+
+def host_element_type(dtype):
+    """Returns the type used for the elements of a USM array in a host
+    function.
+
+    Numba's CPU target has no data model for float16, so the elements of
+    float16 arrays are accessed as 16-bit unsigned integers of the same size
+    on the host. The arrays are only passed through host functions to the
+    kernels, whose data model manager represents float16 as an LLVM ``half``.
+    """
+    return types.uint16 if dtype == types.float16 else dtype
+
+
 class IntEnumLiteralModel(PrimitiveModel):
     """Representation of an object of LiteralIntEnum type using Numba's
     PrimitiveModel that can be represented natively in the target in all
@@ -138,12 +174,13 @@ class USMArrayHostModel(StructModel):
 
     def __init__(self, dmm, fe_type):
         ndim = fe_type.ndim
+        dtype = host_element_type(fe_type.dtype)
         members = [
-            ("meminfo", types.MemInfoPointer(fe_type.dtype)),
+            ("meminfo", types.MemInfoPointer(dtype)),
             ("parent", types.pyobject),
             ("nitems", types.intp),
             ("itemsize", types.intp),
-            ("data", types.CPointer(fe_type.dtype)),
+            ("data", types.CPointer(dtype)),
             ("sycl_queue", types.voidptr),
             ("shape", types.UniTuple(types.intp, ndim)),
             ("strides", types.UniTuple(types.intp, ndim)),
@@ -259,6 +296,35 @@ class NdRangeModel(StructModel):
         return get_flattened_member_count(self)
 
 
+class DeviceEventModel(PrimitiveModel):
+    """Data model for DeviceEventType.
+
+    A device event is represented as a pointer to the opaque ``spirv.Event``
+    struct that the LLVM IR to SPIR-V translator maps to the SPIR-V
+    ``OpTypeEvent`` type.
+    """
+
+    def __init__(self, dmm, fe_type):
+        be_type = llvmir.global_context.get_identified_type(
+            "spirv.Event"
+        ).as_pointer()
+        super().__init__(dmm, fe_type, be_type)
+
+
+class VecModel(PrimitiveModel):
+    """Data model for VecType.
+
+    A vector is represented as an LLVM vector of its elements, which the LLVM
+    IR to SPIR-V translator maps to the SPIR-V ``OpTypeVector`` type.
+    """
+
+    def __init__(self, dmm, fe_type):
+        be_type = llvmir.VectorType(
+            dmm.lookup(fe_type.dtype).get_value_type(), fe_type.count
+        )
+        super().__init__(dmm, fe_type, be_type)
+
+
 class AtomicRefModel(StructModel):
     """Data model for AtomicRefType."""
 
@@ -335,6 +401,9 @@ def _init_kernel_data_model_manager() -> datamodel.DataModelManager:
     dmm = datamodel.default_manager.copy()
     dmm.register(types.CPointer, GenericPointerModel)
 
+    # Register the Float types to support float16 values in kernels
+    dmm.register(types.Float, FloatModel)
+
     # Register the USMNdArray type to USMArrayDeviceModel in numba_dpex's data
     # model manager. The dpex_data_model_manager is used by the DpexKernelTarget
     dmm.register(USMNdArray, USMArrayDeviceModel)
@@ -364,6 +433,15 @@ def _init_kernel_data_model_manager() -> datamodel.DataModelManager:
     # Register the NdItemType type
     dmm.register(NdItemType, EmptyStructModel)
 
+    # Register the SubGroupType type
+    dmm.register(SubGroupType, EmptyStructModel)
+
+    # Register the DeviceEventType type
+    dmm.register(DeviceEventType, DeviceEventModel)
+
+    # Register the VecType type
+    dmm.register(VecType, VecModel)
+
     return dmm
 
 
@@ -400,6 +478,9 @@ def _init_dpjit_data_model_manager() -> datamodel.DataModelManager:
     # Register the NdItemType type
     dmm.register(NdItemType, EmptyStructModel)
 
+    # Register the SubGroupType type
+    dmm.register(SubGroupType, EmptyStructModel)
+
     # Register the MDLocalAccessorType type
     dmm.register(DpctlMDLocalAccessorType, DpctlMDLocalAccessorModel)
 
@@ -82,6 +82,33 @@ def kernel(function_or_signature=None, **options):
               mode. *(Default = False)*
             - **inline_threshold** (int): Specifies the level of inlining that
               the compiler should attempt. *(Default = 2)*
+            - **opt** (int): The LLVM optimization level between 0 and 3 used
+              to optimize the kernel. *(Default = NUMBA_DPEX_OPT)*
+            - **unroll** (bool): Whether loops, *e.g.*, loops with a small
+              constant trip count over a
+              :class:`numba_dpex.kernel_api.PrivateArray`, get unrolled.
+              *(Default = False)*
+            - **vectorize** (bool): Whether the LLVM loop and SLP vectorizers
+              run on the kernel. *(Default = False)*
+            - **restrict** (bool): Whether the array arguments are assumed to
+              not overlap, like C99 ``restrict`` pointers. The data pointers
+              of the arrays get the ``noalias`` attribute, so that the device
+              compiler may reorder the loads and stores of different arrays.
+              Passing overlapping arrays to such a kernel is undefined
+              behavior. *(Default = False)*
+            - **assume_aligned** (int): The power of two alignment in bytes
+              that the data of every global memory array argument is assumed
+              to have, *e.g.*, the alignment of the USM allocations of the
+              device. Views that do not start at the beginning of their
+              allocation may violate the assumption. *(Default = 0, no
+              assumption)*
+            - **fastmath** (bool, set or dict): The LLVM fast-math flags set
+              on the floating point instructions of the kernel, with the same
+              values as the ``fastmath`` option of ``numba.jit``. If the flags
+              include ``"fast"`` or ``"afn"``, float32 transcendental
+              functions use the OpenCL builtins set by
+              :data:`numba_dpex.core.config.APPROX_MATH_BUILTINS`.
+              *(Default = False)*
     Returns:
         An instance of
         :class:`numba_dpex.kernel_api_impl.spirv.dispatcher.KernelDispatcher`.
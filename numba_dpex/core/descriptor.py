@@ -47,6 +47,11 @@ class DpexTargetOptions(CPUTargetOptions):
     release_gil = _option_mapping("release_gil")
     no_compile = _option_mapping("no_compile")
     inline_threshold = _option_mapping("inline_threshold")
+    opt = _option_mapping("opt")
+    unroll = _option_mapping("unroll")
+    vectorize = _option_mapping("vectorize")
+    restrict = _option_mapping("restrict")
+    assume_aligned = _option_mapping("assume_aligned")
     _compilation_mode = _option_mapping("_compilation_mode")
     # TODO: create separate parfor kernel target
     _parfor_body_args = _option_mapping("_parfor_body_args")
@@ -62,6 +67,11 @@ class DpexTargetOptions(CPUTargetOptions):
             )
         else:
             _inherit_if_not_set(flags, options, "inline_threshold", 0)
+        _inherit_if_not_set(flags, options, "opt", config.DPEX_OPT)
+        _inherit_if_not_set(flags, options, "unroll", False)
+        _inherit_if_not_set(flags, options, "vectorize", False)
+        _inherit_if_not_set(flags, options, "restrict", False)
+        _inherit_if_not_set(flags, options, "assume_aligned", 0)
         _inherit_if_not_set(
             flags, options, "_compilation_mode", CompilationMode.KERNEL
         )
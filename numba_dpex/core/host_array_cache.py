@@ -0,0 +1,428 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Implements the transfer cache used to pass NumPy arrays to kernels.
+
+When :data:`numba_dpex.core.config.HOST_ARRAY_ARGS` is set, NumPy arrays passed
+to :func:`numba_dpex.call_kernel` are mirrored to USM device memory. The mirrors
+are cached by the address, shape, strides and dtype of the host buffer, so that
+calling a kernel repeatedly with the same read-only host inputs uploads them
+only once. Arrays that a kernel may write to are copied back to the host after
+the kernel finishes, which also keeps their mirror in sync with the host data.
+
+.. warning::
+    The cache can not observe writes made to a host array outside of a kernel.
+    Such writes have to be announced by calling
+    :func:`numba_dpex.mark_host_array_dirty`, otherwise the next kernel call
+    silently reuses the stale device copy. Comparing the host data against the
+    cached copy on every call would cost as much as uploading it again.
+
+The cache keeps at most
+:data:`numba_dpex.core.config.HOST_ARRAY_CACHE_SIZE` bytes of device copies
+and drops the least recently used ones beyond that.
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import NamedTuple
+
+import dpctl
+import dpnp
+import numpy as np
+from numba.core import ir, types
+from numba.core.compiler import run_frontend
+from numba.core.ir_utils import find_callname, guard
+
+from numba_dpex.core import config
+from numba_dpex.core.types import DpctlSyclQueue, DpnpNdArray
+
+# Attributes of an array argument that can not be used to modify the array.
+_ARRAY_METADATA_ATTRS = frozenset(
+    ("shape", "ndim", "size", "dtype", "strides", "itemsize", "nbytes")
+)
+
+# Modules whose functions never write to their array arguments.
+_PURE_CALLEE_MODULES = frozenset(("math", "cmath", "numpy", "builtins"))
+
+
+def _buffer_owner(array: np.ndarray):
+    """Returns the outermost ndarray that owns the memory of ``array``."""
+    owner = array
+    while isinstance(owner.base, np.ndarray):
+        owner = owner.base
+    return owner
+
+
+def _find_written_params(py_func) -> frozenset:
+    """Returns the indices of the parameters of ``py_func`` that the function
+    may write to.
+
+    The analysis runs on the untyped Numba IR of the function and is
+    conservative: a parameter is considered written if it, or a value derived
+    from it by indexing or attribute access, is the target of a setitem or an
+    in-place operator, or if it is passed to a call that is not known to be
+    side-effect free, *e.g.*, an ``AtomicRef`` constructor or a device function.
+    """
+    func_ir = run_frontend(py_func)
+
+    # Maps variable names to the index of the parameter they are a view of.
+    # ``elements`` additionally tracks the values obtained by indexing into a
+    # parameter, which may either be scalars or sub-arrays.
+    views = {}
+    elements = {}
+
+    stmts = [stmt for block in func_ir.blocks.values() for stmt in block.body]
+
+    changed = True
+    while changed:
+        changed = False
+        for stmt in stmts:
+            if not isinstance(stmt, ir.Assign):
+                continue
+            target, value = stmt.target.name, stmt.value
+            if target in views or target in elements:
+                continue
+            if isinstance(value, ir.Arg):
+                views[target] = value.index
+            elif isinstance(value, ir.Var) and value.name in views:
+                views[target] = views[value.name]
+            elif isinstance(value, ir.Var) and value.name in elements:
+                elements[target] = elements[value.name]
+            elif (
+                isinstance(value, ir.Expr)
+                and value.op == "getattr"
+                and value.attr not in _ARRAY_METADATA_ATTRS
+                and value.value.name in views
+            ):
+                views[target] = views[value.value.name]
+            elif (
+                isinstance(value, ir.Expr)
+                and value.op in ("getitem", "static_getitem")
+                and value.value.name in views
+            ):
+                elements[target] = views[value.value.name]
+            else:
+                continue
+            changed = True
+
+    def _param_of(var):
+        name = var.name
+        return views.get(name, elements.get(name))
+
+    written = set()
+    for stmt in stmts:
+        if isinstance(stmt, (ir.SetItem, ir.StaticSetItem)):
+            param = _param_of(stmt.target)
+            if param is not None:
+                written.add(param)
+        elif isinstance(stmt, ir.Assign) and isinstance(stmt.value, ir.Expr):
+            expr = stmt.value
+            if expr.op == "inplace_binop":
+                param = _param_of(expr.lhs)
+                if param is not None:
+                    written.add(param)
+            elif expr.op == "call":
+                callname = guard(find_callname, func_ir, expr)
+                if callname is not None and (
+                    callname[1] in _PURE_CALLEE_MODULES
+                ):
+                    continue
+                args = list(expr.args) + [v for _, v in expr.kws]
+                if expr.vararg is not None:
+                    args.append(expr.vararg)
+                for arg in args:
+                    param = _param_of(arg)
+                    if param is not None:
+                        written.add(param)
+
+    return frozenset(written)
+
+
+class _MirrorEntry(NamedTuple):
+    """A device copy of a host array together with the version of the host
+    buffer it was created from."""
+
+    mirror: dpnp.ndarray
+    version: int
+    owner_id: int
+
+
+class HostArrayTransferCache:
+    """A cache of USM device copies of NumPy arrays.
+
+    Entries are keyed by the address, shape, strides and dtype of the host
+    array and by the queue the copy was allocated on. Every buffer owner has a
+    version number that is bumped by :meth:`mark_dirty`, and an entry is reused
+    only while its version matches the current one. Entries are evicted
+    automatically once the owner of the host buffer is garbage collected, so
+    that a new array allocated at the same address never hits a stale entry.
+
+    The device copies take up at most ``max_bytes`` bytes, beyond that the
+    least recently used entries are evicted.
+
+    Args:
+        max_bytes (int, optional): The upper bound for the bytes of the cached
+            device copies. Defaults to
+            :data:`numba_dpex.core.config.HOST_ARRAY_CACHE_SIZE`.
+    """
+
+    def __init__(self, max_bytes: int = None):
+        self._lock = threading.RLock()
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._versions = {}
+        self._owner_keys = {}
+        self._written_params = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def _key(array: np.ndarray, queue: dpctl.SyclQueue):
+        return (
+            array.__array_interface__["data"][0],
+            array.shape,
+            array.strides,
+            array.dtype.str,
+            queue,
+        )
+
+    def _track_owner(self, owner, key):
+        owner_id = id(owner)
+        if owner_id not in self._owner_keys:
+            weakref.finalize(owner, self._evict_owner, owner_id)
+            self._owner_keys[owner_id] = set()
+            self._versions.setdefault(owner_id, 0)
+        self._owner_keys[owner_id].add(key)
+
+    def _evict_owner(self, owner_id):
+        with self._lock:
+            for key in self._owner_keys.pop(owner_id, ()):
+                self._drop_entry(key)
+            self._versions.pop(owner_id, None)
+
+    def _drop_entry(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._nbytes -= entry.mirror.nbytes
+        return entry
+
+    def _evict_least_recently_used(self):
+        max_bytes = self._max_bytes
+        if max_bytes is None:
+            max_bytes = config.HOST_ARRAY_CACHE_SIZE
+        while self._nbytes > max_bytes and self._entries:
+            key = next(iter(self._entries))
+            entry = self._drop_entry(key)
+            owner_keys = self._owner_keys.get(entry.owner_id)
+            if owner_keys is not None:
+                owner_keys.discard(key)
+
+    def mark_dirty(self, array: np.ndarray):
+        """Announces that the host data of ``array`` was modified, so that its
+        device copies have to be uploaded again.
+
+        Args:
+            array (numpy.ndarray): The host array, or any view of it, that was
+                written to.
+        """
+        owner_id = id(_buffer_owner(array))
+        with self._lock:
+            if owner_id in self._versions:
+                self._versions[owner_id] += 1
+
+    def to_device(
+        self, array: np.ndarray, queue: dpctl.SyclQueue
+    ) -> dpnp.ndarray:
+        """Returns a USM device copy of ``array`` allocated on ``queue``.
+
+        The copy is taken from the cache if one exists for the current version
+        of the host buffer, otherwise the array is uploaded and cached.
+
+        Args:
+            array (numpy.ndarray): The host array to mirror.
+            queue (dpctl.SyclQueue): The queue to allocate the copy on.
+
+        Returns:
+            dpnp.ndarray: A C-contiguous device copy of ``array``.
+        """
+        owner = _buffer_owner(array)
+        owner_id = id(owner)
+        key = self._key(array, queue)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            version = self._versions.get(owner_id, 0)
+            if entry is not None and entry.version == version:
+                self._entries.move_to_end(key)
+                return entry.mirror
+
+            mirror = dpnp.asarray(
+                np.ascontiguousarray(array), usm_type="device", sycl_queue=queue
+            )
+            try:
+                self._track_owner(owner, key)
+            except TypeError:
+                # The buffer owner can not be tracked, so the copy can not be
+                # safely reused later.
+                return mirror
+            self._drop_entry(key)
+            self._entries[key] = _MirrorEntry(mirror, version, owner_id)
+            self._nbytes += mirror.nbytes
+            self._evict_least_recently_used()
+            return mirror
+
+    def to_host(self, mirror: dpnp.ndarray, array: np.ndarray):
+        """Copies the data of a device copy back into its host array.
+
+        The entry of the device copy stays valid as the host and the device
+        data are identical after the copy.
+
+        Args:
+            mirror (dpnp.ndarray): The device copy returned by
+                :meth:`to_device`.
+            array (numpy.ndarray): The host array the copy was created from.
+        """
+        array[...] = dpnp.asnumpy(mirror)
+
+    def written_params(self, py_func) -> frozenset:
+        """Returns the cached result of the write analysis for a kernel
+        function."""
+        with self._lock:
+            written = self._written_params.get(py_func)
+            if written is None:
+                written = _find_written_params(py_func)
+                self._written_params[py_func] = written
+            return written
+
+    def clear(self):
+        """Drops all cached device copies."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes of the cached device copies."""
+        return self._nbytes
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_default_cache = HostArrayTransferCache()
+
+
+def get_default_cache() -> HostArrayTransferCache:
+    """Returns the transfer cache used by :func:`numba_dpex.call_kernel`."""
+    return _default_cache
+
+
+def mark_host_array_dirty(array: np.ndarray):
+    """Announces that the host data of ``array`` was modified outside of a
+    kernel.
+
+    The transfer cache of :func:`numba_dpex.call_kernel` does not detect such
+    writes, so the function has to be called after every host write to an
+    array that was already passed to a kernel. See
+    :meth:`HostArrayTransferCache.mark_dirty`.
+
+    Args:
+        array (numpy.ndarray): The host array, or any view of it, that was
+            written to.
+    """
+    _default_cache.mark_dirty(array)
+
+
+def _is_host_array(arg) -> bool:
+    return isinstance(arg, np.ndarray)
+
+
+def infer_queue(kernel_args) -> dpctl.SyclQueue:
+    """Returns the queue of the first USM array argument, so that the device
+    copies follow the compute follows data rule, or the cached queue of the
+    default device if there is no such argument.
+
+    The function is used both to type the device copies of the NumPy
+    arguments of a kernel and to allocate them, so that the two always agree.
+    """
+    for arg in kernel_args:
+        queue = getattr(arg, "sycl_queue", None)
+        if isinstance(queue, dpctl.SyclQueue):
+            return queue
+    return dpctl._sycl_queue_manager.get_device_cached_queue(
+        dpctl.select_default_device()
+    )
+
+
+def mirror_type(array_type: types.Array, queue_type: DpctlSyclQueue):
+    """Returns the Numba type of the device copy of a NumPy array.
+
+    The type only depends on the dtype and the number of dimensions of the
+    host array and on the queue, so that typing a NumPy argument does not
+    transfer it. The transfer is done by :func:`mirrored_host_arrays`.
+
+    Args:
+        array_type (numba.core.types.Array): The type of the NumPy array.
+        queue_type (DpctlSyclQueue): The type of the queue the device copy is
+            allocated on.
+
+    Returns:
+        DpnpNdArray: The type of the C-contiguous USM device copy.
+    """
+    return DpnpNdArray(
+        ndim=array_type.ndim,
+        layout="C",
+        dtype=array_type.dtype,
+        usm_type="device",
+        queue=queue_type,
+    )
+
+
+@contextmanager
+def mirrored_host_arrays(kernel_fn, kernel_args, param_offset, cache=None):
+    """Replaces the NumPy arrays in ``kernel_args`` by their device copies for
+    the duration of the ``with`` block.
+
+    On exit the device copies of the arrays that the kernel may write to are
+    copied back to the host. The copy back is skipped if the block raised.
+
+    Args:
+        kernel_fn: The kernel dispatcher that is going to be called.
+        kernel_args (tuple): The arguments passed to the kernel, excluding the
+            item or nd_item argument.
+        param_offset (int): The number of kernel parameters that precede
+            ``kernel_args``, *i.e.*, 1 for the item or nd_item argument that
+            :func:`numba_dpex.call_kernel` passes to the kernel.
+        cache (HostArrayTransferCache, optional): The cache to use. Defaults
+            to the cache returned by :func:`get_default_cache`.
+
+    Yields:
+        tuple: The kernel arguments with NumPy arrays replaced by
+        ``dpnp.ndarray`` device copies.
+    """
+    if not any(_is_host_array(arg) for arg in kernel_args):
+        yield kernel_args
+        return
+
+    if cache is None:
+        cache = _default_cache
+
+    written = cache.written_params(kernel_fn.py_func)
+
+    queue = infer_queue(kernel_args)
+    args = []
+    copy_back = []
+    for i, arg in enumerate(kernel_args):
+        if _is_host_array(arg):
+            mirror = cache.to_device(arg, queue)
+            if i + param_offset in written:
+                copy_back.append((mirror, arg))
+            arg = mirror
+        args.append(arg)
+
+    yield tuple(args)
+
+    for mirror, array in copy_back:
+        cache.to_host(mirror, array)
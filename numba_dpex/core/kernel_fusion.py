@@ -0,0 +1,242 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Implements :func:`fuse` that combines kernels launched over the same index
+space into a single kernel.
+
+The fused kernel calls the functions of the kernels one after another for the
+same work-item. Every function is compiled as a
+:func:`numba_dpex.device_func`, so that it is linked into the fused kernel and
+inlined into it if the ``inline_threshold`` option is set. Values that one
+stage stores into an array and the next stage loads from the same element are
+then forwarded in registers, and the launches of all but one kernel are saved.
+"""
+
+import inspect
+import warnings
+
+from numba_dpex.core.decorators import device_func, kernel
+from numba_dpex.kernel_api import group_barrier
+from numba_dpex.kernel_api_impl.spirv.dispatcher import SPIRVKernelDispatcher
+
+_STAGE_NAME = "_fused_stage_{}"
+_BARRIER_NAME = "_fused_group_barrier"
+_MAPPED_ITEM_NAME = "item"
+_MAPPED_ARG_NAME = "arg{}"
+
+
+def _kernel_pyfunc(kernel_or_func):
+    """Returns the Python function of a kernel dispatcher or the function
+    itself."""
+    if isinstance(kernel_or_func, SPIRVKernelDispatcher):
+        return kernel_or_func.py_func
+    if inspect.isfunction(kernel_or_func):
+        return kernel_or_func
+    raise TypeError(
+        "Expected a kernel decorated function or a Python function, but "
+        f"encountered {kernel_or_func}"
+    )
+
+
+def _kernel_params(pyfunc):
+    """Returns the names of the index space id parameter and of the other
+    parameters of a kernel function."""
+    params = list(inspect.signature(pyfunc).parameters.values())
+    for param in params:
+        if (
+            param.kind != inspect.Parameter.POSITIONAL_OR_KEYWORD
+            or param.default is not inspect.Parameter.empty
+        ):
+            raise ValueError(
+                f"Cannot fuse {pyfunc.__name__}: kernels with variadic, "
+                "keyword-only or default parameters are not supported."
+            )
+    if not params:
+        raise ValueError(
+            f"Cannot fuse {pyfunc.__name__}: a kernel has to take an Item or "
+            "NdItem as its first argument."
+        )
+    return params[0].name, [param.name for param in params[1:]]
+
+
+def _map_params_by_name(pyfuncs, item_name, stage_params):
+    """Returns the parameter names of the fused kernel and, for every stage,
+    the indices of the fused kernel parameters passed to the stage, where
+    parameters with the same name are the same argument."""
+    fused_params = []
+    stage_arg_indices = []
+    for pyfunc, params in zip(pyfuncs, stage_params):
+        if item_name in params:
+            raise ValueError(
+                f"Cannot fuse {pyfunc.__name__}: the parameter {item_name} "
+                "is the index space id of the fused kernel."
+            )
+        shared = [p for p in params if p in fused_params]
+        if shared:
+            warnings.warn(
+                f"The parameters {shared} of {pyfunc.__name__} have the same "
+                "names as parameters of a previous kernel and are passed the "
+                "same arguments by the fused kernel. Pass arg_map to fuse to "
+                "map the parameters explicitly.",
+                UserWarning,
+            )
+        fused_params.extend(p for p in params if p not in fused_params)
+        stage_arg_indices.append([fused_params.index(p) for p in params])
+    return fused_params, stage_arg_indices
+
+
+def _check_arg_map(pyfuncs, stage_params, arg_map):
+    """Checks that ``arg_map`` has a valid list of argument indices for every
+    stage and returns the number of parameters of the fused kernel."""
+    if len(arg_map) != len(pyfuncs):
+        raise ValueError(
+            f"arg_map has {len(arg_map)} entries, but {len(pyfuncs)} "
+            "kernels are fused."
+        )
+    nargs = 0
+    for pyfunc, params, indices in zip(pyfuncs, stage_params, arg_map):
+        if len(indices) != len(params):
+            raise ValueError(
+                f"Cannot fuse {pyfunc.__name__}: arg_map has {len(indices)} "
+                f"argument indices for its {len(params)} parameters."
+            )
+        for index in indices:
+            if not isinstance(index, int) or index < 0:
+                raise ValueError(
+                    f"Cannot fuse {pyfunc.__name__}: arg_map has the invalid "
+                    f"argument index {index}."
+                )
+            nargs = max(nargs, index + 1)
+    return nargs
+
+
+def _fused_source(name, item_name, fused_params, stage_arg_indices, barrier):
+    """Returns the source code of the fused kernel function."""
+    lines = [f"def {name}({', '.join([item_name] + fused_params)}):"]
+    for i, indices in enumerate(stage_arg_indices):
+        if i > 0 and barrier:
+            lines.append(f"    {_BARRIER_NAME}({item_name}.get_group())")
+        args = ", ".join([item_name] + [fused_params[j] for j in indices])
+        lines.append(f"    {_STAGE_NAME.format(i)}({args})")
+    return "\n".join(lines) + "\n"
+
+
+def fuse(*kernels, barrier=False, arg_map=None, **options):
+    """Fuses kernels that are launched one after another over the same index
+    space into a single kernel.
+
+    The fused kernel executes the kernels in the given order for each
+    work-item, *i.e.*, a work-item of the second kernel only sees the stores
+    of the first kernel made by the same work-item. If the kernels exchange
+    data between work-items, they have to be launched over an
+    :class:`numba_dpex.kernel_api.NdRange` and ``barrier`` has to be set, so
+    that the stages are separated by a
+    :func:`numba_dpex.kernel_api.group_barrier`. Data can then only be
+    exchanged within a work-group.
+
+    The arguments of the fused kernel are passed to the stages as given by
+    ``arg_map``, which has one list of argument indices per kernel. For
+    example, fusing ``scale(item, x, tmp)`` and ``shift(item, tmp, y)`` with
+    ``arg_map=[(0, 1), (1, 2)]`` results in a kernel
+    ``fused(item, arg0, arg1, arg2)``. Without ``arg_map``, the parameters of
+    the fused kernel are the union of the parameters of the kernels in the
+    order of their first appearance, where parameters with the same name are
+    the same argument, *i.e.*, ``fused(item, x, tmp, y)`` in the example. A
+    warning is emitted in that case for every kernel that reuses a parameter
+    name, as two kernels ``k(item, a, b, c)`` would silently be passed the
+    same three arrays.
+
+    The fused kernel is compiled with ``options`` only. The options the
+    kernels were decorated with, *e.g.*, ``fastmath``, are not applied to
+    their stages.
+
+    Args:
+        kernels: The :func:`numba_dpex.kernel` decorated functions or Python
+            functions to fuse.
+        barrier (bool, optional): Whether a work-group barrier separates the
+            stages. Requires the kernels to take an NdItem. Defaults to
+            False.
+        arg_map (optional): A sequence with a sequence of indices into the
+            arguments of the fused kernel, excluding the index space id, for
+            every kernel. The fused kernel takes as many arguments as the
+            largest index plus one. Defaults to None, which maps the
+            parameters by name.
+        options (optional): The options of the fused kernel, as for
+            :func:`numba_dpex.kernel`, *e.g.*, ``inline_threshold=3`` to
+            inline the stages into the fused kernel.
+
+    Returns:
+        An instance of
+        :class:`numba_dpex.kernel_api_impl.spirv.dispatcher.KernelDispatcher`
+        for the fused kernel.
+
+    Raises:
+        ValueError: If no kernels are passed, or a kernel has variadic,
+            keyword-only or default parameters, or no index space id
+            parameter, or ``arg_map`` does not match the parameters of the
+            kernels.
+        TypeError: If an argument is neither a kernel nor a function.
+
+    Example:
+
+    .. code-block:: python
+
+        import dpnp
+        import numba_dpex as dpex
+        from numba_dpex import kernel_api as kapi
+
+
+        @dpex.kernel
+        def scale(item: kapi.Item, x, tmp):
+            i = item.get_id(0)
+            tmp[i] = 2 * x[i]
+
+
+        @dpex.kernel
+        def shift(item: kapi.Item, tmp, y):
+            i = item.get_id(0)
+            y[i] = tmp[i] + 1
+
+
+        scale_shift = dpex.fuse(
+            scale, shift, arg_map=[(0, 1), (1, 2)], inline_threshold=3
+        )
+
+        x = dpnp.ones(1024)
+        tmp = dpnp.empty_like(x)
+        y = dpnp.empty_like(x)
+        dpex.call_kernel(scale_shift, dpex.Range(1024), x, tmp, y)
+    """
+    if not kernels:
+        raise ValueError("fuse expects at least one kernel.")
+
+    pyfuncs = [_kernel_pyfunc(k) for k in kernels]
+    item_names, stage_params = zip(*(_kernel_params(f) for f in pyfuncs))
+    if arg_map is None:
+        item_name = item_names[0]
+        fused_params, stage_arg_indices = _map_params_by_name(
+            pyfuncs, item_name, stage_params
+        )
+    else:
+        nargs = _check_arg_map(pyfuncs, stage_params, arg_map)
+        item_name = _MAPPED_ITEM_NAME
+        fused_params = [_MAPPED_ARG_NAME.format(i) for i in range(nargs)]
+        stage_arg_indices = [list(indices) for indices in arg_map]
+
+    name = "fused_" + "_".join(pyfunc.__name__ for pyfunc in pyfuncs)
+    # The fused function is defined in this module, so that Numba can resolve
+    # the module of its globals.
+    fn_globals = {"__name__": __name__}
+    for i, pyfunc in enumerate(pyfuncs):
+        fn_globals[_STAGE_NAME.format(i)] = device_func(pyfunc)
+    fn_globals[_BARRIER_NAME] = group_barrier
+    # pylint: disable=exec-used
+    exec(
+        _fused_source(
+            name, item_name, fused_params, stage_arg_indices, barrier
+        ),
+        fn_globals,
+    )
+
+    return kernel(**options)(fn_globals[name])
@@ -19,6 +19,10 @@ from numba.core.types.functions import Dispatcher
 from numba.extending import intrinsic
 
 from numba_dpex import dpjit
+from numba_dpex.core import config
+from numba_dpex.core.dpjit_dispatcher import DpjitDispatcher
+from numba_dpex.core.host_array_cache import mirrored_host_arrays
+from numba_dpex.core.pipelines.dpjit_compiler import DpjitCompiler
 from numba_dpex.core.targets.dpjit_target import DPEX_TARGET_NAME
 from numba_dpex.core.types import DpctlSyclEvent, NdRangeType, RangeType
 from numba_dpex.core.types.kernel_api.index_space_ids import (
@@ -251,7 +255,48 @@ def _submit_kernel(  # pylint: disable=too-many-arguments
     return sig, codegen
 
 
-@dpjit
+class _BorrowedArgsDpjitCompiler(DpjitCompiler):
+    """A DpjitCompiler that unboxes USM arrays and SYCL queues passed from
+    CPython as borrowed references.
+
+    The unboxed values do not get an NRT meminfo and the Python objects are not
+    increfed, which saves an allocation and a pair of atomic reference count
+    updates per argument. It is only safe for functions that do not let their
+    arguments escape and that do not return before all uses of the arguments
+    are finished, *i.e.*, for the synchronous :func:`call_kernel`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.state.targetctx = self.state.targetctx.subtarget(
+            borrow_unboxed_args=True
+        )
+
+
+class _CallKernelDispatcher(DpjitDispatcher):
+    """The dispatcher of :func:`call_kernel`.
+
+    Calls from CPython go through :meth:`__call__`, which mirrors NumPy array
+    arguments to USM memory when the opt-in
+    :data:`numba_dpex.core.config.HOST_ARRAY_ARGS` mode is enabled. Calls from
+    ``dpjit`` functions are compiled as any other ``dpjit`` function call.
+
+    The arguments of calls from CPython are unboxed as borrowed references by
+    :class:`_BorrowedArgsDpjitCompiler`, as the kernel has finished and the
+    arguments are no longer used once the call returns.
+    """
+
+    def __call__(self, kernel_fn, index_space, *kernel_args):
+        if not config.HOST_ARRAY_ARGS:
+            return super().__call__(kernel_fn, index_space, *kernel_args)
+
+        # The kernel receives the item or nd_item as its first argument.
+        with mirrored_host_arrays(
+            kernel_fn, kernel_args, param_offset=1
+        ) as args:
+            return super().__call__(kernel_fn, index_space, *args)
+
+
 def call_kernel(kernel_fn, index_space, *kernel_args) -> None:
     """Compiles and synchronously executes a kernel function.
 
@@ -265,7 +310,17 @@ def call_kernel(kernel_fn, index_space, *kernel_args) -> None:
         index_space (Range | NdRange): A Range or NdRange type object that
             specifies the index space for the kernel.
         kernel_args : List of objects that are passed to the numba_dpex.kernel
-            decorated function.
+            decorated function. If
+            :data:`numba_dpex.core.config.HOST_ARRAY_ARGS` is set, NumPy
+            arrays are accepted as well when ``call_kernel`` is called from
+            CPython. They are mirrored to USM device memory through
+            :mod:`numba_dpex.core.host_array_cache` and copied back after the
+            kernel finishes if the kernel may write to them.
+
+    .. warning::
+        The device copies of NumPy arrays are reused across calls. Writes to
+        such an array made on the host between two calls are not detected and
+        have to be announced with :func:`numba_dpex.mark_host_array_dirty`.
     """
     _submit_kernel_sync(  # pylint: disable=E1120
         kernel_fn,
@@ -274,6 +329,14 @@ def call_kernel(kernel_fn, index_space, *kernel_args) -> None:
     )
 
 
+call_kernel = _CallKernelDispatcher(
+    py_func=call_kernel,
+    locals={},
+    targetoptions={"nopython": True, "parallel": True},
+    pipeline_class=_BorrowedArgsDpjitCompiler,
+)
+
+
 @dpjit
 def call_kernel_async(
     kernel_fn,
@@ -0,0 +1,171 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Builds the host functions that execute small parfors on the host instead
+of submitting their kernels to a device.
+
+Submitting a kernel and waiting for it costs more than the whole computation
+of a parfor with a small iteration space. When the data of a parfor is
+accessible from the host, the parfor lowerer emits both the kernel and a host
+function for it and selects one of them at run time by comparing the number
+of iterations of the parfor against
+:data:`numba_dpex.core.config.PARFOR_HOST_THRESHOLD`, which is capped at
+:data:`MAX_PARFOR_HOST_THRESHOLD` as the host function is a serial loop.
+"""
+
+import copy
+import functools
+
+import dpctl
+from numba.core import compiler, types
+from numba.core.cpu import ParallelOptions
+
+from numba_dpex.core import config
+from numba_dpex.core.types import USMNdArray
+
+from .kernel_templates.host_loop_template import HostLoopTemplate
+from .parfor_sentinel_replace_pass import (
+    ParforBodyArguments,
+    inject_parfor_body,
+)
+
+# The host loops are serial, so that a parfor only runs on the host when its
+# iteration space is small, whatever the configured threshold is.
+MAX_PARFOR_HOST_THRESHOLD = 1 << 16
+
+
+def host_loop_threshold() -> int:
+    """Returns the number of iterations below which a parfor runs as a host
+    loop, i.e., :data:`numba_dpex.core.config.PARFOR_HOST_THRESHOLD` capped
+    at :data:`MAX_PARFOR_HOST_THRESHOLD`."""
+    return max(0, min(config.PARFOR_HOST_THRESHOLD, MAX_PARFOR_HOST_THRESHOLD))
+
+
+@functools.lru_cache
+def _is_cpu_device(device: str) -> bool:
+    """Returns True if the device with the filter string is a CPU device."""
+    return dpctl.SyclDevice(device).is_cpu
+
+
+def is_host_accessible(arg_types) -> bool:
+    """Returns True if the host can access every array of a parfor.
+
+    The allocations of shared and host USM are accessible from the host. The
+    device allocations of a CPU device are allocated in host memory as well.
+
+    Args:
+        arg_types (list): The types of the arguments of the parfor kernel.
+
+    Returns:
+        bool: True if a host function can be used for the parfor.
+    """
+    for arg_type in arg_types:
+        if not isinstance(arg_type, USMNdArray):
+            continue
+        if arg_type.usm_type in ("shared", "host"):
+            continue
+        if not _is_cpu_device(arg_type.device):
+            return False
+    return True
+
+
+def has_float16_values(arg_types) -> bool:
+    """Returns True if a parfor has float16 arrays or scalars.
+
+    Numba's CPU target has no data model for float16 values, so that parfors
+    with float16 values are only executed by their kernels.
+
+    Args:
+        arg_types (list): The types of the arguments of the parfor kernel.
+
+    Returns:
+        bool: True if an argument is a float16 value or array.
+    """
+    for arg_type in arg_types:
+        if isinstance(arg_type, USMNdArray):
+            arg_type = arg_type.dtype
+        if arg_type == types.float16:
+            return True
+    return False
+
+
+def create_host_function_for_parfor(
+    lowerer,
+    parfor_node,
+    func_params,
+    func_arg_types,
+    loop_body,
+    param_dict,
+    legal_loop_indices,
+    sentinel_name,
+    loop_extent_params,
+    loop_range_params,
+):
+    """Compiles a host function that executes a parfor as a serial loop nest.
+
+    Args:
+        lowerer: The lowerer of the function containing the parfor.
+        parfor_node: The parfor for which the host function is created.
+        func_params (list): The legalized names of the function arguments,
+            the same as the ones of the kernel of the parfor.
+        func_arg_types (list): The types of the function arguments.
+        loop_body (dict): The legalized body of the parfor. It is injected
+            into the host function, so it has to be a copy that is not shared
+            with the kernel of the parfor.
+        param_dict (dict): Maps the names of the parfor parameters to their
+            legalized names.
+        legal_loop_indices (list): The legalized names of the loop indices.
+        sentinel_name (str): The name of the sentinel variable.
+        loop_extent_params (list): The legalized names of the arguments
+            holding the extent of every loop nest.
+        loop_range_params (list): The legalized names of the start and step
+            arguments of every loop nest, or None for normalized loop nests.
+
+    Returns:
+        numba.core.compiler.CompileResult: The compiled host function.
+    """
+    func_name = "__dpex_parfor_host_%s" % (parfor_node.id)
+    template = HostLoopTemplate(
+        func_name=func_name,
+        func_params=func_params,
+        ivar_names=legal_loop_indices,
+        sentinel_name=sentinel_name,
+        loop_extent_params=loop_extent_params,
+        loop_range_params=loop_range_params,
+    )
+
+    func_ir = compiler.run_frontend(template.py_func)
+    inject_parfor_body(
+        func_ir,
+        ParforBodyArguments(
+            loop_body=loop_body,
+            param_dict=param_dict,
+            legal_loop_indices=legal_loop_indices,
+        ),
+    )
+
+    # The loop nest is executed serially, so it is not converted into parfors
+    # again. Compiling it with the parallel options of the parfor would make
+    # the dpjit pipeline offload the loop nest as a kernel once more, and the
+    # CPU target that lowers parfors to threaded loops does not support the
+    # USM array types of the arguments. Below the capped threshold, a serial
+    # loop is also cheaper than waking up a thread pool.
+    flags = copy.copy(parfor_node.flags)
+    flags.error_model = "numpy"
+    flags.auto_parallel = ParallelOptions(False)
+    flags.no_cpython_wrapper = True
+    flags.no_cfunc_wrapper = True
+
+    if config.DEBUG_ARRAY_OPT:
+        template.dump_kernel_string()
+
+    return compiler.compile_ir(
+        lowerer.context.typing_context,
+        lowerer.context,
+        func_ir,
+        tuple(func_arg_types),
+        types.none,
+        flags,
+        {},
+    )
@@ -16,21 +16,35 @@ from numba.core.ir_utils import (
     replace_var_names,
 )
 from numba.core.typing import signature
+from numba.extending import register_jitable
 from numba.parfors import parfor
+from numba.parfors.parfor_lowering_utils import ParforLoweringBuilder
 
 from numba_dpex.core import config
 from numba_dpex.core.decorators import kernel
 from numba_dpex.core.parfors.parfor_sentinel_replace_pass import (
     ParforBodyArguments,
 )
-from numba_dpex.core.types.kernel_api.index_space_ids import ItemType
+from numba_dpex.core.types import USMNdArray
+from numba_dpex.core.types.kernel_api.index_space_ids import (
+    ItemType,
+    NdItemType,
+)
 from numba_dpex.core.utils.call_kernel_builder import SPIRVKernelModule
 from numba_dpex.kernel_api_impl.spirv.dispatcher import (
     SPIRVKernelDispatcher,
     _SPIRVKernelCompileResult,
 )
 
+from .host_loop_builder import (
+    create_host_function_for_parfor,
+    has_float16_values,
+    host_loop_threshold,
+    is_host_accessible,
+)
 from .kernel_templates.range_kernel_template import RangeKernelTemplate
+from .parfor_kernel_cache import parfor_kernel_cache, parfor_kernel_fingerprint
+from .reduction_helper import _select_work_group_size
 
 
 class ParforKernel:
@@ -42,6 +56,8 @@ class ParforKernel:
         local_accessors=None,
         work_group_size=None,
         kernel_module=None,
+        host_function=None,
+        loop_extents=None,
     ):
         self.signature = signature
         self.kernel_args = kernel_args
@@ -49,6 +65,8 @@ class ParforKernel:
         self.local_accessors = local_accessors
         self.work_group_size = work_group_size
         self.kernel_module = kernel_module
+        self.host_function = host_function
+        self.loop_extents = loop_extents
 
 
 def _legalize_names_with_typemap(names, typemap):
@@ -77,6 +95,127 @@ def _to_scalar_from_0d(x):
         return x
 
 
+@register_jitable
+def _loop_trip_count(start, stop, step):
+    """Returns the number of iterations of ``range(start, stop, step)``.
+
+    Raises:
+        ValueError: If ``step`` is zero, as ``range()`` does. A constant zero
+        step is already rejected at compile time by ConvertStridedLoopPass.
+    """
+    if step == 0:
+        raise ValueError("range() arg 3 must not be zero")
+    if step > 0:
+        count = (stop - start + step - 1) // step
+    else:
+        count = (start - stop - step - 1) // -step
+    return max(count, 0)
+
+
+@register_jitable
+def _nd_range_dim(extent, budget):
+    """Returns the padded global size and the local size of a dimension of
+    an nd-range kernel for a parfor.
+
+    The local size is the smallest power of two not smaller than the extent
+    of the dimension, bounded by ``budget``, the power of two number of
+    work-items of a work-group that are left for the dimension. The global
+    size is padded to a multiple of the local size.
+    """
+    local_size = 1
+    while local_size < extent and local_size * 2 <= budget:
+        local_size *= 2
+    global_size = (extent + local_size - 1) // local_size * local_size
+    return global_size, local_size
+
+
+def _is_normalized_loop_range(start, step):
+    """Returns True if a loop starts at zero and has a unit step, i.e., if its
+    loop index is the same as its iteration number."""
+    if isinstance(start, ir.Var) or isinstance(step, ir.Var):
+        return False
+    return start == 0 and step == 1
+
+
+def _assign_loop_range_vars(lowerer, parfor_node):
+    """Assigns the start and the step of every loop nest of a parfor that is
+    not normalized to new intp variables.
+
+    The kernels generated for a parfor iterate over the normalized iteration
+    space of every loop nest, i.e., from zero to its trip count with a unit
+    step, and compute the loop index as ``start + i * step``. The variables
+    are passed to the kernels as arguments for that purpose.
+
+    Returns:
+        list: A tuple of the start and the step variables for every loop nest,
+        or None if the loop nest is already normalized.
+    """
+    scope = parfor_node.init_block.scope
+    loc = parfor_node.init_block.loc
+    pfbdr = ParforLoweringBuilder(lowerer=lowerer, scope=scope, loc=loc)
+
+    loop_range_vars = []
+    for dim, loop_nest in enumerate(parfor_node.loop_nests):
+        if _is_normalized_loop_range(loop_nest.start, loop_nest.step):
+            loop_range_vars.append(None)
+            continue
+        range_vars = []
+        for attr in ("start", "step"):
+            value = getattr(loop_nest, attr)
+            if not isinstance(value, ir.Var):
+                value = ir.Const(value, loc)
+            range_vars.append(
+                pfbdr.assign(rhs=value, typ=types.intp, name=f"{attr}{dim}")
+            )
+        loop_range_vars.append(tuple(range_vars))
+
+    return loop_range_vars
+
+
+def _assign_loop_extent_vars(lowerer, parfor_node, loop_range_vars):
+    """Assigns the extent of every loop nest of a parfor, i.e., the number of
+    iterations of its normalized iteration space, to new intp variables.
+
+    Args:
+        lowerer: The lowerer of the function containing the parfor.
+        parfor_node: The parfor whose loop nests are to be measured.
+        loop_range_vars (list): The start and step variables of every loop
+            nest as returned by :func:`_assign_loop_range_vars`.
+
+    Returns:
+        list: The extent variable of every loop nest.
+    """
+    scope = parfor_node.init_block.scope
+    loc = parfor_node.init_block.loc
+    pfbdr = ParforLoweringBuilder(lowerer=lowerer, scope=scope, loc=loc)
+
+    trip_count_fn = None
+    loop_extent_vars = []
+    for dim, loop_nest in enumerate(parfor_node.loop_nests):
+        stop = loop_nest.stop
+        if not isinstance(stop, ir.Var):
+            stop = ir.Const(stop, loc)
+        extent_var = pfbdr.assign(rhs=stop, typ=types.intp, name=f"extent{dim}")
+        if loop_range_vars[dim] is not None:
+            if trip_count_fn is None:
+                trip_count_fn = pfbdr.bind_global_function(
+                    fobj=_loop_trip_count,
+                    ftype=pfbdr._typingctx.resolve_value_type(_loop_trip_count),
+                    args=[types.intp, types.intp, types.intp],
+                )
+            start_var, step_var = loop_range_vars[dim]
+            extent_var = pfbdr.assign(
+                rhs=pfbdr.call(
+                    trip_count_fn, args=[start_var, extent_var, step_var]
+                ),
+                typ=types.intp,
+                name=f"extent{dim}",
+            )
+        loop_extent_vars.append(extent_var)
+
+    return loop_extent_vars
+
+
 def _replace_var_with_array_in_block(vars, block, typemap, calltypes):
     new_block = []
     for inst in block.body:
@@ -186,6 +325,52 @@ def create_kernel_for_parfor(
     # Reorder all the params so that inputs go first then outputs.
     parfor_params = parfor_inputs + parfor_outputs
 
+    # The start and step of the loop nests that are not normalized are passed
+    # as additional kernel arguments.
+    loop_range_vars = _assign_loop_range_vars(lowerer, parfor_node)
+    loop_range_params = [
+        None if range_vars is None else tuple(v.name for v in range_vars)
+        for range_vars in loop_range_vars
+    ]
+    for range_params in loop_range_params:
+        if range_params is not None:
+            parfor_params += list(range_params)
+
+    # Kernels are submitted as nd-range kernels when the device is known. The
+    # global range is padded to a multiple of the local range, so the kernel
+    # needs the extents of the loop nests to skip the padding work-items.
+    work_group_size = None
+    if config.PARFOR_ND_RANGE:
+        for v in parfor_params:
+            if isinstance(typemap[v], USMNdArray):
+                work_group_size = _select_work_group_size(
+                    typemap[v].device, config.PARFOR_MAX_WORK_GROUP_SIZE
+                )
+                break
+
+    # Small parfors whose arrays the host can access also get a host loop,
+    # see host_loop_builder.
+    use_host_loop = (
+        host_loop_threshold() > 0
+        and not races
+        and is_host_accessible([typemap[v] for v in parfor_params])
+        and not has_float16_values([typemap[v] for v in parfor_params])
+    )
+
+    # SYCL ranges have at most 3 dimensions, the iteration space of the
+    # remaining loop nests is linearized into the third dimension and the
+    # kernel recovers their indices using their extents.
+    loop_extent_params = None
+    if parfor_dim > 3 or work_group_size is not None or use_host_loop:
+        loop_extent_vars = _assign_loop_extent_vars(
+            lowerer, parfor_node, loop_range_vars
+        )
+        loop_extent_params = [v.name for v in loop_extent_vars]
+        if work_group_size is not None or use_host_loop:
+            parfor_params += loop_extent_params
+        else:
+            parfor_params += loop_extent_params[3:]
+
     # Some Var and loop_indices may not have legal parameter names so create a
     # dict of potentially illegal param name to guaranteed legal name.
     param_dict = _legalize_names_with_typemap(parfor_params, typemap)
@@ -196,7 +381,7 @@ def create_kernel_for_parfor(
     # Get the types of each parameter.
     param_types = [_to_scalar_from_0d(typemap[v]) for v in parfor_params]
     # Calculate types of args passed to the kernel function.
-    func_arg_types = [typemap[v] for v in (parfor_inputs + parfor_outputs)]
+    func_arg_types = [typemap[v] for v in parfor_params]
 
     # Replace illegal parameter names in the loop body with legal ones.
     replace_var_names(loop_body, param_dict)
@@ -239,30 +424,81 @@ def create_kernel_for_parfor(
         sentinel_name=sentinel_name,
         loop_ranges=loop_ranges,
         param_dict=param_dict,
+        loop_range_params=[
+            None if p is None else tuple(param_dict[v] for v in p)
+            for p in loop_range_params
+        ],
+        loop_extent_params=(
+            None
+            if loop_extent_params is None
+            else [param_dict.get(v, v) for v in loop_extent_params]
+        ),
+        nd_range=work_group_size is not None,
     )
 
-    kernel_dispatcher: SPIRVKernelDispatcher = kernel(
-        kernel_template.py_func,
-        _parfor_body_args=ParforBodyArguments(
-            loop_body=loop_body,
+    # The kernel compilation modifies the loop body in place, so the host
+    # function gets its own copy of it.
+    host_loop_body = copy.deepcopy(loop_body) if use_host_loop else None
+
+    host_function = None
+    if use_host_loop:
+        host_function = create_host_function_for_parfor(
+            lowerer,
+            parfor_node,
+            func_params=parfor_params,
+            func_arg_types=func_arg_types,
+            loop_body=host_loop_body,
             param_dict=param_dict,
             legal_loop_indices=legal_loop_indices,
-        ),
-    )
+            sentinel_name=sentinel_name,
+            loop_extent_params=[param_dict[v] for v in loop_extent_params],
+            loop_range_params=[
+                None if p is None else tuple(param_dict[v] for v in p)
+                for p in loop_range_params
+            ],
+        )
 
     # The first argument to a range kernel is a kernel_api.NdItem object. The
     # ``NdItem`` object is used by the kernel_api.spirv backend to generate the
     # correct SPIR-V indexing instructions. Since, the argument is not something
     # available originally in the kernel_param_types, we add it at this point to
     # make sure the kernel signature matches the actual generated code.
-    ty_item = ItemType(parfor_dim)
+    if work_group_size is not None:
+        ty_item = NdItemType(min(parfor_dim, 3))
+    else:
+        ty_item = ItemType(min(parfor_dim, 3))
     kernel_param_types = (ty_item, *param_types)
     kernel_sig = signature(types.none, *kernel_param_types)
 
-    kcres: _SPIRVKernelCompileResult = kernel_dispatcher.get_compile_result(
-        types.void(*kernel_param_types)  # kernel signature
+    # Structurally identical parfors, e.g., the same elementwise operation on
+    # the same types in another dpjit function, share the compiled kernel.
+    fingerprint = parfor_kernel_fingerprint(
+        kernel_template,
+        kernel_name=kernel_name,
+        kernel_params=parfor_params,
+        ivar_names=legal_loop_indices,
+        sentinel_name=sentinel_name,
+        loop_body=loop_body,
+        kernel_param_types=kernel_param_types,
+    )
+
+    def compile_kernel_module() -> SPIRVKernelModule:
+        kernel_dispatcher: SPIRVKernelDispatcher = kernel(
+            kernel_template.py_func,
+            _parfor_body_args=ParforBodyArguments(
+                loop_body=loop_body,
+                param_dict=param_dict,
+                legal_loop_indices=legal_loop_indices,
+            ),
+        )
+        kcres: _SPIRVKernelCompileResult = kernel_dispatcher.get_compile_result(
+            types.void(*kernel_param_types)  # kernel signature
+        )
+        return kcres.kernel_device_ir_module
+
+    kernel_module: SPIRVKernelModule = parfor_kernel_cache.get_or_compile(
+        fingerprint, compile_kernel_module
     )
-    kernel_module: SPIRVKernelModule = kcres.kernel_device_ir_module
 
     if config.DEBUG_ARRAY_OPT:
         print("kernel_sig = ", kernel_sig)
@@ -271,7 +507,10 @@ def create_kernel_for_parfor(
         signature=kernel_sig,
         kernel_args=parfor_args,
         kernel_arg_types=func_arg_types,
+        work_group_size=work_group_size,
         kernel_module=kernel_module,
+        host_function=host_function,
+        loop_extents=loop_extent_params,
     )
 
 
@@ -0,0 +1,131 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import sys
+
+from .kernel_template_iface import KernelTemplateInterface
+from .reduction_template import (
+    _REDOP_TO_GROUP_OP,
+    _combine_stmt,
+    _exec_kernel_txt,
+)
+
+
+class AxisReduceKernelTemplate(KernelTemplateInterface):
+    """The class to build the kernel_txt template of a kernel that reduces a
+    2D array along one of its axes, and to compile it into a Python function.
+
+    The kernel is launched with one work-group per element of the result. The
+    work-items of a work-group stride over the slice of the array that is
+    reduced into that element, accumulate it into private values and combine
+    them using a SPIR-V group reduce instruction. If the group reduce
+    instruction can not be used, the kernel has to be launched with
+    work-groups of a single work-item, which reduces the whole slice.
+    """
+
+    def __init__(
+        self, kernel_name, redop, acc_dtype, is_mean, use_group_reduce=True
+    ) -> None:
+        """Creates a new AxisReduceKernelTemplate instance.
+
+        Args:
+            kernel_name (str): The name of the kernel function.
+            redop: The reduction operator, one of ``operator.iadd``,
+                ``operator.imul``, ``min`` or ``max``.
+            acc_dtype (numba.core.types.Type): The type of the accumulated
+                values and of the result.
+            is_mean (bool): If True, the accumulated sum is divided by the
+                length of the reduced slice before it is stored.
+            use_group_reduce (bool, optional): If False, the values of the
+                work-group are not combined, as it has a single work-item.
+                Defaults to True.
+        """
+        self._kernel_name = kernel_name
+        self._use_group_reduce = use_group_reduce
+        self._redop = redop
+        self._acc_dtype = acc_dtype
+        self._is_mean = is_mean
+
+        self._kernel_txt = self._generate_kernel_stub_as_string()
+        self._py_func = self._generate_kernel_ir()
+
+    def _generate_kernel_stub_as_string(self):
+        """Generate the axis reduction kernel template.
+
+        The kernel takes the array, the result array, the axis to reduce along
+        and the length of that axis. Min and max reductions start from the
+        first element of the slice, the length of the slice is checked to be
+        positive before the kernel is launched.
+        """
+        group_op = _REDOP_TO_GROUP_OP[self._redop]
+        acc_ctor = f"dpnp.{self._acc_dtype}"
+
+        gufunc_txt = ""
+        gufunc_txt += "def " + self._kernel_name
+        gufunc_txt += "(nd_item, a, out, axis, n):\n"
+        gufunc_txt += "    group = nd_item.get_group()\n"
+        gufunc_txt += "    group_id0 = group.get_group_id(0)\n"
+        gufunc_txt += "    local_id0 = nd_item.get_local_id(0)\n"
+        gufunc_txt += "    local_size0 = group.get_local_range(0)\n"
+
+        if self._redop not in (min, max):
+            init_val = 0 if group_op == "add" else 1
+            gufunc_txt += f"    acc = {acc_ctor}({init_val})\n"
+
+        # The loops over the slice are generated for both axes, as the axis
+        # is only known at run time.
+        for cond, first, element in (
+            ("if axis == 0:", "a[0, group_id0]", "a[j, group_id0]"),
+            ("else:", "a[group_id0, 0]", "a[group_id0, j]"),
+        ):
+            gufunc_txt += f"    {cond}\n"
+            if self._redop in (min, max):
+                gufunc_txt += f"        acc = {acc_ctor}({first})\n"
+            gufunc_txt += "        j = local_id0\n"
+            gufunc_txt += "        while j < n:\n"
+            gufunc_txt += (
+                "            "
+                + _combine_stmt(self._redop, "acc", element)
+                + "\n"
+            )
+            gufunc_txt += "            j += local_size0\n"
+
+        if self._use_group_reduce:
+            gufunc_txt += f'    acc = group_reduce(group, acc, "{group_op}")\n'
+        gufunc_txt += "    if local_id0 == 0:\n"
+        result = "acc / n" if self._is_mean else "acc"
+        gufunc_txt += f"        out[group_id0] = {result}\n"
+        gufunc_txt += "    return None\n"
+
+        return gufunc_txt
+
+    def _generate_kernel_ir(self):
+        """Exec the kernel_txt string into a Python function object.
+
+        Returns: The Python function object for the kernel_txt string.
+        """
+        return _exec_kernel_txt(self._kernel_txt, self._kernel_name)
+
+    @property
+    def py_func(self):
+        """Returns the python function generated for a
+            AxisReduceKernelTemplate.
+        Returns: The python function object for the compiled kernel_txt string.
+        """
+        return self._py_func
+
+    @property
+    def kernel_string(self):
+        """Returns the function string generated for a
+            AxisReduceKernelTemplate.
+
+        Returns:
+            str: A string representing a stub axis reduction kernel function.
+        """
+        return self._kernel_txt
+
+    def dump_kernel_string(self):
+        """Helper to print the kernel function string."""
+        print(self._kernel_txt)
+        sys.stdout.flush()
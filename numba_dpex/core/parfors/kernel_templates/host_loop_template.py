@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import sys
+
+import dpnp
+
+from .kernel_template_iface import KernelTemplateInterface
+
+
+class HostLoopTemplate(KernelTemplateInterface):
+    """A template class to generate a host function that executes the
+    iteration space of a parfor as a serial loop nest.
+
+    The function takes the same arguments as the kernel generated for the
+    parfor by :class:`RangeKernelTemplate`, so that either of them can be
+    called for the parfor.
+    """
+
+    def __init__(
+        self,
+        func_name,
+        func_params,
+        ivar_names,
+        sentinel_name,
+        loop_extent_params,
+        loop_range_params,
+    ) -> None:
+        """Creates a new HostLoopTemplate instance.
+
+        Args:
+            func_name (str): The name of the host function.
+            func_params (list): A list of names of the function arguments.
+            ivar_names (list): A list of the index variables generated by Numba
+            for every loop nest of the parfor.
+            sentinel_name (str): A textual marker inserted into the function
+            to help Numba identify where to insert the parfor body.
+            loop_extent_params (list): The names of the function arguments
+            holding the extent of every loop nest.
+            loop_range_params (list): For every loop nest, either a tuple of
+            the names of the function arguments holding the start and the
+            step of the loop, or None if the loop starts at zero and has a
+            unit step.
+        """
+        self._func_name = func_name
+        self._func_params = func_params
+        self._ivar_names = ivar_names
+        self._sentinel_name = sentinel_name
+        self._loop_extent_params = loop_extent_params
+        self._loop_range_params = loop_range_params
+
+        self._kernel_txt = self._generate_kernel_stub_as_string()
+        self._py_func = self._generate_kernel_ir()
+
+    def _generate_kernel_stub_as_string(self):
+        """Generates the stub host function for the parfor as a string.
+
+        Returns:
+            str: A string representing a stub host function for the parfor.
+        """
+        func_txt = ""
+        func_txt += "def " + self._func_name
+        func_txt += "(" + ", ".join(self._func_params) + "):\n"
+
+        indent = "    "
+        for dim, extent in enumerate(self._loop_extent_params):
+            func_txt += f"{indent}for index{dim} in range({extent}):\n"
+            indent += "    "
+
+        for dim, ivar_name in enumerate(self._ivar_names):
+            index = f"index{dim}"
+            if self._loop_range_params[dim] is not None:
+                start, step = self._loop_range_params[dim]
+                index = f"{start} + {index} * {step}"
+            func_txt += f"{indent}{ivar_name} = {index}\n"
+
+        # Add the sentinel assignment so that we can find the loop body position
+        # in the IR.
+        func_txt += f"{indent}{self._sentinel_name} = 0\n"
+        func_txt += "    return None\n"
+
+        return func_txt
+
+    def _generate_kernel_ir(self):
+        """Exec the func_txt string into a Python function object.
+
+        Returns: The Python function object for the func_txt string.
+        """
+        globls = {"dpnp": dpnp}
+        locls = {}
+        exec(self._kernel_txt, globls, locls)
+        return locls[self._func_name]
+
+    @property
+    def py_func(self):
+        """Returns the python function generated for a HostLoopTemplate.
+
+        Returns: The python function object for the func_txt string.
+        """
+        return self._py_func
+
+    @property
+    def kernel_string(self):
+        """Returns the function string generated for a HostLoopTemplate.
+
+        Returns:
+            str: A string representing a stub host function for the parfor.
+        """
+        return self._kernel_txt
+
+    def dump_kernel_string(self):
+        """Helper to print the host function string."""
+        print(self._kernel_txt)
+        sys.stdout.flush()
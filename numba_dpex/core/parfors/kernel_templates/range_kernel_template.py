@@ -23,6 +23,9 @@ class RangeKernelTemplate:
         sentinel_name,
         loop_ranges,
         param_dict,
+        loop_range_params=None,
+        loop_extent_params=None,
+        nd_range=False,
     ) -> None:
         """Creates a new RangeKernelTemplate instance and stores the stub
         string and the Numba typed IR for the kernel function.
@@ -40,6 +43,18 @@ class RangeKernelTemplate:
             range dimension.
             param_dict (dict): Dictionary to lookup variable names for loop
             range attributes.
+            loop_range_params (list, optional): For every range dimension,
+            either a tuple of the names of the kernel arguments holding the
+            start and the step of the loop, or None if the loop starts at zero
+            and has a unit step.
+            loop_extent_params (list, optional): For a kernel of rank greater
+            than 3, the names of the kernel arguments holding the extents of
+            every range dimension, only the ones from the fourth dimension on
+            are used. For an nd-range kernel the extents of all dimensions
+            are used.
+            nd_range (bool, optional): If True, the kernel is generated as an
+            nd-range kernel whose global range is padded, and the work-items
+            outside of the extents of the loop nests do not execute the body.
         """
         self._kernel_name = kernel_name
         self._kernel_params = kernel_params
@@ -48,6 +63,9 @@ class RangeKernelTemplate:
         self._sentinel_name = sentinel_name
         self._loop_ranges = loop_ranges
         self._param_dict = param_dict
+        self._loop_range_params = loop_range_params or [None] * kernel_rank
+        self._loop_extent_params = loop_extent_params
+        self._nd_range = nd_range
 
         self._kernel_txt = self._generate_kernel_stub_as_string()
         self._py_func = self._generate_kernel_ir()
@@ -55,6 +73,16 @@ class RangeKernelTemplate:
     def _generate_kernel_stub_as_string(self):
         """Generates a stub dpex kernel for the parfor as a string.
 
+        SYCL ranges have at most three dimensions. For a kernel of a higher
+        rank, the third dimension of the range is the linearized iteration
+        space of all the remaining dimensions in row-major order and the loop
+        indices are recovered from it inside the kernel, so that every
+        dimension is iterated in parallel.
+
+        An nd-range kernel is launched over a global range that is padded to
+        a multiple of the local range, and the body of the kernel is guarded
+        by a check of the loop indices against the extents of the loop nests.
+
         Returns:
             str: A string representing a stub kernel function for the parfor.
         """
@@ -63,34 +91,44 @@ class RangeKernelTemplate:
         # Create the dpex kernel function.
         kernel_txt += "def " + self._kernel_name
         kernel_txt += "(item, " + (", ".join(self._kernel_params)) + "):\n"
-        global_id_dim = 0
-        for_loop_dim = self._kernel_rank
-        global_id_dim = self._kernel_rank
-
-        for dim in range(global_id_dim):
-            dimstr = str(dim)
-            kernel_txt += (
-                f"    {self._ivar_names[dim]} = item.get_id({dimstr})\n"
-            )
-
-        for dim in range(global_id_dim, for_loop_dim):
-            for indent in range(1 + (dim - global_id_dim)):
-                kernel_txt += "    "
 
-            start, stop, step = self._loop_ranges[dim]
-            st = str(self._param_dict.get(str(start), start))
-            en = str(self._param_dict.get(str(stop), stop))
-            kernel_txt += (
-                f"for {self._ivar_names[dim]} in range({st}, {en} + 1):\n"
+        get_id = "get_global_id" if self._nd_range else "get_id"
+        launch_rank = min(self._kernel_rank, 3)
+        indices = [f"item.{get_id}({dim})" for dim in range(self._kernel_rank)]
+        if self._kernel_rank > 3:
+            kernel_txt += f"    linear_id2 = item.{get_id}(2)\n"
+            for dim in range(self._kernel_rank - 1, 2, -1):
+                extent = self._loop_extent_params[dim]
+                kernel_txt += (
+                    f"    index{dim} = linear_id2 % {extent}\n"
+                    f"    linear_id2 = linear_id2 // {extent}\n"
+                )
+                indices[dim] = f"index{dim}"
+            indices[2] = "linear_id2"
+
+        indent = "    "
+        if self._nd_range:
+            for dim in range(launch_rank):
+                kernel_txt += f"    global_id{dim} = {indices[dim]}\n"
+                indices[dim] = f"global_id{dim}"
+            guard = " and ".join(
+                f"{indices[dim]} < {self._loop_extent_params[dim]}"
+                for dim in range(launch_rank)
             )
+            kernel_txt += f"    if {guard}:\n"
+            indent += "    "
 
-        for dim in range(global_id_dim, for_loop_dim):
-            for _ in range(1 + (dim - global_id_dim)):
-                kernel_txt += "    "
+        # The kernel is launched over the normalized iteration space, the trip
+        # count of every loop, and the loop index is computed from the id.
+        for dim, index in enumerate(indices):
+            if self._loop_range_params[dim] is not None:
+                start, step = self._loop_range_params[dim]
+                index = f"{start} + {index} * {step}"
+            kernel_txt += f"{indent}{self._ivar_names[dim]} = {index}\n"
 
         # Add the sentinel assignment so that we can find the loop body position
         # in the IR.
-        kernel_txt += "    "
+        kernel_txt += indent
         kernel_txt += self._sentinel_name + " = 0\n"
 
         # A kernel function does not return anything
@@ -8,9 +8,144 @@ import sys
 import dpnp
 
 import numba_dpex.kernel_api as kapi
+from numba_dpex.core import config
+from numba_dpex.kernel_api_impl.spirv.overloads._group_func_overloads import (
+    _intrinsic_group_reduce,
+)
+from numba_dpex.kernel_api_impl.spirv.overloads._spv_group_inst_helper import (
+    is_group_inst_supported,
+    is_khr_group_inst,
+)
 
 from .kernel_template_iface import KernelTemplateInterface
 
+# Reduction operators mapped to the operation of the SPIR-V group instruction
+# that combines values using the operator.
+_REDOP_TO_GROUP_OP = {
+    operator.iadd: "add",
+    operator.imul: "mul",
+    operator.iand: "and",
+    operator.ior: "or",
+    operator.ixor: "xor",
+    min: "min",
+    max: "max",
+}
+
+_REDOP_TO_INPLACE_STR = {
+    operator.iadd: "+=",
+    operator.imul: "*=",
+    operator.iand: "&=",
+    operator.ior: "|=",
+    operator.ixor: "^=",
+}
+
+
+def _combine_stmt(redop, lhs, rhs):
+    """Returns the statement that combines ``rhs`` into ``lhs`` using the
+    reduction operator."""
+    if redop in _REDOP_TO_INPLACE_STR:
+        return f"{lhs} {_REDOP_TO_INPLACE_STR[redop]} {rhs}"
+    if redop in (min, max):
+        return f"{lhs} = {redop.__name__}({lhs}, {rhs})"
+    raise NotImplementedError
+
+
+def uses_group_reduce(redop, dtype) -> bool:
+    """Returns True if the values of a reduction variable are combined inside a
+    work-group by a SPIR-V group reduce instruction, and False if they are
+    combined by a tree reduction in local memory.
+
+    The instructions of the SPV_KHR_uniform_group_instructions extension,
+    *i.e.*, the ones for the ``*=``, ``&=``, ``|=`` and ``^=`` operators, are
+    only used if ``REDUCTION_KHR_GROUP_BUILTINS`` is set, as not every device
+    supports the extension.
+
+    Args:
+        redop: The reduction operator of the reduction variable.
+        dtype (numba.core.types.Type): The type of the reduction variable.
+    """
+    group_op = _REDOP_TO_GROUP_OP.get(redop)
+    if (
+        not config.REDUCTION_GROUP_BUILTINS
+        or group_op is None
+        or not is_group_inst_supported(group_op, dtype)
+    ):
+        return False
+    return bool(config.REDUCTION_KHR_GROUP_BUILTINS) or not is_khr_group_inst(
+        group_op, dtype
+    )
+
+
+def _generate_work_group_reduce(
+    redvars, redvars_dict, parfor_reddict, typemap, local_accessors_dict
+):
+    """Generates the statements that combine the private values of the
+    reduction variables over all work-items of the work-group.
+
+    Reduction variables supported by the SPIR-V group reduce instructions are
+    combined by a ``group_reduce`` call. The others are stored into their
+    local accessor from ``local_accessors_dict`` and combined by a tree
+    reduction that halves the number of active work-items at every step.
+
+    Returns:
+        A tuple of the generated statements and of a dict that maps every
+        reduction variable to the expression evaluating to its combined value
+        in the first work-item of the work-group.
+    """
+    txt = ""
+    results = {}
+    tree_redvars = []
+    for redvar in redvars:
+        legal_redvar = redvars_dict[redvar]
+        redop = parfor_reddict[redvar].redop
+        if uses_group_reduce(redop, typemap[redvar]):
+            txt += (
+                f"    {legal_redvar} = group_reduce("
+                f'group, {legal_redvar}, "{_REDOP_TO_GROUP_OP[redop]}")\n'
+            )
+            results[redvar] = legal_redvar
+        else:
+            local_sums = local_accessors_dict[redvar]
+            txt += f"    {local_sums}[local_id0] = {legal_redvar}\n"
+            results[redvar] = f"{local_sums}[0]"
+            tree_redvars.append(redvar)
+
+    if not tree_redvars:
+        return txt, results
+
+    txt += (
+        "    stride0 = local_size0 // 2\n"
+        + "    while stride0 > 0:\n"
+        + "        kapi.group_barrier(group)\n"
+        + "        if local_id0 < stride0:\n"
+    )
+    for redvar in tree_redvars:
+        local_sums = local_accessors_dict[redvar]
+        txt += (
+            "            "
+            + _combine_stmt(
+                parfor_reddict[redvar].redop,
+                f"{local_sums}[local_id0]",
+                f"{local_sums}[local_id0 + stride0]",
+            )
+            + "\n"
+        )
+    txt += "        stride0 >>= 1\n"
+
+    return txt, results
+
+
+def _exec_kernel_txt(kernel_txt, kernel_name):
+    """Exec the kernel_txt string into a Python function object."""
+    globls = {
+        "dpnp": dpnp,
+        "kapi": kapi,
+        "group_reduce": _intrinsic_group_reduce,
+    }
+    locls = {}
+    exec(kernel_txt, globls, locls)
+    return locls[kernel_name]
+
 
 class TreeReduceIntermediateKernelTemplate(KernelTemplateInterface):
     """The class to build reduction main kernel_txt template and
@@ -31,6 +166,9 @@ class TreeReduceIntermediateKernelTemplate(KernelTemplateInterface):
         redvars_dict,
         local_accessors_dict,
         typemap,
+        total_work_name,
+        loop_extent_names,
+        loop_range_params,
     ) -> None:
         self._kernel_name = kernel_name
         self._kernel_params = kernel_params
@@ -45,105 +183,88 @@ class TreeReduceIntermediateKernelTemplate(KernelTemplateInterface):
         self._redvars_dict = redvars_dict
         self._local_accessors_dict = local_accessors_dict
         self._typemap = typemap
+        self._total_work_name = total_work_name
+        self._loop_extent_names = loop_extent_names
+        self._loop_range_params = loop_range_params
 
         self._kernel_txt = self._generate_kernel_stub_as_string()
         self._py_func = self._generate_kernel_ir()
 
     def _generate_kernel_stub_as_string(self):
-        """Generate reduction main kernel template"""
+        """Generate reduction main kernel template.
+
+        Every work-item strides over the iteration space with a stride equal
+        to the global size and accumulates the loop body into private
+        reduction variables, so that the kernel can be launched over any
+        number of work-groups. The private values of a work-group are then
+        combined, see :func:`_generate_work_group_reduce`.
+
+        The iteration space of a multi-dimensional parfor is linearized in
+        row-major order and the loop indices are recovered from the linear
+        index using the extents of the loop nests, so that consecutive
+        work-items access consecutive elements along the innermost dimension.
+        Loop nests that do not start at zero or do not have a unit step
+        iterate over their trip count and compute their loop index from it.
+        """
 
         gufunc_txt = ""
         gufunc_txt += "def " + self._kernel_name
         gufunc_txt += "(nd_item, " + (", ".join(self._kernel_params)) + "):\n"
-        global_id_dim = 0
-        for_loop_dim = self._parfor_dim
-
-        if self._parfor_dim > 3:
-            raise NotImplementedError
-        else:
-            global_id_dim = self._parfor_dim
 
         gufunc_txt += "    group = nd_item.get_group()\n"
-        for dim in range(global_id_dim):
-            dstr = str(dim)
-            gufunc_txt += (
-                f"    {self._ivar_names[dim]} = nd_item.get_global_id({dstr})\n"
-            )
-            gufunc_txt += f"    local_id{dim} = nd_item.get_local_id({dstr})\n"
-            gufunc_txt += (
-                f"    local_size{dim} = group.get_local_range({dstr})\n"
-            )
-            gufunc_txt += f"    group_id{dim} = group.get_group_id({dstr})\n"
-
-        for dim in range(global_id_dim, for_loop_dim):
-            for indent in range(1 + (dim - global_id_dim)):
-                gufunc_txt += "    "
-
-            start, stop, step = self._loop_ranges[dim]
-            st = str(self._param_dict.get(str(start), start))
-            en = str(self._param_dict.get(str(stop), stop))
-            gufunc_txt += (
-                f"for {self._ivar_names[dim]} in range({st}, {en} + 1):\n"
-            )
+        gufunc_txt += "    local_id0 = nd_item.get_local_id(0)\n"
+        gufunc_txt += "    local_size0 = group.get_local_range(0)\n"
+        gufunc_txt += "    group_id0 = group.get_group_id(0)\n"
+        gufunc_txt += "    global_size0 = nd_item.get_global_range(0)\n"
 
-        for dim in range(global_id_dim, for_loop_dim):
-            for indent in range(1 + (dim - global_id_dim)):
-                gufunc_txt += "    "
-        # Add the sentinel assignment so that we can find the loop body position
-        # in the IR.
         for redvar in self._redvars:
             legal_redvar = self._redvars_dict[redvar]
             gufunc_txt += "    "
             gufunc_txt += legal_redvar + " = "
             gufunc_txt += f"{self._parfor_reddict[redvar].init_val} \n"
 
-        gufunc_txt += "    "
-        gufunc_txt += self._sentinel_name + " = 0\n"
-
-        # Generate local_sum[local_id0] = redvar, for each reduction variable
-        for redvar in self._redvars:
-            legal_redvar = self._redvars_dict[redvar]
-            gufunc_txt += (
-                "    "
-                + f"local_sums_{legal_redvar}[local_id0] = {legal_redvar}\n"
-            )
-
-        gufunc_txt += (
-            "    stride0 = local_size0 // 2\n"
-            + "    while stride0 > 0:\n"
-            + "        kapi.group_barrier(group)\n"
-            + "        if local_id0 < stride0:\n"
-        )
-
-        for redvar in self._redvars:
-            redop = self._parfor_reddict[redvar].redop
-            redvar_legal = self._redvars_dict[redvar]
-            if redop == operator.iadd:
-                gufunc_txt += (
-                    "            "
-                    f"local_sums_{redvar_legal}[local_id0] "
-                    f"+= local_sums_{redvar_legal}[local_id0 + stride0]\n"
-                )
-            elif redop == operator.imul:
+        gufunc_txt += "    global_id0 = nd_item.get_global_id(0)\n"
+        gufunc_txt += f"    while global_id0 < {self._total_work_name}:\n"
+        if self._parfor_dim == 1:
+            indices = ["global_id0"]
+        else:
+            gufunc_txt += "        linear_id0 = global_id0\n"
+            indices = [None] * self._parfor_dim
+            for dim in range(self._parfor_dim - 1, 0, -1):
+                extent = self._loop_extent_names[dim]
                 gufunc_txt += (
-                    "            "
-                    f"local_sums_{redvar_legal}[local_id0] "
-                    f"*= local_sums_{redvar_legal}[local_id0 + stride0]\n"
+                    f"        index{dim} = linear_id0 % {extent}\n"
+                    f"        linear_id0 = linear_id0 // {extent}\n"
                 )
-            else:
-                raise NotImplementedError
+                indices[dim] = f"index{dim}"
+            indices[0] = "linear_id0"
+        for dim, index in enumerate(indices):
+            if self._loop_range_params[dim] is not None:
+                start, step = self._loop_range_params[dim]
+                index = f"{start} + {index} * {step}"
+            gufunc_txt += f"        {self._ivar_names[dim]} = {index}\n"
+        # Add the sentinel assignment so that we can find the loop body position
+        # in the IR.
+        gufunc_txt += "        " + self._sentinel_name + " = 0\n"
+        gufunc_txt += "        global_id0 += global_size0\n"
+
+        work_group_reduce_txt, results = _generate_work_group_reduce(
+            self._redvars,
+            self._redvars_dict,
+            self._parfor_reddict,
+            self._typemap,
+            self._local_accessors_dict,
+        )
+        gufunc_txt += work_group_reduce_txt
 
-        gufunc_txt += "        stride0 >>= 1\n"
         gufunc_txt += "    if local_id0 == 0:\n"
         for redvar in self._redvars:
             for i, arg in enumerate(self._parfor_args):
                 if arg == redvar:
                     partial_sum_var = self._kernel_params[i]
-                    redvar_legal = self._redvars_dict[redvar]
                     gufunc_txt += (
                         "        "
-                        f"{partial_sum_var}[group_id0] = "
-                        f"local_sums_{redvar_legal}[0]\n"
+                        f"{partial_sum_var}[group_id0] = {results[redvar]}\n"
                     )
 
         gufunc_txt += "    return None\n"
@@ -157,10 +278,7 @@ class TreeReduceIntermediateKernelTemplate(KernelTemplateInterface):
         Returns: The Numba functionIR object for the compiled kernel_txt string.
 
         """
-        globls = {"dpnp": dpnp, "kapi": kapi}
-        locls = {}
-        exec(self._kernel_txt, globls, locls)
-        return locls[self._kernel_name]
+        return _exec_kernel_txt(self._kernel_txt, self._kernel_name)
 
     @property
     def py_func(self):
@@ -187,116 +305,102 @@ class TreeReduceIntermediateKernelTemplate(KernelTemplateInterface):
         sys.stdout.flush()
 
 
-class RemainderReduceIntermediateKernelTemplate(KernelTemplateInterface):
-    """The class to build reduction remainder kernel_txt template and
-    compiled Numba functionIR.
+class TreeReduceFinalKernelTemplate(KernelTemplateInterface):
+    """The class to build the kernel_txt template of the final reduction
+    kernel that combines the partial sums of all work-groups of the reduction
+    main kernel, and to compile it into a Python function.
+
+    The kernel is launched as a single work-group. Every work-item
+    accumulates a strided subset of the partial sums and the work-group then
+    reduces the accumulated values, see :func:`_generate_work_group_reduce`.
     """
 
     def __init__(
         self,
         kernel_name,
-        kernel_params,
-        sentinel_name,
         redvars,
         parfor_reddict,
         redvars_dict,
         typemap,
-        legal_loop_indices,
-        global_size_var_name,
-        global_size_mod_var_name,
-        partial_sum_size_var_name,
         partial_sum_var_name,
+        partial_sum_size_var_name,
         final_sum_var_name,
-        reductionKernelVar,
+        local_accessors_dict,
     ) -> None:
         self._kernel_name = kernel_name
-        self._kernel_params = kernel_params
-        self._sentinel_name = sentinel_name
         self._redvars = redvars
         self._parfor_reddict = parfor_reddict
         self._redvars_dict = redvars_dict
         self._typemap = typemap
-        self._legal_loop_indices = legal_loop_indices
-        self._global_size_var_name = global_size_var_name
-        self._global_size_mod_var_name = global_size_mod_var_name
-        self._partial_sum_size_var_name = partial_sum_size_var_name
         self._partial_sum_var_name = partial_sum_var_name
+        self._partial_sum_size_var_name = partial_sum_size_var_name
         self._final_sum_var_name = final_sum_var_name
-        self._reductionKernelVar = reductionKernelVar
+        self._local_accessors_dict = local_accessors_dict
 
         self._kernel_txt = self._generate_kernel_stub_as_string()
         self._py_func = self._generate_kernel_ir()
 
+    @property
+    def kernel_params(self):
+        """Returns the names of the kernel parameters, excluding the leading
+        nd_item parameter, in the order of the kernel signature."""
+        return (
+            self._partial_sum_var_name
+            + [self._partial_sum_size_var_name]
+            + self._final_sum_var_name
+            + list(self._local_accessors_dict.values())
+        )
+
     def _generate_kernel_stub_as_string(self):
-        """Generate reduction remainder kernel template"""
+        """Generate reduction final kernel template"""
 
         gufunc_txt = ""
         gufunc_txt += "def " + self._kernel_name
-        gufunc_txt += "(" + (", ".join(self._kernel_params))
-
-        for i in range(len(self._redvars)):
-            gufunc_txt += (
-                ", "
-                + f"{self._global_size_var_name[i]}, "
-                + f"{self._global_size_mod_var_name[i]}, "
-            )
-            gufunc_txt += (
-                f"{self._partial_sum_size_var_name[i]}, "
-                + f"{self._final_sum_var_name[i]}"
-            )
-
-        gufunc_txt += "):\n"
-
-        gufunc_txt += "    "
+        gufunc_txt += "(nd_item, " + (", ".join(self.kernel_params)) + "):\n"
 
-        gufunc_txt += (
-            "for j" + f" in range({self._partial_sum_size_var_name[0]}):\n"
-        )
-
-        for i, redvar in enumerate(self._redvars):
-            redop = self._parfor_reddict[redvar].redop
-            if redop == operator.iadd:
-                gufunc_txt += f"        {self._final_sum_var_name[i]}[0] += \
-                    {self._partial_sum_var_name[i]}[j]\n"
-            elif redop == operator.imul:
-                gufunc_txt += f"        {self._final_sum_var_name[i]}[0] *= \
-                    {self._partial_sum_var_name[i]}[j]\n"
-            else:
-                raise NotImplementedError
-
-        gufunc_txt += (
-            f"    for j in range ({self._global_size_mod_var_name[0]}) :\n"
-        )
+        gufunc_txt += "    group = nd_item.get_group()\n"
+        gufunc_txt += "    local_id0 = nd_item.get_local_id(0)\n"
+        gufunc_txt += "    local_size0 = group.get_local_range(0)\n"
 
         for redvar in self._redvars:
             rtyp = str(self._typemap[redvar])
             legal_redvar = self._redvars_dict[redvar]
-            gufunc_txt += "        "
-            gufunc_txt += legal_redvar + " = "
             gufunc_txt += (
+                f"    {legal_redvar} = "
                 f"dpnp.{rtyp}({self._parfor_reddict[redvar].init_val})\n"
             )
 
-        gufunc_txt += (
-            "        "
-            + self._legal_loop_indices[0]
-            + " = "
-            + f"{self._global_size_var_name[0]} + j\n"
+        gufunc_txt += "    j = local_id0\n"
+        gufunc_txt += f"    while j < {self._partial_sum_size_var_name}:\n"
+        for i, redvar in enumerate(self._redvars):
+            gufunc_txt += (
+                "        "
+                + _combine_stmt(
+                    self._parfor_reddict[redvar].redop,
+                    self._redvars_dict[redvar],
+                    f"{self._partial_sum_var_name[i]}[j]",
+                )
+                + "\n"
+            )
+        gufunc_txt += "        j += local_size0\n"
+
+        work_group_reduce_txt, results = _generate_work_group_reduce(
+            self._redvars,
+            self._redvars_dict,
+            self._parfor_reddict,
+            self._typemap,
+            self._local_accessors_dict,
         )
+        gufunc_txt += work_group_reduce_txt
 
-        gufunc_txt += "        " + self._sentinel_name + " = 0\n"
-
+        gufunc_txt += "    if local_id0 == 0:\n"
         for i, redvar in enumerate(self._redvars):
-            legal_redvar = self._redvars_dict[redvar]
-            redop = self._parfor_reddict[redvar].redop
-            if redop == operator.iadd:
-                gufunc_txt += f"        {self._final_sum_var_name[i]}[0] +=  \
-                    {legal_redvar}\n"
-            elif redop == operator.imul:
-                gufunc_txt += f"        {self._final_sum_var_name[i]}[0] *=  \
-                    {legal_redvar}\n"
-            else:
-                raise NotImplementedError
+            gufunc_txt += (
+                f"        {self._final_sum_var_name[i]}[0] = "
+                f"{results[redvar]}\n"
+            )
+
+        gufunc_txt += "    return None\n"
 
         return gufunc_txt
 
@@ -308,15 +412,12 @@ class RemainderReduceIntermediateKernelTemplate(KernelTemplateInterface):
 
         """
 
-        globls = {"dpnp": dpnp, "kapi": kapi}
-        locls = {}
-        exec(self._kernel_txt, globls, locls)
-        return locls[self._kernel_name]
+        return _exec_kernel_txt(self._kernel_txt, self._kernel_name)
 
     @property
     def py_func(self):
         """Returns the python function generated for a
-            TreeReduceIntermediateKernelTemplate.
+            TreeReduceFinalKernelTemplate.
         Returns: The python function object for the compiled kernel_txt string.
         """
         return self._py_func
@@ -324,7 +425,7 @@ class RemainderReduceIntermediateKernelTemplate(KernelTemplateInterface):
     @property
     def kernel_string(self):
         """Returns the function string generated for a
-            RemainderReduceIntermediateKernelTemplate.
+            TreeReduceFinalKernelTemplate.
 
         Returns:
             str: A string representing a stub reduction kernel function
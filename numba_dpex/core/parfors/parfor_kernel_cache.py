@@ -0,0 +1,244 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Reuses the SPIR-V modules of structurally identical parfor kernels.
+
+Every parfor is compiled into its own kernel from a generated Python stub and
+the parfor body. Many of these kernels are identical up to the names of their
+variables, *e.g.*, the same elementwise ``a + b`` on arrays of the same types
+in two dpjit functions or in two specializations of a function. The kernel
+builders compute a structural fingerprint of the kernel stub, the parfor body
+and the argument types with :func:`parfor_kernel_fingerprint`, and look up the
+compiled :class:`SPIRVKernelModule` in :data:`parfor_kernel_cache` before
+compiling a new one.
+
+The size of the cache is set by
+:data:`numba_dpex.core.config.PARFOR_KERNEL_CACHE_SIZE`.
+"""
+
+import copy
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Callable, NamedTuple
+
+from numba.core import ir, targetconfig
+from numba.core.ir_utils import replace_var_names
+
+from numba_dpex.core import config
+from numba_dpex.core.utils.call_kernel_builder import SPIRVKernelModule
+
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+class ParforKernelFingerprint(NamedTuple):
+    """The structural fingerprint of a parfor kernel.
+
+    Attributes:
+        key (tuple): A digest of the canonical form of the kernel and the
+            types of its parameters.
+        referents (tuple): The global and free variable values used by the
+            parfor body. The identity of these values is part of the key, so
+            the cache keeps them alive for as long as it keeps the module.
+    """
+
+    key: tuple
+    referents: tuple
+
+
+def _canonical_template_text(kernel_string, name_map):
+    """Returns the kernel stub with the names in ``name_map`` replaced."""
+    return _IDENTIFIER.sub(
+        lambda m: name_map.get(m.group(0), m.group(0)), kernel_string
+    )
+
+
+def _canonical_body_text(loop_body, name_map, referents):
+    """Returns the parfor body as text with its variables and labels numbered
+    in the order of their first use.
+
+    The values of the global and free variables of the body are appended to
+    ``referents``.
+    """
+    labels = sorted(loop_body.keys())
+    label_map = {label: i for i, label in enumerate(labels)}
+
+    var_map = dict(name_map)
+    for label in labels:
+        for stmt in loop_body[label].body:
+            for var in stmt.list_vars():
+                if var.name not in var_map:
+                    var_map[var.name] = "$fp_v%d" % len(var_map)
+
+    body = copy.deepcopy(loop_body)
+    replace_var_names(body, var_map)
+
+    lines = []
+    for label in labels:
+        lines.append("label %d:" % label_map[label])
+        for stmt in body[label].body:
+            if isinstance(stmt, ir.Jump):
+                lines.append("jump %d" % label_map.get(stmt.target, -1))
+            elif isinstance(stmt, ir.Branch):
+                lines.append(
+                    "branch %s, %d, %d"
+                    % (
+                        stmt.cond,
+                        label_map.get(stmt.truebr, -1),
+                        label_map.get(stmt.falsebr, -1),
+                    )
+                )
+            else:
+                if isinstance(stmt, ir.Assign) and isinstance(
+                    stmt.value, (ir.Global, ir.FreeVar)
+                ):
+                    referents.append(stmt.value.value)
+                    lines.append("%s [%x]" % (stmt, id(stmt.value.value)))
+                    continue
+                lines.append(str(stmt))
+    return "\n".join(lines)
+
+
+def _compile_options_key():
+    """Returns the options that the kernel inherits from the function being
+    compiled and from the configuration."""
+    top = targetconfig.ConfigStack.top_or_none()
+    fastmath = getattr(top, "fastmath", None)
+    return (
+        tuple(sorted(fastmath.flags)) if fastmath else (),
+        getattr(top, "debuginfo", None),
+        getattr(top, "boundscheck", None),
+        getattr(top, "error_model", None),
+        getattr(top, "inline_threshold", None),
+        getattr(top, "opt", None),
+        getattr(top, "unroll", None),
+        getattr(top, "vectorize", None),
+        getattr(top, "restrict", None),
+        getattr(top, "assume_aligned", None),
+        config.DEBUGINFO_DEFAULT,
+        config.DPEX_OPT,
+        config.INLINE_THRESHOLD,
+        config.APPROX_MATH_BUILTINS,
+    )
+
+
+def parfor_kernel_fingerprint(
+    kernel_template,
+    kernel_name,
+    kernel_params,
+    ivar_names,
+    sentinel_name,
+    loop_body,
+    kernel_param_types,
+) -> ParforKernelFingerprint:
+    """Computes the structural fingerprint of a parfor kernel.
+
+    The names of the kernel, its parameters, the loop indices and the
+    variables of the parfor body are replaced by positional names, so that
+    kernels that only differ in these names get the same fingerprint.
+
+    Args:
+        kernel_template: The template the kernel stub was generated with.
+        kernel_name (str): The name of the kernel function.
+        kernel_params (list): The names of the kernel parameters.
+        ivar_names (list): The names of the loop indices.
+        sentinel_name (str): The name of the sentinel variable, or None if
+            the kernel has no parfor body.
+        loop_body (dict): The legalized parfor body injected into the stub,
+            or None if the kernel has no parfor body.
+        kernel_param_types (tuple): The types of the kernel parameters.
+
+    Returns:
+        ParforKernelFingerprint: The fingerprint of the kernel.
+    """
+    name_map = {kernel_name: "$fp_kernel"}
+    if sentinel_name is not None:
+        name_map[sentinel_name] = "$fp_sentinel"
+    for i, name in enumerate(kernel_params):
+        name_map[name] = "$fp_p%d" % i
+    for i, name in enumerate(ivar_names):
+        name_map[name] = "$fp_i%d" % i
+
+    referents = []
+    parts = [
+        _canonical_template_text(kernel_template.kernel_string, name_map),
+        (
+            ""
+            if loop_body is None
+            else _canonical_body_text(loop_body, name_map, referents)
+        ),
+        repr(_compile_options_key()),
+    ]
+    digest = hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+    return ParforKernelFingerprint(
+        key=(digest, tuple(kernel_param_types)),
+        referents=tuple(referents),
+    )
+
+
+class ParforKernelCache:
+    """A least recently used cache of the SPIR-V modules of parfor kernels,
+    keyed by their structural fingerprint."""
+
+    def __init__(self):
+        self._modules = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._modules)
+
+    def clear(self):
+        """Removes all modules from the cache and resets its statistics."""
+        with self._lock:
+            self._modules.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_or_compile(
+        self,
+        fingerprint: ParforKernelFingerprint,
+        compile_kernel_module: Callable[[], SPIRVKernelModule],
+    ) -> SPIRVKernelModule:
+        """Returns the module compiled for a kernel with the same fingerprint,
+        or compiles and caches a new one.
+
+        Args:
+            fingerprint (ParforKernelFingerprint): The fingerprint of the
+                kernel.
+            compile_kernel_module: A function without arguments that compiles
+                the kernel and returns its module.
+
+        Returns:
+            SPIRVKernelModule: The compiled module of the kernel.
+        """
+        capacity = config.PARFOR_KERNEL_CACHE_SIZE
+        if capacity <= 0:
+            return compile_kernel_module()
+
+        with self._lock:
+            entry = self._modules.get(fingerprint.key)
+            if entry is not None:
+                self._modules.move_to_end(fingerprint.key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        kernel_module = compile_kernel_module()
+
+        with self._lock:
+            self._modules[fingerprint.key] = (
+                kernel_module,
+                fingerprint.referents,
+            )
+            while len(self._modules) > capacity:
+                self._modules.popitem(last=False)
+
+        return kernel_module
+
+
+parfor_kernel_cache = ParforKernelCache()
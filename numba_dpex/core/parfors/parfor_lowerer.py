@@ -6,6 +6,7 @@ import copy
 
 from llvmlite import ir as llvmir
 from numba.core import cgutils, ir, types
+from numba.core.typing import signature
 from numba.parfors.parfor import (
     find_potential_aliases_parfor,
     get_parfor_outputs,
@@ -24,10 +25,17 @@ from numba_dpex.dpctl_iface import libsyclinterface_bindings as sycl
 
 from ..exceptions import UnsupportedParforError
 from ..types.dpnp_ndarray_type import DpnpNdArray
-from .kernel_builder import ParforKernel, create_kernel_for_parfor
+from .host_loop_builder import host_loop_threshold
+from .kernel_builder import (
+    ParforKernel,
+    _is_normalized_loop_range,
+    _loop_trip_count,
+    _nd_range_dim,
+    create_kernel_for_parfor,
+)
 from .reduction_kernel_builder import (
+    create_reduction_final_kernel_for_parfor,
     create_reduction_main_kernel_for_parfor,
-    create_reduction_remainder_kernel_for_parfor,
 )
 
 
@@ -76,6 +84,18 @@ def _load_range(lowerer, value):
         return lowerer.context.get_constant(types.uintp, value)
 
 
+def _load_intp(lowerer, value):
+    """Returns the LLVM Value of a loop range attribute cast to intp."""
+    if isinstance(value, ir.Var):
+        return lowerer.context.cast(
+            lowerer.builder,
+            lowerer.loadvar(value.name),
+            lowerer.fndesc.typemap[value.name],
+            types.intp,
+        )
+    return lowerer.context.get_constant(types.intp, value)
+
+
 class ParforLowerImpl:
     """Provides a custom lowerer for parfor nodes that generates a SYCL kernel
     for a parfor and submits it to a queue.
@@ -85,29 +105,57 @@ class ParforLowerImpl:
         self,
         lowerer,
         loop_ranges,
+        work_group_size=None,
     ):
         # Create a global range over which to submit the kernel based on the
         # loop_ranges of the parfor
         global_range = []
 
         # SYCL ranges can have at max 3 dimension. If the parfor is of a higher
-        # dimension then the indexing for the higher dimensions is done inside
-        # the kernel.
-        global_range_rank = len(loop_ranges) if len(loop_ranges) < 3 else 3
-
-        for i in range(global_range_rank):
-            start, stop, step = loop_ranges[i]
-            stop = _load_range(lowerer, stop)
-            if step != 1:
-                raise UnsupportedParforError(
-                    "non-unit strides are not yet supported."
+        # dimension then the iteration space of the third and all the higher
+        # dimensions is linearized into the third dimension of the range, see
+        # RangeKernelTemplate.
+        for i, (start, stop, step) in enumerate(loop_ranges):
+            if _is_normalized_loop_range(start, step):
+                extent = _load_intp(lowerer, stop)
+            else:
+                # The kernel is launched over the trip count of the loop, see
+                # RangeKernelTemplate.
+                extent = lowerer.context.compile_internal(
+                    lowerer.builder,
+                    _loop_trip_count,
+                    signature(types.intp, types.intp, types.intp, types.intp),
+                    [_load_intp(lowerer, v) for v in (start, stop, step)],
                 )
-            global_range.append(stop)
-        # For now the local_range is always an empty list as numba_dpex always
-        # submits kernels generated for parfor nodes as range kernels.
-        # The provision is kept here if in future there is newer functionality
-        # to submit these kernels as ndrange.
+            if i < 3:
+                global_range.append(extent)
+            else:
+                global_range[2] = lowerer.builder.mul(global_range[2], extent)
+        # Kernels for which no work-group size was selected are submitted as
+        # range kernels and the local range is left to the SYCL runtime.
         local_range = []
+        if work_group_size is None:
+            return global_range, local_range
+
+        # The work-group size is handed out to the dimensions from the
+        # innermost one, the unit stride dimension of a row-major iteration
+        # space, to the outermost one. The global range is padded to a
+        # multiple of the local range, see RangeKernelTemplate.
+        budget = lowerer.context.get_constant(types.intp, work_group_size)
+        nd_range_sig = signature(
+            types.UniTuple(types.intp, 2), types.intp, types.intp
+        )
+        local_range = [None] * len(global_range)
+        for i in reversed(range(len(global_range))):
+            dims = lowerer.context.compile_internal(
+                lowerer.builder,
+                _nd_range_dim,
+                nd_range_sig,
+                [global_range[i], budget],
+            )
+            global_range[i] = lowerer.builder.extract_value(dims, 0)
+            local_range[i] = lowerer.builder.extract_value(dims, 1)
+            budget = lowerer.builder.sdiv(budget, local_range[i])
 
         return global_range, local_range
 
@@ -131,18 +179,38 @@ class ParforLowerImpl:
 
         return global_range, local_range
 
-    def _remainder_ranges(self, lowerer):
-        # Create a global range over which to submit the kernel based on the
-        # loop_ranges of the parfor
-        global_range = []
+    def _final_reduction_ranges(self, lowerer, reductionHelper):
+        # The final reduction kernel is submitted as a single work-group.
+        wg_size = _load_range(lowerer, reductionHelper.work_group_size)
 
-        stop = _load_range(lowerer, 1)
+        global_range = [wg_size]
+        local_range = [wg_size]
 
-        global_range.append(stop)
+        return global_range, local_range
 
-        local_range = []
+    def _runs_on_host(self, lowerer, kernel_fn: ParforKernel):
+        """Returns an LLVM Value that is true if the number of iterations of
+        the parfor is below the capped config.PARFOR_HOST_THRESHOLD."""
+        total_work = lowerer.context.get_constant(types.intp, 1)
+        for extent in kernel_fn.loop_extents:
+            total_work = lowerer.builder.mul(
+                total_work, _getvar(lowerer, extent)
+            )
+        threshold = lowerer.context.get_constant(
+            types.intp, host_loop_threshold()
+        )
+        return lowerer.builder.icmp_signed("<", total_work, threshold)
 
-        return global_range, local_range
+    def _call_host_function(self, lowerer, kernel_fn: ParforKernel):
+        """Adds a call to the host function of a parfor into the function
+        body of the current Numba JIT compiled function.
+        """
+        cres = kernel_fn.host_function
+        lowerer.library.add_linking_library(cres.library)
+        args = [_getvar(lowerer, arg) for arg in kernel_fn.kernel_args]
+        lowerer.context.call_internal(
+            lowerer.builder, cres.fndesc, cres.signature, args
+        )
 
     def _submit_parfor_kernel(
         self,
@@ -245,17 +313,13 @@ class ParforLowerImpl:
             reductionHelperList=reductionHelperList,
         )
 
-        if len(parfor.loop_nests) > 1:
-            raise UnsupportedParforError(
-                "Reduction with nested loop is not yet supported."
-            )
-
         parfor_kernel = create_reduction_main_kernel_for_parfor(
             loop_ranges,
             parfor,
             typemap,
             reductionKernelVar,
             parfor_reddict,
+            reductionHelperList,
         )
 
         global_range, local_range = self._reduction_ranges(
@@ -270,7 +334,7 @@ class ParforLowerImpl:
             debug=flags.debuginfo,
         )
 
-        parfor_kernel = create_reduction_remainder_kernel_for_parfor(
+        parfor_kernel = create_reduction_final_kernel_for_parfor(
             parfor,
             typemap,
             reductionKernelVar,
@@ -278,7 +342,9 @@ class ParforLowerImpl:
             reductionHelperList,
         )
 
-        global_range, local_range = self._remainder_ranges(lowerer)
+        global_range, local_range = self._final_reduction_ranges(
+            lowerer, reductionHelperList[0]
+        )
 
         # TODO: find better way to pass queue
         queue_ref = self._submit_parfor_kernel(
@@ -398,17 +464,35 @@ class ParforLowerImpl:
                 # FIXME: Make the exception more informative
                 raise UnsupportedParforError
 
-            global_range, local_range = self._loop_ranges(lowerer, loop_ranges)
-
-            # Finally submit the kernel
-            self._submit_parfor_kernel(
-                lowerer,
-                parfor_kernel,
-                global_range,
-                local_range,
-                debug=flags.debuginfo,
+            global_range, local_range = self._loop_ranges(
+                lowerer, loop_ranges, parfor_kernel.work_group_size
             )
 
+            if parfor_kernel.host_function is None:
+                # Finally submit the kernel
+                self._submit_parfor_kernel(
+                    lowerer,
+                    parfor_kernel,
+                    global_range,
+                    local_range,
+                    debug=flags.debuginfo,
+                )
+            else:
+                # Parfors with few iterations run as a loop on the host.
+                with lowerer.builder.if_else(
+                    self._runs_on_host(lowerer, parfor_kernel)
+                ) as (on_host, on_device):
+                    with on_host:
+                        self._call_host_function(lowerer, parfor_kernel)
+                    with on_device:
+                        self._submit_parfor_kernel(
+                            lowerer,
+                            parfor_kernel,
+                            global_range,
+                            local_range,
+                            debug=flags.debuginfo,
+                        )
+
         # Restore the original typemap of the function that was replaced
         # temporarily at the beginning of this function.
         lowerer.fndesc.typemap = orig_typemap
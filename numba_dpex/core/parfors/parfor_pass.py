@@ -14,14 +14,16 @@ import operator
 import warnings
 
 import dpnp
-from numba.core import config, errors, ir, types, typing
+from numba.core import config, errors, ir, ir_utils, types, typing
 from numba.core.compiler_machinery import register_pass
 from numba.core.ir_utils import (
     convert_size_to_var,
     dprint_func_ir,
+    get_call_table,
     mk_unique_var,
     next_label,
 )
+from numba.core.typed_passes import ParforFusionPass as NumpyParforFusionPass
 from numba.core.typed_passes import ParforPass as NumpyParforPass
 from numba.core.typed_passes import _reload_parfors
 from numba.core.typing import npydecl
@@ -34,12 +36,16 @@ from numba.parfors.parfor import (
     ConvertSetItemPass,
     Parfor,
 )
+from numba.parfors.parfor import ParforFusionPass as _NumpyParforFusionPass
 from numba.parfors.parfor import ParforPass as _NumpyParforPass
 from numba.parfors.parfor import (
     _make_index_var,
     _mk_parfor_loops,
+    maximize_fusion,
     repr_arrayexpr,
     signature,
+    unwrap_parfor_blocks,
+    wrap_parfor_blocks,
 )
 from numba.stencils.stencilparfor import StencilPass
 
@@ -177,6 +183,126 @@ class ConvertDPNPPass(ConvertNumpyPass):
         return parfor
 
 
+class ConvertStridedLoopPass(ConvertLoopPass):
+    """Build Parfor nodes from prange loops, including prange loops with a
+    step other than one.
+
+    Numba's ConvertLoopPass only accepts a constant step of one. The step of
+    every other prange loop is removed from its call before the loops are
+    converted and is set on the loop nest of the resulting parfor afterwards.
+    The step is either an integer constant or a variable whose value is only
+    known at run time, the kernel of the parfor iterates over the trip count
+    of the loop and computes the loop index from it.
+    """
+
+    def run(self, blocks):
+        func_ir = self.pass_states.func_ir
+        call_table, _ = get_call_table(blocks)
+        steps = {}
+        stepped_calls = []
+        for block in blocks.values():
+            for inst in block.body:
+                if not (
+                    isinstance(inst, ir.Assign)
+                    and isinstance(inst.value, ir.Expr)
+                    and inst.value.op == "call"
+                    and len(inst.value.args) == 3
+                    and self._is_parallel_loop(inst.value.func.name, call_table)
+                ):
+                    continue
+                loop_kind, _ = self._get_loop_kind(
+                    inst.value.func.name, call_table
+                )
+                if loop_kind == "pndindex":
+                    continue
+                start, stop, step = inst.value.args
+                try:
+                    step_def = func_ir.get_definition(step)
+                except KeyError:
+                    step_def = None
+                if isinstance(step_def, ir.Const):
+                    if step_def.value == 0:
+                        raise errors.UnsupportedRewriteError(
+                            "prange() step size must not be zero",
+                            loc=inst.loc,
+                        )
+                    if step_def.value == 1:
+                        continue
+                    step = step_def.value
+                steps[(start.name, stop.name, inst.loc)] = step
+                stepped_calls.append((inst.value, inst.value.args))
+                inst.value.args = [start, stop]
+
+        try:
+            super().run(blocks)
+        finally:
+            for call, args in stepped_calls:
+                call.args = args
+
+        if steps:
+            self._set_loop_steps(blocks, steps)
+
+    def _set_loop_steps(self, blocks, steps):
+        """Sets the step of the loop nests of the parfors created from the
+        prange loops whose step was removed from the call."""
+        for block in blocks.values():
+            for inst in block.body:
+                if not isinstance(inst, Parfor):
+                    continue
+                loop_nest = inst.loop_nests[0]
+                key = (
+                    getattr(loop_nest.start, "name", None),
+                    getattr(loop_nest.stop, "name", None),
+                    inst.loc,
+                )
+                if key in steps:
+                    loop_nest.step = steps[key]
+                self._set_loop_steps(inst.loop_body, steps)
+
+
+class DpnpArrayAnalysis(array_analysis.ArrayAnalysis):
+    """Array analysis that knows the shapes of the arrays created by the dpnp
+    array creation functions.
+
+    Numba's ArrayAnalysis only derives the shape of arrays created by NumPy
+    functions. Every parfor that writes a new array allocates it with
+    ``dpnp.empty()``, so without these rules the shape of the array is unknown
+    and the loops that later read the array can not be shown to have the same
+    extents as the parfor that wrote it.
+    """
+
+    def _analyze_op_call_dpnp_empty(self, scope, equiv_set, loc, args, kws):
+        return self._analyze_numpy_create_array(
+            scope, equiv_set, loc, args, kws
+        )
+
+    def _analyze_op_call_dpnp_zeros(self, scope, equiv_set, loc, args, kws):
+        return self._analyze_numpy_create_array(
+            scope, equiv_set, loc, args, kws
+        )
+
+    def _analyze_op_call_dpnp_ones(self, scope, equiv_set, loc, args, kws):
+        return self._analyze_numpy_create_array(
+            scope, equiv_set, loc, args, kws
+        )
+
+
+def _remove_dead_dpnp_allocation(rhs, lives, call_list):
+    """Marks the calls of the dpnp array creation functions as free of side
+    effects, so that the dead code elimination removes arrays that are not
+    used anymore, e.g. the temporary array of a parfor fused into a
+    reduction.
+    """
+    return (
+        len(call_list) == 2
+        and call_list[1] is dpnp
+        and call_list[0] in ("empty", "zeros", "ones")
+    )
+
+
+ir_utils.remove_call_handlers.append(_remove_dead_dpnp_allocation)
+
+
 class _ParforPass(_NumpyParforPass):
     """ParforPass class is responsible for converting NumPy
     calls in Numba intermediate representation to Parfors, which
@@ -192,7 +318,7 @@ class _ParforPass(_NumpyParforPass):
         with Parfors when possible and optimize the IR.
 
         Exactly same as the original one, but with mock ConvertNumpyPass to
-        ConvertDPNPPass.
+        ConvertDPNPPass and ConvertLoopPass to ConvertStridedLoopPass.
         """
         self._pre_run()
         # run stencil translation to parfor
@@ -214,7 +340,7 @@ class _ParforPass(_NumpyParforPass):
         if self.options.reduction:
             ConvertReducePass(self).run(self.func_ir.blocks)
         if self.options.prange:
-            ConvertLoopPass(self).run(self.func_ir.blocks)
+            ConvertStridedLoopPass(self).run(self.func_ir.blocks)
         if self.options.inplace_binop:
             ConvertInplaceBinop(self).run(self.func_ir.blocks)
 
@@ -293,6 +419,79 @@ class ParforPass(NumpyParforPass):
         return True
 
 
+class _ParforFusionPass(_NumpyParforFusionPass):
+    """ParforFusionPass class is responsible for fusing parfors, including
+    fusing elementwise parfors into the reduction parfors that consume their
+    output.
+
+    Based on the _NumpyParforFusionPass, but with the array analysis replaced
+    by DpnpArrayAnalysis. A reduction such as
+    ``x = (a - b) ** 2; s = 0; for i in prange(len(x)): s += x[i]`` is then
+    fused into a single parfor whose loop body computes the elements of ``x``
+    and accumulates them right away. The dead code elimination that runs after
+    the fusion removes the writes to ``x`` and its allocation if ``x`` is not
+    used anywhere else, so the reduction is lowered as a single kernel that
+    does not write the temporary array.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.array_analysis = DpnpArrayAnalysis(
+            self.typingctx,
+            self.func_ir,
+            self.typemap,
+            self.calltypes,
+        )
+
+    def fuse_recursive_parfor(self, parfor, equiv_set, func_ir, typemap):
+        """Exactly same as the original one, but with mock ArrayAnalysis to
+        DpnpArrayAnalysis.
+        """
+        blocks = wrap_parfor_blocks(parfor)
+        maximize_fusion(self.func_ir, blocks, self.typemap)
+        dprint_func_ir(
+            self.func_ir, "after recursive maximize fusion down", blocks
+        )
+        arr_analysis = DpnpArrayAnalysis(
+            self.typingctx, self.func_ir, self.typemap, self.calltypes
+        )
+        arr_analysis.run(blocks, equiv_set)
+        self.fuse_parfors(arr_analysis, blocks, func_ir, typemap)
+        unwrap_parfor_blocks(parfor)
+
+
+@register_pass(mutates_CFG=True, analysis_only=False)
+class ParforFusionPass(NumpyParforFusionPass):
+    """Based on the NumpyParforFusionPass, with mock to _ParforFusionPass."""
+
+    _name = "dpnp_parfor_fusion_pass"
+
+    def __init__(self):
+        NumpyParforFusionPass.__init__(self)
+
+    def run_pass(self, state):
+        """
+        Do fusion of parfor nodes.
+        """
+        # Ensure we have an IR and type information.
+        assert state.func_ir
+        parfor_pass = _ParforFusionPass(
+            state.func_ir,
+            state.typemap,
+            state.calltypes,
+            state.return_type,
+            state.typingctx,
+            state.targetctx,
+            state.flags.auto_parallel,
+            state.flags,
+            state.metadata,
+            state.parfor_diagnostics,
+        )
+        parfor_pass.run()
+
+        return True
+
+
 def _ufunc_to_parfor_instr(
     typemap,
     op,
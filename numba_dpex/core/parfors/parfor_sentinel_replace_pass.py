@@ -39,6 +39,62 @@ def _print_body(body_dict):
         _print_block(block)
 
 
+def inject_parfor_body(func_ir, args: ParforBodyArguments):
+    """Replaces the sentinel assignment of the IR of a function generated from
+    a parfor template with the body of the parfor.
+
+    Args:
+        func_ir: The Numba FunctionIR of the function generated from the
+            template. It is modified in place.
+        args (ParforBodyArguments): The body of the parfor and the names of
+            the parameters and loop indices that the body uses.
+    """
+    loop_body = args.loop_body
+
+    if config.DEBUG_ARRAY_OPT:
+        print("kernel_ir dump ", type(func_ir))
+        func_ir.dump()
+        print("loop_body dump ", type(loop_body))
+        _print_body(loop_body)
+
+    # Determine the unique names of the scheduling and kernel functions.
+    loop_body_var_table = get_name_var_table(loop_body)
+    sentinel_name = get_unused_var_name("__sentinel__", loop_body_var_table)
+
+    # rename all variables in kernel_ir afresh
+    var_table = get_name_var_table(func_ir.blocks)
+    new_var_dict = {}
+    reserved_names = (
+        [sentinel_name]
+        + list(args.param_dict.values())
+        + args.legal_loop_indices
+    )
+    for name, _ in var_table.items():
+        if not (name in reserved_names):
+            new_var_dict[name] = mk_unique_var(name)
+
+    replace_var_names(func_ir.blocks, new_var_dict)
+
+    kernel_stub_last_label = max(func_ir.blocks.keys()) + 1
+    loop_body = add_offset_to_labels(loop_body, kernel_stub_last_label)
+
+    # new label for splitting sentinel block
+    new_label = max(loop_body.keys()) + 1
+
+    from .kernel_builder import update_sentinel  # circular
+
+    update_sentinel(func_ir, sentinel_name, loop_body, new_label)
+
+    # FIXME: Why rename and remove dels causes the partial_sum array update
+    # instructions to be removed.
+    func_ir.blocks = rename_labels(func_ir.blocks)
+    remove_dels(func_ir.blocks)
+
+    if config.DEBUG_ARRAY_OPT:
+        print("kernel_ir after remove dead")
+        func_ir.dump()
+
+
 @register_pass(mutates_CFG=True, analysis_only=False)
 class ParforSentinelReplacePass(FunctionPass):
     _name = "sentinel_inject"
@@ -60,51 +116,6 @@ class ParforSentinelReplacePass(FunctionPass):
         if args is None:
             return True
 
-        # beginning
-        kernel_ir = state["func_ir"]
-        loop_body = args.loop_body
-
-        if config.DEBUG_ARRAY_OPT:
-            print("kernel_ir dump ", type(kernel_ir))
-            kernel_ir.dump()
-            print("loop_body dump ", type(loop_body))
-            _print_body(loop_body)
-
-        # Determine the unique names of the scheduling and kernel functions.
-        loop_body_var_table = get_name_var_table(loop_body)
-        sentinel_name = get_unused_var_name("__sentinel__", loop_body_var_table)
-
-        # rename all variables in kernel_ir afresh
-        var_table = get_name_var_table(kernel_ir.blocks)
-        new_var_dict = {}
-        reserved_names = (
-            [sentinel_name]
-            + list(args.param_dict.values())
-            + args.legal_loop_indices
-        )
-        for name, _ in var_table.items():
-            if not (name in reserved_names):
-                new_var_dict[name] = mk_unique_var(name)
-
-        replace_var_names(kernel_ir.blocks, new_var_dict)
-
-        kernel_stub_last_label = max(kernel_ir.blocks.keys()) + 1
-        loop_body = add_offset_to_labels(loop_body, kernel_stub_last_label)
-
-        # new label for splitting sentinel block
-        new_label = max(loop_body.keys()) + 1
-
-        from .kernel_builder import update_sentinel  # circular
-
-        update_sentinel(kernel_ir, sentinel_name, loop_body, new_label)
-
-        # FIXME: Why rename and remove dels causes the partial_sum array update
-        # instructions to be removed.
-        kernel_ir.blocks = rename_labels(kernel_ir.blocks)
-        remove_dels(kernel_ir.blocks)
-
-        if config.DEBUG_ARRAY_OPT:
-            print("kernel_ir after remove dead")
-            kernel_ir.dump()
+        inject_parfor_body(state["func_ir"], args)
 
         return True
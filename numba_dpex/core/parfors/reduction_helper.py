@@ -3,11 +3,13 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import copy
+import functools
 import operator
 
+import dpctl
 import dpnp
 import numba
-from numba.core import ir, types
+from numba.core import cgutils, ir, types
 from numba.core.ir_utils import (
     get_np_ufunc_typ,
     legalize_names,
@@ -17,11 +19,55 @@ from numba.core.ir_utils import (
 from numba.parfors import parfor
 from numba.parfors.parfor_lowering_utils import ParforLoweringBuilder
 
+from numba_dpex.core import config
 from numba_dpex.core.utils.cgutils_extra import get_llvm_type
 from numba_dpex.dpctl_iface import libsyclinterface_bindings as sycl
 
 from ..types.dpnp_ndarray_type import DpnpNdArray
 
+# Alignment in bytes of every reduction result inside the host staging buffer
+# used by ReductionKernelVariables.copy_final_sum_to_host.
+_STAGING_SLOT_ALIGNMENT = 16
+
+# The maximum number of partial sums reduced by every work-item of the final
+# reduction kernel.
+_MAX_PARTIAL_SUMS_PER_ITEM = 4
+
+
+@functools.lru_cache(maxsize=None)
+def _select_work_group_size(device: str, limit: int) -> int:
+    """Returns the work-group size of the kernels generated for parfors on a
+    device.
+
+    The size is the largest power of two that fits both the maximum
+    work-group size of the device and ``limit``, as the tree reduction in
+    local memory halves the number of active work-items at every step. If
+    ``limit`` is smaller than the largest sub-group size of the device, the
+    sub-group size is used instead so that no work-group consists of a
+    partial sub-group.
+
+    Args:
+        device (str): The filter string of the device the kernels run on.
+        limit (int): The upper bound of the work-group size. The bound is
+            passed explicitly rather than read from the config inside the
+            function, so that changing the config is not hidden by the cache.
+
+    Returns:
+        int: The work-group size.
+    """
+    sycl_device = dpctl.SyclDevice(device)
+    max_wg_size = sycl_device.max_work_group_size
+    sub_group_sizes = [
+        sg_size
+        for sg_size in sycl_device.sub_group_sizes
+        if sg_size <= max_wg_size
+    ]
+    limit = max(
+        min(max_wg_size, limit),
+        max(sub_group_sizes, default=1),
+    )
+    return 1 << (limit.bit_length() - 1)
+
 
 class ReductionHelper:
     """The class to define and allocate reduction intermediate variables."""
@@ -46,59 +92,94 @@ class ReductionHelper:
         reddtype = redarrvar_typ.dtype
         redarrdim = redarrvar_typ.ndim
 
-        # allocate partial sum
-        work_group_size = 8
-        # writing work_group_size inot IR
+        # Every work-item of the main reduction kernel strides over the
+        # iteration space and accumulates a private value. The values of a
+        # work-group are then combined by a tree reduction in local memory
+        # into a partial sum per work-group.
+        work_group_size = _select_work_group_size(
+            inputArrayType.device, config.REDUCTION_MAX_WORK_GROUP_SIZE
+        )
         work_group_size_var = pfbdr.assign(
             rhs=ir.Const(work_group_size, loc),
             typ=types.literal(work_group_size),
             name="work_group_size",
         )
-
-        # get total_work from parfor loop range
-        # FIXME: right way is to use (stop - start) if start != 0
-        total_work_var = pfbdr.assign(
-            rhs=parfor.loop_nests[0].stop,
+        # The number of work-groups is bounded, so that the partial sums can
+        # be reduced by the single work-group of the final reduction kernel.
+        max_num_groups_var = pfbdr.assign(
+            rhs=ir.Const(work_group_size * _MAX_PARTIAL_SUMS_PER_ITEM, loc),
             typ=types.intp,
-            name="tot_work",
+            name="max_num_groups",
         )
 
-        # global_size_mod = tot_work%work_group_size # noqa: E800 help understanding
-        ir_expr = ir.Expr.binop(
-            operator.mod, total_work_var, work_group_size_var, loc
-        )
-        pfbdr._calltypes[ir_expr] = numba.core.typing.signature(
-            types.intp, types.intp, types.intp
-        )
-        self.global_size_mod_var = pfbdr.assign(
-            rhs=ir_expr, typ=types.intp, name="global_size_mod"
+        # The iteration space of a multi-dimensional parfor is linearized in
+        # row-major order, so that the main reduction kernel is always a 1D
+        # kernel. The extents of all dimensions are kept to recover the loop
+        # indices from the linear index inside the kernel, and total_work is
+        # their product.
+        # Loop nests that do not start at zero or do not have a unit step are
+        # normalized, their extent is their trip count and the kernel computes
+        # the loop index from the start and step variables.
+        from .kernel_builder import (
+            _assign_loop_extent_vars,
+            _assign_loop_range_vars,
         )
 
-        # Calculates global_size_var as total_work - global_size_mod
-        ir_expr = ir.Expr.binop(
-            operator.sub, total_work_var, self.global_size_mod_var, loc
-        )
-        pfbdr._calltypes[ir_expr] = numba.core.typing.signature(
-            types.intp, types.intp, types.intp
-        )
-        self.global_size_var = pfbdr.assign(
-            rhs=ir_expr, typ=types.intp, name="global_size"
+        self.loop_range_vars = _assign_loop_range_vars(lowerer, parfor)
+        self.loop_extent_vars = _assign_loop_extent_vars(
+            lowerer, parfor, self.loop_range_vars
         )
 
-        # Calculates partial_sum_size_var as
-        # global_size_var_assign // work_group_size_var_assign
-        ir_expr = ir.Expr.binop(
+        self.total_work_var = self.loop_extent_vars[0]
+        for extent_var in self.loop_extent_vars[1:]:
+            self.total_work_var = self._assign_binop(
+                pfbdr,
+                operator.mul,
+                self.total_work_var,
+                extent_var,
+                name="tot_work",
+            )
+
+        # Calculates partial_sum_size_var, the number of work-groups, as
+        # min(ceil(tot_work / work_group_size), max_num_groups)
+        num_groups_var = self._assign_binop(
+            pfbdr,
+            operator.add,
+            self.total_work_var,
+            pfbdr.assign(
+                rhs=ir.Const(work_group_size - 1, loc),
+                typ=types.intp,
+                name="work_group_size_m1",
+            ),
+            name="tot_work_padded",
+        )
+        num_groups_var = self._assign_binop(
+            pfbdr,
             operator.floordiv,
-            self.global_size_var,
+            num_groups_var,
             work_group_size_var,
-            loc,
+            name="num_groups_unbounded",
         )
-        pfbdr._calltypes[ir_expr] = numba.core.typing.signature(
-            types.intp, types.intp, types.intp
+        min_fn = pfbdr.bind_global_function(
+            fobj=min,
+            ftype=pfbdr._typingctx.resolve_value_type(min),
+            args=[types.intp, types.intp],
         )
         self.partial_sum_size_var = pfbdr.assign(
-            rhs=ir_expr, typ=types.intp, name="partial_sum_size"
+            rhs=pfbdr.call(min_fn, args=[num_groups_var, max_num_groups_var]),
+            typ=types.intp,
+            name="partial_sum_size",
+        )
+
+        # The global size of the main reduction kernel.
+        self.global_size_var = self._assign_binop(
+            pfbdr,
+            operator.mul,
+            self.partial_sum_size_var,
+            work_group_size_var,
+            name="global_size",
         )
+
         # Dpnp object
         fillFunc = None
         parfor_reddict = parfor.reddict
@@ -179,6 +260,16 @@ class ReductionHelper:
         self.redvars_to_redarrs_dict[red_name].append(self.partial_sum_var.name)
         self.redvars_to_redarrs_dict[red_name].append(self.final_sum_var.name)
 
+    @staticmethod
+    def _assign_binop(pfbdr, op, lhs, rhs, name):
+        """Assigns the result of an integer binary operation to a new
+        variable."""
+        ir_expr = ir.Expr.binop(op, lhs, rhs, pfbdr._loc)
+        pfbdr._calltypes[ir_expr] = numba.core.typing.signature(
+            types.intp, types.intp, types.intp
+        )
+        return pfbdr.assign(rhs=ir_expr, typ=types.intp, name=name)
+
     def _redtyp_to_redarraytype(self, redtyp, inputArrayType):
         """Go from a reduction variable type to a reduction array type
         used to hold per-worker results.
@@ -396,13 +487,30 @@ class ReductionKernelVariables:
         return self._work_group_size
 
     def copy_final_sum_to_host(self, queue_ref):
+        """Copies the final values of all reduction variables to the host.
+
+        All results are first copied into a single pinned USM host staging
+        buffer taken from the dpex runtime pool. The device-to-host copies are
+        submitted back to back and the host synchronizes only once before
+        scattering the values into the reduction variables.
+        """
         lowerer = self.lowerer
         builder = lowerer.builder
         context = lowerer.context
-
-        for i, redvar in enumerate(self.parfor_redvars):
-            srcVar = self.final_sum_names[i]
-
+        intp_t = context.get_value_type(types.intp)
+        voidptr_t = get_llvm_type(context=context, type=types.voidptr)
+
+        # Every result gets a slot aligned to the largest scalar we can reduce
+        # (complex128), so the values can be read back from the staging buffer
+        # without unaligned accesses.
+        slot_align = context.get_constant(types.intp, _STAGING_SLOT_ALIGNMENT)
+        slot_mask = builder.not_(builder.sub(slot_align, intp_t(1)))
+
+        item_sizes = []
+        data_ptrs = []
+        offsets = []
+        total_size = intp_t(0)
+        for srcVar in self.final_sum_names:
             item_size = builder.gep(
                 lowerer.getvar(srcVar),
                 [
@@ -419,22 +527,41 @@ class ReductionKernelVariables:
                 ],
             )
 
-            dest = builder.bitcast(
-                lowerer.getvar(redvar),
-                get_llvm_type(context=context, type=types.voidptr),
+            item_size = builder.load(item_size)
+            item_sizes.append(item_size)
+            data_ptrs.append(
+                builder.bitcast(builder.load(array_attr), voidptr_t)
             )
-            src = builder.bitcast(
-                builder.load(array_attr),
-                get_llvm_type(context=context, type=types.voidptr),
+            offsets.append(total_size)
+
+            slot_size = builder.and_(
+                builder.add(item_size, builder.sub(slot_align, intp_t(1))),
+                slot_mask,
             )
+            total_size = builder.add(total_size, slot_size)
 
-            args = [
-                queue_ref,
-                dest,
-                src,
-                builder.load(item_size),
-            ]
+        staging_buffer = context.dpexrt.host_staging_buffer_acquire(
+            builder, [queue_ref, total_size]
+        )
 
-            event_ref = sycl.dpctl_queue_memcpy(builder, *args)
+        events = []
+        for src, item_size, offset in zip(data_ptrs, item_sizes, offsets):
+            dest = builder.gep(staging_buffer, [offset])
+            events.append(
+                sycl.dpctl_queue_memcpy(
+                    builder, queue_ref, dest, src, item_size
+                )
+            )
+
+        for event_ref in events:
             sycl.dpctl_event_wait(builder, event_ref)
             sycl.dpctl_event_delete(builder, event_ref)
+
+        for i, redvar in enumerate(self.parfor_redvars):
+            dest = builder.bitcast(lowerer.getvar(redvar), voidptr_t)
+            src = builder.gep(staging_buffer, [offsets[i]])
+            cgutils.raw_memcpy(builder, dest, src, item_sizes[i], 1)
+
+        context.dpexrt.host_staging_buffer_release(
+            builder, [queue_ref, staging_buffer]
+        )
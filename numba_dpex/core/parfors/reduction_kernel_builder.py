@@ -2,6 +2,7 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import functools
 import warnings
 
 from numba.core import types
@@ -27,10 +28,14 @@ from numba_dpex.kernel_api_impl.spirv.dispatcher import (
 )
 
 from .kernel_builder import ParforKernel, _to_scalar_from_0d
+from .kernel_templates.axis_reduction_template import AxisReduceKernelTemplate
 from .kernel_templates.reduction_template import (
-    RemainderReduceIntermediateKernelTemplate,
+    _REDOP_TO_GROUP_OP,
+    TreeReduceFinalKernelTemplate,
     TreeReduceIntermediateKernelTemplate,
+    uses_group_reduce,
 )
+from .parfor_kernel_cache import parfor_kernel_cache, parfor_kernel_fingerprint
 
 
 def create_reduction_main_kernel_for_parfor(
@@ -39,6 +44,7 @@ def create_reduction_main_kernel_for_parfor(
     typemap,
     reductionKernelVar: ReductionKernelVariables,
     parfor_reddict=None,
+    reductionHelperList=None,
 ):
     """
     Creates a numba_dpex.kernel function for reduction main kernel.
@@ -78,18 +84,45 @@ def create_reduction_main_kernel_for_parfor(
     parfor_params = reductionKernelVar.parfor_params.copy()
     parfor_legalized_params = reductionKernelVar.parfor_legalized_params.copy()
     parfor_param_types = reductionKernelVar.param_types.copy()
+    # Local accessors are only needed by the reduction variables that are
+    # combined by a tree reduction in local memory.
     local_accessors_dict = {}
     for k, v in reductionKernelVar.redvars_legal_dict.items():
+        if uses_group_reduce(parfor_reddict[k].redop, typemap[k]):
+            continue
         la_var = "local_sums_" + v
         local_accessors_dict[k] = la_var
         idx = reductionKernelVar.parfor_params.index(k)
         arr_ty = reductionKernelVar.param_types[idx]
-        la_ty = LocalAccessorType(parfor_dim, arr_ty.dtype)
+        la_ty = LocalAccessorType(1, arr_ty.dtype)
 
         parfor_params.append(la_var)
         parfor_legalized_params.append(la_var)
         parfor_param_types.append(la_ty)
 
+    # The total number of iterations is passed as a kernel argument, as the
+    # kernel is launched over a fixed number of work-groups that stride over
+    # the linearized iteration space. For a multi-dimensional parfor the
+    # extents of the inner loop nests follow it, so that the kernel can
+    # recover the loop indices from the linear index, and then the start and
+    # step of the loop nests that are not normalized.
+    reductionHelper = reductionHelperList[0]
+    extent_var_names = [v.name for v in reductionHelper.loop_extent_vars]
+    total_work_var_name = reductionHelper.total_work_var.name
+    loop_range_names = [
+        None if range_vars is None else tuple(v.name for v in range_vars)
+        for range_vars in reductionHelper.loop_range_vars
+    ]
+    extra_param_names = [total_work_var_name] + extent_var_names[1:]
+    for range_names in loop_range_names:
+        if range_names is not None:
+            extra_param_names += list(range_names)
+    legal_names = legalize_names(extra_param_names + extent_var_names)
+    for name in extra_param_names:
+        parfor_params.append(name)
+        parfor_legalized_params.append(legal_names[name])
+        parfor_param_types.append(_to_scalar_from_0d(typemap[name]))
+
     kernel_template = TreeReduceIntermediateKernelTemplate(
         kernel_name=kernel_name,
         kernel_params=parfor_legalized_params,
@@ -104,6 +137,12 @@ def create_reduction_main_kernel_for_parfor(
         redvars_dict=reductionKernelVar.redvars_legal_dict,
         local_accessors_dict=local_accessors_dict,
         typemap=typemap,
+        total_work_name=legal_names[total_work_var_name],
+        loop_extent_names=[legal_names[v] for v in extent_var_names],
+        loop_range_params=[
+            None if names is None else tuple(legal_names[v] for v in names)
+            for names in loop_range_names
+        ],
     )
 
     for i, name in enumerate(reductionKernelVar.parfor_params):
@@ -113,28 +152,44 @@ def create_reduction_main_kernel_for_parfor(
         except KeyError:
             pass
 
-    kernel_dispatcher: SPIRVKernelDispatcher = kernel(
-        kernel_template.py_func,
-        _parfor_body_args=ParforBodyArguments(
-            loop_body=reductionKernelVar.loop_body,
-            param_dict=reductionKernelVar.param_dict,
-            legal_loop_indices=reductionKernelVar.legal_loop_indices,
-        ),
-    )
-
     # The first argument to a range kernel is a kernel_api.NdItem object. The
     # ``NdItem`` object is used by the kernel_api.spirv backend to generate the
     # correct SPIR-V indexing instructions. Since, the argument is not something
     # available originally in the kernel_param_types, we add it at this point to
-    # make sure the kernel signature matches the actual generated code.
-    ty_item = NdItemType(parfor_dim)
+    # make sure the kernel signature matches the actual generated code. The
+    # kernel is always launched over a 1D range as the iteration space of the
+    # parfor is linearized.
+    ty_item = NdItemType(1)
     kernel_param_types = (ty_item, *parfor_param_types)
     kernel_sig = signature(types.none, *kernel_param_types)
 
-    kcres: _SPIRVKernelCompileResult = kernel_dispatcher.get_compile_result(
-        types.void(*kernel_param_types)  # kernel signature
+    fingerprint = parfor_kernel_fingerprint(
+        kernel_template,
+        kernel_name=kernel_name,
+        kernel_params=parfor_legalized_params,
+        ivar_names=reductionKernelVar.legal_loop_indices,
+        sentinel_name=sentinel_name,
+        loop_body=reductionKernelVar.loop_body,
+        kernel_param_types=kernel_param_types,
+    )
+
+    def compile_kernel_module() -> SPIRVKernelModule:
+        kernel_dispatcher: SPIRVKernelDispatcher = kernel(
+            kernel_template.py_func,
+            _parfor_body_args=ParforBodyArguments(
+                loop_body=reductionKernelVar.loop_body,
+                param_dict=reductionKernelVar.param_dict,
+                legal_loop_indices=reductionKernelVar.legal_loop_indices,
+            ),
+        )
+        kcres: _SPIRVKernelCompileResult = kernel_dispatcher.get_compile_result(
+            types.void(*kernel_param_types)  # kernel signature
+        )
+        return kcres.kernel_device_ir_module
+
+    kernel_module: SPIRVKernelModule = parfor_kernel_cache.get_or_compile(
+        fingerprint, compile_kernel_module
     )
-    kernel_module: SPIRVKernelModule = kcres.kernel_device_ir_module
 
     parfor_params = (
         reductionKernelVar.parfor_params.copy()
@@ -151,7 +206,7 @@ def create_reduction_main_kernel_for_parfor(
     )
 
 
-def create_reduction_remainder_kernel_for_parfor(
+def create_reduction_final_kernel_for_parfor(
     parfor_node,
     typemap,
     reductionKernelVar,
@@ -159,159 +214,137 @@ def create_reduction_remainder_kernel_for_parfor(
     reductionHelperList,
 ):
     """
-    Creates a numba_dpex.kernel function for a reduction remainder kernel.
+    Creates a numba_dpex.kernel function for a reduction final kernel that
+    combines the partial sums computed by the reduction main kernel.
     """
 
-    loc = parfor_node.init_block.loc
-
-    for race in parfor_node.races:
-        msg = (
-            "Variable %s used in parallel loop may be written "
-            "to simultaneously by multiple workers and may result "
-            "in non-deterministic or unintended results." % race
-        )
-        warnings.warn(NumbaParallelSafetyWarning(msg, loc))
-
-    loop_body_var_table = get_name_var_table(reductionKernelVar.loop_body)
-    sentinel_name = get_unused_var_name("__sentinel__", loop_body_var_table)
-
-    global_size_var_name = []
-    global_size_mod_var_name = []
     partial_sum_var_name = []
-    partial_sum_size_var_name = []
     final_sum_var_name = []
-
-    for i, _ in enumerate(reductionKernelVar.parfor_redvars):
+    local_accessors_dict = {}
+    local_accessor_types = []
+    for i, redvar in enumerate(reductionKernelVar.parfor_redvars):
         reductionHelper = reductionHelperList[i]
-        name = reductionHelper.partial_sum_var.name
-        partial_sum_var_name.append(name)
-
-        name = reductionHelper.global_size_var.name
-        global_size_var_name.append(name)
-
-        name = reductionHelper.global_size_mod_var.name
-        global_size_mod_var_name.append(name)
-
-        name = reductionHelper.partial_sum_size_var.name
-        partial_sum_size_var_name.append(name)
+        partial_sum_var_name.append(reductionHelper.partial_sum_var.name)
+        final_sum_var_name.append(reductionHelper.final_sum_var.name)
+        if uses_group_reduce(parfor_reddict[redvar].redop, typemap[redvar]):
+            continue
+        local_accessors_dict[redvar] = (
+            "local_sums_" + reductionKernelVar.redvars_legal_dict[redvar]
+        )
+        local_accessor_types.append(
+            LocalAccessorType(1, typemap[partial_sum_var_name[-1]].dtype)
+        )
 
-        name = reductionHelper.final_sum_var.name
-        final_sum_var_name.append(name)
+    # All reduction variables share the number of partial sums.
+    partial_sum_size_var_name = reductionHelperList[0].partial_sum_size_var.name
 
-    kernel_name = "__dpex_redection_parfor_%s_remainder" % (parfor_node.id)
+    kernel_name = "__dpex_reduction_parfor_%s_final" % (parfor_node.id)
 
     partial_sum_var_dict = legalize_names(partial_sum_var_name)
-    global_size_var_dict = legalize_names(global_size_var_name)
-    global_size_mod_var_dict = legalize_names(global_size_mod_var_name)
-    partial_sum_size_var_dict = legalize_names(partial_sum_size_var_name)
+    partial_sum_size_var_dict = legalize_names([partial_sum_size_var_name])
     final_sum_var_dict = legalize_names(final_sum_var_name)
 
-    partial_sum_var_legal_name = [
-        partial_sum_var_dict[v] for v in partial_sum_var_dict
-    ]
-
-    global_size_var_legal_name = [
-        global_size_var_dict[v] for v in global_size_var_dict
-    ]
-    global_size_mod_var_legal_name = [
-        global_size_mod_var_dict[v] for v in global_size_mod_var_dict
-    ]
-    partial_sum_size_var_legal_name = [
-        partial_sum_size_var_dict[v] for v in partial_sum_size_var_dict
-    ]
-    final_sum_var_legal_name = [
-        final_sum_var_dict[v] for v in final_sum_var_dict
-    ]
-
-    kernel_template = RemainderReduceIntermediateKernelTemplate(
+    kernel_template = TreeReduceFinalKernelTemplate(
         kernel_name=kernel_name,
-        kernel_params=reductionKernelVar.parfor_legalized_params,
-        sentinel_name=sentinel_name,
-        legal_loop_indices=reductionKernelVar.legal_loop_indices,
-        redvars_dict=reductionKernelVar.redvars_legal_dict,
         redvars=reductionKernelVar.parfor_redvars,
         parfor_reddict=parfor_reddict,
+        redvars_dict=reductionKernelVar.redvars_legal_dict,
         typemap=typemap,
-        global_size_var_name=global_size_var_legal_name,
-        global_size_mod_var_name=global_size_mod_var_legal_name,
-        partial_sum_size_var_name=partial_sum_size_var_legal_name,
-        partial_sum_var_name=partial_sum_var_legal_name,
-        final_sum_var_name=final_sum_var_legal_name,
-        reductionKernelVar=reductionKernelVar,
+        partial_sum_var_name=[
+            partial_sum_var_dict[v] for v in partial_sum_var_name
+        ],
+        partial_sum_size_var_name=partial_sum_size_var_dict[
+            partial_sum_size_var_name
+        ],
+        final_sum_var_name=[final_sum_var_dict[v] for v in final_sum_var_name],
+        local_accessors_dict=local_accessors_dict,
     )
 
-    for i, _ in enumerate(reductionKernelVar.parfor_redvars):
-        if reductionHelperList[i].global_size_var is not None:
-            reductionKernelVar.parfor_params.append(global_size_var_name[i])
-            reductionKernelVar.parfor_legalized_params.append(
-                global_size_var_legal_name[i]
-            )
-            reductionKernelVar.param_types.append(
-                _to_scalar_from_0d(typemap[global_size_var_name[i]])
-            )
-            reductionKernelVar.func_arg_types.append(
-                _to_scalar_from_0d(typemap[global_size_var_name[i]])
-            )
-
-        if reductionHelperList[i].global_size_mod_var is not None:
-            reductionKernelVar.parfor_params.append(global_size_mod_var_name[i])
-            reductionKernelVar.parfor_legalized_params.append(
-                global_size_mod_var_legal_name[i]
-            )
-
-            reductionKernelVar.param_types.append(
-                _to_scalar_from_0d(typemap[global_size_mod_var_name[i]])
-            )
-            reductionKernelVar.func_arg_types.append(
-                _to_scalar_from_0d(typemap[global_size_mod_var_name[i]])
-            )
+    kernel_args = (
+        partial_sum_var_name
+        + [partial_sum_size_var_name]
+        + final_sum_var_name
+        + list(local_accessors_dict.values())
+    )
+    kernel_arg_types = (
+        [typemap[v] for v in partial_sum_var_name]
+        + [_to_scalar_from_0d(typemap[partial_sum_size_var_name])]
+        + [typemap[v] for v in final_sum_var_name]
+        + local_accessor_types
+    )
 
-        if reductionHelperList[i].partial_sum_size_var is not None:
-            reductionKernelVar.parfor_params.append(
-                partial_sum_size_var_name[i]
-            )
-            reductionKernelVar.parfor_legalized_params.append(
-                partial_sum_size_var_legal_name[i]
-            )
-            reductionKernelVar.param_types.append(
-                _to_scalar_from_0d(typemap[partial_sum_size_var_name[i]])
-            )
-            reductionKernelVar.func_arg_types.append(
-                _to_scalar_from_0d(typemap[partial_sum_size_var_name[i]])
-            )
-        if reductionHelperList[i].final_sum_var is not None:
-            reductionKernelVar.parfor_params.append(final_sum_var_name[i])
-            reductionKernelVar.parfor_legalized_params.append(
-                final_sum_var_legal_name[i]
-            )
-            reductionKernelVar.param_types.append(
-                _to_scalar_from_0d(typemap[final_sum_var_name[i]])
-            )
-            reductionKernelVar.func_arg_types.append(
-                _to_scalar_from_0d(typemap[final_sum_var_name[i]])
-            )
+    ty_item = NdItemType(1)
+    kernel_param_types = (ty_item, *kernel_arg_types)
+    kernel_sig = signature(types.none, *kernel_param_types)
 
-    kernel_dispatcher: SPIRVKernelDispatcher = kernel(
-        kernel_template.py_func,
-        _parfor_body_args=ParforBodyArguments(
-            loop_body=reductionKernelVar.loop_body,
-            param_dict=reductionKernelVar.param_dict,
-            legal_loop_indices=reductionKernelVar.legal_loop_indices,
-        ),
+    fingerprint = parfor_kernel_fingerprint(
+        kernel_template,
+        kernel_name=kernel_name,
+        kernel_params=kernel_template.kernel_params,
+        ivar_names=[],
+        sentinel_name=None,
+        loop_body=None,
+        kernel_param_types=kernel_param_types,
     )
 
-    kernel_param_types = reductionKernelVar.param_types
-
-    kernel_sig = signature(types.none, *kernel_param_types)
+    def compile_kernel_module() -> SPIRVKernelModule:
+        kernel_dispatcher: SPIRVKernelDispatcher = kernel(
+            kernel_template.py_func
+        )
+        kcres: _SPIRVKernelCompileResult = kernel_dispatcher.get_compile_result(
+            types.void(*kernel_param_types)  # kernel signature
+        )
+        return kcres.kernel_device_ir_module
 
-    kcres: _SPIRVKernelCompileResult = kernel_dispatcher.get_compile_result(
-        types.void(*kernel_param_types)  # kernel signature
+    kernel_module: SPIRVKernelModule = parfor_kernel_cache.get_or_compile(
+        fingerprint, compile_kernel_module
     )
-    kernel_module: SPIRVKernelModule = kcres.kernel_device_ir_module
 
     return ParforKernel(
         signature=kernel_sig,
-        kernel_args=reductionKernelVar.parfor_params,
-        kernel_arg_types=reductionKernelVar.func_arg_types,
+        kernel_args=kernel_args,
+        kernel_arg_types=kernel_arg_types,
+        local_accessors=set(local_accessors_dict.values()),
+        work_group_size=reductionKernelVar.work_group_size,
         kernel_module=kernel_module,
     )
+
+
+@functools.lru_cache(maxsize=None)
+def create_axis_reduction_kernel(
+    redop, acc_dtype, is_mean=False, use_group_reduce=True
+):
+    """
+    Creates a numba_dpex.kernel function that reduces a 2D array along an
+    axis, with one work-group per element of the result.
+
+    Args:
+        redop: The reduction operator, one of ``operator.iadd``,
+            ``operator.imul``, ``min`` or ``max``.
+        acc_dtype (numba.core.types.Type): The type of the accumulated values
+            and of the result.
+        is_mean (bool, optional): If True, the kernel stores the mean instead
+            of the sum of every slice. Defaults to False.
+        use_group_reduce (bool, optional): If False, the kernel does not use
+            a SPIR-V group reduce instruction and has to be called with a
+            local size of 1. Defaults to True.
+
+    Returns:
+        SPIRVKernelDispatcher: The kernel, which has to be called with an
+        ``NdRange`` whose global size is the number of elements of the result
+        times the local size.
+    """
+    kernel_name = "__dpex_axis_reduction_%s_%s%s" % (
+        "mean" if is_mean else _REDOP_TO_GROUP_OP[redop],
+        acc_dtype,
+        "" if use_group_reduce else "_serial",
+    )
+    kernel_template = AxisReduceKernelTemplate(
+        kernel_name=kernel_name,
+        redop=redop,
+        acc_dtype=acc_dtype,
+        is_mean=is_mean,
+        use_group_reduce=use_group_reduce,
+    )
+
+    return kernel(kernel_template.py_func)
@@ -12,7 +12,6 @@ from numba.core.typed_passes import (
     NopythonRewrites,
     NoPythonSupportedFeatureValidation,
     NopythonTypeInference,
-    ParforFusionPass,
     ParforPreLoweringPass,
     PreLowerStripPhis,
     PreParforPass,
@@ -20,7 +19,7 @@ from numba.core.typed_passes import (
 
 from numba_dpex.core.exceptions import UnsupportedCompilationModeError
 from numba_dpex.core.parfors.parfor_diagnostics import ExtendedParforDiagnostics
-from numba_dpex.core.parfors.parfor_pass import ParforPass
+from numba_dpex.core.parfors.parfor_pass import ParforFusionPass, ParforPass
 from numba_dpex.core.passes import (
     DumpParforDiagnostics,
     NoPythonBackend,
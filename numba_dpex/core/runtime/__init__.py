@@ -2,9 +2,12 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import atexit
+import ctypes
+
 import llvmlite.binding as ll
 
-from ._dpexrt_python import c_helpers
+from ._dpexrt_python import DPEXRT_host_staging_pool_clear, c_helpers
 
 # Register the helper function in _dpexrt_python so that we can insert
 # calls to them via llvmlite.
@@ -13,3 +16,7 @@ for (
     c_address,
 ) in c_helpers.items():
     ll.add_symbol(py_name, c_address)
+
+# The pinned host buffers of the staging pool are freed while the SYCL runtime
+# is still alive, as the pool itself is never destroyed.
+atexit.register(ctypes.CFUNCTYPE(None)(DPEXRT_host_staging_pool_clear))
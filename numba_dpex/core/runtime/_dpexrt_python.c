@@ -24,10 +24,18 @@
 #include "_queuestruct.h"
 #include "_usmarraystruct.h"
 
+#include "experimental/host_staging_pool.h"
 #include "experimental/kernel_caching.h"
 #include "experimental/nrt_reserve_meminfo.h"
 #include "numba/core/runtime/nrt_external.h"
 
+// Python objects looked up once at module initialization, so that boxing a
+// dpnp.ndarray does not have to import dpnp or build attribute names on every
+// call.
+static PyTypeObject *dpnp_array_type_cached = NULL;
+static PyObject *array_obj_attr_name = NULL;
+static PyObject *empty_tuple = NULL;
+
 // forward declarations
 static struct PyUSMArrayObject *PyUSMNdArray_ARRAYOBJ(PyObject *obj);
 static npy_intp product_of_shape(npy_intp *shape, npy_intp ndim);
@@ -69,9 +77,16 @@ DPEXRT_sycl_usm_ndarray_to_python_acqref(usmarystruct_t *arystruct,
                                          int ndim,
                                          int writeable,
                                          PyArray_Descr *descr);
+static int
+DPEXRT_sycl_usm_ndarray_from_python_borrowed(NRT_api_functions *nrt,
+                                             PyObject *obj,
+                                             usmarystruct_t *arystruct);
 static int DPEXRT_sycl_queue_from_python(NRT_api_functions *nrt,
                                          PyObject *obj,
                                          queuestruct_t *queue_struct);
+static int DPEXRT_sycl_queue_from_python_borrowed(NRT_api_functions *nrt,
+                                                  PyObject *obj,
+                                                  queuestruct_t *queue_struct);
 static int DPEXRT_sycl_event_from_python(NRT_api_functions *nrt,
                                          PyObject *obj,
                                          eventstruct_t *event_struct);
@@ -804,11 +819,14 @@ static npy_intp product_of_shape(npy_intp *shape, npy_intp ndim)
  * @param    obj            A Python object that may be a dpnp.ndarray
  * @param    arystruct      Numba's internal native represnetation for a given
  *                          instance of a dpnp.ndarray
+ * @param    borrowed       If non-zero, no NRT meminfo is allocated for the
+ *                          array and the reference of obj is only borrowed.
  * @return   {return}       Error code representing success (0) or failure (-1).
  */
-static int DPEXRT_sycl_usm_ndarray_from_python(NRT_api_functions *nrt,
-                                               PyObject *obj,
-                                               usmarystruct_t *arystruct)
+static int usm_ndarray_from_python_impl(NRT_api_functions *nrt,
+                                        PyObject *obj,
+                                        usmarystruct_t *arystruct,
+                                        int borrowed)
 {
     struct PyUSMArrayObject *arrayobj = NULL;
     int i = 0, j = 0, k = 0, ndim = 0, exp = 0;
@@ -853,8 +871,14 @@ static int DPEXRT_sycl_usm_ndarray_from_python(NRT_api_functions *nrt,
         goto error;
     }
 
-    if (!(arystruct->meminfo = NRT_MemInfo_new_from_usmndarray(
-              nrt, obj, data, nitems, itemsize, qref)))
+    // In the borrowed mode the caller guarantees that obj outlives every use
+    // of the native array, so neither a meminfo nor a new reference to obj is
+    // needed. NRT incref/decref calls are no-ops on a NULL meminfo.
+    if (borrowed) {
+        arystruct->meminfo = NULL;
+    }
+    else if (!(arystruct->meminfo = NRT_MemInfo_new_from_usmndarray(
+                   nrt, obj, data, nitems, itemsize, qref)))
     {
         DPEXRT_DEBUG(drt_debug_print(
             "DPEXRT-ERROR: NRT_MemInfo_new_from_usmndarray failed "
@@ -864,7 +888,8 @@ static int DPEXRT_sycl_usm_ndarray_from_python(NRT_api_functions *nrt,
     }
 
     Py_XDECREF(arrayobj);
-    Py_IncRef(obj);
+    if (!borrowed)
+        Py_IncRef(obj);
 
     arystruct->data = data;
     arystruct->sycl_queue = qref;
@@ -929,6 +954,42 @@ error:
     return -1;
 }
 
+/*!
+ * @brief Unboxes a PyObject that may represent a dpnp.ndarray into a Numba
+ * native represetation. The native array owns an NRT meminfo that keeps a
+ * reference to the PyObject.
+ *
+ * @param    obj            A Python object that may be a dpnp.ndarray
+ * @param    arystruct      Numba's internal native represnetation for a given
+ *                          instance of a dpnp.ndarray
+ * @return   {return}       Error code representing success (0) or failure (-1).
+ */
+static int DPEXRT_sycl_usm_ndarray_from_python(NRT_api_functions *nrt,
+                                               PyObject *obj,
+                                               usmarystruct_t *arystruct)
+{
+    return usm_ndarray_from_python_impl(nrt, obj, arystruct, 0);
+}
+
+/*!
+ * @brief Unboxes a PyObject that may represent a dpnp.ndarray into a Numba
+ * native represetation that borrows the PyObject. No NRT meminfo is
+ * allocated, so the caller has to keep the PyObject alive for as long as the
+ * native array is used, e.g., for the duration of a synchronous kernel call.
+ *
+ * @param    obj            A Python object that may be a dpnp.ndarray
+ * @param    arystruct      Numba's internal native represnetation for a given
+ *                          instance of a dpnp.ndarray
+ * @return   {return}       Error code representing success (0) or failure (-1).
+ */
+static int
+DPEXRT_sycl_usm_ndarray_from_python_borrowed(NRT_api_functions *nrt,
+                                             PyObject *obj,
+                                             usmarystruct_t *arystruct)
+{
+    return usm_ndarray_from_python_impl(nrt, obj, arystruct, 1);
+}
+
 /*!
  * @brief A helper function that boxes a Numba arystruct_t object into a
  * dpnp.ndarray PyObject using the arystruct_t's parent attribute.
@@ -1073,17 +1134,12 @@ DPEXRT_sycl_usm_ndarray_to_python_acqref(usmarystruct_t *arystruct,
                                          PyArray_Descr *descr)
 {
     PyObject *dpnp_ary = NULL;
-    PyObject *dpnp_array_mod = NULL;
-    PyObject *dpnp_array_type = NULL;
     PyObject *usm_ndarr_obj = NULL;
-    PyObject *args = NULL;
-    PyTypeObject *dpnp_array_type_obj = NULL;
     MemInfoObject *miobj = NULL;
-    npy_intp *shape = NULL, *strides = NULL;
-    int typenum = 0;
-    int status = 0;
-    int exp = 0;
+    npy_intp *shape = NULL;
+    npy_intp strides[NPY_MAXDIMS];
     npy_intp itemsize = 0;
+    int status = 0;
 
     DPEXRT_DEBUG(drt_debug_print(
         "DPEXRT-DEBUG: In DPEXRT_sycl_usm_ndarray_to_python_acqref.\n"));
@@ -1101,6 +1157,14 @@ DPEXRT_sycl_usm_ndarray_to_python_acqref(usmarystruct_t *arystruct,
         return MOD_ERROR_VAL;
     }
 
+    if (ndim < 0 || ndim > NPY_MAXDIMS) {
+        PyErr_Format(PyExc_ValueError,
+                     "In 'DPEXRT_sycl_usm_ndarray_to_python_acqref', "
+                     "unsupported number of dimensions %d.",
+                     ndim);
+        return MOD_ERROR_VAL;
+    }
+
     // If the arystruct has a parent attribute, try to box the parent and
     // return it.
     if (arystruct->parent) {
@@ -1124,39 +1188,12 @@ DPEXRT_sycl_usm_ndarray_to_python_acqref(usmarystruct_t *arystruct,
     // The rationale for boxing the dpnp.ndarray from the meminfo pointer is to
     // return back to Python memory that was allocated inside Numba and let
     // Python manage the lifetime of the memory.
-    if (arystruct->meminfo) {
-        DPEXRT_DEBUG(
-            drt_debug_print("DPEXRT-DEBUG: Set the base of the boxed array "
-                            "from arystruct's meminfo pointer at %s, line %d\n",
-                            __FILE__, __LINE__));
-        // wrap into MemInfoObject
-        if (!(miobj = PyObject_New(MemInfoObject, &MemInfoType))) {
-            PyErr_Format(PyExc_ValueError,
-                         "In 'DPEXRT_sycl_usm_ndarray_to_python_acqref', "
-                         "failed to create a new MemInfoObject object.");
-            return MOD_ERROR_VAL;
-        };
-        args = PyTuple_New(1);
-        // PyTuple_SET_ITEM steals reference
-        PyTuple_SET_ITEM(args, 0, PyLong_FromVoidPtr(arystruct->meminfo));
-
-        //  Note: MemInfo_init() does not incref. The function steals the
-        //        NRT reference, which we need to acquire.
-        // Increase the refcount of the NRT_MemInfo object, i.e., mi->refct++
-        NRT_MemInfo_acquire(arystruct->meminfo);
-        status = MemInfo_init(miobj, args, NULL);
-        if (status != 0) {
-            DPEXRT_DEBUG(drt_debug_print("MemInfo_init failed at %s, line %d\n",
-                                         __FILE__, __LINE__));
-            Py_DECREF(args);
-            PyErr_Format(PyExc_ValueError,
-                         "In 'DPEXRT_sycl_usm_ndarray_to_python_acqref', "
-                         "failed to init MemInfoObject object.");
-            return MOD_ERROR_VAL;
-        }
-        Py_DECREF(args);
-    }
-    else {
+    //
+    // All objects are built directly through the C-API: the MemInfoObject is
+    // initialized in place instead of going through MemInfo_init's argument
+    // parsing, and the dpnp.ndarray type and attribute name are the ones
+    // cached when the module was initialized.
+    if (!arystruct->meminfo) {
         PyErr_Format(PyExc_ValueError,
                      "In 'DPEXRT_sycl_usm_ndarray_to_python_acqref', "
                      "failed to create a new MemInfoObject object since "
@@ -1164,63 +1201,51 @@ DPEXRT_sycl_usm_ndarray_to_python_acqref(usmarystruct_t *arystruct,
         return MOD_ERROR_VAL;
     }
 
-    shape = arystruct->shape_and_strides;
+    DPEXRT_DEBUG(
+        drt_debug_print("DPEXRT-DEBUG: Set the base of the boxed array "
+                        "from arystruct's meminfo pointer at %s, line %d\n",
+                        __FILE__, __LINE__));
 
-    // Calculate the exponent from the arystruct->itemsize as we know
-    // itemsize is a power of two
-    itemsize = arystruct->itemsize;
-    while (itemsize >>= 1)
-        exp++;
+    if (!(miobj = PyObject_New(MemInfoObject, &MemInfoType))) {
+        PyErr_Format(PyExc_ValueError,
+                     "In 'DPEXRT_sycl_usm_ndarray_to_python_acqref', "
+                     "failed to create a new MemInfoObject object.");
+        return MOD_ERROR_VAL;
+    };
+    // The MemInfoObject steals the NRT reference, which we need to acquire.
+    // Increase the refcount of the NRT_MemInfo object, i.e., mi->refct++
+    NRT_MemInfo_acquire(arystruct->meminfo);
+    miobj->meminfo = arystruct->meminfo;
+
+    shape = arystruct->shape_and_strides;
 
     // Numba internally stores strides as bytes and not as elements. Divide
     // the stride by itemsize to get number of elements.
-    for (size_t idx = ndim; idx < 2 * ((size_t)ndim); ++idx)
-        arystruct->shape_and_strides[idx] =
-            arystruct->shape_and_strides[idx] >> exp;
-    strides = (shape + ndim);
+    itemsize = arystruct->itemsize;
+    for (int idx = 0; idx < ndim; ++idx)
+        strides[idx] = arystruct->shape_and_strides[ndim + idx] / itemsize;
 
-    typenum = descr->type_num;
     usm_ndarr_obj = UsmNDArray_MakeFromPtr(
-        ndim, shape, typenum, strides, (DPCTLSyclUSMRef)arystruct->data,
+        ndim, shape, descr->type_num, strides, (DPCTLSyclUSMRef)arystruct->data,
         (DPCTLSyclQueueRef)arystruct->sycl_queue, 0, (PyObject *)miobj);
+    // The usm_ndarray keeps its own reference to the MemInfoObject.
+    Py_DECREF(miobj);
 
     if (usm_ndarr_obj == NULL ||
         !PyObject_TypeCheck(usm_ndarr_obj, &PyUSMArrayType))
     {
+        Py_XDECREF(usm_ndarr_obj);
         PyErr_Format(PyExc_ValueError,
                      "In 'DPEXRT_sycl_usm_ndarray_to_python_acqref', "
                      "failed to create a new dpctl.tensor.usm_ndarray object.");
         return MOD_ERROR_VAL;
     }
 
-    // TODO: check if the object is dpctl tensor and return usm_ndarr_obj then
-
     //  call new on dpnp_array
-    dpnp_array_mod = PyImport_ImportModule("dpnp.dpnp_array");
-    if (!dpnp_array_mod) {
-        PyErr_Format(PyExc_ValueError,
-                     "In 'DPEXRT_sycl_usm_ndarray_to_python_acqref', "
-                     "failed to load the dpnp.dpnp_array module.");
-        return MOD_ERROR_VAL;
-    }
-    dpnp_array_type = PyObject_GetAttrString(dpnp_array_mod, "dpnp_array");
-
-    if (!PyType_Check(dpnp_array_type)) {
-        Py_DECREF(dpnp_array_mod);
-        Py_XDECREF(dpnp_array_type);
-        PyErr_Format(PyExc_ValueError,
-                     "In 'DPEXRT_sycl_usm_ndarray_to_python_acqref', "
-                     "failed to crate dpnp.dpnp_array PyTypeObject.");
-        return MOD_ERROR_VAL;
-    }
-
-    Py_DECREF(dpnp_array_mod);
-
-    dpnp_array_type_obj = (PyTypeObject *)(dpnp_array_type);
-
-    if (!(dpnp_ary = (PyObject *)dpnp_array_type_obj->tp_new(
-              dpnp_array_type_obj, PyTuple_New(0), PyDict_New())))
+    if (!(dpnp_ary = dpnp_array_type_cached->tp_new(dpnp_array_type_cached,
+                                                    empty_tuple, NULL)))
     {
+        Py_DECREF(usm_ndarr_obj);
         PyErr_SetString(PyExc_ValueError,
                         "In 'DPEXRT_sycl_usm_ndarray_to_python_acqref', "
                         "creating a dpnp.ndarray object from "
@@ -1228,10 +1253,10 @@ DPEXRT_sycl_usm_ndarray_to_python_acqref(usmarystruct_t *arystruct,
         return MOD_ERROR_VAL;
     };
 
-    status = PyObject_SetAttrString((PyObject *)dpnp_ary, "_array_obj",
-                                    usm_ndarr_obj);
+    status = PyObject_SetAttr(dpnp_ary, array_obj_attr_name, usm_ndarr_obj);
+    Py_DECREF(usm_ndarr_obj);
     if (status == -1) {
-        Py_DECREF(dpnp_array_type_obj);
+        Py_DECREF(dpnp_ary);
         PyErr_SetString(PyExc_TypeError,
                         "In 'DPEXRT_sycl_usm_ndarray_to_python_acqref', "
                         "could not extract '_array_obj' attribute from "
@@ -1244,7 +1269,7 @@ DPEXRT_sycl_usm_ndarray_to_python_acqref(usmarystruct_t *arystruct,
         "at %s, line %d\n",
         __FILE__, __LINE__));
 
-    return (PyObject *)dpnp_ary;
+    return dpnp_ary;
 }
 
 /*----------------------------------------------------------------------------*/
@@ -1258,11 +1283,14 @@ DPEXRT_sycl_usm_ndarray_to_python_acqref(usmarystruct_t *arystruct,
  * @param    obj            A dpctl.SyclQueue Python object
  * @param    queue_struct   An instance of the struct numba-dpex uses to
  *                          represent a dpctl.SyclQueue inside Numba.
+ * @param    borrowed       If non-zero, no NRT meminfo is allocated for the
+ *                          queue and the reference of obj is only borrowed.
  * @return   {return}       Return code indicating success (0) or failure (-1).
  */
-static int DPEXRT_sycl_queue_from_python(NRT_api_functions *nrt,
-                                         PyObject *obj,
-                                         queuestruct_t *queue_struct)
+static int queue_from_python_impl(NRT_api_functions *nrt,
+                                  PyObject *obj,
+                                  queuestruct_t *queue_struct,
+                                  int borrowed)
 {
     struct PySyclQueueObject *queue_obj = NULL;
     DPCTLSyclQueueRef queue_ref = NULL;
@@ -1291,13 +1319,18 @@ static int DPEXRT_sycl_queue_from_python(NRT_api_functions *nrt,
                                  DPCTLDeviceMgr_GetDeviceInfoStr(device_ref));
                  DPCTLDevice_Delete(device_ref););
 
-    // We are doing incref here to ensure python does not release the object
-    // while NRT references it. Coresponding decref is called by NRT in
-    // NRT_MemInfo_pyobject_dtor once there is no reference to this object by
-    // the code managed by NRT.
-    Py_INCREF(queue_obj);
-    queue_struct->meminfo =
-        nrt->manage_memory(queue_obj, NRT_MemInfo_pyobject_dtor);
+    if (borrowed) {
+        queue_struct->meminfo = NULL;
+    }
+    else {
+        // We are doing incref here to ensure python does not release the
+        // object while NRT references it. Coresponding decref is called by
+        // NRT in NRT_MemInfo_pyobject_dtor once there is no reference to this
+        // object by the code managed by NRT.
+        Py_INCREF(queue_obj);
+        queue_struct->meminfo =
+            nrt->manage_memory(queue_obj, NRT_MemInfo_pyobject_dtor);
+    }
     queue_struct->parent = (PyObject *)queue_obj;
     queue_struct->queue_ref = queue_ref;
 
@@ -1316,6 +1349,39 @@ error:
     return -1;
 }
 
+/*!
+ * @brief Unboxes a Python dpctl.SyclQueue object to a Numba-native
+ * queuestruct_t instance that owns an NRT meminfo referencing the object.
+ *
+ * @param    obj            A dpctl.SyclQueue Python object
+ * @param    queue_struct   An instance of the struct numba-dpex uses to
+ *                          represent a dpctl.SyclQueue inside Numba.
+ * @return   {return}       Return code indicating success (0) or failure (-1).
+ */
+static int DPEXRT_sycl_queue_from_python(NRT_api_functions *nrt,
+                                         PyObject *obj,
+                                         queuestruct_t *queue_struct)
+{
+    return queue_from_python_impl(nrt, obj, queue_struct, 0);
+}
+
+/*!
+ * @brief Unboxes a Python dpctl.SyclQueue object to a Numba-native
+ * queuestruct_t instance that borrows the object. The caller has to keep the
+ * object alive for as long as the queuestruct_t is used.
+ *
+ * @param    obj            A dpctl.SyclQueue Python object
+ * @param    queue_struct   An instance of the struct numba-dpex uses to
+ *                          represent a dpctl.SyclQueue inside Numba.
+ * @return   {return}       Return code indicating success (0) or failure (-1).
+ */
+static int DPEXRT_sycl_queue_from_python_borrowed(NRT_api_functions *nrt,
+                                                  PyObject *obj,
+                                                  queuestruct_t *queue_struct)
+{
+    return queue_from_python_impl(nrt, obj, queue_struct, 1);
+}
+
 /*!
  * @brief A helper function that boxes a Numba-dpex queuestruct_t object into a
  * dctl.SyclQueue PyObject using the queuestruct_t's parent attribute.
@@ -1506,6 +1572,8 @@ static PyObject *build_c_helpers_dict(void)
 
     _declpointer("DPEXRT_sycl_usm_ndarray_from_python",
                  &DPEXRT_sycl_usm_ndarray_from_python);
+    _declpointer("DPEXRT_sycl_usm_ndarray_from_python_borrowed",
+                 &DPEXRT_sycl_usm_ndarray_from_python_borrowed);
     _declpointer("DPEXRT_sycl_usm_ndarray_to_python_acqref",
                  &DPEXRT_sycl_usm_ndarray_to_python_acqref);
     _declpointer("DPEXRTQueue_CreateFromFilterString",
@@ -1518,6 +1586,8 @@ static PyObject *build_c_helpers_dict(void)
                  &NRT_ExternalAllocator_new_for_usm);
     _declpointer("DPEXRT_sycl_queue_from_python",
                  &DPEXRT_sycl_queue_from_python);
+    _declpointer("DPEXRT_sycl_queue_from_python_borrowed",
+                 &DPEXRT_sycl_queue_from_python_borrowed);
     _declpointer("DPEXRT_sycl_queue_to_python", &DPEXRT_sycl_queue_to_python);
     _declpointer("DPEXRT_sycl_event_from_python",
                  &DPEXRT_sycl_event_from_python);
@@ -1527,6 +1597,14 @@ static PyObject *build_c_helpers_dict(void)
                  &DPEXRT_nrt_acquire_meminfo_and_schedule_release);
     _declpointer("DPEXRT_build_or_get_kernel", &DPEXRT_build_or_get_kernel);
     _declpointer("DPEXRT_kernel_cache_size", &DPEXRT_kernel_cache_size);
+    _declpointer("DPEXRT_host_staging_buffer_acquire",
+                 &DPEXRT_host_staging_buffer_acquire);
+    _declpointer("DPEXRT_host_staging_buffer_release",
+                 &DPEXRT_host_staging_buffer_release);
+    _declpointer("DPEXRT_host_staging_pool_clear",
+                 &DPEXRT_host_staging_pool_clear);
+    _declpointer("DPEXRT_host_staging_pool_size",
+                 &DPEXRT_host_staging_pool_size);
 
 #undef _declpointer
     return dct;
@@ -1562,20 +1640,35 @@ MOD_INIT(_dpexrt_python)
         Py_XDECREF(dpnp_array_type);
         return MOD_ERROR_VAL;
     }
+    Py_INCREF(dpnp_array_type);
+    dpnp_array_type_cached = (PyTypeObject *)dpnp_array_type;
     PyModule_AddObject(m, "dpnp_array_type", dpnp_array_type);
     Py_DECREF(dpnp_array_mod);
 
+    array_obj_attr_name = PyUnicode_InternFromString("_array_obj");
+    empty_tuple = PyTuple_New(0);
+    if (array_obj_attr_name == NULL || empty_tuple == NULL) {
+        Py_DECREF(m);
+        return MOD_ERROR_VAL;
+    }
+
     PyModule_AddObject(m, "NRT_ExternalAllocator_new_for_usm",
                        PyLong_FromVoidPtr(&NRT_ExternalAllocator_new_for_usm));
     PyModule_AddObject(
         m, "DPEXRT_sycl_usm_ndarray_from_python",
         PyLong_FromVoidPtr(&DPEXRT_sycl_usm_ndarray_from_python));
+    PyModule_AddObject(
+        m, "DPEXRT_sycl_usm_ndarray_from_python_borrowed",
+        PyLong_FromVoidPtr(&DPEXRT_sycl_usm_ndarray_from_python_borrowed));
     PyModule_AddObject(
         m, "DPEXRT_sycl_usm_ndarray_to_python_acqref",
         PyLong_FromVoidPtr(&DPEXRT_sycl_usm_ndarray_to_python_acqref));
 
     PyModule_AddObject(m, "DPEXRT_sycl_queue_from_python",
                        PyLong_FromVoidPtr(&DPEXRT_sycl_queue_from_python));
+    PyModule_AddObject(
+        m, "DPEXRT_sycl_queue_from_python_borrowed",
+        PyLong_FromVoidPtr(&DPEXRT_sycl_queue_from_python_borrowed));
     PyModule_AddObject(m, "DPEXRT_sycl_queue_to_python",
                        PyLong_FromVoidPtr(&DPEXRT_sycl_queue_to_python));
     PyModule_AddObject(m, "DPEXRT_sycl_event_from_python",
@@ -1601,6 +1694,14 @@ MOD_INIT(_dpexrt_python)
                        PyLong_FromVoidPtr(&DPEXRT_build_or_get_kernel));
     PyModule_AddObject(m, "DPEXRT_kernel_cache_size",
                        PyLong_FromVoidPtr(&DPEXRT_kernel_cache_size));
+    PyModule_AddObject(m, "DPEXRT_host_staging_buffer_acquire",
+                       PyLong_FromVoidPtr(&DPEXRT_host_staging_buffer_acquire));
+    PyModule_AddObject(m, "DPEXRT_host_staging_buffer_release",
+                       PyLong_FromVoidPtr(&DPEXRT_host_staging_buffer_release));
+    PyModule_AddObject(m, "DPEXRT_host_staging_pool_clear",
+                       PyLong_FromVoidPtr(&DPEXRT_host_staging_pool_clear));
+    PyModule_AddObject(m, "DPEXRT_host_staging_pool_size",
+                       PyLong_FromVoidPtr(&DPEXRT_host_staging_pool_size));
 
     PyModule_AddObject(m, "c_helpers", build_c_helpers_dict());
     return MOD_SUCCESS_VAL(m);
@@ -164,16 +164,23 @@ class DpexRTContext(object):
 
         return ret
 
-    def arraystruct_from_python(self, pyapi, obj, ptr):
+    def arraystruct_from_python(self, pyapi, obj, ptr, borrowed=False):
         """Generates a call to DPEXRT_sycl_usm_ndarray_from_python C function
         defined in the _DPREXRT_python Python extension.
 
+        If ``borrowed`` is set, DPEXRT_sycl_usm_ndarray_from_python_borrowed is
+        called instead. It does not allocate an NRT meminfo for the array and
+        does not take a reference to ``obj``, so the caller has to keep ``obj``
+        alive for as long as the native array is used.
         """
         fnty = llvmir.FunctionType(
             llvmir.IntType(32), [pyapi.voidptr, pyapi.pyobj, pyapi.voidptr]
         )
         nrt_api = self._context.nrt.get_nrt_api(pyapi.builder)
-        fn = pyapi._get_function(fnty, "DPEXRT_sycl_usm_ndarray_from_python")
+        fn_name = "DPEXRT_sycl_usm_ndarray_from_python"
+        if borrowed:
+            fn_name += "_borrowed"
+        fn = pyapi._get_function(fnty, fn_name)
         fn.args[0].add_attribute("nocapture")
         fn.args[1].add_attribute("nocapture")
         fn.args[2].add_attribute("nocapture")
@@ -182,14 +189,18 @@ class DpexRTContext(object):
 
         return self.error
 
-    def queuestruct_from_python(self, pyapi, obj, ptr):
-        """Calls the c function DPEXRT_sycl_queue_from_python"""
+    def queuestruct_from_python(self, pyapi, obj, ptr, borrowed=False):
+        """Calls the c function DPEXRT_sycl_queue_from_python, or
+        DPEXRT_sycl_queue_from_python_borrowed if ``borrowed`` is set."""
         fnty = llvmir.FunctionType(
             llvmir.IntType(32), [pyapi.voidptr, pyapi.pyobj, pyapi.voidptr]
         )
         nrt_api = self._context.nrt.get_nrt_api(pyapi.builder)
 
-        fn = pyapi._get_function(fnty, "DPEXRT_sycl_queue_from_python")
+        fn_name = "DPEXRT_sycl_queue_from_python"
+        if borrowed:
+            fn_name += "_borrowed"
+        fn = pyapi._get_function(fnty, fn_name)
         fn.args[0].add_attribute("nocapture")
         fn.args[1].add_attribute("nocapture")
         fn.args[2].add_attribute("nocapture")
@@ -534,3 +545,81 @@ class DpexRTContext(object):
         )
 
         return builder.call(fn, [])
+
+    @_check_null_result
+    def host_staging_buffer_acquire(self, builder: llvmir.IRBuilder, args):
+        """Inserts LLVM IR to call host_staging_buffer_acquire and checks the
+        returned pointer for NULL.
+
+        .. code-block:: c
+
+            void *DPEXRT_host_staging_buffer_acquire(
+                DPCTLSyclQueueRef QRef,
+                size_t nbytes
+            );
+
+        """
+        fn = cgutils.get_or_insert_function(
+            builder.module,
+            llvmir.FunctionType(
+                cgutils.voidptr_t,
+                [cgutils.voidptr_t, llvmir.IntType(64)],
+            ),
+            "DPEXRT_host_staging_buffer_acquire",
+        )
+
+        return builder.call(fn, args)
+
+    def host_staging_buffer_release(self, builder: llvmir.IRBuilder, args):
+        """Inserts LLVM IR to call host_staging_buffer_release.
+
+        .. code-block:: c
+
+            void DPEXRT_host_staging_buffer_release(
+                DPCTLSyclQueueRef QRef,
+                void *ptr
+            );
+
+        """
+        fn = cgutils.get_or_insert_function(
+            builder.module,
+            llvmir.FunctionType(
+                llvmir.VoidType(),
+                [cgutils.voidptr_t, cgutils.voidptr_t],
+            ),
+            "DPEXRT_host_staging_buffer_release",
+        )
+
+        return builder.call(fn, args)
+
+    def host_staging_pool_clear(self, builder: llvmir.IRBuilder):
+        """Inserts LLVM IR to call host_staging_pool_clear.
+
+        .. code-block:: c
+
+            void DPEXRT_host_staging_pool_clear();
+
+        """
+        fn = cgutils.get_or_insert_function(
+            builder.module,
+            llvmir.FunctionType(llvmir.VoidType(), []),
+            "DPEXRT_host_staging_pool_clear",
+        )
+
+        return builder.call(fn, [])
+
+    def host_staging_pool_size(self, builder: llvmir.IRBuilder):
+        """Inserts LLVM IR to call host_staging_pool_size.
+
+        .. code-block:: c
+
+            size_t DPEXRT_host_staging_pool_size();
+
+        """
+        fn = cgutils.get_or_insert_function(
+            builder.module,
+            llvmir.FunctionType(llvmir.IntType(64), []),
+            "DPEXRT_host_staging_pool_size",
+        )
+
+        return builder.call(fn, [])
@@ -0,0 +1,223 @@
+// SPDX-FileCopyrightText: 2024 Intel Corporation
+//
+// SPDX-License-Identifier: Apache-2.0
+
+#include "host_staging_pool.h"
+#include <algorithm>
+#include <mutex>
+#include <unordered_map>
+#include <vector>
+
+extern "C"
+{
+#include "dpctl_capi.h"
+#include "dpctl_sycl_interface.h"
+
+#include "_dbg_printer.h"
+}
+
+#include "syclinterface/dpctl_sycl_type_casters.hpp"
+#include <CL/sycl.hpp>
+
+namespace
+{
+
+// Smallest allocation made by the pool, so that subsequent requests for
+// a handful of reduction results can reuse the same buffer.
+constexpr size_t min_staging_buffer_size = 256;
+
+// Upper bound on the bytes of the free buffers a pool retains. Buffers
+// released while the bound is reached are freed instead of being cached.
+constexpr size_t max_retained_staging_bytes = 1 << 20;
+
+struct StagingBuffer
+{
+    void *ptr;
+    size_t size;
+};
+
+void free_staging_buffer(void *ptr, const sycl::context &ctx)
+{
+    try {
+        sycl::free(ptr, ctx);
+    } catch (const std::exception &e) {
+        DPEXRT_DEBUG(
+            drt_debug_print("DPEXRT-DEBUG: failed to free staging buffer %p.\n",
+                            ptr););
+        return;
+    }
+    DPEXRT_DEBUG(
+        drt_debug_print("DPEXRT-DEBUG: freed staging buffer %p.\n", ptr););
+}
+
+class StagingPool
+{
+public:
+    explicit StagingPool(const sycl::context &ctx) : ctx(ctx) {}
+
+    StagingPool(const StagingPool &) = delete;
+    StagingPool &operator=(const StagingPool &) = delete;
+
+    // Frees every buffer of the pool. Pools are only dropped by
+    // DPEXRT_host_staging_pool_clear once no buffer is acquired.
+    ~StagingPool()
+    {
+        for (const auto &kv : sizes) {
+            free_staging_buffer(kv.first, ctx);
+        }
+    }
+
+    // Returns a free buffer of at least nbytes bytes, or nullptr.
+    void *take(size_t nbytes)
+    {
+        auto it = std::find_if(
+            free_buffers.begin(), free_buffers.end(),
+            [nbytes](const StagingBuffer &b) { return b.size >= nbytes; });
+        if (it == free_buffers.end())
+            return nullptr;
+        void *ptr = it->ptr;
+        retained_bytes -= it->size;
+        free_buffers.erase(it);
+        return ptr;
+    }
+
+    void add(void *ptr, size_t size) { sizes.emplace(ptr, size); }
+
+    // Returns an acquired buffer to the pool, or frees it if the pool
+    // already retains max_retained_staging_bytes bytes.
+    bool release(void *ptr)
+    {
+        auto it = sizes.find(ptr);
+        if (it == sizes.end())
+            return false;
+        size_t size = it->second;
+        if (retained_bytes + size > max_retained_staging_bytes) {
+            sizes.erase(it);
+            free_staging_buffer(ptr, ctx);
+            return true;
+        }
+        free_buffers.push_back(StagingBuffer{ptr, size});
+        retained_bytes += size;
+        return true;
+    }
+
+    // Frees the free buffers. Acquired buffers stay owned by the pool and
+    // are handled by release once they are returned.
+    void clear()
+    {
+        for (const auto &b : free_buffers) {
+            sizes.erase(b.ptr);
+            free_staging_buffer(b.ptr, ctx);
+        }
+        free_buffers.clear();
+        retained_bytes = 0;
+    }
+
+    bool empty() const { return sizes.empty(); }
+
+    size_t num_buffers() const { return sizes.size(); }
+
+private:
+    sycl::context ctx;
+    std::vector<StagingBuffer> free_buffers;
+    std::unordered_map<void *, size_t> sizes;
+    size_t retained_bytes = 0;
+};
+
+std::mutex staging_pool_mutex;
+
+// The map is intentionally leaked, so that no buffer is freed by a static
+// destructor at process exit, when the SYCL runtime may already be torn down.
+// The runtime empties the pools with DPEXRT_host_staging_pool_clear from an
+// atexit hook instead.
+std::unordered_map<sycl::context, StagingPool> &staging_pools =
+    *new std::unordered_map<sycl::context, StagingPool>();
+
+StagingPool &get_staging_pool(const sycl::context &ctx)
+{
+    return staging_pools.try_emplace(ctx, ctx).first->second;
+}
+
+} // namespace
+
+extern "C"
+{
+    void *DPEXRT_host_staging_buffer_acquire(DPCTLSyclQueueRef QRef,
+                                             size_t nbytes)
+    {
+        using dpctl::syclinterface::unwrap;
+
+        sycl::queue *q = unwrap<sycl::queue>(QRef);
+        std::lock_guard<std::mutex> lock(staging_pool_mutex);
+        StagingPool &pool = get_staging_pool(q->get_context());
+
+        if (void *ptr = pool.take(nbytes)) {
+            DPEXRT_DEBUG(
+                drt_debug_print("DPEXRT-DEBUG: reusing staging buffer %p.\n",
+                                ptr););
+            return ptr;
+        }
+
+        size_t size = std::max(nbytes, min_staging_buffer_size);
+        void *ptr = nullptr;
+        try {
+            ptr = sycl::malloc_host(size, *q);
+        } catch (const std::exception &e) {
+            ptr = nullptr;
+        }
+        if (ptr == nullptr) {
+            DPEXRT_DEBUG(drt_debug_print(
+                             "DPEXRT-DEBUG: staging buffer allocation of %zu "
+                             "bytes failed.\n",
+                             size););
+            return nullptr;
+        }
+        pool.add(ptr, size);
+        DPEXRT_DEBUG(
+            drt_debug_print("DPEXRT-DEBUG: allocated staging buffer %p of %zu "
+                            "bytes.\n",
+                            ptr, size););
+        return ptr;
+    }
+
+    void DPEXRT_host_staging_buffer_release(DPCTLSyclQueueRef QRef, void *ptr)
+    {
+        using dpctl::syclinterface::unwrap;
+
+        if (ptr == nullptr)
+            return;
+
+        sycl::queue *q = unwrap<sycl::queue>(QRef);
+        std::lock_guard<std::mutex> lock(staging_pool_mutex);
+        auto it = staging_pools.find(q->get_context());
+        if (it == staging_pools.end() || !it->second.release(ptr)) {
+            DPEXRT_DEBUG(
+                drt_debug_print("DPEXRT-DEBUG: %p is not a staging buffer.\n",
+                                ptr););
+        }
+    }
+
+    void DPEXRT_host_staging_pool_clear()
+    {
+        std::lock_guard<std::mutex> lock(staging_pool_mutex);
+        for (auto it = staging_pools.begin(); it != staging_pools.end();) {
+            it->second.clear();
+            // Pools with acquired buffers are kept, so that the buffers can
+            // still be released.
+            if (it->second.empty())
+                it = staging_pools.erase(it);
+            else
+                ++it;
+        }
+    }
+
+    size_t DPEXRT_host_staging_pool_size()
+    {
+        std::lock_guard<std::mutex> lock(staging_pool_mutex);
+        size_t size = 0;
+        for (const auto &kv : staging_pools) {
+            size += kv.second.num_buffers();
+        }
+        return size;
+    }
+}
@@ -0,0 +1,66 @@
+// SPDX-FileCopyrightText: 2024 Intel Corporation
+//
+// SPDX-License-Identifier: Apache-2.0
+
+//===----------------------------------------------------------------------===//
+///
+/// \file
+/// Defines dpex run time function(s) that manage a pool of pinned USM host
+/// allocations used to stage small device-to-host transfers.
+///
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#include "dpctl_capi.h"
+#include "dpctl_sycl_interface.h"
+
+#ifdef __cplusplus
+extern "C"
+{
+#endif
+    /*!
+     * @brief Returns a pinned USM host buffer of at least nbytes bytes that
+     * is bound to the context of the queue. Buffers are taken from a per
+     * context pool and are only allocated if no free buffer of sufficient
+     * size is cached. The buffer has to be returned to the pool with
+     * DPEXRT_host_staging_buffer_release once it is no longer used. A pool
+     * retains at most 1 MiB of free buffers, larger buffers are freed on
+     * release.
+     *
+     * @param    QRef           Queue reference,
+     * @param    nbytes         Minimal size of the buffer in bytes.
+     *
+     * @return   {return}       Pointer to the host buffer or nullptr if the
+     * allocation failed.
+     */
+    void *DPEXRT_host_staging_buffer_acquire(DPCTLSyclQueueRef QRef,
+                                             size_t nbytes);
+
+    /*!
+     * @brief Returns a buffer acquired with
+     * DPEXRT_host_staging_buffer_acquire back to the pool of the queue's
+     * context.
+     *
+     * @param    QRef           Queue reference the buffer was acquired with,
+     * @param    ptr            Pointer to the host buffer.
+     */
+    void DPEXRT_host_staging_buffer_release(DPCTLSyclQueueRef QRef, void *ptr);
+
+    /*!
+     * @brief Frees the buffers of all pools that are not acquired, and drops
+     * the pools that have no acquired buffers left. The function is called
+     * at interpreter exit by numba_dpex.core.runtime.
+     */
+    void DPEXRT_host_staging_pool_clear();
+
+    /*!
+     * @brief returns number of buffers allocated by the pool. Intended for
+     * test purposes only
+     *
+     * @return   {return}       Number of allocated staging buffers.
+     */
+    size_t DPEXRT_host_staging_pool_size();
+#ifdef __cplusplus
+}
+#endif
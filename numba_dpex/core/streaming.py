@@ -0,0 +1,304 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Implements :func:`stream_map` that runs a kernel over data that is streamed
+through a device in chunks.
+
+The data is split into chunks along its first axis. Every chunk goes through
+three stages: a host-to-device copy, the kernel and a device-to-host copy. The
+stages are submitted asynchronously and are chained using SYCL events, and
+several chunks are kept in flight using rotating sets of buffers, so that the
+copies of one chunk overlap with the computation of another one. Data sets that
+do not fit into device memory can be processed that way, as only
+``num_buffers`` chunks ever reside on the device.
+"""
+
+import itertools
+from typing import NamedTuple
+
+import dpctl
+import dpnp
+import numpy as np
+from dpctl.memory import MemoryUSMHost
+
+from numba_dpex.core.host_array_cache import infer_queue
+from numba_dpex.core.kernel_launcher import call_kernel_async
+from numba_dpex.kernel_api import Range
+
+
+class _StagingSlot(NamedTuple):
+    """The set of buffers used to move one chunk through the device."""
+
+    host_in: np.ndarray
+    host_out: np.ndarray
+    host_in_mem: MemoryUSMHost
+    host_out_mem: MemoryUSMHost
+    device_in: dpnp.ndarray
+    device_out: dpnp.ndarray
+
+
+class _InFlightChunk(NamedTuple):
+    """The state of a chunk that was submitted but not yet written back."""
+
+    nrows: int
+    dest: np.ndarray
+    events: list
+
+
+def _host_staging_array(shape, dtype, queue):
+    """Allocates a pinned USM host buffer and returns it together with a NumPy
+    view of it."""
+    dtype = np.dtype(dtype)
+    nbytes = max(int(np.prod(shape)) * dtype.itemsize, 1)
+    mem = MemoryUSMHost(nbytes, queue=queue)
+    return np.ndarray(shape, dtype=dtype, buffer=mem), mem
+
+
+def _make_slot(chunk_shape, in_dtype, out_shape, out_dtype, inplace, queue):
+    host_in, host_in_mem = _host_staging_array(chunk_shape, in_dtype, queue)
+    device_in = dpnp.empty(
+        chunk_shape, dtype=in_dtype, usm_type="device", sycl_queue=queue
+    )
+    if inplace:
+        host_out, host_out_mem, device_out = host_in, host_in_mem, device_in
+    else:
+        host_out, host_out_mem = _host_staging_array(
+            out_shape, out_dtype, queue
+        )
+        device_out = dpnp.empty(
+            out_shape, dtype=out_dtype, usm_type="device", sycl_queue=queue
+        )
+    return _StagingSlot(
+        host_in, host_out, host_in_mem, host_out_mem, device_in, device_out
+    )
+
+
+def _iter_blocks(source, chunk_size):
+    """Yields the chunks of ``source`` as NumPy arrays."""
+    if isinstance(source, np.ndarray):
+        for start in range(0, source.shape[0], chunk_size):
+            stop = start + chunk_size
+            yield source[start:stop]
+        return
+
+    for block in source:
+        block = np.asarray(block)
+        if block.ndim == 0 or block.shape[0] > chunk_size:
+            raise ValueError(
+                "Blocks produced by the source iterator must have at least "
+                f"one dimension and at most chunk_size={chunk_size} rows, "
+                f"got a block of shape {block.shape}."
+            )
+        yield block
+
+
+def _check_out(source, out):
+    """Checks that ``out`` can hold the results of all rows of ``source``
+    before the first chunk is submitted."""
+    if not isinstance(out, np.ndarray) or out.ndim == 0:
+        raise ValueError("out has to be a NumPy array with a first axis.")
+    if isinstance(source, np.ndarray) and out.shape[0] != source.shape[0]:
+        raise ValueError(
+            f"The out array has {out.shape[0]} rows, but the source has "
+            f"{source.shape[0]} rows."
+        )
+
+
+def _check_block(block, first):
+    """Checks that a block shares the layout of the first block."""
+    if block.shape[1:] != first.shape[1:] or block.dtype != first.dtype:
+        raise ValueError(
+            "All blocks have to share the trailing shape and dtype of "
+            f"the first block, got {block.shape} {block.dtype} after "
+            f"{first.shape} {first.dtype}."
+        )
+
+
+def _retire(chunk: _InFlightChunk, slot: _StagingSlot):
+    """Waits for a chunk to leave the device and writes it back to the
+    host."""
+    for event in chunk.events:
+        event.wait()
+    chunk.dest[...] = slot.host_out[: chunk.nrows]
+
+
+def stream_map(
+    kernel_fn,
+    source,
+    chunk_size,
+    out=None,
+    *,
+    args=(),
+    num_buffers=2,
+    sycl_queue=None,
+):
+    """Runs a kernel over ``source`` by streaming it through a device in
+    chunks.
+
+    The data is split into chunks of ``chunk_size`` rows along the first axis
+    and every chunk is processed by a separate launch of ``kernel_fn`` over a
+    :class:`numba_dpex.kernel_api.Range` of the chunk's number of rows. Up to
+    ``num_buffers`` chunks are kept in flight, so that host-to-device copies,
+    kernel execution and device-to-host copies of different chunks overlap.
+    The copies go through pinned USM host staging buffers.
+
+    If ``out`` is ``None``, the kernel is called as
+    ``kernel_fn(item, block, *args)`` and is expected to update the chunk in
+    place. The updated chunk is written back into the source, or into the
+    blocks yielded by the source iterator. Otherwise the kernel is called as
+    ``kernel_fn(item, src_block, dst_block, *args)`` and the chunks of
+    ``dst_block`` are written into ``out`` one after another.
+
+    .. code-block:: python
+
+        import numpy as np
+        import numba_dpex as dpex
+
+
+        @dpex.kernel
+        def square(item, src, dst):
+            i = item.get_id(0)
+            dst[i] = src[i] * src[i]
+
+
+        data = np.memmap("data.bin", dtype=np.float32, mode="r")
+        res = np.empty_like(data)
+        dpex.stream_map(square, data, chunk_size=1 << 24, out=res)
+
+    Args:
+        kernel_fn: A :func:`numba_dpex.kernel` decorated function.
+        source: A NumPy array, a ``numpy.memmap`` or an iterable of NumPy
+            array blocks that have at most ``chunk_size`` rows each and the
+            same trailing shape and dtype.
+        chunk_size (int): The number of rows of every chunk.
+        out (numpy.ndarray, optional): The array to write the results to. Its
+            first dimension has to match the total number of rows of the
+            source.
+        args (tuple, optional): Extra arguments that are passed to every
+            kernel launch after the array arguments.
+        num_buffers (int, optional): The number of chunks kept in flight. Two
+            buffers give double buffering, three give triple buffering.
+            Defaults to 2.
+        sycl_queue (dpctl.SyclQueue, optional): The queue to execute on.
+            Defaults to the queue of the first USM array in ``args``, or to
+            the queue of the default device.
+
+    Returns:
+        The ``out`` array, or the ``source`` if ``out`` is ``None``.
+
+    Raises:
+        ValueError: If ``chunk_size`` or ``num_buffers`` are not positive, if
+            a block does not match the layout of the first one, or if ``out``
+            can not hold all rows of the source. ``out`` is checked against
+            an array source before the first chunk is submitted. Chunks that
+            were submitted before an error are waited for before the error is
+            raised.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size has to be a positive integer.")
+    if num_buffers < 1:
+        raise ValueError("num_buffers has to be a positive integer.")
+
+    inplace = out is None
+    queue = sycl_queue if sycl_queue is not None else infer_queue(args)
+    if not isinstance(queue, dpctl.SyclQueue):
+        raise TypeError("sycl_queue has to be a dpctl.SyclQueue.")
+    if not inplace:
+        _check_out(source, out)
+
+    blocks = _iter_blocks(source, chunk_size)
+    first = next(blocks, None)
+    if first is None:
+        return source if inplace else out
+
+    chunk_shape = (chunk_size,) + first.shape[1:]
+    out_shape = chunk_shape if inplace else (chunk_size,) + out.shape[1:]
+    out_dtype = first.dtype if inplace else out.dtype
+
+    slots = [
+        _make_slot(
+            chunk_shape, first.dtype, out_shape, out_dtype, inplace, queue
+        )
+        for _ in range(num_buffers)
+    ]
+    in_flight = [None] * num_buffers
+    row_in_nbytes = int(np.prod(first.shape[1:])) * first.dtype.itemsize
+    row_out_nbytes = int(np.prod(out_shape[1:])) * np.dtype(out_dtype).itemsize
+
+    offset = 0
+    index = -1
+    try:
+        for index, block in enumerate(itertools.chain((first,), blocks)):
+            _check_block(block, first)
+            nrows = block.shape[0]
+            if nrows == 0:
+                continue
+            if inplace:
+                dest = block
+            else:
+                stop = offset + nrows
+                if stop > out.shape[0]:
+                    raise ValueError(
+                        "The out array is too small for the rows of the "
+                        "source."
+                    )
+                dest = out[offset:stop]
+            offset += nrows
+
+            slot_id = index % num_buffers
+            slot = slots[slot_id]
+            if in_flight[slot_id] is not None:
+                _retire(in_flight[slot_id], slot)
+                in_flight[slot_id] = None
+
+            # Filling the staging buffer on the host overlaps with the device
+            # work of the chunks that are still in flight in other slots.
+            slot.host_in[:nrows] = block
+
+            # The chunk is tracked before its first submission, so that every
+            # submitted event is waited for if a later submission fails.
+            chunk = _InFlightChunk(nrows, dest, [])
+            in_flight[slot_id] = chunk
+            h2d_event = queue.memcpy_async(
+                dpnp.get_usm_ndarray(slot.device_in).usm_data,
+                slot.host_in_mem,
+                nrows * row_in_nbytes,
+            )
+            chunk.events.append(h2d_event)
+            if inplace:
+                kernel_args = (slot.device_in[:nrows],)
+            else:
+                kernel_args = (slot.device_in[:nrows], slot.device_out[:nrows])
+            host_event, kernel_event = call_kernel_async(
+                kernel_fn,
+                Range(nrows),
+                (h2d_event,),
+                *kernel_args,
+                *args,
+            )
+            chunk.events.extend((host_event, kernel_event))
+            d2h_event = queue.memcpy_async(
+                slot.host_out_mem,
+                dpnp.get_usm_ndarray(slot.device_out).usm_data,
+                nrows * row_out_nbytes,
+                [kernel_event],
+            )
+            chunk.events.append(d2h_event)
+
+        # Drain the pipeline in submission order.
+        for step in range(num_buffers):
+            slot_id = (index + 1 + step) % num_buffers
+            if in_flight[slot_id] is not None:
+                _retire(in_flight[slot_id], slots[slot_id])
+                in_flight[slot_id] = None
+    finally:
+        # If the loop raised, the copies and kernels of the chunks in flight
+        # may still use the staging and device buffers, which are freed once
+        # the slots go out of scope.
+        for chunk in in_flight:
+            if chunk is not None:
+                for event in chunk.events:
+                    event.wait()
+
+    return source if inplace else out
@@ -43,6 +43,12 @@ class DpexTypingContext(typing.Context):
 
 
 class DpexTargetContext(CPUContext):
+    # If set, USM arrays and SYCL queues passed from Python are unboxed without
+    # an NRT meminfo and only borrow the reference to the Python object. Only
+    # safe for functions whose arguments can not outlive the call, see
+    # numba_dpex.core.kernel_launcher.call_kernel.
+    borrow_unboxed_args = False
+
     def __init__(self, typingctx, target=DPEX_TARGET_NAME):
         super().__init__(typingctx, target)
 
@@ -26,6 +26,8 @@ class DpctlSyclQueue(types.Type):
         self._device_has_aspect_atomic64 = (
             sycl_queue.sycl_device.has_aspect_atomic64
         )
+        self._device_has_aspect_fp16 = sycl_queue.sycl_device.has_aspect_fp16
+        self._device_has_aspect_fp64 = sycl_queue.sycl_device.has_aspect_fp64
         try:
             self._unique_id = hash(sycl_queue)
         except Exception:
@@ -53,6 +55,14 @@ class DpctlSyclQueue(types.Type):
     def device_has_aspect_atomic64(self):
         return self._device_has_aspect_atomic64
 
+    @property
+    def device_has_aspect_fp16(self):
+        return self._device_has_aspect_fp16
+
+    @property
+    def device_has_aspect_fp64(self):
+        return self._device_has_aspect_fp64
+
     @property
     def key(self):
         """Returns a Python object used as the key to cache an instance of
@@ -84,7 +94,12 @@ def unbox_sycl_queue(typ, obj, c):
     ptr = c.builder.bitcast(qptr, c.pyapi.voidptr)
 
     dpexrtCtx = dpexrt.DpexRTContext(c.context)
-    errcode = dpexrtCtx.queuestruct_from_python(c.pyapi, obj, ptr)
+    errcode = dpexrtCtx.queuestruct_from_python(
+        c.pyapi,
+        obj,
+        ptr,
+        borrowed=getattr(c.context, "borrow_unboxed_args", False),
+    )
     is_error = cgutils.is_not_null(c.builder, errcode)
 
     # Handle error
@@ -0,0 +1,22 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Defines the numba type for the DeviceEvent class"""
+
+from numba.core import types
+
+
+class DeviceEventType(types.Type):
+    """Numba-dpex type corresponding to
+    :class:`numba_dpex.kernel_api.DeviceEvent`"""
+
+    def __init__(self):
+        super().__init__(name="DeviceEvent")
+
+    @property
+    def mangling_args(self):
+        return self.__class__.__name__, []
+
+    def cast_python_value(self, args):
+        raise NotImplementedError
@@ -2,7 +2,7 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-"""Defines numba types for Item and NdItem classes"""
+"""Defines numba types for Item, NdItem, Group and SubGroup classes"""
 
 from numba.core import errors, types
 
@@ -95,3 +95,18 @@ class NdItemType(types.Type):
 
     def cast_python_value(self, args):
         raise NotImplementedError
+
+
+class SubGroupType(types.Type):
+    """Numba-dpex type corresponding to
+    :class:`numba_dpex.kernel_api.SubGroup`"""
+
+    def __init__(self):
+        super().__init__(name="SubGroup")
+
+    @property
+    def mangling_args(self):
+        return self.__class__.__name__, []
+
+    def cast_python_value(self, args):
+        raise NotImplementedError
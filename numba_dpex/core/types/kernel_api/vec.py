@@ -0,0 +1,41 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Defines the numba type for the Vec class"""
+
+from numba.core import types
+
+
+class VecType(types.Type):
+    """Numba-dpex type corresponding to
+    :class:`numba_dpex.kernel_api.Vec`"""
+
+    def __init__(self, dtype: types.Type, count: int):
+        self._dtype = dtype
+        self._count = count
+        super().__init__(name=f"Vec({dtype}, {count})")
+
+    @property
+    def dtype(self):
+        """Returns the Numba type of the vector elements."""
+        return self._dtype
+
+    @property
+    def count(self) -> int:
+        """Returns the number of vector elements."""
+        return self._count
+
+    @property
+    def key(self):
+        """
+        A property used for __eq__, __ne__ and __hash__.
+        """
+        return self.dtype, self.count
+
+    @property
+    def mangling_args(self):
+        return self.__class__.__name__, [self.dtype, self.count]
+
+    def cast_python_value(self, args):
+        raise NotImplementedError
@@ -8,14 +8,26 @@ from dpnp import ndarray
 from numba.extending import typeof_impl
 from numba.np import numpy_support
 
-from numba_dpex.kernel_api import AtomicRef, Group, Item, LocalAccessor, NdItem
+from numba_dpex.kernel_api import (
+    AtomicRef,
+    Group,
+    Item,
+    LocalAccessor,
+    NdItem,
+    SubGroup,
+)
 from numba_dpex.kernel_api.memory_enums import AddressSpace as address_space
 from numba_dpex.kernel_api.ranges import NdRange, Range
 
 from ..types.dpctl_types import DpctlSyclEvent, DpctlSyclQueue
 from ..types.dpnp_ndarray_type import DpnpNdArray
 from ..types.kernel_api.atomic_ref import AtomicRefType
-from ..types.kernel_api.index_space_ids import GroupType, ItemType, NdItemType
+from ..types.kernel_api.index_space_ids import (
+    GroupType,
+    ItemType,
+    NdItemType,
+    SubGroupType,
+)
 from ..types.kernel_api.local_accessor import LocalAccessorType
 from ..types.kernel_api.ranges import NdRangeType, RangeType
 from ..types.usm_ndarray_type import USMNdArray
@@ -223,6 +235,21 @@ def typeof_nditem(val: NdItem, c):
     return NdItemType(val.dimensions)
 
 
+@typeof_impl.register(SubGroup)
+def typeof_sub_group(val: SubGroup, c):
+    """Registers the type inference implementation function for a
+    numba_dpex.kernel_api.SubGroup PyObject.
+
+    Args:
+        val : An instance of numba_dpex.kernel_api.SubGroup.
+        c : Unused argument used to be consistent with Numba API.
+
+    Returns: A numba_dpex.core.types.kernel_api.index_space_ids.SubGroupType
+        instance.
+    """
+    return SubGroupType()
+
+
 @typeof_impl.register(LocalAccessor)
 def typeof_local_accessor(val: LocalAccessor, c) -> LocalAccessorType:
     """Returns a ``numba_dpex.experimental.dpctpp_types.LocalAccessorType``
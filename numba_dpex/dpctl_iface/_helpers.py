@@ -25,6 +25,10 @@ def numba_type_to_dpctl_typenum(context, ty):
         return context.get_constant(types.int32, kargty.dpctl_int64.value)
     elif ty == types.uint64:
         return context.get_constant(types.int32, kargty.dpctl_uint64.value)
+    elif ty == types.float16:
+        # dpctl has no half precision argument type, the value is passed as
+        # the unsigned 16-bit integer that has the same size and bits.
+        return context.get_constant(types.int32, kargty.dpctl_uint16.value)
     elif ty == types.float32:
         return context.get_constant(types.int32, kargty.dpctl_float32.value)
     elif ty == types.float64:
@@ -16,11 +16,11 @@ from numba.extending import intrinsic, overload_classmethod
 from numba.np.arrayobj import (
     _parse_empty_args,
     _parse_empty_like_args,
-    get_itemsize,
     make_array,
     populate_array,
 )
 
+from numba_dpex.core.datamodel.models import host_element_type
 from numba_dpex.core.runtime import context as dpexrt
 from numba_dpex.core.types import DpnpNdArray
 from numba_dpex.core.types.dpctl_types import DpctlSyclQueue
@@ -29,6 +29,15 @@ from numba_dpex.dpctl_iface import libsyclinterface_bindings as sycl
 # can't import name because of the circular import
 DPEX_TARGET_NAME = "dpex"
 
+
+def get_itemsize(context, array_type):
+    """Returns the size in bytes of an element of a USM array in a host
+    function."""
+    return context.get_abi_sizeof(
+        context.get_data_type(host_element_type(array_type.dtype))
+    )
+
+
 _QueueRefPayload = namedtuple(
     "QueueRefPayload", ["queue_ref", "py_dpctl_sycl_queue_addr", "pyapi"]
 )
@@ -203,7 +212,7 @@ def _empty_nd_impl(context, builder, arrtype, shapes, queue_ref):
     arycls = make_array(arrtype)
     ary = arycls(context, builder)
 
-    datatype = context.get_data_type(arrtype.dtype)
+    datatype = context.get_data_type(host_element_type(arrtype.dtype))
     itemsize = context.get_constant(types.intp, get_itemsize(context, arrtype))
 
     # compute array length
@@ -0,0 +1,202 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Overloads of the dpnp reductions along an axis of an array.
+
+The reductions are offloaded as a single nd-range kernel with one work-group
+per element of the result, see
+:func:`numba_dpex.core.parfors.reduction_kernel_builder.create_axis_reduction_kernel`.
+"""
+
+import operator
+
+import dpnp
+from numba import errors, types
+from numba.extending import overload
+from numba.np.numpy_support import as_dtype, is_nonelike
+
+from numba_dpex.core import config
+from numba_dpex.core.types import DpnpNdArray
+from numba_dpex.kernel_api_impl.spirv.overloads._spv_group_inst_helper import (
+    is_group_inst_supported,
+)
+
+# can't import name because of the circular import
+DPEX_TARGET_NAME = "dpex"
+
+
+def _parse_acc_dtype(fn_name, redop, group_op, is_mean, dtype, queue):
+    """Returns the type that the values of an array of type ``dtype`` are
+    accumulated in, which is also the dtype of the result, following the
+    NumPy type promotion rules of the reduction.
+
+    The mean of integers is accumulated in float64, or in float32 if the
+    device of ``queue`` does not support float64, as dpnp does.
+
+    Raises:
+        errors.TypingError: If the accumulated values can not be combined by a
+            SPIR-V group reduce instruction.
+    """
+    acc_dtype = dtype
+    if isinstance(dtype, types.Integer) and redop not in (min, max):
+        if is_mean:
+            acc_dtype = (
+                types.float64 if queue.device_has_aspect_fp64 else types.float32
+            )
+        else:
+            acc_dtype = types.int64 if dtype.signed else types.uint64
+
+    if not is_group_inst_supported(group_op, acc_dtype):
+        raise errors.TypingError(
+            f"dpnp.{fn_name}() along an axis is not supported for arrays of "
+            f"dtype {dtype}."
+        )
+    return acc_dtype
+
+
+def _ol_axis_reduction(fn_name, redop, a, axis, is_mean=False):
+    """Returns the implementation of a dpnp reduction along an axis of a 2D
+    array.
+
+    The reduced axis is only required to be known at run time. The work-group
+    size is the smallest power of two not smaller than the length of the
+    reduced axis, bounded by the work-group size used by the parfor
+    reduction kernels for the device, so that short slices do not leave most
+    work-items of a work-group idle. If the values of a work-group can not be
+    combined by a group reduce instruction, *e.g.*, for ``prod`` unless
+    ``REDUCTION_KHR_GROUP_BUILTINS`` is set, every slice is reduced by a
+    single work-item.
+    """
+    # Imported here to avoid circular imports, as the dpjit target imports
+    # the dpnp_iface package.
+    from numba_dpex.core.kernel_launcher import call_kernel
+    from numba_dpex.core.parfors.kernel_templates.reduction_template import (
+        _REDOP_TO_GROUP_OP,
+        uses_group_reduce,
+    )
+    from numba_dpex.core.parfors.reduction_helper import _select_work_group_size
+    from numba_dpex.core.parfors.reduction_kernel_builder import (
+        create_axis_reduction_kernel,
+    )
+    from numba_dpex.kernel_api import NdRange, Range
+
+    if not isinstance(a, DpnpNdArray):
+        return None
+    if is_nonelike(axis):
+        raise errors.TypingError(
+            f"dpnp.{fn_name}() is only supported along an axis inside a "
+            "dpjit function."
+        )
+    if a.ndim != 2:
+        raise errors.TypingError(
+            f"dpnp.{fn_name}() along an axis is only supported for 2D "
+            f"arrays, got an array of {a.ndim} dimensions."
+        )
+    if not isinstance(axis, types.Integer):
+        raise errors.TypingError(
+            f"The axis argument of dpnp.{fn_name}() has to be an integer."
+        )
+    if isinstance(axis, types.IntegerLiteral) and not (
+        -2 <= axis.literal_value < 2
+    ):
+        raise errors.NumbaValueError(
+            f"axis {axis.literal_value} is out of bounds for an array of "
+            "dimension 2."
+        )
+
+    acc_dtype = _parse_acc_dtype(
+        fn_name, redop, _REDOP_TO_GROUP_OP[redop], is_mean, a.dtype, a.queue
+    )
+    res_dtype = as_dtype(acc_dtype).type
+    use_group_reduce = uses_group_reduce(redop, acc_dtype)
+    kernel_fn = create_axis_reduction_kernel(
+        redop, acc_dtype, is_mean, use_group_reduce
+    )
+    max_wg_size = (
+        _select_work_group_size(a.device, config.REDUCTION_MAX_WORK_GROUP_SIZE)
+        if use_group_reduce
+        else 1
+    )
+    check_nonempty = redop in (min, max)
+
+    def impl(a, axis=None):
+        if axis < 0:
+            axis += 2
+        if axis != 0 and axis != 1:
+            raise ValueError(
+                "axis is out of bounds for an array of dimension 2."
+            )
+        n = a.shape[axis]
+        nout = a.shape[1 - axis]
+        if check_nonempty and n == 0:
+            raise ValueError(
+                "zero-size array to reduction operation which has no identity."
+            )
+        out = dpnp.empty(nout, dtype=res_dtype, sycl_queue=a.sycl_queue)
+        wg_size = 1
+        while wg_size < n and wg_size < max_wg_size:
+            wg_size *= 2
+        if nout > 0:
+            call_kernel(
+                kernel_fn,
+                NdRange(Range(nout * wg_size), Range(wg_size)),
+                a,
+                out,
+                axis,
+                n,
+            )
+        return out
+
+    return impl
+
+
+@overload(dpnp.sum, prefer_literal=True, target=DPEX_TARGET_NAME)
+def ol_dpnp_sum(a, axis=None):
+    """Implementation of an overload to support dpnp.sum() along an axis of a
+    2D array inside a dpjit function.
+
+    Args:
+        a (numba_dpex.core.types.DpnpNdArray): The array to reduce.
+        axis (numba.core.types.Integer): The axis to reduce along.
+
+    Raises:
+        errors.TypingError: If the array is not 2D, if ``axis`` is not an
+            integer or if the dtype of the array is not supported.
+
+    Returns:
+        function: Local function `impl()`.
+    """
+    return _ol_axis_reduction("sum", operator.iadd, a, axis)
+
+
+@overload(dpnp.prod, prefer_literal=True, target=DPEX_TARGET_NAME)
+def ol_dpnp_prod(a, axis=None):
+    """Implementation of an overload to support dpnp.prod() along an axis of
+    a 2D array inside a dpjit function. See :func:`ol_dpnp_sum`.
+    """
+    return _ol_axis_reduction("prod", operator.imul, a, axis)
+
+
+@overload(dpnp.min, prefer_literal=True, target=DPEX_TARGET_NAME)
+def ol_dpnp_min(a, axis=None):
+    """Implementation of an overload to support dpnp.min() along an axis of a
+    2D array inside a dpjit function. See :func:`ol_dpnp_sum`.
+    """
+    return _ol_axis_reduction("min", min, a, axis)
+
+
+@overload(dpnp.max, prefer_literal=True, target=DPEX_TARGET_NAME)
+def ol_dpnp_max(a, axis=None):
+    """Implementation of an overload to support dpnp.max() along an axis of a
+    2D array inside a dpjit function. See :func:`ol_dpnp_sum`.
+    """
+    return _ol_axis_reduction("max", max, a, axis)
+
+
+@overload(dpnp.mean, prefer_literal=True, target=DPEX_TARGET_NAME)
+def ol_dpnp_mean(a, axis=None):
+    """Implementation of an overload to support dpnp.mean() along an axis of
+    a 2D array inside a dpjit function. See :func:`ol_dpnp_sum`.
+    """
+    return _ol_axis_reduction("mean", operator.iadd, a, axis, is_mean=True)
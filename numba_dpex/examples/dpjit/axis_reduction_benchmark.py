@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Measures the time of dpnp.sum() and dpnp.max() along both axes of tall-skinny
+and short-wide 2D arrays inside a dpjit function.
+
+Every reduction runs as a single kernel with one work-group per element of the
+result. The work-items of a work-group stride over the slice of the array that
+is reduced into the element, so a tall-skinny array reduced along axis 0 gives
+a few work-groups that reduce long columns, while reducing it along axis 1
+gives many work-groups that reduce short rows.
+"""
+
+import argparse
+import time
+
+import dpnp
+
+from numba_dpex import dpjit
+
+
+@dpjit
+def sum_along(a, axis):
+    return dpnp.sum(a, axis=axis)
+
+
+@dpjit
+def max_along(a, axis):
+    return dpnp.max(a, axis=axis)
+
+
+def timeit(func, a, axis, n_itr):
+    # Warm up to exclude compilation time.
+    func(a, axis)
+    t0 = time.perf_counter()
+    for _ in range(n_itr):
+        func(a, axis)
+    return (time.perf_counter() - t0) / n_itr * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the time of dpnp reductions along an axis."
+    )
+    parser.add_argument(
+        "--device", type=str, default="cpu", help="device filter string"
+    )
+    parser.add_argument(
+        "--n_itr", type=int, default=10, help="number of iterations"
+    )
+    args = parser.parse_args()
+
+    shapes = {
+        "tall-skinny": (1 << 22, 8),
+        "short-wide": (8, 1 << 22),
+        "square": (2048, 2048),
+    }
+    for name, shape in shapes.items():
+        a = dpnp.ones(shape, dtype=dpnp.float32, device=args.device)
+        for axis in (0, 1):
+            for func in (sum_along, max_along):
+                t = timeit(func, a, axis, args.n_itr)
+                print(
+                    f"{name} {shape}, {func.py_func.__name__}, "
+                    f"axis={axis}: {t:.3f} ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
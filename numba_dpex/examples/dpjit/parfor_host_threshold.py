@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Measures the break-even point between executing an elementwise parfor as a
+loop on the host and as a kernel on a device, to calibrate
+NUMBA_DPEX_PARFOR_HOST_THRESHOLD.
+
+Only parfors on arrays that the host can access get a host loop, so the arrays
+are allocated as shared USM. For every size the time of the parfor is measured
+with the host loop disabled and with the host loop forced, and the smallest
+size at which the device kernel is faster is printed as the suggested
+threshold.
+"""
+
+import argparse
+import time
+
+import dpnp
+
+from numba_dpex import dpjit
+from numba_dpex.core import config
+
+
+def axpy(a, b):
+    return a * 2 + b
+
+
+def compile_with_threshold(threshold, a, b):
+    """Returns axpy compiled with the given host threshold."""
+    saved = config.PARFOR_HOST_THRESHOLD
+    config.PARFOR_HOST_THRESHOLD = threshold
+    try:
+        func = dpjit(axpy)
+        # Compile the function while the threshold is set.
+        func(a, b)
+    finally:
+        config.PARFOR_HOST_THRESHOLD = saved
+    return func
+
+
+def timeit(func, a, b, n_itr):
+    t0 = time.perf_counter()
+    for _ in range(n_itr):
+        func(a, b)
+    return (time.perf_counter() - t0) / n_itr * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the host loop threshold of parfors."
+    )
+    parser.add_argument(
+        "--device", type=str, default="gpu", help="device filter string"
+    )
+    parser.add_argument(
+        "--n_itr", type=int, default=100, help="number of iterations"
+    )
+    parser.add_argument(
+        "--max_size_log2", type=int, default=20, help="largest size as log2"
+    )
+    args = parser.parse_args()
+
+    a = dpnp.ones(1, device=args.device, usm_type="shared")
+    on_device = compile_with_threshold(0, a, a)
+    on_host = compile_with_threshold(1 << 62, a, a)
+
+    break_even = None
+    for size_log2 in range(args.max_size_log2 + 1):
+        n = 1 << size_log2
+        a = dpnp.ones(n, device=args.device, usm_type="shared")
+        b = dpnp.ones(n, device=args.device, usm_type="shared")
+        t_device = timeit(on_device, a, b, args.n_itr)
+        t_host = timeit(on_host, a, b, args.n_itr)
+        print(f"n={n}: device {t_device:.1f} us, host {t_host:.1f} us")
+        if break_even is None and t_device < t_host:
+            break_even = n
+
+    if break_even is None:
+        print("The host loop was faster for every size.")
+    else:
+        print(f"Suggested NUMBA_DPEX_PARFOR_HOST_THRESHOLD={break_even}")
+
+
+if __name__ == "__main__":
+    main()
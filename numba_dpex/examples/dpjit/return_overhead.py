@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Measures the overhead of returning arrays allocated inside a dpjit function to
+Python. Every returned array is boxed into a new dpnp.ndarray, so for small
+arrays the call time is dominated by the boxing and not by the computation.
+"""
+
+import argparse
+import time
+
+import dpnp
+
+from numba_dpex import dpjit
+
+
+@dpjit
+def return_one(a):
+    return dpnp.empty_like(a)
+
+
+@dpjit
+def return_many(a):
+    return (
+        dpnp.empty_like(a),
+        dpnp.empty_like(a),
+        dpnp.empty_like(a),
+        dpnp.empty_like(a),
+        dpnp.empty_like(a),
+        dpnp.empty_like(a),
+        dpnp.empty_like(a),
+        dpnp.empty_like(a),
+    )
+
+
+@dpjit
+def return_input(a):
+    return a
+
+
+def timeit(func, arg, n_itr):
+    # Warm up to exclude compilation time.
+    func(arg)
+    t0 = time.perf_counter()
+    for _ in range(n_itr):
+        func(arg)
+    return (time.perf_counter() - t0) / n_itr * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the return overhead of dpjit functions."
+    )
+    parser.add_argument(
+        "--n", type=int, default=16, help="number of elements per array"
+    )
+    parser.add_argument(
+        "--n_itr", type=int, default=10000, help="number of iterations"
+    )
+    args = parser.parse_args()
+
+    a = dpnp.ones(args.n, dtype=dpnp.float32)
+
+    baseline = timeit(return_input, a, args.n_itr)
+    one = timeit(return_one, a, args.n_itr)
+    many = timeit(return_many, a, args.n_itr)
+
+    print(f"return the argument (parent boxing): {baseline:.2f} us/call")
+    print(f"return 1 new array:                  {one:.2f} us/call")
+    print(f"return 8 new arrays:                 {many:.2f} us/call")
+    print(f"boxing cost per new array:           {(many - one) / 7:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Measures the time of a prange sum reduction for array sizes from 1e3 to 1e8.
+
+The reduction runs as two kernels: a main kernel in which every work-group
+reduces a strided part of the array into a partial sum, and a final kernel that
+reduces the partial sums as a single work-group. The work-group size is chosen
+from the device limits and can be bounded by setting the
+NUMBA_DPEX_REDUCTION_MAX_WORK_GROUP_SIZE environment variable, e.g., to compare
+different sizes.
+"""
+
+import argparse
+import time
+
+import dpnp
+import numba
+
+from numba_dpex import dpjit
+
+
+@dpjit
+def prange_sum(a):
+    s = a.dtype.type(0)
+    for i in numba.prange(a.shape[0]):
+        s += a[i]
+    return s
+
+
+def timeit(func, arg, n_itr):
+    # Warm up to exclude compilation time.
+    func(arg)
+    t0 = time.perf_counter()
+    for _ in range(n_itr):
+        func(arg)
+    return (time.perf_counter() - t0) / n_itr * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the time of a dpjit prange sum reduction."
+    )
+    parser.add_argument(
+        "--device", type=str, default="cpu", help="device filter string"
+    )
+    parser.add_argument(
+        "--n_itr", type=int, default=10, help="number of iterations"
+    )
+    args = parser.parse_args()
+
+    for exp in range(3, 9):
+        n = 10**exp
+        a = dpnp.ones(n, dtype=dpnp.float32, device=args.device)
+        t = timeit(prange_sum, a, args.n_itr)
+        print(f"n = 1e{exp}: {t:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Compares the single precision Black-Scholes kernel compiled with different
+values of the fastmath option of numba_dpex.kernel.
+
+With the ``"afn"`` or ``"fast"`` flags, the exp, log and sqrt calls of the
+kernel are lowered to the OpenCL native_* builtins, or to the half_* builtins
+if NUMBA_DPEX_APPROX_MATH_BUILTINS=half is set. The script prints the time of
+every kernel and the largest deviation of its results from the kernel
+compiled without fastmath.
+"""
+
+import argparse
+import time
+from math import erf, exp, log, sqrt
+
+import dpnp
+import numpy
+
+import numba_dpex as dpex
+from numba_dpex import kernel_api as kapi
+
+# Constants as float32 values keep the arithmetic in single precision
+HALF = numpy.float32(0.5)
+QUARTER = numpy.float32(0.25)
+ONE = numpy.float32(1.0)
+TWO = numpy.float32(2.0)
+
+
+def black_scholes(item: kapi.Item, price, strike, t, rate, volatility, call):
+    mr = -rate
+    sig_sig_two = volatility * volatility * TWO
+
+    i = item.get_id(0)
+    p = price[i]
+    s = strike[i]
+    tt = t[i]
+
+    a = log(p / s)
+    b = tt * mr
+
+    z = tt * sig_sig_two
+    c = QUARTER * z
+    y = ONE / sqrt(z)
+
+    w1 = (a - b + c) * y
+    w2 = (a - b - c) * y
+
+    d1 = HALF + HALF * erf(w1)
+    d2 = HALF + HALF * erf(w2)
+
+    se = exp(b) * s
+    call[i] = p * d1 - se * d2
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the fastmath options on a Black-Scholes kernel."
+    )
+    parser.add_argument(
+        "--device", type=str, default="gpu", help="device filter string"
+    )
+    parser.add_argument(
+        "--n_itr", type=int, default=100, help="number of iterations"
+    )
+    parser.add_argument(
+        "--size", type=int, default=1 << 22, help="number of options"
+    )
+    args = parser.parse_args()
+
+    n = args.size
+    rng = numpy.random.default_rng(777)
+
+    def uniform(low, high):
+        return dpnp.asarray(
+            rng.uniform(low, high, n).astype(numpy.float32),
+            device=args.device,
+        )
+
+    price, strike, t = uniform(10, 50), uniform(10, 50), uniform(1, 2)
+    rate, volatility = numpy.float32(0.1), numpy.float32(0.2)
+
+    reference = None
+    for fastmath in [False, {"contract", "nsz"}, {"afn"}, True]:
+        kernel = dpex.kernel(fastmath=fastmath)(black_scholes)
+        call = dpnp.empty_like(price)
+        kargs = (price, strike, t, rate, volatility, call)
+
+        # The first call compiles the kernel.
+        dpex.call_kernel(kernel, dpex.Range(n), *kargs)
+        t0 = time.perf_counter()
+        for _ in range(args.n_itr):
+            dpex.call_kernel(kernel, dpex.Range(n), *kargs)
+        elapsed = (time.perf_counter() - t0) / args.n_itr * 1e6
+
+        if reference is None:
+            reference = call
+        error = float(dpnp.max(dpnp.abs(call - reference)))
+        print(f"fastmath={fastmath}: {elapsed:.1f} us, max error {error:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Compares the work-group collective functions with the hand-written local
+memory algorithms of the sum_reduction_tree.py and scan.py examples.
+
+The tree reduction and the Hillis-Steele scan synchronize the work-group with
+a group_barrier after every step and keep their partial results in local
+memory. kapi.reduce_over_group and kapi.inclusive_scan_over_group compute the
+same per work-group results with a single SPIR-V group instruction. The script
+checks that both versions agree and prints the time of every kernel.
+"""
+
+import argparse
+import time
+
+import dpnp
+
+import numba_dpex as ndpx
+from numba_dpex import kernel_api as kapi
+
+
+@ndpx.kernel
+def tree_reduction(nditem: kapi.NdItem, a, partial_sums, slm):
+    local_id = nditem.get_local_id(0)
+    global_id = nditem.get_global_id(0)
+    group_size = nditem.get_local_range(0)
+    gr = nditem.get_group()
+
+    slm[local_id] = a[global_id]
+
+    stride = group_size // 2
+    while stride > 0:
+        kapi.group_barrier(gr)
+        if local_id < stride:
+            slm[local_id] += slm[local_id + stride]
+        stride >>= 1
+
+    if local_id == 0:
+        partial_sums[gr.get_group_id(0)] = slm[0]
+
+
+@ndpx.kernel
+def group_reduction(nditem: kapi.NdItem, a, partial_sums):
+    gr = nditem.get_group()
+    group_sum = kapi.reduce_over_group(gr, a[nditem.get_global_id(0)], "add")
+
+    if nditem.get_local_id(0) == 0:
+        partial_sums[gr.get_group_id(0)] = group_sum
+
+
+@ndpx.kernel
+def hillis_steele_scan(nditem: kapi.NdItem, a, b, slm_b, slm_c):
+    gid = nditem.get_global_id(0)
+    lid = nditem.get_local_id(0)
+    ls = nditem.get_local_range(0)
+    gr = nditem.get_group()
+
+    slm_c[lid] = slm_b[lid] = a[gid]
+
+    kapi.group_barrier(gr)
+
+    d = 1
+    while d < ls:
+        if lid >= d:
+            slm_c[lid] = slm_b[lid] + slm_b[lid - d]
+        else:
+            slm_c[lid] = slm_b[lid]
+
+        kapi.group_barrier(gr)
+
+        e = slm_c[lid]
+        slm_c[lid] = slm_b[lid]
+        slm_b[lid] = e
+
+        d *= 2
+
+    b[gid] = slm_b[lid]
+
+
+@ndpx.kernel
+def group_scan(nditem: kapi.NdItem, a, b):
+    gid = nditem.get_global_id(0)
+    b[gid] = kapi.inclusive_scan_over_group(nditem.get_group(), a[gid], "add")
+
+
+def timeit(kernel, nd_range, args, n_itr):
+    # The first call compiles the kernel.
+    ndpx.call_kernel(kernel, nd_range, *args)
+    t0 = time.perf_counter()
+    for _ in range(n_itr):
+        ndpx.call_kernel(kernel, nd_range, *args)
+    return (time.perf_counter() - t0) / n_itr * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare group collective functions with local memory "
+        "algorithms."
+    )
+    parser.add_argument(
+        "--device", type=str, default="gpu", help="device filter string"
+    )
+    parser.add_argument(
+        "--n_itr", type=int, default=100, help="number of iterations"
+    )
+    parser.add_argument(
+        "--size", type=int, default=1 << 20, help="number of elements"
+    )
+    parser.add_argument(
+        "--group_size", type=int, default=256, help="work-group size"
+    )
+    args = parser.parse_args()
+
+    n, group_size = args.size, args.group_size
+    n_groups = n // group_size
+    nd_range = ndpx.NdRange(ndpx.Range(n), ndpx.Range(group_size))
+
+    a = dpnp.ones(n, dtype=dpnp.float32, device=args.device)
+    sums_tree = dpnp.zeros(n_groups, dtype=a.dtype, device=args.device)
+    sums_group = dpnp.zeros(n_groups, dtype=a.dtype, device=args.device)
+    slm = kapi.LocalAccessor(group_size, a.dtype)
+
+    t_tree = timeit(tree_reduction, nd_range, (a, sums_tree, slm), args.n_itr)
+    t_group = timeit(group_reduction, nd_range, (a, sums_group), args.n_itr)
+    assert dpnp.allclose(sums_tree, sums_group)
+    print(
+        f"reduction: tree {t_tree:.1f} us, reduce_over_group {t_group:.1f} us"
+    )
+
+    scan_hs = dpnp.zeros_like(a)
+    scan_group = dpnp.zeros_like(a)
+    slm_b = kapi.LocalAccessor(group_size, a.dtype)
+    slm_c = kapi.LocalAccessor(group_size, a.dtype)
+
+    t_hs = timeit(
+        hillis_steele_scan,
+        nd_range,
+        (a, scan_hs, slm_b, slm_c),
+        args.n_itr,
+    )
+    t_group = timeit(group_scan, nd_range, (a, scan_group), args.n_itr)
+    assert dpnp.allclose(scan_hs, scan_group)
+    print(
+        f"scan: Hillis-Steele {t_hs:.1f} us, "
+        f"inclusive_scan_over_group {t_group:.1f} us"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Compares a histogram kernel that updates the global histogram with an atomic
+operation per element with a version that privatizes the updates into a
+per work-group copy of the histogram in local memory.
+
+Every work-item of the first kernel updates one of a few global memory bins,
+so that the atomic operations of all work-groups contend for the same
+elements. The second kernel updates a local memory copy with
+kapi.privatize_atomics and flushes it into the global histogram with
+kapi.flush_atomics, so that every work-group issues only one global memory
+atomic operation per bin. The script prints the time of both kernels.
+"""
+
+import argparse
+import time
+
+import dpnp
+import numpy as np
+
+import numba_dpex as ndpx
+from numba_dpex import kernel_api as kapi
+
+
+@ndpx.kernel
+def global_histogram(nd_item: kapi.NdItem, a, hist, local_hist):
+    # pylint: disable=unused-argument
+    kapi.AtomicRef(hist, a[nd_item.get_global_id(0)]).fetch_add(1)
+
+
+@ndpx.kernel
+def privatized_histogram(nd_item: kapi.NdItem, a, hist, local_hist):
+    kapi.privatize_atomics(nd_item, local_hist, "add")
+    kapi.AtomicRef(
+        local_hist,
+        a[nd_item.get_global_id(0)],
+        address_space=kapi.AddressSpace.LOCAL,
+    ).fetch_add(1)
+    kapi.flush_atomics(nd_item, local_hist, hist, "add")
+
+
+def timeit(kernel, nd_range, args, n_itr):
+    # The first call compiles the kernel.
+    ndpx.call_kernel(kernel, nd_range, *args)
+    t0 = time.perf_counter()
+    for _ in range(n_itr):
+        ndpx.call_kernel(kernel, nd_range, *args)
+    return (time.perf_counter() - t0) / n_itr
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare global and privatized histogram kernels."
+    )
+    parser.add_argument(
+        "--device", type=str, default="gpu", help="device filter string"
+    )
+    parser.add_argument(
+        "--n_itr", type=int, default=100, help="number of iterations"
+    )
+    parser.add_argument(
+        "--size", type=int, default=1 << 24, help="number of elements"
+    )
+    parser.add_argument("--bins", type=int, default=64, help="number of bins")
+    parser.add_argument(
+        "--group_size", type=int, default=256, help="work-group size"
+    )
+    args = parser.parse_args()
+
+    a = np.random.randint(0, args.bins, args.size).astype(np.int32)
+    a_d = dpnp.asarray(a, device=args.device)
+    nd_range = ndpx.NdRange((args.size,), (args.group_size,))
+    local_hist = kapi.LocalAccessor(args.bins, dtype=np.int32)
+    expected = np.bincount(a, minlength=args.bins)
+
+    for name, kernel in (
+        ("global", global_histogram),
+        ("privatized", privatized_histogram),
+    ):
+        hist = dpnp.zeros(args.bins, dtype=dpnp.int32, device=args.device)
+        t = timeit(kernel, nd_range, (a_d, hist, local_hist), args.n_itr)
+        assert np.array_equal(
+            dpnp.asnumpy(hist), (args.n_itr + 1) * expected
+        ), f"{name} histogram is incorrect"
+        print(f"{name}: {t * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
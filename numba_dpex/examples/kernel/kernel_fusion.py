@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Compares a pipeline of three small kernels launched one after another with
+the kernel that numba_dpex.fuse builds from them.
+
+Every kernel of the pipeline reads the output of the previous one from global
+memory. The fused kernel runs the three stages for each work-item in a single
+launch and, as the stages are inlined, forwards the intermediate values in
+registers instead of reloading them. The script prints the time of both
+versions.
+"""
+
+import argparse
+import time
+
+import dpnp
+import numpy as np
+
+import numba_dpex as ndpx
+from numba_dpex import kernel_api as kapi
+
+
+@ndpx.kernel(inline_threshold=3)
+def scale(item: kapi.Item, x, a, tmp1):
+    i = item.get_id(0)
+    tmp1[i] = a[0] * x[i]
+
+
+@ndpx.kernel(inline_threshold=3)
+def offset(item: kapi.Item, tmp1, b, tmp2):
+    i = item.get_id(0)
+    tmp2[i] = tmp1[i] + b[0]
+
+
+@ndpx.kernel(inline_threshold=3)
+def clamp(item: kapi.Item, tmp2, y):
+    i = item.get_id(0)
+    y[i] = min(max(tmp2[i], 0.0), 1.0)
+
+
+def run_pipeline(size, x, a, b, tmp1, tmp2, y):
+    ndpx.call_kernel(scale, ndpx.Range(size), x, a, tmp1)
+    ndpx.call_kernel(offset, ndpx.Range(size), tmp1, b, tmp2)
+    ndpx.call_kernel(clamp, ndpx.Range(size), tmp2, y)
+
+
+def timeit(fn, n_itr):
+    # The first call compiles the kernels.
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(n_itr):
+        fn()
+    return (time.perf_counter() - t0) / n_itr
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare a pipeline of kernels with the fused kernel."
+    )
+    parser.add_argument(
+        "--device", type=str, default="gpu", help="device filter string"
+    )
+    parser.add_argument(
+        "--n_itr", type=int, default=100, help="number of iterations"
+    )
+    parser.add_argument(
+        "--size", type=int, default=1 << 24, help="number of elements"
+    )
+    args = parser.parse_args()
+
+    n = args.size
+    x = dpnp.asarray(
+        np.random.uniform(-1, 2, n).astype(np.float32), device=args.device
+    )
+    a = dpnp.full(1, 0.5, dtype=dpnp.float32, device=args.device)
+    b = dpnp.full(1, 0.25, dtype=dpnp.float32, device=args.device)
+    tmp1 = dpnp.empty_like(x)
+    tmp2 = dpnp.empty_like(x)
+    y = dpnp.empty_like(x)
+
+    # The fused kernel takes the arguments (item, x, a, tmp1, b, tmp2, y).
+    fused = ndpx.fuse(
+        scale,
+        offset,
+        clamp,
+        arg_map=[(0, 1, 2), (2, 3, 4), (4, 5)],
+        inline_threshold=3,
+    )
+
+    t_pipeline = timeit(
+        lambda: run_pipeline(n, x, a, b, tmp1, tmp2, y), args.n_itr
+    )
+    expected = dpnp.asnumpy(y)
+    y.fill(0)
+    t_fused = timeit(
+        lambda: ndpx.call_kernel(fused, ndpx.Range(n), x, a, tmp1, b, tmp2, y),
+        args.n_itr,
+    )
+    assert np.array_equal(dpnp.asnumpy(y), expected), "fused result differs"
+
+    print(f"pipeline: {t_pipeline * 1e6:.1f} us")
+    print(f"fused: {t_fused * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -101,6 +101,24 @@ def run_pipeline(host_arr, n_itr):
     return dt, None, None
 
 
+def run_stream_map(host_arr, n_itr):
+    # The n_itr iterations of the other variants process n_itr copies of the
+    # host array, which are streamed here as the n_itr chunks of one array.
+    work_arr = np.tile(host_arr, n_itr)
+
+    t0 = time.time()
+
+    # numba_dpex.stream_map implements the pipeline above: every chunk goes
+    # through its own set of staging buffers and the copies of one chunk
+    # overlap with the kernel execution of another one. The results are
+    # written back into the chunks of work_arr.
+    dpex.stream_map(async_kernel, work_arr, chunk_size=len(host_arr))
+
+    dt = time.time() - t0
+
+    return dt, None, None
+
+
 def main():
     parser = argparse.ArgumentParser(description="Process some integers.")
     parser.add_argument(
@@ -117,7 +135,7 @@ def main():
         "--algo",
         type=str,
         default="pipeline",
-        choices=["pipeline", "serial"],
+        choices=["pipeline", "serial", "stream_map"],
         help="algo",
     )
 
@@ -135,6 +153,7 @@ def main():
     algo_func = {
         "pipeline": run_pipeline,
         "serial": run_serial,
+        "stream_map": run_stream_map,
     }.get(args.algo)
 
     for _ in range(args.reps):
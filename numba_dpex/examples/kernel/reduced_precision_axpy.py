@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Compares an axpy kernel y = a * x + y on float32 arrays with versions that
+store the arrays as float16 and as bfloat16 values.
+
+The kernel is bound by the global memory bandwidth, so that halving the size
+of the elements about halves its time. The float16 kernel computes in half
+precision, the bfloat16 kernel converts its uint16 elements to float32 with
+kapi.bfloat16_to_float32 and rounds the results back with
+kapi.float32_to_bfloat16. The script prints the time, the achieved bandwidth
+and the largest difference to the exact float32 result of every kernel.
+"""
+
+import argparse
+import time
+
+import dpctl
+import dpnp
+import numpy as np
+
+import numba_dpex as ndpx
+from numba_dpex import kernel_api as kapi
+
+
+@ndpx.kernel
+def axpy(item: kapi.Item, a, x, y):
+    i = item.get_id(0)
+    y[i] = a[0] * x[i] + y[i]
+
+
+@ndpx.kernel
+def bfloat16_axpy(item: kapi.Item, a, x, y):
+    i = item.get_id(0)
+    y[i] = kapi.float32_to_bfloat16(
+        a[0] * kapi.bfloat16_to_float32(x[i]) + kapi.bfloat16_to_float32(y[i])
+    )
+
+
+def timeit(kernel, size, args, n_itr):
+    # The first call compiles the kernel.
+    ndpx.call_kernel(kernel, ndpx.Range(size), *args)
+    t0 = time.perf_counter()
+    for _ in range(n_itr):
+        ndpx.call_kernel(kernel, ndpx.Range(size), *args)
+    return (time.perf_counter() - t0) / n_itr
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare float32, float16 and bfloat16 axpy kernels."
+    )
+    parser.add_argument(
+        "--device", type=str, default="gpu", help="device filter string"
+    )
+    parser.add_argument(
+        "--n_itr", type=int, default=100, help="number of iterations"
+    )
+    parser.add_argument(
+        "--size", type=int, default=1 << 24, help="number of elements"
+    )
+    args = parser.parse_args()
+
+    n = args.size
+    x = np.random.uniform(-1, 1, n).astype(np.float32)
+    y = np.random.uniform(-1, 1, n).astype(np.float32)
+    a = np.full(1, 0.5, dtype=np.float32)
+    # Every run adds a * x to y again.
+    expected = y + (args.n_itr + 1) * a[0] * x
+
+    # The name, kernel, conversions from and to float32 of the arrays and the
+    # dtype of a of every version.
+    versions = [("float32", axpy, np.asarray, np.asarray, np.float32)]
+    if dpctl.SyclDevice(args.device).has_aspect_fp16:
+        versions.append(
+            (
+                "float16",
+                axpy,
+                lambda v: v.astype(np.float16),
+                lambda v: v.astype(np.float32),
+                np.float16,
+            )
+        )
+    versions.append(
+        (
+            "bfloat16",
+            bfloat16_axpy,
+            kapi.float32_to_bfloat16,
+            kapi.bfloat16_to_float32,
+            np.float32,
+        )
+    )
+
+    for name, kernel, to_storage, to_float32, a_dtype in versions:
+        a_d = dpnp.asarray(a.astype(a_dtype), device=args.device)
+        x_d = dpnp.asarray(to_storage(x), device=args.device)
+        y_d = dpnp.asarray(to_storage(y), device=args.device)
+        t = timeit(kernel, n, (a_d, x_d, y_d), args.n_itr)
+        result = to_float32(dpnp.asnumpy(y_d))
+        error = np.max(np.abs(result - expected))
+        n_bytes = 3 * n * x_d.itemsize
+        print(
+            f"{name}: {t * 1e6:.1f} us, {n_bytes / t * 1e-9:.1f} GB/s, "
+            f"max error {error:.3g}"
+        )
+
+
+if __name__ == "__main__":
+    main()
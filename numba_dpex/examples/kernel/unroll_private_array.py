@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Compares kernels compiled with and without the unroll and vectorize options of
+numba_dpex.kernel.
+
+Every work-item of the kernel evaluates a polynomial with coefficients kept in
+a kapi.PrivateArray. The loops over the private array have a small constant
+trip count. Unrolled, the private array is promoted to registers and the loops
+disappear, while without unrolling every iteration reads and writes the
+private memory of the work-item. The script checks that all versions agree and
+prints the time of every kernel.
+"""
+
+import argparse
+import time
+
+import dpnp
+
+import numba_dpex as ndpx
+from numba_dpex import float32
+from numba_dpex import kernel_api as kapi
+
+DEGREE = 16
+
+
+def horner(item: kapi.Item, x, y, coeffs):
+    i = item.get_id(0)
+    c = kapi.PrivateArray(DEGREE, float32)
+    for k in range(DEGREE):
+        c[k] = coeffs[k]
+
+    xi = x[i]
+    acc = float32(0)
+    for k in range(DEGREE):
+        acc = acc * xi + c[k]
+    y[i] = acc
+
+
+def timeit(kernel, size, args, n_itr):
+    # The first call compiles the kernel.
+    ndpx.call_kernel(kernel, ndpx.Range(size), *args)
+    t0 = time.perf_counter()
+    for _ in range(n_itr):
+        ndpx.call_kernel(kernel, ndpx.Range(size), *args)
+    return (time.perf_counter() - t0) / n_itr * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the unroll and vectorize kernel options."
+    )
+    parser.add_argument(
+        "--device", type=str, default="gpu", help="device filter string"
+    )
+    parser.add_argument(
+        "--n_itr", type=int, default=100, help="number of iterations"
+    )
+    parser.add_argument(
+        "--size", type=int, default=1 << 22, help="number of elements"
+    )
+    args = parser.parse_args()
+
+    x = dpnp.linspace(0, 1, args.size, dtype=dpnp.float32, device=args.device)
+    coeffs = dpnp.linspace(1, 2, DEGREE, dtype=dpnp.float32, device=args.device)
+
+    results = []
+    for options in [
+        {},
+        {"unroll": True},
+        {"unroll": True, "vectorize": True},
+        {"opt": 3, "unroll": True, "vectorize": True},
+    ]:
+        y = dpnp.zeros_like(x)
+        kernel = ndpx.kernel(inline_threshold=3, **options)(horner)
+        t = timeit(kernel, args.size, (x, y, coeffs), args.n_itr)
+        results.append(y)
+        print(f"{options or 'default'}: {t:.1f} us")
+
+    for y in results[1:]:
+        assert dpnp.allclose(y, results[0])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Compares a STREAM triad kernel that reads and writes one element per work-item
+with versions that use kapi.load_vec and kapi.store_vec to access four or
+eight consecutive elements with single vector loads and stores.
+
+The triad a = b + s * c is bound by the global memory bandwidth. The script
+checks that all versions agree and prints the time and the achieved bandwidth
+of every kernel.
+"""
+
+import argparse
+import time
+
+import dpnp
+
+import numba_dpex as ndpx
+from numba_dpex import kernel_api as kapi
+
+
+@ndpx.kernel
+def scalar_triad(item: kapi.Item, a, b, c, s):
+    i = item.get_id(0)
+    a[i] = b[i] + s * c[i]
+
+
+@ndpx.kernel
+def vec4_triad(item: kapi.Item, a, b, c, s):
+    i = item.get_id(0) * 4
+    kapi.store_vec(a, i, kapi.load_vec(b, i, 4) + s * kapi.load_vec(c, i, 4))
+
+
+@ndpx.kernel
+def vec8_triad(item: kapi.Item, a, b, c, s):
+    i = item.get_id(0) * 8
+    kapi.store_vec(a, i, kapi.load_vec(b, i, 8) + s * kapi.load_vec(c, i, 8))
+
+
+def timeit(kernel, size, args, n_itr):
+    # The first call compiles the kernel.
+    ndpx.call_kernel(kernel, ndpx.Range(size), *args)
+    t0 = time.perf_counter()
+    for _ in range(n_itr):
+        ndpx.call_kernel(kernel, ndpx.Range(size), *args)
+    return (time.perf_counter() - t0) / n_itr
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare scalar and vector accesses in a triad kernel."
+    )
+    parser.add_argument(
+        "--device", type=str, default="gpu", help="device filter string"
+    )
+    parser.add_argument(
+        "--n_itr", type=int, default=100, help="number of iterations"
+    )
+    parser.add_argument(
+        "--size", type=int, default=1 << 24, help="number of elements"
+    )
+    args = parser.parse_args()
+
+    n = args.size
+    b = dpnp.arange(n, dtype=dpnp.float32, device=args.device)
+    c = dpnp.ones(n, dtype=dpnp.float32, device=args.device)
+    s = dpnp.float32(3)
+    expected = b + s * c
+    n_bytes = 3 * n * b.itemsize
+
+    for kernel, width in [(scalar_triad, 1), (vec4_triad, 4), (vec8_triad, 8)]:
+        a = dpnp.zeros_like(b)
+        t = timeit(kernel, n // width, (a, b, c, s), args.n_itr)
+        assert dpnp.allclose(a, expected)
+        print(
+            f"{kernel.py_func.__name__}: {t * 1e6:.1f} us, "
+            f"{n_bytes / t * 1e-9:.1f} GB/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
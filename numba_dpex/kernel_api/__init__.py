@@ -12,19 +12,42 @@ numba_dpex.
 from .atomic_fence import atomic_fence
 from .atomic_ref import AtomicRef
 from .barrier import group_barrier
-from .index_space_ids import Group, Item, NdItem
+from .bfloat16 import bfloat16_to_float32, float32_to_bfloat16
+from .device_event import DeviceEvent, async_work_group_copy, wait_for
+from .group_algorithms import (
+    exclusive_scan_over_group,
+    group_broadcast,
+    inclusive_scan_over_group,
+    reduce_over_group,
+)
+from .index_space_ids import Group, Item, NdItem, SubGroup
 from .launcher import call_kernel
 from .local_accessor import LocalAccessor
 from .memory_enums import AddressSpace, MemoryOrder, MemoryScope
 from .private_array import PrivateArray
+from .privatized_atomics import flush_atomics, privatize_atomics
 from .ranges import NdRange, Range
+from .vec import Vec, load_vec, store_vec, vec
 
 __all__ = [
     "call_kernel",
+    "bfloat16_to_float32",
+    "float32_to_bfloat16",
+    "flush_atomics",
+    "privatize_atomics",
     "group_barrier",
+    "exclusive_scan_over_group",
+    "group_broadcast",
+    "inclusive_scan_over_group",
+    "reduce_over_group",
+    "load_vec",
+    "store_vec",
+    "vec",
     "AddressSpace",
+    "async_work_group_copy",
     "atomic_fence",
     "AtomicRef",
+    "DeviceEvent",
     "Group",
     "Item",
     "LocalAccessor",
@@ -33,6 +56,9 @@ __all__ = [
     "NdItem",
     "NdRange",
     "Range",
+    "wait_for",
+    "SubGroup",
+    "Vec",
     "PrivateArray",
     "group_barrier",
     "call_kernel",
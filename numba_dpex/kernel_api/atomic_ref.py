@@ -6,8 +6,15 @@
 prototyping numba_dpex kernel functions before they are JIT compiled.
 """
 
+import threading
+
 from .memory_enums import AddressSpace, MemoryOrder, MemoryScope
 
+# The work-items of an nd-range kernel are executed on threads by
+# call_kernel, so that the read-modify-write operations of an AtomicRef have
+# to be serialized to be atomic.
+_atomic_lock = threading.Lock()
+
 
 class AtomicRef:
     """Analogue to the :sycl_atomic_ref:`sycl::atomic_ref <>` class.
@@ -73,8 +80,9 @@ class AtomicRef:
 
         Returns: The original value of the object referenced by the AtomicRef.
         """
-        old = self._ref[self._index].copy()
-        self._ref[self._index] += val
+        with _atomic_lock:
+            old = self._ref[self._index].copy()
+            self._ref[self._index] += val
         return old
 
     def fetch_sub(self, val):
@@ -88,8 +96,9 @@ class AtomicRef:
 
         Returns: The original value of the object referenced by the AtomicRef.
         """
-        old = self._ref[self._index].copy()
-        self._ref[self._index] -= val
+        with _atomic_lock:
+            old = self._ref[self._index].copy()
+            self._ref[self._index] -= val
         return old
 
     def fetch_min(self, val):
@@ -103,8 +112,9 @@ class AtomicRef:
 
         Returns: The original value of the object referenced by the AtomicRef.
         """
-        old = self._ref[self._index].copy()
-        self._ref[self._index] = min(old, val)
+        with _atomic_lock:
+            old = self._ref[self._index].copy()
+            self._ref[self._index] = min(old, val)
         return old
 
     def fetch_max(self, val):
@@ -118,8 +128,9 @@ class AtomicRef:
 
         Returns: The original value of the object referenced by the AtomicRef.
         """
-        old = self._ref[self._index].copy()
-        self._ref[self._index] = max(old, val)
+        with _atomic_lock:
+            old = self._ref[self._index].copy()
+            self._ref[self._index] = max(old, val)
         return old
 
     def fetch_and(self, val):
@@ -133,8 +144,9 @@ class AtomicRef:
 
         Returns: The original value of the object referenced by the AtomicRef.
         """
-        old = self._ref[self._index].copy()
-        self._ref[self._index] &= val
+        with _atomic_lock:
+            old = self._ref[self._index].copy()
+            self._ref[self._index] &= val
         return old
 
     def fetch_or(self, val):
@@ -148,8 +160,9 @@ class AtomicRef:
 
         Returns: The original value of the object referenced by the AtomicRef.
         """
-        old = self._ref[self._index].copy()
-        self._ref[self._index] |= val
+        with _atomic_lock:
+            old = self._ref[self._index].copy()
+            self._ref[self._index] |= val
         return old
 
     def fetch_xor(self, val):
@@ -164,8 +177,9 @@ class AtomicRef:
         Returns: The original value of the object referenced by the AtomicRef.
 
         """
-        old = self._ref[self._index].copy()
-        self._ref[self._index] ^= val
+        with _atomic_lock:
+            old = self._ref[self._index].copy()
+            self._ref[self._index] ^= val
         return old
 
     def load(self):
@@ -194,8 +208,9 @@ class AtomicRef:
 
         Returns: The original value of the object referenced by the AtomicRef.
         """
-        old = self._ref[self._index].copy()
-        self._ref[self._index] = val
+        with _atomic_lock:
+            old = self._ref[self._index].copy()
+            self._ref[self._index] = val
         return old
 
     def compare_exchange(self, expected, desired, expected_idx=0):
@@ -216,8 +231,9 @@ class AtomicRef:
         Returns: ``True`` if the comparison operation and replacement operation
             were successful.
         """
-        if self._ref[self._index] == expected[expected_idx]:
-            self._ref[self._index] = desired
-            return True
-        expected[expected_idx] = self._ref[self._index]
+        with _atomic_lock:
+            if self._ref[self._index] == expected[expected_idx]:
+                self._ref[self._index] = desired
+                return True
+            expected[expected_idx] = self._ref[self._index]
         return False
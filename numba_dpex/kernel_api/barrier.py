@@ -26,9 +26,10 @@ def group_barrier(
     acquire fence afterwards, and there is an implicit synchronization of these
     fences as if provided by an explicit atomic operation on an atomic object.
 
-    .. important::
-        The function is not implemented yet for pure CPython execution and is
-        only supported in JIT compiled mode of execution.
+    When the function is called from a kernel launched by
+    :func:`numba_dpex.kernel_api.call_kernel`, the work-items of the work-group
+    run on threads of their own and the calling thread blocks until every
+    work-item of the work-group reached the barrier.
 
     Args:
         group (Group): Indicates the work-group inside which the barrier is to
@@ -36,8 +37,15 @@ def group_barrier(
         fence_scope (MemoryScope) (optional): scope of any memory
             consistency operations that are performed by the barrier.
     Raises:
-        NotImplementedError: When the function is called directly from Python.
+        NotImplementedError: If the function is not called from a kernel
+        launched by :func:`numba_dpex.kernel_api.call_kernel`.
+        RuntimeError: If a work-item of the work-group finished without
+        reaching the barrier.
     """
-
-    # TODO: A pure Python simulation of a group_barrier will be added later.
-    raise NotImplementedError
+    sync = group._sync  # pylint: disable=protected-access
+    if sync is None:
+        raise NotImplementedError(
+            "group_barrier can only be called from a kernel launched by "
+            "numba_dpex.kernel_api.call_kernel"
+        )
+    sync.exchange(None)
@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Python functions that convert between float32 values and bfloat16 values
+stored in uint16 integers.
+
+Neither NumPy nor Numba have a bfloat16 type. A bfloat16 value is the upper
+half of the bits of a float32 value, so that arrays of bfloat16 elements are
+stored as uint16 arrays and converted to float32 for arithmetic. The functions
+work on scalars and on NumPy arrays, so that they can be used to prepare
+bfloat16 data on the host as well as in a kernel.
+"""
+
+import numpy as np
+
+
+def bfloat16_to_float32(value):
+    """Converts a bfloat16 value stored in a uint16 integer to float32.
+
+    The conversion is exact. Inside a kernel it compiles to an integer shift
+    of the bits of the value.
+
+    Args:
+        value: The bits of the bfloat16 value as an unsigned 16-bit integer,
+            or an array of such values.
+    Returns:
+        The float32 value, or an array of float32 values.
+    """
+    bits = np.asarray(value).astype(np.uint16).astype(np.uint32)
+    return (bits << np.uint32(16)).view(np.float32)[()]
+
+
+def float32_to_bfloat16(value):
+    """Converts a float32 value to a bfloat16 value stored in a uint16 integer.
+
+    The value is rounded to the nearest bfloat16 value, with ties rounded to
+    the value with an even last bit. A NaN is converted to a quiet NaN. Inside
+    a kernel the conversion compiles to integer instructions on the bits of
+    the value.
+
+    Args:
+        value: The float32 value, or an array of float32 values.
+    Returns:
+        The bits of the bfloat16 value as an unsigned 16-bit integer, or an
+        array of such values.
+    """
+    data = np.asarray(value, dtype=np.float32)
+    bits = data.view(np.uint32)
+    rounding = ((bits >> np.uint32(16)) & np.uint32(1)) + np.uint32(0x7FFF)
+    rounded = (bits + rounding) >> np.uint32(16)
+    quiet_nan = (bits >> np.uint32(16)) | np.uint32(0x40)
+    return np.where(np.isnan(data), quiet_nan, rounded).astype(np.uint16)[()]
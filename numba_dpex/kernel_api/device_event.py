@@ -0,0 +1,128 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Python functions that simulate SYCL's asynchronous work-group copies
+between global and local memory and the device_event class that they return.
+"""
+
+from .index_space_ids import Group
+from .local_accessor import _LocalAccessorMock
+from .private_array import PrivateArray
+
+
+class DeviceEvent:
+    # pylint: disable=line-too-long
+    """Analogue to the :sycl_device_event:`sycl::device_event <>` class.
+
+    Represents an asynchronous copy issued by
+    :func:`numba_dpex.kernel_api.async_work_group_copy`. An instance of the
+    class is not user-constructible. The copy is complete once
+    :func:`numba_dpex.kernel_api.wait_for` returned for the event.
+    """
+
+
+def _flat(array):
+    """Returns a one-dimensional view of the elements of a C-contiguous
+    array."""
+    if isinstance(array, (_LocalAccessorMock, PrivateArray)):
+        array = array._data  # pylint: disable=protected-access
+    return array.reshape(-1)
+
+
+def async_work_group_copy(  # pylint: disable=too-many-arguments
+    group: Group,
+    dest,
+    src,
+    num_elements: int,
+    stride: int = 1,
+    dest_offset: int = 0,
+    src_offset: int = 0,
+    event: DeviceEvent = None,
+):
+    """Copies elements between global and local memory asynchronously, with
+    all work-items of a work-group cooperating on the copy.
+
+    The function is equivalent to the ``async_work_group_copy`` and
+    ``async_work_group_strided_copy`` OpenCL functions and to the
+    ``sycl::group::async_work_group_copy`` function. Either ``dest`` has to
+    be a :class:`numba_dpex.kernel_api.LocalAccessor` and ``src`` an array in
+    global memory, or the other way around. The arrays have to be
+    C-contiguous and the offsets count elements from the beginning of their
+    flattened data.
+
+    The copy reads and writes consecutive elements of the local memory array
+    and every ``stride``-th element of the global memory array. The function
+    has to be called by every work-item of the work-group with the same
+    arguments, and the copied elements may only be accessed after
+    :func:`numba_dpex.kernel_api.wait_for` returned for the event.
+
+    Args:
+        group (Group): The work-group whose work-items perform the copy.
+        dest: The array to copy the elements to.
+        src: The array to copy the elements from.
+        num_elements (int): The number of elements to copy.
+        stride (int, optional): The distance between two copied elements of
+            the global memory array. Defaults to 1.
+        dest_offset (int, optional): The index of the first element written
+            to ``dest``. Defaults to 0.
+        src_offset (int, optional): The index of the first element read from
+            ``src``. Defaults to 0.
+        event (DeviceEvent, optional): An event of an earlier copy that the
+            copy is added to, so that waiting for the returned event waits for
+            both copies. Defaults to None.
+    Returns:
+        DeviceEvent: The event to wait for the completion of the copy.
+    Raises:
+        NotImplementedError: If the function is not called from a kernel
+        launched by :func:`numba_dpex.kernel_api.call_kernel`.
+    """
+    sync = group._sync  # pylint: disable=protected-access
+    if sync is None:
+        raise NotImplementedError(
+            "async_work_group_copy can only be called from a kernel launched "
+            "by numba_dpex.kernel_api.call_kernel"
+        )
+
+    # The copy is performed by a single work-item. As every work-item has to
+    # call wait_for before using the copied elements, the copy is complete
+    # before any work-item can access them.
+    if sync.local_linear_id == 0:
+        if isinstance(dest, _LocalAccessorMock):
+            dest_stride, src_stride = 1, stride
+        else:
+            dest_stride, src_stride = stride, 1
+        dest_data = _flat(dest)
+        src_data = _flat(src)
+        for i in range(num_elements):
+            dest_data[dest_offset + i * dest_stride] = src_data[
+                src_offset + i * src_stride
+            ]
+
+    return event if event is not None else DeviceEvent()
+
+
+def wait_for(group: Group, event: DeviceEvent):
+    """Waits until the copies of an event are complete.
+
+    The function is equivalent to the ``wait_group_events`` OpenCL function
+    and to the ``sycl::group::wait_for`` function. It has to be called by
+    every work-item of the work-group.
+
+    Args:
+        group (Group): The work-group whose work-items performed the copies.
+        event (DeviceEvent): The event returned by
+            :func:`numba_dpex.kernel_api.async_work_group_copy`.
+    Raises:
+        NotImplementedError: If the function is not called from a kernel
+        launched by :func:`numba_dpex.kernel_api.call_kernel`.
+    """
+    sync = group._sync  # pylint: disable=protected-access
+    if sync is None:
+        raise NotImplementedError(
+            "wait_for can only be called from a kernel launched by "
+            "numba_dpex.kernel_api.call_kernel"
+        )
+    if not isinstance(event, DeviceEvent):
+        raise TypeError("Expected a DeviceEvent returned by a copy")
+    sync.exchange(None)
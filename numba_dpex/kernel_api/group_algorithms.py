@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Python functions that simulate SYCL's group algorithms.
+
+The collective functions combine the values of all work-items of a work-group
+with one of the binary operations ``"add"``, ``"mul"``, ``"min"``, ``"max"``,
+``"and"``, ``"or"`` and ``"xor"``. They have to be called by every work-item
+of the work-group with the same operation.
+"""
+
+from functools import reduce
+
+from .index_space_ids import (
+    _GROUP_OPERATORS,
+    Group,
+    _check_group_operation,
+    _identity,
+)
+
+
+def _exchange(group: Group, value):
+    """Returns the local linear id of the calling work-item and the values of
+    all work-items of the work-group ordered by their local linear id."""
+    if group._sync is None:  # pylint: disable=protected-access
+        raise NotImplementedError(
+            "Group collective functions can only be called from a kernel "
+            "launched by numba_dpex.kernel_api.call_kernel"
+        )
+    return group._sync.exchange(value)  # pylint: disable=protected-access
+
+
+def reduce_over_group(group: Group, value, op: str):
+    """Combines the values of all work-items of a work-group.
+
+    The function is equivalent to the ``sycl::reduce_over_group`` function.
+
+    Args:
+        group (Group): The work-group whose work-items' values are combined.
+        value: The value contributed by the work-item.
+        op (str): The operation combining the values.
+    Returns:
+        The combined value, which is returned to every work-item.
+    Raises:
+        ValueError: If the operation is not supported.
+    """
+    _check_group_operation(op)
+    _, values = _exchange(group, value)
+    return reduce(_GROUP_OPERATORS[op], values)
+
+
+def inclusive_scan_over_group(group: Group, value, op: str):
+    """Computes an inclusive prefix scan over the values of the work-items of
+    a work-group in the order of their local linear id.
+
+    The function is equivalent to the ``sycl::inclusive_scan_over_group``
+    function.
+
+    Args:
+        group (Group): The work-group whose work-items' values are scanned.
+        value: The value contributed by the work-item.
+        op (str): The operation combining the values.
+    Returns:
+        The combined values of the work-items up to and including the calling
+        one.
+    Raises:
+        ValueError: If the operation is not supported.
+    """
+    _check_group_operation(op)
+    local_id, values = _exchange(group, value)
+    return reduce(_GROUP_OPERATORS[op], values[: local_id + 1])
+
+
+def exclusive_scan_over_group(group: Group, value, op: str):
+    """Computes an exclusive prefix scan over the values of the work-items of
+    a work-group in the order of their local linear id.
+
+    The function is equivalent to the ``sycl::exclusive_scan_over_group``
+    function. The first work-item gets the identity of the operation.
+
+    Args:
+        group (Group): The work-group whose work-items' values are scanned.
+        value: The value contributed by the work-item.
+        op (str): The operation combining the values.
+    Returns:
+        The combined values of the work-items before the calling one.
+    Raises:
+        ValueError: If the operation is not supported.
+    """
+    _check_group_operation(op)
+    local_id, values = _exchange(group, value)
+    return reduce(_GROUP_OPERATORS[op], values[:local_id], _identity(op, value))
+
+
+def group_broadcast(group: Group, value, local_id: int = 0):
+    """Returns the value of one work-item to every work-item of a work-group.
+
+    The function is equivalent to the ``sycl::group_broadcast`` function.
+
+    Args:
+        group (Group): The work-group to broadcast the value in.
+        value: The value contributed by the work-item.
+        local_id (int, optional): The local linear id of the work-item that
+            broadcasts its value. Has to be the same for all work-items of the
+            work-group. Defaults to 0.
+    Returns:
+        The value of the work-item ``local_id``.
+    """
+    _, values = _exchange(group, value)
+    return values[local_id]
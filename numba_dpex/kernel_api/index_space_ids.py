@@ -7,8 +7,42 @@
 compiled.
 """
 
+import operator
+
+import numpy as np
+
 from .ranges import Range
 
+# The binary operations of the group and sub-group collective functions.
+_GROUP_OPERATORS = {
+    "add": operator.add,
+    "mul": operator.mul,
+    "min": min,
+    "max": max,
+    "and": operator.and_,
+    "or": operator.or_,
+    "xor": operator.xor,
+}
+
+
+def _check_group_operation(op):
+    if op not in _GROUP_OPERATORS:
+        raise ValueError(f"Unsupported group operation {op}")
+
+
+def _identity(op, value):
+    """Returns the identity of a group operation for the type of value."""
+    if op in ("add", "or", "xor"):
+        return type(value)(0)
+    if op == "mul":
+        return type(value)(1)
+    if op == "and":
+        return ~type(value)(0)
+    if isinstance(value, (float, np.floating)):
+        return type(value)(np.inf if op == "min" else -np.inf)
+    info = np.iinfo(np.asarray(value).dtype)
+    return type(value)(info.max if op == "min" else info.min)
+
 
 class Group:
     # pylint: disable=line-too-long
@@ -27,12 +61,16 @@ class Group:
         local_range: Range,
         group_range: Range,
         index: list,
+        sync=None,
     ):
         self._global_range = global_range
         self._local_range = local_range
         self._group_range = group_range
         self._index = index
         self._leader = False
+        # Exchanges the values of the work-items of the work-group in the
+        # collective functions, set by the kernel launcher.
+        self._sync = sync
 
     def get_group_id(self, dim):
         """Returns a specific coordinate of the multi-dimensional index of a group.
@@ -157,6 +195,196 @@ class Group:
         self._leader = work_item_id
 
 
+class SubGroup:
+    # pylint: disable=line-too-long
+    """Analogue to the :sycl_sub_group:`sycl::sub_group <>` class.
+
+    Represents the sub-group of a work-group that a work-item belongs to. The
+    work-items of a sub-group execute concurrently and can exchange values
+    without going through memory using the shuffle, broadcast and collective
+    operations of the class. An instance of the class is not
+    user-constructible. Users should use
+    :func:`numba_dpex.kernel_api.NdItem.get_sub_group` to access the SubGroup
+    to which a work-item belongs.
+
+    The size of a sub-group is chosen by the device. Kernels therefore have
+    to use :meth:`get_local_range` instead of assuming a size. The Python
+    simulator executes every work-item of a work-group on a thread of its own
+    and does not group the threads into sub-groups, so every work-item forms
+    a sub-group of size one of its own.
+
+    The collective operations take the operation as a string, one of
+    ``"add"``, ``"mul"``, ``"min"``, ``"max"``, ``"and"``, ``"or"`` and
+    ``"xor"``.
+    """
+
+    def __init__(self, group_id: int, group_range: int):
+        self._group_id = group_id
+        self._group_range = group_range
+
+    def get_local_id(self):
+        """Returns the index of the work-item within its sub-group.
+
+        Returns:
+            int: The index of the work-item in the sub-group.
+        """
+        return 0
+
+    def get_local_range(self):
+        """Returns the number of work-items in the sub-group.
+
+        Returns:
+            int: The size of the sub-group.
+        """
+        return 1
+
+    def get_max_local_range(self):
+        """Returns the largest number of work-items in any sub-group of the
+        kernel.
+
+        Returns:
+            int: The maximum size of a sub-group.
+        """
+        return 1
+
+    def get_group_id(self):
+        """Returns the index of the sub-group within its work-group.
+
+        Returns:
+            int: The index of the sub-group.
+        """
+        return self._group_id
+
+    def get_group_range(self):
+        """Returns the number of sub-groups in the work-group.
+
+        Returns:
+            int: The number of sub-groups.
+        """
+        return self._group_range
+
+    def shuffle(self, value, local_id):
+        """Returns the value of the work-item with the index ``local_id`` in
+        the sub-group.
+
+        Args:
+            value: The value contributed by the work-item.
+            local_id (int): The index of the work-item to read the value of.
+        Returns:
+            The value of the work-item ``local_id``.
+        """
+        return value
+
+    def shuffle_down(self, value, delta):
+        """Returns the value of the work-item whose index is ``delta`` larger
+        than the index of the calling work-item. The result is undefined if
+        that index is not in the sub-group.
+
+        Args:
+            value: The value contributed by the work-item.
+            delta (int): The distance to the work-item to read the value of.
+        Returns:
+            The value of the work-item ``get_local_id() + delta``.
+        """
+        return value
+
+    def shuffle_up(self, value, delta):
+        """Returns the value of the work-item whose index is ``delta``
+        smaller than the index of the calling work-item. The result is
+        undefined if that index is not in the sub-group.
+
+        Args:
+            value: The value contributed by the work-item.
+            delta (int): The distance to the work-item to read the value of.
+        Returns:
+            The value of the work-item ``get_local_id() - delta``.
+        """
+        return value
+
+    def shuffle_xor(self, value, mask):
+        """Returns the value of the work-item whose index is the index of the
+        calling work-item xor ``mask``.
+
+        Args:
+            value: The value contributed by the work-item.
+            mask (int): The mask applied to the index of the work-item.
+        Returns:
+            The value of the work-item ``get_local_id() ^ mask``.
+        """
+        return value
+
+    def broadcast(self, value, local_id):
+        """Returns the value of the work-item with the index ``local_id`` to
+        every work-item of the sub-group. ``local_id`` has to be the same for
+        all work-items of the sub-group.
+
+        Args:
+            value: The value contributed by the work-item.
+            local_id (int): The index of the work-item that broadcasts its
+                value.
+        Returns:
+            The value of the work-item ``local_id``.
+        """
+        return value
+
+    def any(self, predicate):
+        """Returns True if the predicate is true for any work-item of the
+        sub-group.
+
+        Args:
+            predicate (bool): The predicate of the work-item.
+        Returns:
+            bool: True if any predicate is true.
+        """
+        return bool(predicate)
+
+    def all(self, predicate):
+        """Returns True if the predicate is true for every work-item of the
+        sub-group.
+
+        Args:
+            predicate (bool): The predicate of the work-item.
+        Returns:
+            bool: True if all predicates are true.
+        """
+        return bool(predicate)
+
+    def reduce(self, value, op):
+        """Combines the values of all work-items of the sub-group.
+
+        Args:
+            value: The value contributed by the work-item.
+            op (str): The operation combining the values.
+        Returns:
+            The combined value, which is returned to every work-item.
+        Raises:
+            ValueError: If the operation is not supported.
+        """
+        _check_group_operation(op)
+        return value
+
+    def scan(self, value, op, exclusive=False):
+        """Computes a prefix scan over the values of the work-items of the
+        sub-group in the order of their index.
+
+        Args:
+            value: The value contributed by the work-item.
+            op (str): The operation combining the values.
+            exclusive (bool, optional): If True, the value of the calling
+                work-item is not included in its result and the first
+                work-item gets the identity of the operation. Defaults to
+                False.
+        Returns:
+            The combined values of the work-items up to the calling one.
+        Raises:
+            ValueError: If the operation is not supported.
+        """
+        _check_group_operation(op)
+        if exclusive:
+            return _identity(op, value)
+        return value
+
+
 class Item:
     """Analogue to the :sycl_item:`sycl::item <>` class.
 
@@ -340,6 +568,16 @@ class NdItem:
             A group object."""
         return self._group
 
+    def get_sub_group(self):
+        """Returns the sub-group of the work-group that the work-item belongs
+        to.
+
+        Returns:
+            A sub-group object."""
+        return SubGroup(
+            self.get_local_linear_id(), self.get_local_linear_range()
+        )
+
     @property
     def dimensions(self) -> int:
         """Returns the rank of a NdItem object.
@@ -5,6 +5,7 @@
 """Implementation of mock kernel launcher functions
 """
 
+import threading
 from inspect import signature
 from itertools import product
 from typing import Union
@@ -14,6 +15,109 @@ from .local_accessor import LocalAccessor, _LocalAccessorMock
 from .ranges import NdRange, Range
 
 
+class _WorkGroupSync:
+    """Exchanges the values of the work-items of a work-group in the group
+    collective functions.
+
+    The work-items of a work-group are executed on threads of their own. A
+    collective function blocks until every work-item of the work-group called
+    it and then returns the values of all work-items to each of them.
+    """
+
+    def __init__(self, size: int):
+        self._cond = threading.Condition()
+        self._size = size
+        self._active = size
+        self._arrived = 0
+        self._generation = 0
+        self._broken = False
+        self._values = [None] * size
+        self._result = None
+        self._work_item = threading.local()
+
+    def enter(self, local_linear_id: int):
+        """Registers the calling thread as the work-item with the local linear
+        id."""
+        self._work_item.local_linear_id = local_linear_id
+
+    @property
+    def local_linear_id(self) -> int:
+        """The local linear id of the work-item of the calling thread."""
+        return self._work_item.local_linear_id
+
+    def leave(self):
+        """Unregisters the calling thread once its work-item finished."""
+        with self._cond:
+            self._active -= 1
+            if self._arrived:
+                self._broken = True
+                self._cond.notify_all()
+
+    def exchange(self, value):
+        """Waits until every work-item contributed a value.
+
+        Returns:
+            tuple: The local linear id of the calling work-item and the list
+            of the values of all work-items ordered by their local linear id.
+
+        Raises:
+            RuntimeError: If a work-item of the work-group finished without
+            calling the collective function.
+        """
+        local_linear_id = self.local_linear_id
+        with self._cond:
+            if self._broken or self._active < self._size:
+                self._broken = True
+                self._cond.notify_all()
+                raise RuntimeError(
+                    "A group collective function was not called by all "
+                    "work-items of the work-group"
+                )
+            self._values[local_linear_id] = value
+            generation = self._generation
+            self._arrived += 1
+            if self._arrived == self._size:
+                self._result = list(self._values)
+                self._arrived = 0
+                self._generation += 1
+                self._cond.notify_all()
+            while generation == self._generation and not self._broken:
+                self._cond.wait()
+            if generation == self._generation:
+                raise RuntimeError(
+                    "A group collective function was not called by all "
+                    "work-items of the work-group"
+                )
+            return local_linear_id, self._result
+
+
+def _run_work_group(kernel_fn, nd_items, kernel_args, sync):
+    """Executes the work-items of a work-group, each on a thread of its own,
+    and re-raises the first exception raised by a work-item."""
+    errors = []
+
+    def run_work_item(local_linear_id, nd_item):
+        sync.enter(local_linear_id)
+        try:
+            kernel_fn(nd_item, *kernel_args)
+        except BaseException as exc:  # pylint: disable=broad-exception-caught
+            errors.append(exc)
+        finally:
+            sync.leave()
+
+    threads = [
+        threading.Thread(target=run_work_item, args=(i, nd_item))
+        for i, nd_item in enumerate(nd_items)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+
 def _range_kernel_launcher(kernel_fn, index_range, *kernel_args):
     """Executes a function that mocks a range kernel.
 
@@ -54,7 +158,11 @@ def _range_kernel_launcher(kernel_fn, index_range, *kernel_args):
 
 
 def _ndrange_kernel_launcher(kernel_fn, index_range, *kernel_args):
-    """Executes a function that mocks a range kernel.
+    """Executes a function that mocks an nd-range kernel.
+
+    The work-groups are executed one after another. The work-items of a
+    work-group are executed concurrently on threads, so that they can
+    exchange values in the group collective functions.
 
     Args:
         kernel_fn : A callable function object
@@ -80,8 +188,16 @@ def _ndrange_kernel_launcher(kernel_fn, index_range, *kernel_args):
             karg = _LocalAccessorMock(karg)
         modified_kernel_args.append(karg)
 
+    if len(signature(kernel_fn).parameters) - len(kernel_args) != 1:
+        raise ValueError(
+            "Required number of kernel function arguments do not "
+            "match provided number of kernel args"
+        )
+
     # Loop over the groups (parallel loop)
     for gidx in group_index_tuples:
+        sync = _WorkGroupSync(len(local_index_tuples))
+        nd_items = []
         # loop over work items in the group (parallel loop)
         for lidx in local_index_tuples:
             global_id = []
@@ -90,13 +206,8 @@ def _ndrange_kernel_launcher(kernel_fn, index_range, *kernel_args):
                 global_id.append(
                     gidx_val * index_range.local_range[dim] + lidx[dim]
                 )
-            if len(signature(kernel_fn).parameters) - len(kernel_args) != 1:
-                raise ValueError(
-                    "Required number of kernel function arguments do not "
-                    "match provided number of kernel args"
-                )
 
-            kernel_fn(
+            nd_items.append(
                 NdItem(
                     global_item=Item(
                         extent=index_range.global_range, index=global_id
@@ -107,11 +218,13 @@ def _ndrange_kernel_launcher(kernel_fn, index_range, *kernel_args):
                         index_range.local_range,
                         group_range,
                         gidx,
+                        sync=sync,
                     ),
-                ),
-                *modified_kernel_args,
+                )
             )
 
+        _run_work_group(kernel_fn, nd_items, modified_kernel_args, sync)
+
 
 def call_kernel(kernel_fn, index_range: Union[Range, NdRange], *kernel_args):
     """Mocks the launching of a kernel function over either a Range or NdRange.
@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Python functions that privatize atomic updates of a global memory array
+into a per work-group copy in local memory.
+
+Kernels such as histograms update a small global array with atomic operations
+from every work-item, so that the work-items of all work-groups contend for
+the same elements. With the functions the work-items of a work-group instead
+update a :class:`numba_dpex.kernel_api.LocalAccessor` with atomic operations
+and the work-group combines its copy into the global array once, with one
+atomic operation per element::
+
+    privatize_atomics(nd_item, local_hist, "add")
+    AtomicRef(local_hist, bin, address_space=AddressSpace.LOCAL).fetch_add(1)
+    flush_atomics(nd_item, local_hist, hist, "add")
+"""
+
+from .atomic_ref import AtomicRef
+from .device_event import _flat
+from .index_space_ids import NdItem, _identity
+
+# The operations supported by privatize_atomics and flush_atomics and the
+# AtomicRef methods that flush_atomics uses for them.
+_PRIVATIZED_OPERATIONS = {
+    "add": "fetch_add",
+    "min": "fetch_min",
+    "max": "fetch_max",
+    "and": "fetch_and",
+    "or": "fetch_or",
+    "xor": "fetch_xor",
+}
+
+
+def _check_privatized_operation(op):
+    if op not in _PRIVATIZED_OPERATIONS:
+        raise ValueError(f"Unsupported privatized atomic operation {op}")
+
+
+def _sync_work_group(nd_item: NdItem, func_name: str):
+    """Waits until every work-item of the work-group of nd_item reached the
+    call."""
+    sync = nd_item.get_group()._sync  # pylint: disable=protected-access
+    if sync is None:
+        raise NotImplementedError(
+            f"{func_name} can only be called from a kernel launched by "
+            "numba_dpex.kernel_api.call_kernel"
+        )
+    sync.exchange(None)
+
+
+def _work_item_indices(nd_item: NdItem, size: int):
+    """Returns the indices of the elements of an array of the size that the
+    work-item handles when the work-items of a work-group share the
+    elements."""
+    return range(
+        nd_item.get_local_linear_id(), size, nd_item.get_local_linear_range()
+    )
+
+
+def privatize_atomics(nd_item: NdItem, local, op: str = "add"):
+    """Initializes the work-group's local memory copy of an array that is
+    updated with atomic operations.
+
+    The work-items of the work-group fill the one-dimensional ``local`` array
+    with the identity of the operation and synchronize, so that they can
+    update ``local`` with :class:`numba_dpex.kernel_api.AtomicRef` operations
+    after the call. The function has to be called by every work-item of the
+    work-group with the same arguments.
+
+    Args:
+        nd_item (NdItem): The work-item calling the function.
+        local: The one-dimensional LocalAccessor holding the copy.
+        op (str, optional): The operation the copy is updated with, one of
+            ``"add"``, ``"min"``, ``"max"``, ``"and"``, ``"or"`` and
+            ``"xor"``. Defaults to ``"add"``.
+    Raises:
+        ValueError: If the operation is not supported.
+        NotImplementedError: If the function is not called from a kernel
+        launched by :func:`numba_dpex.kernel_api.call_kernel`.
+    """
+    _check_privatized_operation(op)
+    data = _flat(local)
+    identity = _identity(op, data.dtype.type(0))
+    for i in _work_item_indices(nd_item, data.size):
+        data[i] = identity
+    _sync_work_group(nd_item, "privatize_atomics")
+
+
+def flush_atomics(nd_item: NdItem, local, dest, op: str = "add"):
+    """Combines the work-group's local memory copy of an array into the
+    array in global memory.
+
+    The work-items of the work-group synchronize and then combine every
+    element of ``local`` that differs from the identity of the operation
+    into the element of ``dest`` with the same index, using one atomic
+    operation per element. The function has to be called by every work-item
+    of the work-group with the same arguments.
+
+    Args:
+        nd_item (NdItem): The work-item calling the function.
+        local: The one-dimensional LocalAccessor initialized by
+            :func:`numba_dpex.kernel_api.privatize_atomics`.
+        dest: The one-dimensional global memory array with at least as many
+            elements as ``local``.
+        op (str, optional): The operation the copy was updated with.
+            Defaults to ``"add"``.
+    Raises:
+        ValueError: If the operation is not supported.
+        NotImplementedError: If the function is not called from a kernel
+        launched by :func:`numba_dpex.kernel_api.call_kernel`.
+    """
+    _check_privatized_operation(op)
+    _sync_work_group(nd_item, "flush_atomics")
+    data = _flat(local)
+    identity = _identity(op, data.dtype.type(0))
+    for i in _work_item_indices(nd_item, data.size):
+        if data[i] != identity:
+            getattr(AtomicRef(dest, i), _PRIVATIZED_OPERATIONS[op])(data[i])
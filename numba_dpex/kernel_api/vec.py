@@ -0,0 +1,153 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Implements a Python analogue to SYCL's vec class and the functions that
+load and store vectors of consecutive array elements. The class is intended to
+be used in pure Python code when prototyping a kernel function.
+"""
+
+import operator
+
+import numpy as np
+
+from .device_event import _flat
+
+_SUPPORTED_VEC_SIZES = (2, 4, 8, 16)
+
+
+def _check_vec_size(size):
+    if size not in _SUPPORTED_VEC_SIZES:
+        raise ValueError(
+            f"Unsupported vector size {size}. The supported sizes are "
+            f"{_SUPPORTED_VEC_SIZES}."
+        )
+
+
+class Vec:
+    """Analogue to the :sycl_vec:`sycl::vec <>` class.
+
+    A Vec is a value holding a small fixed number of elements of the same
+    integer or floating point type. Inside a kernel a Vec is lowered to an
+    LLVM vector type, so that loading, storing and combining the elements
+    of a Vec compiles to single vector instructions. A Vec is created with
+    :func:`numba_dpex.kernel_api.vec` or
+    :func:`numba_dpex.kernel_api.load_vec` and is not user-constructible.
+
+    The ``+``, ``-``, ``*`` and ``/`` operators apply element-wise to two
+    vectors of the same type or to a vector and a scalar, which is converted
+    to the element type of the vector first. Division is only supported for
+    floating point vectors.
+    """
+
+    # Makes numpy scalars defer to the reflected operators of the class.
+    __array_ufunc__ = None
+
+    def __init__(self, data) -> None:
+        self._data = data
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, idx):
+        """Returns the element at position idx of the vector."""
+
+        return self._data[idx]
+
+    def _binary_op(self, other, op, reflected=False):
+        dtype = self._data.dtype
+        if op is operator.truediv and not np.issubdtype(dtype, np.floating):
+            raise TypeError("Division is only supported for floating point Vec")
+
+        if isinstance(other, Vec):
+            if other._data.dtype != dtype or len(other) != len(self):
+                raise TypeError(
+                    "Element-wise operations require vectors of the same "
+                    "type and size"
+                )
+            other = other._data
+        else:
+            other = dtype.type(other)
+
+        lhs, rhs = (other, self._data) if reflected else (self._data, other)
+        return Vec(op(lhs, rhs).astype(dtype, copy=False))
+
+    def __add__(self, other):
+        return self._binary_op(other, operator.add)
+
+    def __radd__(self, other):
+        return self._binary_op(other, operator.add, reflected=True)
+
+    def __sub__(self, other):
+        return self._binary_op(other, operator.sub)
+
+    def __rsub__(self, other):
+        return self._binary_op(other, operator.sub, reflected=True)
+
+    def __mul__(self, other):
+        return self._binary_op(other, operator.mul)
+
+    def __rmul__(self, other):
+        return self._binary_op(other, operator.mul, reflected=True)
+
+    def __truediv__(self, other):
+        return self._binary_op(other, operator.truediv)
+
+    def __rtruediv__(self, other):
+        return self._binary_op(other, operator.truediv, reflected=True)
+
+
+def vec(dtype, size: int, value=0) -> Vec:
+    """Creates a vector whose elements are all set to the same value.
+
+    Args:
+        dtype: The type of the vector elements.
+        size (int): The number of elements. Has to be a compile-time constant
+            of 2, 4, 8 or 16.
+        value (optional): The value of the elements. Defaults to 0.
+    Returns:
+        Vec: The new vector.
+    Raises:
+        ValueError: If the size is not supported.
+    """
+    _check_vec_size(size)
+    return Vec(np.full(size, value, dtype=dtype))
+
+
+def load_vec(array, index: int, size: int) -> Vec:
+    """Loads consecutive elements of an array into a vector.
+
+    Inside a kernel, the elements are read with a single vector load. The
+    array has to be C-contiguous and the index counts elements from the
+    beginning of its flattened data. Loads are fastest if the index is a
+    multiple of the size.
+
+    Args:
+        array: The array to read the elements from.
+        index (int): The index of the first element to read.
+        size (int): The number of elements to read. Has to be a compile-time
+            constant of 2, 4, 8 or 16.
+    Returns:
+        Vec: The vector of the elements ``index`` to ``index + size - 1``.
+    Raises:
+        ValueError: If the size is not supported.
+    """
+    _check_vec_size(size)
+    end = index + size
+    return Vec(_flat(array)[index:end].copy())
+
+
+def store_vec(array, index: int, value: Vec):
+    """Stores the elements of a vector into consecutive elements of an array.
+
+    Inside a kernel, the elements are written with a single vector store. The
+    array has to be C-contiguous and have the element type of the vector.
+
+    Args:
+        array: The array to write the elements to.
+        index (int): The index of the first element to write, counted from the
+            beginning of the flattened array data.
+        value (Vec): The vector to store.
+    """
+    end = index + len(value)
+    _flat(array)[index:end] = value._data  # pylint: disable=protected-access
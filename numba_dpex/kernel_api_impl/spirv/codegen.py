@@ -57,12 +57,59 @@ class SPIRVCodeLibrary(CPUCodeLibrary):
         else:
             self._inline_threshold = value
 
+    @property
+    def opt_level(self):
+        """
+        The LLVM optimization level to be used to optimize the final library.
+        """
+        if hasattr(self, "_opt_level"):
+            return self._opt_level
+
+        return config.DPEX_OPT
+
+    @opt_level.setter
+    def opt_level(self, value: int):
+        """Sets the LLVM optimization level for the library."""
+        if value < 0 or value > 3:
+            warnings.warn(
+                "Unsupported optimization level. Set a value between 0 and 3"
+            )
+            self._opt_level = config.DPEX_OPT
+        else:
+            self._opt_level = value
+
+    @property
+    def unroll_loops(self):
+        """
+        Whether the loop unrolling passes run when optimizing the final library.
+        """
+        return getattr(self, "_unroll_loops", False)
+
+    @unroll_loops.setter
+    def unroll_loops(self, value: bool):
+        """Enables or disables loop unrolling for the library."""
+        self._unroll_loops = bool(value)
+
+    @property
+    def vectorize(self):
+        """
+        Whether the loop and SLP vectorizers run when optimizing the final
+        library.
+        """
+        return getattr(self, "_vectorize", False)
+
+    @vectorize.setter
+    def vectorize(self, value: bool):
+        """Enables or disables the vectorizers for the library."""
+        self._vectorize = bool(value)
+
     def _optimize_final_module(self):
         # Run some lightweight optimization to simplify the module.
         pmb = ll.PassManagerBuilder()
 
-        # Make optimization level depending on config.DPEX_OPT variable
-        pmb.opt_level = config.DPEX_OPT
+        # The optimization level defaults to the config.DPEX_OPT variable and
+        # can be set per kernel.
+        pmb.opt_level = self.opt_level
 
         pmb.disable_unit_at_a_time = False
 
@@ -73,9 +120,11 @@ class SPIRVCodeLibrary(CPUCodeLibrary):
         if self.inline_threshold > 0:
             pmb.inlining_threshold = self.inline_threshold
 
-        pmb.disable_unroll_loops = True
-        pmb.loop_vectorize = False
-        pmb.slp_vectorize = False
+        # Loop unrolling and vectorization are disabled unless a kernel asks
+        # for them, as they increase the register pressure of every work-item.
+        pmb.disable_unroll_loops = not self.unroll_loops
+        pmb.loop_vectorize = self.vectorize
+        pmb.slp_vectorize = self.vectorize
 
         pm = ll.ModulePassManager()
         pmb.populate(pm)
@@ -26,7 +26,7 @@ from numba.core.types import Array as NpArrayType
 from numba.core.types import void
 from numba.core.typing.typeof import Purpose, typeof
 
-from numba_dpex.core import config
+from numba_dpex.core import config, host_array_cache
 from numba_dpex.core.descriptor import dpex_kernel_target
 from numba_dpex.core.exceptions import (
     ExecutionQueueInferenceError,
@@ -35,7 +35,7 @@ from numba_dpex.core.exceptions import (
     UnsupportedKernelArgumentError,
 )
 from numba_dpex.core.pipelines import kernel_compiler
-from numba_dpex.core.types import USMNdArray
+from numba_dpex.core.types import DpctlSyclQueue, USMNdArray
 from numba_dpex.core.utils import call_kernel_builder as kl
 from numba_dpex.kernel_api_impl.spirv import spirv_generator
 from numba_dpex.kernel_api_impl.spirv.codegen import SPIRVCodeLibrary
@@ -164,19 +164,31 @@ class _SPIRVKernelCompiler(_FunctionCompiler):
             kernel_fndesc.llvm_func_name
         )
 
-        # Create a spir_kernel wrapper function
-        kernel_fn = kernel_targetctx.prepare_spir_kernel(
-            kernel_func, kernel_fndesc.argtypes
-        )
         # Get the compiler flags that were passed through the target descriptor
         flags = Flags()
         self.targetdescr.options.parse_as_flags(flags, self.targetoptions)
 
+        # Create a spir_kernel wrapper function. The restrict and
+        # assume_aligned options add the noalias and align attributes to the
+        # data pointers of the array arguments of the wrapper.
+        kernel_fn = kernel_targetctx.prepare_spir_kernel(
+            kernel_func,
+            kernel_fndesc.argtypes,
+            restrict=flags.restrict,  # pylint: disable=E1101
+            assume_aligned=flags.assume_aligned,  # pylint: disable=E1101
+        )
+
         # If the inline_threshold option was set then set the property in the
         # kernel_library to force inlining ``overload`` calls into a kernel.
         inline_threshold = flags.inline_threshold  # pylint: disable=E1101
         kernel_library.inline_threshold = inline_threshold
 
+        # Set the optimization level, loop unrolling and vectorization options
+        # of the kernel for the final optimization of the kernel_library.
+        kernel_library.opt_level = flags.opt  # pylint: disable=E1101
+        kernel_library.unroll_loops = flags.unroll  # pylint: disable=E1101
+        kernel_library.vectorize = flags.vectorize  # pylint: disable=E1101
+
         # Call finalize on the LLVM module. Finalization will result in
         # all linking libraries getting linked together and final optimization
         # including inlining of functions if an inlining level is specified.
@@ -321,6 +333,7 @@ class SPIRVKernelDispatcher(Dispatcher):
         targetoptions["experimental"] = True
 
         self._kernel_name = pyfunc.__name__
+        self._args_active_call = ()
 
         super().__init__(
             py_func=pyfunc,
@@ -341,14 +354,25 @@ class SPIRVKernelDispatcher(Dispatcher):
         Resolve the Numba type of Python value *val*.
         This is called from numba._dispatcher as a fallback if the native code
         cannot decide the type.
+
+        NumPy arrays are rejected unless the
+        :data:`numba_dpex.core.config.HOST_ARRAY_ARGS` mode is enabled, in which
+        case they are typed as their USM device copy without transferring
+        them. The queue of the copy is chosen from all the arguments of the
+        active call by :func:`numba_dpex.core.host_array_cache.infer_queue`,
+        which also picks the queue the copy is allocated on.
         """
         # Not going through the resolve_argument_type() indirection
         # can save a couple µs.
         try:
             typ = typeof(val, Purpose.argument)
             if isinstance(typ, types.Array) and not isinstance(typ, USMNdArray):
-                raise UnsupportedKernelArgumentError(
-                    type=str(type(val)), value=val
+                if not config.HOST_ARRAY_ARGS:
+                    raise UnsupportedKernelArgumentError(
+                        type=str(type(val)), value=val
+                    )
+                typ = host_array_cache.mirror_type(
+                    typ, self._mirror_queue_type()
                 )
         except ValueError:
             typ = types.pyobject
@@ -358,6 +382,22 @@ class SPIRVKernelDispatcher(Dispatcher):
         self._types_active_call.append(typ)
         return typ
 
+    def _mirror_queue_type(self):
+        """Returns the queue type of the device copies of the NumPy arrays
+        passed in the active call."""
+        return DpctlSyclQueue(
+            host_array_cache.infer_queue(self._args_active_call)
+        )
+
+    def _compile_for_args(self, *args, **kws):
+        # Keeps the arguments of the active call, as the queue of the device
+        # copies of NumPy arguments depends on all of them.
+        self._args_active_call = args
+        try:
+            return super()._compile_for_args(*args, **kws)
+        finally:
+            self._args_active_call = ()
+
     def add_overload(self, cres):
         args = tuple(cres.signature.args)
         self.overloads[args] = cres
@@ -138,6 +138,7 @@ class UnaryMathFuncTemplate(ConcreteTemplate):
     cases = [
         signature(types.float64, types.int64),
         signature(types.float64, types.uint64),
+        signature(types.float16, types.float16),
         signature(types.float32, types.float32),
         signature(types.float64, types.float64),
     ]
@@ -212,6 +213,7 @@ class MathAtan2Fn(ConcreteTemplate):
     cases = [
         signature(types.float64, types.int64, types.int64),
         signature(types.float64, types.uint64, types.uint64),
+        signature(types.float16, types.float16, types.float16),
         signature(types.float32, types.float32, types.float32),
         signature(types.float64, types.float64, types.float64),
     ]
@@ -267,6 +269,7 @@ class MathLgammaFn(UnaryMathFuncTemplate):
 
 class BinaryMathFuncTemplate(ConcreteTemplate):
     cases = [
+        signature(types.float16, types.float16, types.float16),
         signature(types.float32, types.float32, types.float32),
         signature(types.float64, types.float64, types.float64),
     ]
@@ -283,6 +286,7 @@ class MathFmodFn(BinaryMathFuncTemplate):
 class MathPowFn(ConcreteTemplate):
     key = math.pow
     cases = [
+        signature(types.float16, types.float16, types.float16),
         signature(types.float32, types.float32, types.float32),
         signature(types.float64, types.float64, types.float64),
         signature(types.float32, types.float32, types.int32),
@@ -295,6 +299,7 @@ class MathIsnanFn(ConcreteTemplate):
     cases = [
         signature(types.boolean, types.int64),
         signature(types.boolean, types.uint64),
+        signature(types.boolean, types.float16),
         signature(types.boolean, types.float32),
         signature(types.boolean, types.float64),
     ]
@@ -305,6 +310,7 @@ class MathIsinfFn(ConcreteTemplate):
     cases = [
         signature(types.boolean, types.int64),
         signature(types.boolean, types.uint64),
+        signature(types.boolean, types.float16),
         signature(types.boolean, types.float32),
         signature(types.boolean, types.float64),
     ]
@@ -12,15 +12,19 @@ import numpy
 from numba.core import types
 from numba.core.imputils import Registry
 
+from numba_dpex.core import config
 from numba_dpex.core.utils import cgutils_extra, itanium_mangler
 
 registry = Registry()
 lower = registry.lower
 
+_unary_b_h = types.int32(types.float16)
 _unary_b_f = types.int32(types.float32)
 _unary_b_d = types.int32(types.float64)
+_unary_h_h = types.float16(types.float16)
 _unary_f_f = types.float32(types.float32)
 _unary_d_d = types.float64(types.float64)
+_binary_h_hh = types.float16(types.float16, types.float16)
 _binary_f_ff = types.float32(types.float32, types.float32)
 _binary_d_dd = types.float64(types.float64, types.float64)
 
@@ -43,42 +47,42 @@ sig_mapper = {
 }
 
 function_descriptors = {
-    "isnan": (_unary_b_f, _unary_b_d),
-    "isinf": (_unary_b_f, _unary_b_d),
-    "ceil": (_unary_f_f, _unary_d_d),
-    "floor": (_unary_f_f, _unary_d_d),
-    "trunc": (_unary_f_f, _unary_d_d),
-    "fabs": (_unary_f_f, _unary_d_d),
-    "sqrt": (_unary_f_f, _unary_d_d),
-    "exp": (_unary_f_f, _unary_d_d),
-    "expm1": (_unary_f_f, _unary_d_d),
-    "log": (_unary_f_f, _unary_d_d),
-    "log10": (_unary_f_f, _unary_d_d),
-    "log1p": (_unary_f_f, _unary_d_d),
-    "sin": (_unary_f_f, _unary_d_d),
-    "cos": (_unary_f_f, _unary_d_d),
-    "tan": (_unary_f_f, _unary_d_d),
-    "asin": (_unary_f_f, _unary_d_d),
-    "acos": (_unary_f_f, _unary_d_d),
-    "atan": (_unary_f_f, _unary_d_d),
-    "sinh": (_unary_f_f, _unary_d_d),
-    "cosh": (_unary_f_f, _unary_d_d),
-    "tanh": (_unary_f_f, _unary_d_d),
-    "asinh": (_unary_f_f, _unary_d_d),
-    "acosh": (_unary_f_f, _unary_d_d),
-    "atanh": (_unary_f_f, _unary_d_d),
-    "copysign": (_binary_f_ff, _binary_d_dd),
-    "atan2": (_binary_f_ff, _binary_d_dd),
-    "pow": (_binary_f_ff, _binary_d_dd),
-    "fmod": (_binary_f_ff, _binary_d_dd),
-    "erf": (_unary_f_f, _unary_d_d),
-    "erfc": (_unary_f_f, _unary_d_d),
-    "gamma": (_unary_f_f, _unary_d_d),
-    "lgamma": (_unary_f_f, _unary_d_d),
+    "isnan": (_unary_b_h, _unary_b_f, _unary_b_d),
+    "isinf": (_unary_b_h, _unary_b_f, _unary_b_d),
+    "ceil": (_unary_h_h, _unary_f_f, _unary_d_d),
+    "floor": (_unary_h_h, _unary_f_f, _unary_d_d),
+    "trunc": (_unary_h_h, _unary_f_f, _unary_d_d),
+    "fabs": (_unary_h_h, _unary_f_f, _unary_d_d),
+    "sqrt": (_unary_h_h, _unary_f_f, _unary_d_d),
+    "exp": (_unary_h_h, _unary_f_f, _unary_d_d),
+    "expm1": (_unary_h_h, _unary_f_f, _unary_d_d),
+    "log": (_unary_h_h, _unary_f_f, _unary_d_d),
+    "log10": (_unary_h_h, _unary_f_f, _unary_d_d),
+    "log1p": (_unary_h_h, _unary_f_f, _unary_d_d),
+    "sin": (_unary_h_h, _unary_f_f, _unary_d_d),
+    "cos": (_unary_h_h, _unary_f_f, _unary_d_d),
+    "tan": (_unary_h_h, _unary_f_f, _unary_d_d),
+    "asin": (_unary_h_h, _unary_f_f, _unary_d_d),
+    "acos": (_unary_h_h, _unary_f_f, _unary_d_d),
+    "atan": (_unary_h_h, _unary_f_f, _unary_d_d),
+    "sinh": (_unary_h_h, _unary_f_f, _unary_d_d),
+    "cosh": (_unary_h_h, _unary_f_f, _unary_d_d),
+    "tanh": (_unary_h_h, _unary_f_f, _unary_d_d),
+    "asinh": (_unary_h_h, _unary_f_f, _unary_d_d),
+    "acosh": (_unary_h_h, _unary_f_f, _unary_d_d),
+    "atanh": (_unary_h_h, _unary_f_f, _unary_d_d),
+    "copysign": (_binary_h_hh, _binary_f_ff, _binary_d_dd),
+    "atan2": (_binary_h_hh, _binary_f_ff, _binary_d_dd),
+    "pow": (_binary_h_hh, _binary_f_ff, _binary_d_dd),
+    "fmod": (_binary_h_hh, _binary_f_ff, _binary_d_dd),
+    "erf": (_unary_h_h, _unary_f_f, _unary_d_d),
+    "erfc": (_unary_h_h, _unary_f_f, _unary_d_d),
+    "gamma": (_unary_h_h, _unary_f_f, _unary_d_d),
+    "lgamma": (_unary_h_h, _unary_f_f, _unary_d_d),
     "ldexp": (_binary_f_fi, _binary_f_fl, _binary_d_di, _binary_d_dl),
     "hypot": (_binary_f_fi, _binary_f_ff, _binary_d_dl, _binary_d_dd),
-    "exp2": (_unary_f_f, _unary_d_d),
-    "log2": (_unary_f_f, _unary_d_d),
+    "exp2": (_unary_h_h, _unary_f_f, _unary_d_d),
+    "log2": (_unary_h_h, _unary_f_f, _unary_d_d),
     # unsupported functions listed in the math module documentation:
     # frexp, ldexp, trunc, modf, factorial, fsum
 }
@@ -88,15 +92,44 @@ function_descriptors = {
 # library as opposed to the Python name.
 _lib_counterpart = {"gamma": "tgamma"}
 
+# functions that have native_* and half_* OpenCL builtin counterparts for
+# float32 arguments.
+_approx_counterpart = frozenset(
+    ["sin", "cos", "tan", "exp", "exp2", "log", "log2", "log10", "sqrt"]
+)
 
-def _mk_fn_decl(name, decl_sig):
+
+def _allows_approx_functions(context):
+    """Checks if the fastmath flags of the function being lowered allow
+    approximate implementations of math functions."""
+    fastmath = context.fastmath
+    return bool(fastmath) and not fastmath.flags.isdisjoint({"fast", "afn"})
+
+
+def _builtin_name(context, name, decl_sig):
+    """Returns the name of the OpenCL builtin a math function is lowered to.
+
+    The native_* or half_* builtin, as set by
+    :data:`numba_dpex.core.config.APPROX_MATH_BUILTINS`, is used for float32
+    functions if the fastmath flags allow approximate functions.
+    """
     sym = _lib_counterpart.get(name, name)
+    if (
+        name in _approx_counterpart
+        and decl_sig.args == (types.float32,)
+        and config.APPROX_MATH_BUILTINS in ("native", "half")
+        and _allows_approx_functions(context)
+    ):
+        sym = f"{config.APPROX_MATH_BUILTINS}_{sym}"
+    return sym
+
 
+def _mk_fn_decl(name, decl_sig):
     def core(context, builder, sig, args):
         fn = cgutils_extra.declare_function(
             context,
             builder,
-            sym,
+            _builtin_name(context, name, decl_sig),
             decl_sig,
             decl_sig.args,
             mangler=itanium_mangler.mangle,
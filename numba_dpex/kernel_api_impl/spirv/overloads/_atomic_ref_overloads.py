@@ -11,6 +11,7 @@ from numba import errors
 from numba.core import cgutils, types
 from numba.extending import intrinsic, overload, overload_method
 
+from numba_dpex.core import config
 from numba_dpex.core.types import USMNdArray
 from numba_dpex.core.types.kernel_api.atomic_ref import AtomicRefType
 from numba_dpex.core.utils import itanium_mangler as ext_itanium_mangler
@@ -151,9 +152,134 @@ def _intrinsic_helper(
     return sig, gen
 
 
+def _use_cas_loop(atomic_ref_dtype):
+    """Returns True if the floating point atomic operations of an AtomicRef
+    are emulated with compare-exchange loops, see
+    :data:`numba_dpex.core.config.NATIVE_FP_ATOMICS`. float16 values always
+    use the native instructions, as SPIR-V has no 16-bit compare-exchange."""
+    return not config.NATIVE_FP_ATOMICS and atomic_ref_dtype in (
+        types.float32,
+        types.float64,
+    )
+
+
+def _load_memory_order(memory_order):
+    """Returns the memory order of the load and of the failed compare-exchange
+    of a compare-exchange loop, as the getLoadOrder function of dpcpp."""
+    if memory_order == MemoryOrder.RELEASE.value:
+        return MemoryOrder.RELAXED.value
+    if memory_order == MemoryOrder.ACQ_REL.value:
+        return MemoryOrder.ACQUIRE.value
+    return memory_order
+
+
+def _cas_loop_combine(builder, op_str, old, val):
+    """Returns the value a floating point atomic operation stores for the old
+    value of the referenced object and the operand."""
+    if op_str == "fetch_add":
+        return builder.fadd(old, val)
+    if op_str == "fetch_sub":
+        return builder.fsub(old, val)
+    if op_str == "fetch_min":
+        return builder.select(builder.fcmp_ordered("<", val, old), val, old)
+    if op_str == "fetch_max":
+        return builder.select(builder.fcmp_ordered(">", val, old), val, old)
+    raise errors.TypingError(f"{op_str} is not supported for floating point")
+
+
+def _intrinsic_cas_loop_helper(
+    ty_context, ty_atomic_ref, ty_val, op_str  # pylint: disable=unused-argument
+):
+    """Generates a floating point atomic operation as a loop that computes the
+    new value from the loaded old value and stores it with a compare-exchange
+    on the integer bits of the values, retrying until no other work-item
+    changed the value in between. dpcpp uses the same loop for floating point
+    atomics if SYCL_USE_NATIVE_FP_ATOMICS is not defined."""
+    sig = ty_atomic_ref.dtype(ty_atomic_ref, ty_val)
+
+    def gen(context, builder, sig, args):
+        atomic_ref_ty = sig.args[0]
+        fp_type = context.get_value_type(atomic_ref_ty.dtype)
+        int_type = llvmir.IntType(atomic_ref_ty.dtype.bitwidth)
+
+        ref_ptr = builder.extract_value(
+            args[0],
+            context.data_model_manager.lookup(atomic_ref_ty).get_field_position(
+                "ref"
+            ),
+        )
+        int_ptr = builder.bitcast(
+            ref_ptr,
+            llvmir.PointerType(int_type, addrspace=atomic_ref_ty.address_space),
+        )
+        scope = context.get_constant(
+            types.int32, get_scope(atomic_ref_ty.memory_scope)
+        )
+        success_order = context.get_constant(
+            types.int32, get_memory_semantics_mask(atomic_ref_ty.memory_order)
+        )
+        load_order = context.get_constant(
+            types.int32,
+            get_memory_semantics_mask(
+                _load_memory_order(atomic_ref_ty.memory_order)
+            ),
+        )
+
+        loaded = builder.call(
+            get_or_insert_atomic_load_fn(
+                context, builder.module, atomic_ref_ty
+            ),
+            [int_ptr, scope, load_order],
+        )
+        entry_block = builder.block
+        loop_block = builder.append_basic_block("atomic_cas_loop")
+        done_block = builder.append_basic_block("atomic_cas_done")
+        builder.branch(loop_block)
+
+        builder.position_at_end(loop_block)
+        expected = builder.phi(int_type)
+        expected.add_incoming(loaded, entry_block)
+        old = builder.bitcast(expected, fp_type)
+        desired = builder.bitcast(
+            _cas_loop_combine(builder, op_str, old, args[1]), int_type
+        )
+        actual = builder.call(
+            get_or_insert_spv_atomic_compare_exchange_fn(
+                context, builder.module, atomic_ref_ty
+            ),
+            [int_ptr, scope, success_order, load_order, desired, expected],
+        )
+        expected.add_incoming(actual, builder.block)
+        builder.cbranch(
+            builder.icmp_unsigned("==", actual, expected),
+            done_block,
+            loop_block,
+        )
+
+        for callinst in (loaded, actual):
+            if _SUPPORT_CONVERGENT:
+                callinst.attributes.add("convergent")
+            callinst.attributes.add("nounwind")
+
+        builder.position_at_end(done_block)
+        return old
+
+    return sig, gen
+
+
+def _intrinsic_fp_helper(ty_context, ty_atomic_ref, ty_val, op_str):
+    """Generates an atomic operation that supports floating point values as
+    a SPIR-V instruction or as a compare-exchange loop."""
+    if _use_cas_loop(ty_atomic_ref.dtype):
+        return _intrinsic_cas_loop_helper(
+            ty_context, ty_atomic_ref, ty_val, op_str
+        )
+    return _intrinsic_helper(ty_context, ty_atomic_ref, ty_val, op_str)
+
+
 @intrinsic(target=SPIRV_TARGET_NAME)
 def _intrinsic_fetch_add(ty_context, ty_atomic_ref, ty_val):
-    return _intrinsic_helper(ty_context, ty_atomic_ref, ty_val, "fetch_add")
+    return _intrinsic_fp_helper(ty_context, ty_atomic_ref, ty_val, "fetch_add")
 
 
 def _atomic_sub_float_wrapper(gen_fn):
@@ -172,7 +298,11 @@ def _atomic_sub_float_wrapper(gen_fn):
 
 @intrinsic(target=SPIRV_TARGET_NAME)
 def _intrinsic_fetch_sub(ty_context, ty_atomic_ref, ty_val):
-    if ty_atomic_ref.dtype in (types.float32, types.float64):
+    if _use_cas_loop(ty_atomic_ref.dtype):
+        return _intrinsic_cas_loop_helper(
+            ty_context, ty_atomic_ref, ty_val, "fetch_sub"
+        )
+    if ty_atomic_ref.dtype in (types.float16, types.float32, types.float64):
         # dpcpp does not support ``__spirv_AtomicFSubEXT``. fetch_sub
         # for floats is implemented by negating the value and calling fetch_add.
         # For example, A.fetch_sub(A, val) is implemented as A.fetch_add(-val).
@@ -186,12 +316,12 @@ def _intrinsic_fetch_sub(ty_context, ty_atomic_ref, ty_val):
 
 @intrinsic(target=SPIRV_TARGET_NAME)
 def _intrinsic_fetch_min(ty_context, ty_atomic_ref, ty_val):
-    return _intrinsic_helper(ty_context, ty_atomic_ref, ty_val, "fetch_min")
+    return _intrinsic_fp_helper(ty_context, ty_atomic_ref, ty_val, "fetch_min")
 
 
 @intrinsic(target=SPIRV_TARGET_NAME)
 def _intrinsic_fetch_max(ty_context, ty_atomic_ref, ty_val):
-    return _intrinsic_helper(ty_context, ty_atomic_ref, ty_val, "fetch_max")
+    return _intrinsic_fp_helper(ty_context, ty_atomic_ref, ty_val, "fetch_max")
 
 
 @intrinsic(target=SPIRV_TARGET_NAME)
@@ -548,6 +678,7 @@ def _check_if_supported_ref(ref):
     if ref.dtype not in [
         types.int32,
         types.uint32,
+        types.float16,
         types.float32,
         types.int64,
         types.uint64,
@@ -562,10 +693,26 @@ def _check_if_supported_ref(ref):
             raise errors.TypingError(
                 "Targeted device does not support 64-bit atomic operations."
             )
+    if ref.dtype == types.float16:
+        if not ref.queue.device_has_aspect_fp16:
+            raise errors.TypingError(
+                "Targeted device does not support float16 operations."
+            )
 
     return supported
 
 
+def _check_no_float16_ref(atomic_ref, op_str):
+    """SPIR-V has atomic add, min and max instructions for float16 values,
+    but no atomic loads, stores and exchanges of 16-bit values."""
+    if atomic_ref.dtype == types.float16:
+        raise errors.TypingError(
+            f"{op_str} operation is not supported on float16 dtype. Only "
+            "fetch_add, fetch_sub, fetch_min and fetch_max operations support "
+            "float16."
+        )
+
+
 @overload(
     AtomicRef,
     prefer_literal=True,
@@ -782,9 +929,15 @@ def ol_fetch_and(atomic_ref, val):
             f"reference: {atomic_ref.dtype} stored in the atomic ref."
         )
 
-    if atomic_ref.dtype not in (types.int32, types.int64):
+    if atomic_ref.dtype not in (
+        types.int32,
+        types.uint32,
+        types.int64,
+        types.uint64,
+    ):
         raise errors.TypingError(
-            "fetch_and operation only supported on int32 and int64 dtypes."
+            "fetch_and operation only supported on int32, uint32, int64 and "
+            "uint64 dtypes."
         )
 
     def ol_fetch_and_impl(atomic_ref, val):
@@ -811,9 +964,15 @@ def ol_fetch_or(atomic_ref, val):
             f"reference: {atomic_ref.dtype} stored in the atomic ref."
         )
 
-    if atomic_ref.dtype not in (types.int32, types.int64):
+    if atomic_ref.dtype not in (
+        types.int32,
+        types.uint32,
+        types.int64,
+        types.uint64,
+    ):
         raise errors.TypingError(
-            "fetch_or operation only supported on int32 and int64 dtypes."
+            "fetch_or operation only supported on int32, uint32, int64 and "
+            "uint64 dtypes."
         )
 
     def ol_fetch_or_impl(atomic_ref, val):
@@ -840,9 +999,15 @@ def ol_fetch_xor(atomic_ref, val):
             f"reference: {atomic_ref.dtype} stored in the atomic ref."
         )
 
-    if atomic_ref.dtype not in (types.int32, types.int64):
+    if atomic_ref.dtype not in (
+        types.int32,
+        types.uint32,
+        types.int64,
+        types.uint64,
+    ):
         raise errors.TypingError(
-            "fetch_xor operation only supported on int32 and int64 dtypes."
+            "fetch_xor operation only supported on int32, uint32, int64 and "
+            "uint64 dtypes."
         )
 
     def ol_fetch_xor_impl(atomic_ref, val):
@@ -859,7 +1024,10 @@ def ol_load(atomic_ref):  # pylint: disable=unused-argument
     Generates the same LLVM IR instruction as dpcpp for the
     `atomic_ref::load` function.
 
+    Raises:
+        TypingError: When the dtype of the AtomicRef type is float16.
     """
+    _check_no_float16_ref(atomic_ref, "load")
 
     def ol_load_impl(atomic_ref):
         # pylint: disable=no-value-for-parameter
@@ -878,7 +1046,9 @@ def ol_store(atomic_ref, val):
     Raises:
         TypingError: When the dtype of the value stored does not match the
         dtype of the AtomicRef type.
+        TypingError: When the dtype of the AtomicRef type is float16.
     """
+    _check_no_float16_ref(atomic_ref, "store")
 
     if atomic_ref.dtype != val:
         raise errors.TypingError(
@@ -903,7 +1073,9 @@ def ol_exchange(atomic_ref, val):
     Raises:
         TypingError: When the dtype of the value passed to `exchange`
         does not match the dtype of the AtomicRef type.
+        TypingError: When the dtype of the AtomicRef type is float16.
     """
+    _check_no_float16_ref(atomic_ref, "exchange")
 
     if atomic_ref.dtype != val:
         raise errors.TypingError(
@@ -938,7 +1110,9 @@ def ol_compare_exchange(
     Raises:
         TypingError: When the dtype of the value passed to `compare_exchange`
         does not match the dtype of the AtomicRef type.
+        TypingError: When the dtype of the AtomicRef type is float16.
     """
+    _check_no_float16_ref(atomic_ref, "compare_exchange")
 
     _check_if_supported_ref(expected_ref)
 
@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Implements the SPIR-V overloads for the functions of kernel_api.bfloat16 that
+convert between float32 values and bfloat16 values stored in uint16 integers.
+
+The conversions are generated as integer instructions on the bits of the
+values, so that they do not require the bfloat16 conversion extensions of the
+LLVM IR to SPIR-V translator and work on every device.
+"""
+
+import llvmlite.ir as llvmir
+from numba.core import types
+from numba.core.errors import TypingError
+from numba.extending import intrinsic, overload
+
+from numba_dpex.kernel_api import bfloat16_to_float32, float32_to_bfloat16
+
+from ..target import SPIRV_TARGET_NAME
+
+
+@intrinsic(target=SPIRV_TARGET_NAME)
+def _intrinsic_bfloat16_to_float32(
+    ty_context, ty_value  # pylint: disable=unused-argument
+):
+    """Generates the shift of the bfloat16 bits into the upper half of the
+    bits of a float32 value."""
+    sig = types.float32(ty_value)
+
+    def _intrinsic_bfloat16_to_float32_gen(context, builder, sig, args):
+        bits = context.cast(builder, args[0], sig.args[0], types.uint16)
+        bits = builder.zext(bits, llvmir.IntType(32))
+        bits = builder.shl(bits, llvmir.Constant(llvmir.IntType(32), 16))
+        return builder.bitcast(bits, llvmir.FloatType())
+
+    return (
+        sig,
+        _intrinsic_bfloat16_to_float32_gen,
+    )
+
+
+@intrinsic(target=SPIRV_TARGET_NAME)
+def _intrinsic_float32_to_bfloat16(
+    ty_context, ty_value  # pylint: disable=unused-argument
+):
+    """Generates the round to nearest even conversion of a float32 value to
+    the bits of a bfloat16 value."""
+    sig = types.uint16(ty_value)
+
+    def _intrinsic_float32_to_bfloat16_gen(context, builder, sig, args):
+        i32 = llvmir.IntType(32)
+        value = context.cast(builder, args[0], sig.args[0], types.float32)
+        bits = builder.bitcast(value, i32)
+        upper = builder.lshr(bits, llvmir.Constant(i32, 16))
+
+        # Adds 0x7FFF plus the last bit of the result, so that the upper half
+        # is rounded up if the lower half is above the halfway point and ties
+        # are rounded to even.
+        rounding = builder.add(
+            builder.and_(upper, llvmir.Constant(i32, 1)),
+            llvmir.Constant(i32, 0x7FFF),
+        )
+        rounded = builder.lshr(
+            builder.add(bits, rounding), llvmir.Constant(i32, 16)
+        )
+        quiet_nan = builder.or_(upper, llvmir.Constant(i32, 0x40))
+
+        is_nan = builder.fcmp_unordered("uno", value, value)
+        result = builder.select(is_nan, quiet_nan, rounded)
+        return builder.trunc(result, llvmir.IntType(16))
+
+    return (
+        sig,
+        _intrinsic_float32_to_bfloat16_gen,
+    )
+
+
+@overload(bfloat16_to_float32, target=SPIRV_TARGET_NAME)
+def ol_bfloat16_to_float32(value):
+    """SPIR-V overload for :func:`numba_dpex.kernel_api.bfloat16_to_float32`.
+
+    Generates integer instructions that move the bfloat16 bits into a float32
+    value.
+    """
+    if not isinstance(value, types.Integer):
+        raise TypingError(
+            "Expected the bits of a bfloat16 value as an integer, but "
+            f"encountered {value}"
+        )
+
+    def ol_bfloat16_to_float32_impl(value):
+        # pylint: disable=no-value-for-parameter
+        return _intrinsic_bfloat16_to_float32(value)
+
+    return ol_bfloat16_to_float32_impl
+
+
+@overload(float32_to_bfloat16, target=SPIRV_TARGET_NAME)
+def ol_float32_to_bfloat16(value):
+    """SPIR-V overload for :func:`numba_dpex.kernel_api.float32_to_bfloat16`.
+
+    Generates integer instructions that round a float32 value to the bits of
+    a bfloat16 value.
+    """
+    if not isinstance(value, types.Float):
+        raise TypingError(
+            f"Expected a floating point value, but encountered {value}"
+        )
+
+    def ol_float32_to_bfloat16_impl(value):
+        # pylint: disable=no-value-for-parameter
+        return _intrinsic_float32_to_bfloat16(value)
+
+    return ol_float32_to_bfloat16_impl
@@ -0,0 +1,246 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Provides overloads for functions included in kernel_api.device_event that
+generate dpcpp SPIR-V LLVM IR intrinsic function calls.
+"""
+
+from llvmlite import ir as llvmir
+from numba.core import cgutils, types
+from numba.core.errors import TypingError
+from numba.extending import intrinsic, overload
+from numba.np.arrayobj import make_array
+
+from numba_dpex.core.types import USMNdArray
+from numba_dpex.core.types.kernel_api.device_event import DeviceEventType
+from numba_dpex.core.types.kernel_api.index_space_ids import GroupType
+from numba_dpex.kernel_api import async_work_group_copy, wait_for
+from numba_dpex.kernel_api.memory_enums import AddressSpace
+from numba_dpex.kernel_api_impl.spirv.target import SPIRV_TARGET_NAME
+
+from ._spv_atomic_inst_helper import _SpvScope
+from .spv_fn_declarations import (
+    _SUPPORT_CONVERGENT,
+    get_or_insert_spv_group_async_copy_fn,
+    get_or_insert_spv_group_wait_events_fn,
+)
+
+
+def _check_group(group):
+    if not isinstance(group, GroupType):
+        raise TypingError(
+            "Expected a group to be a GroupType value, but "
+            f"encountered {group}"
+        )
+
+
+def _check_copy_arrays(dest, src):
+    """Checks that one of the arrays is in local and the other in global
+    memory, and that both are C-contiguous arrays of the same dtype."""
+    for name, array in (("dest", dest), ("src", src)):
+        if not isinstance(array, USMNdArray) or array.layout != "C":
+            raise TypingError(
+                f"Expected {name} to be a C-contiguous array, but "
+                f"encountered {array}"
+            )
+        if not isinstance(array.dtype, (types.Integer, types.Float)):
+            raise TypingError(
+                "async_work_group_copy supports integer and floating point "
+                f"arrays, but encountered {array}"
+            )
+
+    if dest.dtype != src.dtype:
+        raise TypingError(
+            "Expected dest and src to have the same dtype, but encountered "
+            f"{dest.dtype} and {src.dtype}"
+        )
+
+    address_spaces = (dest.addrspace, src.addrspace)
+    if address_spaces not in (
+        (AddressSpace.LOCAL.value, AddressSpace.GLOBAL.value),
+        (AddressSpace.GLOBAL.value, AddressSpace.LOCAL.value),
+    ):
+        raise TypingError(
+            "async_work_group_copy copies between a LocalAccessor and an "
+            "array in global memory."
+        )
+
+
+@intrinsic(target=SPIRV_TARGET_NAME)
+def _intrinsic_async_work_group_copy(
+    ty_context,  # pylint: disable=unused-argument
+    ty_group,
+    ty_dest,
+    ty_src,
+    ty_num_elements,  # pylint: disable=unused-argument
+    ty_stride,  # pylint: disable=unused-argument
+    ty_dest_offset,  # pylint: disable=unused-argument
+    ty_src_offset,  # pylint: disable=unused-argument
+    ty_event,
+):
+    """Generates a __spirv_GroupAsyncCopy call with the Workgroup scope."""
+    _check_group(ty_group)
+    _check_copy_arrays(ty_dest, ty_src)
+
+    ty_device_event = DeviceEventType()
+    has_event = isinstance(ty_event, DeviceEventType)
+    if not has_event and not isinstance(
+        ty_event, (types.NoneType, types.Omitted)
+    ):
+        raise TypingError(
+            "Expected event to be a DeviceEvent or None, but encountered "
+            f"{ty_event}"
+        )
+
+    sig = ty_device_event(
+        ty_group,
+        ty_dest,
+        ty_src,
+        types.uint64,
+        types.uint64,
+        types.intp,
+        types.intp,
+        ty_event,
+    )
+
+    def _intrinsic_async_work_group_copy_gen(context, builder, sig, args):
+        dest = make_array(ty_dest)(context, builder, value=args[1])
+        src = make_array(ty_src)(context, builder, value=args[2])
+        dest_ptr = builder.gep(dest.data, [args[5]])
+        src_ptr = builder.gep(src.data, [args[6]])
+
+        event_type = context.get_value_type(ty_device_event)
+        event = args[7] if has_event else llvmir.Constant(event_type, None)
+
+        fn = get_or_insert_spv_group_async_copy_fn(
+            context,
+            builder.module,
+            types.CPointer(ty_dest.dtype, addrspace=ty_dest.addrspace),
+            types.CPointer(ty_src.dtype, addrspace=ty_src.addrspace),
+            ty_device_event,
+        )
+        callinst = builder.call(
+            fn,
+            [
+                llvmir.Constant(llvmir.IntType(32), _SpvScope.WORKGROUP.value),
+                dest_ptr,
+                src_ptr,
+                args[3],
+                args[4],
+                event,
+            ],
+        )
+
+        if _SUPPORT_CONVERGENT:  # pylint: disable=duplicate-code
+            callinst.attributes.add("convergent")
+        callinst.attributes.add("nounwind")
+
+        return callinst
+
+    return (
+        sig,
+        _intrinsic_async_work_group_copy_gen,
+    )
+
+
+@intrinsic(target=SPIRV_TARGET_NAME)
+def _intrinsic_wait_for(
+    ty_context, ty_group, ty_event  # pylint: disable=unused-argument
+):
+    """Generates a __spirv_GroupWaitEvents call with the Workgroup scope for a
+    single event."""
+    _check_group(ty_group)
+    if not isinstance(ty_event, DeviceEventType):
+        raise TypingError(
+            f"Expected a DeviceEvent value, but encountered {ty_event}"
+        )
+
+    sig = types.void(ty_group, ty_event)
+
+    def _intrinsic_wait_for_gen(context, builder, sig, args):
+        events = cgutils.alloca_once(builder, context.get_value_type(ty_event))
+        builder.store(args[1], events)
+
+        fn = get_or_insert_spv_group_wait_events_fn(
+            context, builder.module, ty_event
+        )
+        callinst = builder.call(
+            fn,
+            [
+                llvmir.Constant(llvmir.IntType(32), _SpvScope.WORKGROUP.value),
+                llvmir.Constant(llvmir.IntType(32), 1),
+                events,
+            ],
+        )
+
+        if _SUPPORT_CONVERGENT:
+            callinst.attributes.add("convergent")
+        callinst.attributes.add("nounwind")
+
+    return (
+        sig,
+        _intrinsic_wait_for_gen,
+    )
+
+
+@overload(async_work_group_copy, target=SPIRV_TARGET_NAME)
+def ol_async_work_group_copy(  # pylint: disable=too-many-arguments
+    group,
+    dest,
+    src,
+    num_elements,
+    stride=1,
+    dest_offset=0,
+    src_offset=0,
+    event=None,
+):
+    """SPIR-V overload for
+    :meth:`numba_dpex.kernel_api.async_work_group_copy`.
+
+    Generates the same LLVM IR instruction as DPC++ for the SYCL
+    `group::async_work_group_copy` function.
+    """
+    _check_group(group)
+    _check_copy_arrays(dest, src)
+
+    def ol_async_work_group_copy_impl(
+        group,
+        dest,
+        src,
+        num_elements,
+        stride=1,
+        dest_offset=0,
+        src_offset=0,
+        event=None,
+    ):  # pylint: disable=too-many-arguments
+        # pylint: disable=no-value-for-parameter
+        return _intrinsic_async_work_group_copy(
+            group,
+            dest,
+            src,
+            num_elements,
+            stride,
+            dest_offset,
+            src_offset,
+            event,
+        )
+
+    return ol_async_work_group_copy_impl
+
+
+@overload(wait_for, target=SPIRV_TARGET_NAME)
+def ol_wait_for(group, event):
+    """SPIR-V overload for :meth:`numba_dpex.kernel_api.wait_for`.
+
+    Generates the same LLVM IR instruction as DPC++ for the SYCL
+    `group::wait_for` function.
+    """
+    _check_group(group)
+
+    def ol_wait_for_impl(group, event):
+        # pylint: disable=no-value-for-parameter
+        return _intrinsic_wait_for(group, event)
+
+    return ol_wait_for_impl
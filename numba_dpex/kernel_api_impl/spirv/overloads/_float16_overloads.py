@@ -0,0 +1,147 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Implements the SPIR-V overloads of the arithmetic and comparison operators for
+float16 values.
+
+Numba's typing rules promote float16 operands to float32, so that without the
+overloads every operation on float16 values would convert its operands to
+float32 and its result back to float16. The overloads keep operations whose
+operands are all float16 in half precision, so that they compile to single
+half precision instructions. Operations that mix float16 with other types
+follow Numba's typing rules.
+"""
+
+import operator
+
+from numba.core import types
+from numba.extending import intrinsic, overload
+
+from ..target import SPIRV_TARGET_NAME
+
+
+def _is_float16(*tys):
+    return all(ty == types.float16 for ty in tys)
+
+
+def _generate_float16_binary_intrinsic(inst):
+    """Generates an intrinsic for a binary operation on two float16 values
+    that lowers to the LLVM instruction inst."""
+
+    def _intrinsic_float16_binary_op(
+        ty_context, ty_lhs, ty_rhs  # pylint: disable=unused-argument
+    ):
+        sig = types.float16(ty_lhs, ty_rhs)
+
+        def _intrinsic_float16_binary_op_gen(context, builder, sig, args):
+            return getattr(builder, inst)(*args)
+
+        return (
+            sig,
+            _intrinsic_float16_binary_op_gen,
+        )
+
+    return intrinsic(target=SPIRV_TARGET_NAME)(_intrinsic_float16_binary_op)
+
+
+def _generate_float16_compare_intrinsic(cmpop, ordered):
+    """Generates an intrinsic for a comparison of two float16 values that
+    lowers to an ordered or unordered LLVM fcmp instruction."""
+
+    def _intrinsic_float16_compare_op(
+        ty_context, ty_lhs, ty_rhs  # pylint: disable=unused-argument
+    ):
+        sig = types.boolean(ty_lhs, ty_rhs)
+
+        def _intrinsic_float16_compare_op_gen(context, builder, sig, args):
+            if ordered:
+                return builder.fcmp_ordered(cmpop, *args)
+            return builder.fcmp_unordered(cmpop, *args)
+
+        return (
+            sig,
+            _intrinsic_float16_compare_op_gen,
+        )
+
+    return intrinsic(target=SPIRV_TARGET_NAME)(_intrinsic_float16_compare_op)
+
+
+@intrinsic(target=SPIRV_TARGET_NAME)
+def _intrinsic_float16_neg(
+    ty_context, ty_value  # pylint: disable=unused-argument
+):
+    """Generates an fneg instruction for a float16 value."""
+    sig = types.float16(ty_value)
+
+    def _intrinsic_float16_neg_gen(context, builder, sig, args):
+        return builder.fneg(args[0])
+
+    return (
+        sig,
+        _intrinsic_float16_neg_gen,
+    )
+
+
+def _generate_float16_binary_overload(_intrinsic):
+    """Generates overload for a binary operator that generates specific IR
+    from provided intrinsic if both operands are float16 values."""
+
+    def ol_float16_binary_op(lhs, rhs):
+        if not _is_float16(lhs, rhs):
+            return None
+
+        def ol_float16_binary_op_impl(lhs, rhs):
+            # pylint: disable=no-value-for-parameter
+            return _intrinsic(lhs, rhs)
+
+        return ol_float16_binary_op_impl
+
+    return ol_float16_binary_op
+
+
+@overload(operator.neg, target=SPIRV_TARGET_NAME)
+def ol_float16_neg(value):
+    """SPIR-V overload for the negation of a float16 value."""
+    if not _is_float16(value):
+        return None
+
+    def ol_float16_neg_impl(value):
+        # pylint: disable=no-value-for-parameter
+        return _intrinsic_float16_neg(value)
+
+    return ol_float16_neg_impl
+
+
+def register_float16_operators():
+    """Register the arithmetic and comparison operators of float16 values."""
+    _arithmetic_operators = [
+        ((operator.add, operator.iadd), "fadd"),
+        ((operator.sub, operator.isub), "fsub"),
+        ((operator.mul, operator.imul), "fmul"),
+        ((operator.truediv, operator.itruediv), "fdiv"),
+    ]
+    _compare_operators = [
+        (operator.eq, "==", True),
+        (operator.ne, "!=", False),
+        (operator.lt, "<", True),
+        (operator.le, "<=", True),
+        (operator.gt, ">", True),
+        (operator.ge, ">=", True),
+    ]
+
+    for operators, inst in _arithmetic_operators:
+        _intrinsic = _generate_float16_binary_intrinsic(inst)
+
+        for op in operators:
+            ol_func = _generate_float16_binary_overload(_intrinsic)
+            overload(op, target=SPIRV_TARGET_NAME)(ol_func)
+
+    for op, cmpop, ordered in _compare_operators:
+        _intrinsic = _generate_float16_compare_intrinsic(cmpop, ordered)
+        ol_func = _generate_float16_binary_overload(_intrinsic)
+        overload(op, target=SPIRV_TARGET_NAME)(ol_func)
+
+
+register_float16_operators()
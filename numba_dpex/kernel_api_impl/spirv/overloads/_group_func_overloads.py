@@ -0,0 +1,312 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Implements the SPIR-V code generation for collective operations over the
+work-items of a group that map to SPIR-V group instructions.
+"""
+
+from llvmlite import ir as llvmir
+from numba.core import cgutils, types
+from numba.core.errors import TypingError
+from numba.extending import intrinsic, overload
+
+from numba_dpex.core.types.kernel_api.index_space_ids import GroupType
+from numba_dpex.kernel_api import (
+    exclusive_scan_over_group,
+    group_broadcast,
+    inclusive_scan_over_group,
+    reduce_over_group,
+)
+
+from ..target import SPIRV_TARGET_NAME
+from ._spv_atomic_inst_helper import _SpvScope
+from ._spv_group_inst_helper import (
+    _get_value_kind,
+    _SpvGroupOperation,
+    get_group_inst_name,
+    is_group_inst_supported,
+)
+from .spv_fn_declarations import (
+    _SUPPORT_CONVERGENT,
+    get_or_insert_spv_group_broadcast_fn,
+    get_or_insert_spv_group_op_fn,
+)
+
+
+def _check_group(group):
+    if not isinstance(group, GroupType):
+        raise TypingError(
+            "Expected a group to be a GroupType value, but "
+            f"encountered {group}"
+        )
+
+
+def _intrinsic_group_collective_inst(
+    ty_group, ty_value, ty_group_op, group_operation: _SpvGroupOperation
+):
+    """Generates a call to the SPIR-V group instruction of a group operation
+    with the ``Workgroup`` scope.
+
+    The group operation has to be a string literal that is supported for the
+    type of the value, see
+    :func:`numba_dpex.kernel_api_impl.spirv.overloads._spv_group_inst_helper.is_group_inst_supported`.
+    """
+    _check_group(ty_group)
+    if not isinstance(ty_group_op, types.StringLiteral):
+        raise TypingError("The group operation has to be a string literal.")
+
+    dtype = types.unliteral(ty_value)
+    group_op = ty_group_op.literal_value
+    if not is_group_inst_supported(group_op, dtype):
+        raise TypingError(
+            f"Group operation {group_op} is not supported for {ty_value}."
+        )
+
+    inst_name = get_group_inst_name(group_op, dtype)
+    sig = dtype(ty_group, dtype, ty_group_op)
+
+    def _intrinsic_group_collective_gen(context, builder, sig, args):
+        fn = get_or_insert_spv_group_op_fn(
+            context, builder.module, inst_name, sig.return_type
+        )
+        callinst = builder.call(
+            fn,
+            [
+                llvmir.Constant(llvmir.IntType(32), _SpvScope.WORKGROUP.value),
+                llvmir.Constant(llvmir.IntType(32), group_operation.value),
+                args[1],
+            ],
+        )
+
+        if _SUPPORT_CONVERGENT:  # pylint: disable=duplicate-code
+            callinst.attributes.add("convergent")
+        callinst.attributes.add("nounwind")
+
+        return callinst
+
+    return (
+        sig,
+        _intrinsic_group_collective_gen,
+    )
+
+
+@intrinsic(target=SPIRV_TARGET_NAME, prefer_literal=True)
+def _intrinsic_group_reduce(
+    ty_context, ty_group, ty_value, ty_group_op
+):  # pylint: disable=unused-argument
+    """Combines the values of all work-items of a work-group using a SPIR-V
+    group instruction with the ``Reduce`` group operation.
+
+    The result is returned to every work-item of the work-group.
+    """
+    return _intrinsic_group_collective_inst(
+        ty_group, ty_value, ty_group_op, _SpvGroupOperation.REDUCE
+    )
+
+
+@intrinsic(target=SPIRV_TARGET_NAME, prefer_literal=True)
+def _intrinsic_group_inclusive_scan(
+    ty_context, ty_group, ty_value, ty_group_op
+):  # pylint: disable=unused-argument
+    """Scans the values of the work-items of a work-group using a SPIR-V group
+    instruction with the ``InclusiveScan`` group operation."""
+    return _intrinsic_group_collective_inst(
+        ty_group, ty_value, ty_group_op, _SpvGroupOperation.INCLUSIVE_SCAN
+    )
+
+
+@intrinsic(target=SPIRV_TARGET_NAME, prefer_literal=True)
+def _intrinsic_group_exclusive_scan(
+    ty_context, ty_group, ty_value, ty_group_op
+):  # pylint: disable=unused-argument
+    """Scans the values of the work-items of a work-group using a SPIR-V group
+    instruction with the ``ExclusiveScan`` group operation."""
+    return _intrinsic_group_collective_inst(
+        ty_group, ty_value, ty_group_op, _SpvGroupOperation.EXCLUSIVE_SCAN
+    )
+
+
+@intrinsic(target=SPIRV_TARGET_NAME)
+def _intrinsic_group_broadcast(
+    ty_context, ty_group, ty_value, ty_local_id
+):  # pylint: disable=unused-argument
+    """Broadcasts the value of a work-item to every work-item of a work-group
+    using the SPIR-V ``GroupBroadcast`` instruction.
+
+    The local id of the broadcasting work-item is an integer for
+    one-dimensional work-groups and a tuple with a coordinate per dimension
+    otherwise.
+    """
+    _check_group(ty_group)
+
+    dtype = types.unliteral(ty_value)
+    if _get_value_kind(dtype) is None:
+        raise TypingError(
+            "group_broadcast supports 32 and 64 bit integer and floating "
+            f"point values, but encountered {ty_value}"
+        )
+
+    if ty_group.ndim == 1:
+        if not isinstance(ty_local_id, types.Integer):
+            raise TypingError(
+                "Expected the local id to be an Integer value, but "
+                f"encountered {ty_local_id}"
+            )
+        ty_id = types.uint64
+    else:
+        if not (
+            isinstance(ty_local_id, types.UniTuple)
+            and isinstance(ty_local_id.dtype, types.Integer)
+            and ty_local_id.count == ty_group.ndim
+        ):
+            raise TypingError(
+                f"Expected the local id to be a tuple of {ty_group.ndim} "
+                f"Integer values, but encountered {ty_local_id}"
+            )
+        ty_id = types.UniTuple(types.uint64, ty_group.ndim)
+
+    sig = dtype(ty_group, dtype, ty_id)
+
+    def _intrinsic_group_broadcast_gen(context, builder, sig, args):
+        local_id = args[2]
+        if isinstance(ty_id, types.UniTuple):
+            id_vector = llvmir.Constant(
+                llvmir.VectorType(llvmir.IntType(64), ty_id.count), None
+            )
+            for dim, coordinate in enumerate(
+                cgutils.unpack_tuple(builder, local_id)
+            ):
+                id_vector = builder.insert_element(
+                    id_vector,
+                    coordinate,
+                    llvmir.Constant(llvmir.IntType(32), dim),
+                )
+            local_id = id_vector
+
+        fn = get_or_insert_spv_group_broadcast_fn(
+            context, builder.module, dtype, ty_id
+        )
+        callinst = builder.call(
+            fn,
+            [
+                llvmir.Constant(llvmir.IntType(32), _SpvScope.WORKGROUP.value),
+                args[1],
+                local_id,
+            ],
+        )
+
+        if _SUPPORT_CONVERGENT:
+            callinst.attributes.add("convergent")
+        callinst.attributes.add("nounwind")
+
+        return callinst
+
+    return (
+        sig,
+        _intrinsic_group_broadcast_gen,
+    )
+
+
+@overload(reduce_over_group, prefer_literal=True, target=SPIRV_TARGET_NAME)
+def ol_reduce_over_group(group, value, op):
+    """SPIR-V overload for
+    :meth:`numba_dpex.kernel_api.reduce_over_group`.
+
+    Generates the same LLVM IR instruction as DPC++ for the SYCL
+    `reduce_over_group` function.
+    """
+    _check_group(group)
+
+    def ol_reduce_over_group_impl(group, value, op):
+        # pylint: disable=no-value-for-parameter
+        return _intrinsic_group_reduce(group, value, op)
+
+    return ol_reduce_over_group_impl
+
+
+@overload(
+    inclusive_scan_over_group, prefer_literal=True, target=SPIRV_TARGET_NAME
+)
+def ol_inclusive_scan_over_group(group, value, op):
+    """SPIR-V overload for
+    :meth:`numba_dpex.kernel_api.inclusive_scan_over_group`.
+
+    Generates the same LLVM IR instruction as DPC++ for the SYCL
+    `inclusive_scan_over_group` function.
+    """
+    _check_group(group)
+
+    def ol_inclusive_scan_over_group_impl(group, value, op):
+        # pylint: disable=no-value-for-parameter
+        return _intrinsic_group_inclusive_scan(group, value, op)
+
+    return ol_inclusive_scan_over_group_impl
+
+
+@overload(
+    exclusive_scan_over_group, prefer_literal=True, target=SPIRV_TARGET_NAME
+)
+def ol_exclusive_scan_over_group(group, value, op):
+    """SPIR-V overload for
+    :meth:`numba_dpex.kernel_api.exclusive_scan_over_group`.
+
+    Generates the same LLVM IR instruction as DPC++ for the SYCL
+    `exclusive_scan_over_group` function.
+    """
+    _check_group(group)
+
+    def ol_exclusive_scan_over_group_impl(group, value, op):
+        # pylint: disable=no-value-for-parameter
+        return _intrinsic_group_exclusive_scan(group, value, op)
+
+    return ol_exclusive_scan_over_group_impl
+
+
+@overload(group_broadcast, target=SPIRV_TARGET_NAME)
+def ol_group_broadcast(group, value, local_id=0):
+    """SPIR-V overload for
+    :meth:`numba_dpex.kernel_api.group_broadcast`.
+
+    Generates the same LLVM IR instruction as DPC++ for the SYCL
+    `group_broadcast` function. For a multi-dimensional work-group the local
+    linear id is converted into the coordinates of the broadcasting
+    work-item.
+    """
+    _check_group(group)
+
+    if group.ndim == 1:
+
+        def ol_group_broadcast_1d_impl(group, value, local_id=0):
+            # pylint: disable=no-value-for-parameter
+            return _intrinsic_group_broadcast(group, value, local_id)
+
+        return ol_group_broadcast_1d_impl
+
+    if group.ndim == 2:
+
+        def ol_group_broadcast_2d_impl(group, value, local_id=0):
+            range1 = group.get_local_range(1)
+            # pylint: disable=no-value-for-parameter
+            return _intrinsic_group_broadcast(
+                group, value, (local_id // range1, local_id % range1)
+            )
+
+        return ol_group_broadcast_2d_impl
+
+    def ol_group_broadcast_3d_impl(group, value, local_id=0):
+        range1 = group.get_local_range(1)
+        range2 = group.get_local_range(2)
+        # pylint: disable=no-value-for-parameter
+        return _intrinsic_group_broadcast(
+            group,
+            value,
+            (
+                local_id // (range1 * range2),
+                (local_id // range2) % range1,
+                local_id % range2,
+            ),
+        )
+
+    return ol_group_broadcast_3d_impl
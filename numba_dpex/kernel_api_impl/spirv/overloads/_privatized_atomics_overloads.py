@@ -0,0 +1,168 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Implements the SPIR-V overloads for the functions of
+kernel_api.privatized_atomics that keep a work-group's copy of an atomically
+updated global memory array in local memory.
+
+The identity of the operation is computed while typing the call, so that the
+initialization stores a constant and the flush only issues global memory
+atomics for the elements the work-group updated.
+"""
+
+from numba.core import types
+from numba.core.errors import TypingError
+from numba.extending import overload
+from numba.np import numpy_support
+
+from numba_dpex.core.types import USMNdArray
+from numba_dpex.core.types.kernel_api.index_space_ids import NdItemType
+from numba_dpex.kernel_api import (
+    AtomicRef,
+    flush_atomics,
+    group_barrier,
+    privatize_atomics,
+)
+from numba_dpex.kernel_api.index_space_ids import _identity
+from numba_dpex.kernel_api.memory_enums import AddressSpace
+
+from ..target import SPIRV_TARGET_NAME
+from ._atomic_ref_overloads import (
+    _intrinsic_fetch_add,
+    _intrinsic_fetch_and,
+    _intrinsic_fetch_max,
+    _intrinsic_fetch_min,
+    _intrinsic_fetch_or,
+    _intrinsic_fetch_xor,
+)
+
+# The atomic operations that flush a work-group's copy into the global array.
+_FETCH_INTRINSICS = {
+    "add": _intrinsic_fetch_add,
+    "min": _intrinsic_fetch_min,
+    "max": _intrinsic_fetch_max,
+    "and": _intrinsic_fetch_and,
+    "or": _intrinsic_fetch_or,
+    "xor": _intrinsic_fetch_xor,
+}
+
+_SUPPORTED_DTYPES = (
+    types.int32,
+    types.uint32,
+    types.int64,
+    types.uint64,
+    types.float32,
+    types.float64,
+)
+
+
+def _check_nd_item(nd_item):
+    if not isinstance(nd_item, NdItemType):
+        raise TypingError(
+            f"Expected an NdItemType value, but encountered {nd_item}"
+        )
+
+
+def _check_array(name, array, address_space):
+    if (
+        not isinstance(array, USMNdArray)
+        or array.ndim != 1
+        or array.addrspace != address_space.value
+    ):
+        raise TypingError(
+            f"Expected {name} to be a one-dimensional array in the "
+            f"{address_space.name} address space, but encountered {array}"
+        )
+    if array.dtype not in _SUPPORTED_DTYPES:
+        raise TypingError(
+            "Privatized atomic operations support int32, uint32, int64, "
+            f"uint64, float32 and float64 arrays, but encountered {array}"
+        )
+
+
+def _parse_operation(op, dtype):
+    """Returns the operation given as a string literal or the default value
+    of the op argument."""
+    if isinstance(op, types.StringLiteral):
+        op_name = op.literal_value
+    elif isinstance(op, types.Omitted):
+        op_name = op.value
+    else:
+        raise TypingError("The atomic operation has to be a string literal.")
+
+    if op_name not in _FETCH_INTRINSICS:
+        raise TypingError(f"Unsupported privatized atomic operation {op_name}")
+    if op_name in ("and", "or", "xor") and not isinstance(dtype, types.Integer):
+        raise TypingError(
+            f"Atomic operation {op_name} is only supported for integer "
+            f"arrays, but encountered {dtype}"
+        )
+    return op_name
+
+
+def _identity_constant(op_name, dtype):
+    return _identity(op_name, numpy_support.as_dtype(dtype).type(0))
+
+
+@overload(privatize_atomics, prefer_literal=True, target=SPIRV_TARGET_NAME)
+def ol_privatize_atomics(nd_item, local, op="add"):
+    """SPIR-V overload for
+    :meth:`numba_dpex.kernel_api.privatize_atomics`.
+
+    Generates a loop in which the work-items of the work-group store the
+    identity of the operation into their share of the local memory array,
+    followed by a work-group barrier.
+    """
+    _check_nd_item(nd_item)
+    _check_array("local", local, AddressSpace.LOCAL)
+    identity = _identity_constant(
+        _parse_operation(op, local.dtype), local.dtype
+    )
+
+    def ol_privatize_atomics_impl(nd_item, local, op="add"):
+        for i in range(
+            nd_item.get_local_linear_id(),
+            local.shape[0],
+            nd_item.get_local_linear_range(),
+        ):
+            local[i] = identity
+        group_barrier(nd_item.get_group())
+
+    return ol_privatize_atomics_impl
+
+
+@overload(flush_atomics, prefer_literal=True, target=SPIRV_TARGET_NAME)
+def ol_flush_atomics(nd_item, local, dest, op="add"):
+    """SPIR-V overload for
+    :meth:`numba_dpex.kernel_api.flush_atomics`.
+
+    Generates a work-group barrier followed by a loop in which the
+    work-items of the work-group combine their share of the local memory
+    array into the global memory array with device scope atomic operations.
+    """
+    _check_nd_item(nd_item)
+    _check_array("local", local, AddressSpace.LOCAL)
+    _check_array("dest", dest, AddressSpace.GLOBAL)
+    if local.dtype != dest.dtype:
+        raise TypingError(
+            "Expected local and dest to have the same dtype, but encountered "
+            f"{local.dtype} and {dest.dtype}"
+        )
+    op_name = _parse_operation(op, local.dtype)
+    identity = _identity_constant(op_name, local.dtype)
+    fetch = _FETCH_INTRINSICS[op_name]
+
+    def ol_flush_atomics_impl(nd_item, local, dest, op="add"):
+        group_barrier(nd_item.get_group())
+        for i in range(
+            nd_item.get_local_linear_id(),
+            local.shape[0],
+            nd_item.get_local_linear_range(),
+        ):
+            value = local[i]
+            if value != identity:
+                fetch(AtomicRef(dest, i), value)
+
+    return ol_flush_atomics_impl
@@ -46,38 +46,56 @@ _spv_atomic_instructions_map = {
     "fetch_add": {
         types.int32: "__spirv_AtomicIAdd",
         types.int64: "__spirv_AtomicIAdd",
+        types.uint32: "__spirv_AtomicIAdd",
+        types.uint64: "__spirv_AtomicIAdd",
+        types.float16: "__spirv_AtomicFAddEXT",
         types.float32: "__spirv_AtomicFAddEXT",
         types.float64: "__spirv_AtomicFAddEXT",
     },
     "fetch_sub": {
         types.int32: "__spirv_AtomicISub",
         types.int64: "__spirv_AtomicISub",
+        types.uint32: "__spirv_AtomicISub",
+        types.uint64: "__spirv_AtomicISub",
+        types.float16: "__spirv_AtomicFSubEXT",
         types.float32: "__spirv_AtomicFSubEXT",
         types.float64: "__spirv_AtomicFSubEXT",
     },
     "fetch_min": {
         types.int32: "__spirv_AtomicSMin",
         types.int64: "__spirv_AtomicSMin",
+        types.uint32: "__spirv_AtomicUMin",
+        types.uint64: "__spirv_AtomicUMin",
+        types.float16: "__spirv_AtomicFMinEXT",
         types.float32: "__spirv_AtomicFMinEXT",
         types.float64: "__spirv_AtomicFMinEXT",
     },
     "fetch_max": {
         types.int32: "__spirv_AtomicSMax",
         types.int64: "__spirv_AtomicSMax",
+        types.uint32: "__spirv_AtomicUMax",
+        types.uint64: "__spirv_AtomicUMax",
+        types.float16: "__spirv_AtomicFMaxEXT",
         types.float32: "__spirv_AtomicFMaxEXT",
         types.float64: "__spirv_AtomicFMaxEXT",
     },
     "fetch_and": {
         types.int32: "__spirv_AtomicAnd",
         types.int64: "__spirv_AtomicAnd",
+        types.uint32: "__spirv_AtomicAnd",
+        types.uint64: "__spirv_AtomicAnd",
     },
     "fetch_or": {
         types.int32: "__spirv_AtomicOr",
         types.int64: "__spirv_AtomicOr",
+        types.uint32: "__spirv_AtomicOr",
+        types.uint64: "__spirv_AtomicOr",
     },
     "fetch_xor": {
         types.int32: "__spirv_AtomicXor",
         types.int64: "__spirv_AtomicXor",
+        types.uint32: "__spirv_AtomicXor",
+        types.uint64: "__spirv_AtomicXor",
     },
 }
 
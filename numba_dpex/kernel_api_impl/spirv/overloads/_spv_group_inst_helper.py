@@ -0,0 +1,126 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Helper module to generate LLVM IR SPIR-V group (collective) instruction
+calls.
+"""
+from enum import IntEnum
+
+from numba.core import types
+
+
+class _SpvGroupOperation(IntEnum):
+    """
+    An enumeration of the SPIR-V group operations that select the kind of
+    collective operation performed by a group instruction.
+    """
+
+    REDUCE = 0
+    INCLUSIVE_SCAN = 1
+    EXCLUSIVE_SCAN = 2
+
+
+# The instructions are looked up by the reduction operator and the kind of the
+# value type: "signed", "unsigned" or "float". The instructions with the KHR
+# suffix require the SPV_KHR_uniform_group_instructions extension.
+KHR_GROUP_INST_SUFFIX = "KHR"
+
+_spv_group_instructions_map = {
+    "add": {
+        "signed": "__spirv_GroupIAdd",
+        "unsigned": "__spirv_GroupIAdd",
+        "float": "__spirv_GroupFAdd",
+    },
+    "mul": {
+        "signed": "__spirv_GroupIMulKHR",
+        "unsigned": "__spirv_GroupIMulKHR",
+        "float": "__spirv_GroupFMulKHR",
+    },
+    "min": {
+        "signed": "__spirv_GroupSMin",
+        "unsigned": "__spirv_GroupUMin",
+        "float": "__spirv_GroupFMin",
+    },
+    "max": {
+        "signed": "__spirv_GroupSMax",
+        "unsigned": "__spirv_GroupUMax",
+        "float": "__spirv_GroupFMax",
+    },
+    "and": {
+        "signed": "__spirv_GroupBitwiseAndKHR",
+        "unsigned": "__spirv_GroupBitwiseAndKHR",
+    },
+    "or": {
+        "signed": "__spirv_GroupBitwiseOrKHR",
+        "unsigned": "__spirv_GroupBitwiseOrKHR",
+    },
+    "xor": {
+        "signed": "__spirv_GroupBitwiseXorKHR",
+        "unsigned": "__spirv_GroupBitwiseXorKHR",
+    },
+}
+
+
+def _get_value_kind(dtype: types.Type):
+    if isinstance(dtype, types.Float) and dtype.bitwidth in (32, 64):
+        return "float"
+    if isinstance(dtype, types.Integer) and dtype.bitwidth in (32, 64):
+        return "signed" if dtype.signed else "unsigned"
+    return None
+
+
+def get_group_inst_name(group_op: str, dtype: types.Type) -> str:
+    """Returns a string corresponding to the LLVM IR intrinsic function
+    generated for a group operation for a specific data type.
+
+    Args:
+        group_op (str): The name of the group operation to look up, one of
+            ``"add"``, ``"mul"``, ``"min"``, ``"max"``, ``"and"``, ``"or"`` and
+            ``"xor"``.
+        dtype (numba.core.types.Type): The Numba type of the values combined
+            by the group operation.
+
+    Raises:
+        ValueError: If the group operation is not found in the
+        ``_spv_group_instructions_map`` dictionary.
+        ValueError: If no instruction is found for a combination of the
+        group operation and the dtype in the ``_spv_group_instructions_map``
+        dictionary.
+
+    Returns:
+        str: A string corresponding to the LLVM IR intrinsic that should be
+        generated for the group operation for the specified dtype.
+    """
+    inst_kinds_map = _spv_group_instructions_map.get(group_op)
+    if inst_kinds_map is None:
+        raise ValueError("Unsupported group operation " + str(group_op))
+
+    inst_name = inst_kinds_map.get(_get_value_kind(dtype))
+
+    if inst_name is None:
+        raise ValueError(
+            f"Unsupported type {dtype} for group operation {group_op}"
+        )
+    return inst_name
+
+
+def is_group_inst_supported(group_op: str, dtype: types.Type) -> bool:
+    """Returns True if a SPIR-V group instruction exists for a group operation
+    and a data type."""
+    try:
+        get_group_inst_name(group_op, dtype)
+    except ValueError:
+        return False
+    return True
+
+
+def is_khr_group_inst(group_op: str, dtype: types.Type) -> bool:
+    """Returns True if the SPIR-V group instruction for a group operation and
+    a data type requires the SPV_KHR_uniform_group_instructions extension.
+
+    Raises:
+        ValueError: If no instruction exists for the group operation and the
+        data type.
+    """
+    return get_group_inst_name(group_op, dtype).endswith(KHR_GROUP_INST_SUFFIX)
@@ -0,0 +1,588 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Implements the SPIR-V overloads for the kernel_api.SubGroup class methods.
+
+The index queries load the SPIR-V sub-group built-in variables, the shuffles
+are lowered to the SPV_INTEL_subgroups shuffle instructions and the broadcast,
+vote and collective operations to SPIR-V group instructions with the
+``Subgroup`` execution scope.
+"""
+
+import llvmlite.ir as llvmir
+from numba.core import cgutils, types
+from numba.core.errors import TypingError
+from numba.extending import intrinsic, overload_method
+
+from numba_dpex.core.types.kernel_api.index_space_ids import (
+    NdItemType,
+    SubGroupType,
+)
+from numba_dpex.kernel_api_impl.spirv.target import SPIRVTargetContext
+
+from ..target import SPIRV_TARGET_NAME
+from ._spv_atomic_inst_helper import _SpvScope
+from ._spv_group_inst_helper import (
+    _get_value_kind,
+    _SpvGroupOperation,
+    get_group_inst_name,
+    is_group_inst_supported,
+)
+from .spv_fn_declarations import (
+    _SUPPORT_CONVERGENT,
+    get_or_insert_spv_group_op_fn,
+    get_or_insert_spv_sub_group_fn,
+)
+
+_SCOPE_FLAG = "__spv.Scope.Flag"
+
+
+def _sub_group_scope():
+    return llvmir.Constant(llvmir.IntType(32), _SpvScope.SUBGROUP.value)
+
+
+def _add_call_attributes(callinst):
+    if _SUPPORT_CONVERGENT:
+        callinst.attributes.add("convergent")
+    callinst.attributes.add("nounwind")
+
+
+def _check_sub_group(ty_sub_group):
+    if not isinstance(ty_sub_group, SubGroupType):
+        raise TypingError(
+            "Expected a sub_group to be a SubGroupType value, but "
+            f"encountered {ty_sub_group}"
+        )
+
+
+def _check_value(method, ty_value):
+    """Returns the non-literal type of a value exchanged between the
+    work-items of a sub-group."""
+    dtype = types.unliteral(ty_value)
+    if _get_value_kind(dtype) is None:
+        raise TypingError(
+            f"SubGroup.{method} supports 32 and 64 bit integer and floating "
+            f"point values, but encountered {ty_value}"
+        )
+    return dtype
+
+
+def _check_index(method, ty_index):
+    if not isinstance(ty_index, types.Integer):
+        raise TypingError(
+            f"Expected the index of SubGroup.{method} to be an Integer "
+            f"value, but encountered {ty_index}"
+        )
+
+
+def _declare_spirv_scalar_builtin(module: llvmir.Module, name: str):
+    """Declares the global external i32 SPIR-V built-in variable
+    ``__spirv_<name>``."""
+    global_name = "__spirv_" + name
+    data = module.globals.get(global_name)
+    if data is None:
+        data = llvmir.GlobalVariable(
+            module, llvmir.IntType(32), global_name, addrspace=1
+        )
+        data.linkage = "external"
+        data.global_constant = True
+        data.align = 4
+        data.storage_class = "dso_local local_unnamed_addr"
+    return data
+
+
+def _intrinsic_spirv_sub_group_builtin(ty_sub_group, builtin_name: str):
+    """Generates instruction to load a sub-group built-in variable."""
+    _check_sub_group(ty_sub_group)
+    sig = types.int64(ty_sub_group)
+
+    def _intrinsic_spirv_sub_group_builtin_gen(
+        context: SPIRVTargetContext,  # pylint: disable=unused-argument
+        builder: llvmir.IRBuilder,
+        sig,  # pylint: disable=unused-argument
+        args,  # pylint: disable=unused-argument
+    ):
+        builtin = _declare_spirv_scalar_builtin(builder.module, builtin_name)
+        res = builder.load(builtin, align=4)
+        return builder.zext(res, llvmir.IntType(64))
+
+    return sig, _intrinsic_spirv_sub_group_builtin_gen
+
+
+@intrinsic(target=SPIRV_TARGET_NAME)
+def _intrinsic_spirv_sub_group_local_id(
+    ty_context, ty_sub_group  # pylint: disable=unused-argument
+):
+    """Generates instruction to get BuiltInSubgroupLocalInvocationId."""
+    return _intrinsic_spirv_sub_group_builtin(
+        ty_sub_group, "BuiltInSubgroupLocalInvocationId"
+    )
+
+
+@intrinsic(target=SPIRV_TARGET_NAME)
+def _intrinsic_spirv_sub_group_size(
+    ty_context, ty_sub_group  # pylint: disable=unused-argument
+):
+    """Generates instruction to get BuiltInSubgroupSize."""
+    return _intrinsic_spirv_sub_group_builtin(
+        ty_sub_group, "BuiltInSubgroupSize"
+    )
+
+
+@intrinsic(target=SPIRV_TARGET_NAME)
+def _intrinsic_spirv_sub_group_max_size(
+    ty_context, ty_sub_group  # pylint: disable=unused-argument
+):
+    """Generates instruction to get BuiltInSubgroupMaxSize."""
+    return _intrinsic_spirv_sub_group_builtin(
+        ty_sub_group, "BuiltInSubgroupMaxSize"
+    )
+
+
+@intrinsic(target=SPIRV_TARGET_NAME)
+def _intrinsic_spirv_sub_group_id(
+    ty_context, ty_sub_group  # pylint: disable=unused-argument
+):
+    """Generates instruction to get BuiltInSubgroupId."""
+    return _intrinsic_spirv_sub_group_builtin(ty_sub_group, "BuiltInSubgroupId")
+
+
+@intrinsic(target=SPIRV_TARGET_NAME)
+def _intrinsic_spirv_num_sub_groups(
+    ty_context, ty_sub_group  # pylint: disable=unused-argument
+):
+    """Generates instruction to get BuiltInNumSubgroups."""
+    return _intrinsic_spirv_sub_group_builtin(
+        ty_sub_group, "BuiltInNumSubgroups"
+    )
+
+
+def _intrinsic_sub_group_shuffle_inst(
+    ty_sub_group, ty_value, ty_index, method: str, fn_name: str, two_values
+):
+    """Generates a call to a SPV_INTEL_subgroups shuffle instruction.
+
+    The shuffle down and shuffle up instructions read from the concatenation
+    of two values. Both are set to the value of the work-item, so that the
+    result is only defined inside the sub-group.
+    """
+    _check_sub_group(ty_sub_group)
+    dtype = _check_value(method, ty_value)
+    _check_index(method, ty_index)
+    sig = dtype(ty_sub_group, dtype, types.uint32)
+
+    def _intrinsic_sub_group_shuffle_gen(context, builder, sig, args):
+        value_types = [dtype, dtype] if two_values else [dtype]
+        fn = get_or_insert_spv_sub_group_fn(
+            context,
+            builder.module,
+            fn_name,
+            dtype,
+            value_types + [types.uint32],
+        )
+        value = args[1]
+        values = [value, value] if two_values else [value]
+        callinst = builder.call(fn, values + [args[2]])
+        _add_call_attributes(callinst)
+        return callinst
+
+    return sig, _intrinsic_sub_group_shuffle_gen
+
+
+@intrinsic(target=SPIRV_TARGET_NAME)
+def _intrinsic_sub_group_shuffle(
+    ty_context, ty_sub_group, ty_value, ty_index
+):  # pylint: disable=unused-argument
+    """Generates a __spirv_SubgroupShuffleINTEL call."""
+    return _intrinsic_sub_group_shuffle_inst(
+        ty_sub_group,
+        ty_value,
+        ty_index,
+        "shuffle",
+        "__spirv_SubgroupShuffleINTEL",
+        two_values=False,
+    )
+
+
+@intrinsic(target=SPIRV_TARGET_NAME)
+def _intrinsic_sub_group_shuffle_down(
+    ty_context, ty_sub_group, ty_value, ty_index
+):  # pylint: disable=unused-argument
+    """Generates a __spirv_SubgroupShuffleDownINTEL call."""
+    return _intrinsic_sub_group_shuffle_inst(
+        ty_sub_group,
+        ty_value,
+        ty_index,
+        "shuffle_down",
+        "__spirv_SubgroupShuffleDownINTEL",
+        two_values=True,
+    )
+
+
+@intrinsic(target=SPIRV_TARGET_NAME)
+def _intrinsic_sub_group_shuffle_up(
+    ty_context, ty_sub_group, ty_value, ty_index
+):  # pylint: disable=unused-argument
+    """Generates a __spirv_SubgroupShuffleUpINTEL call."""
+    return _intrinsic_sub_group_shuffle_inst(
+        ty_sub_group,
+        ty_value,
+        ty_index,
+        "shuffle_up",
+        "__spirv_SubgroupShuffleUpINTEL",
+        two_values=True,
+    )
+
+
+@intrinsic(target=SPIRV_TARGET_NAME)
+def _intrinsic_sub_group_shuffle_xor(
+    ty_context, ty_sub_group, ty_value, ty_index
+):  # pylint: disable=unused-argument
+    """Generates a __spirv_SubgroupShuffleXorINTEL call."""
+    return _intrinsic_sub_group_shuffle_inst(
+        ty_sub_group,
+        ty_value,
+        ty_index,
+        "shuffle_xor",
+        "__spirv_SubgroupShuffleXorINTEL",
+        two_values=False,
+    )
+
+
+@intrinsic(target=SPIRV_TARGET_NAME)
+def _intrinsic_sub_group_broadcast(
+    ty_context, ty_sub_group, ty_value, ty_index
+):  # pylint: disable=unused-argument
+    """Generates a __spirv_GroupBroadcast call with the Subgroup scope."""
+    _check_sub_group(ty_sub_group)
+    dtype = _check_value("broadcast", ty_value)
+    _check_index("broadcast", ty_index)
+    sig = dtype(ty_sub_group, dtype, types.uint32)
+
+    def _intrinsic_sub_group_broadcast_gen(context, builder, sig, args):
+        fn = get_or_insert_spv_sub_group_fn(
+            context,
+            builder.module,
+            "__spirv_GroupBroadcast",
+            dtype,
+            [_SCOPE_FLAG, dtype, types.uint32],
+        )
+        callinst = builder.call(fn, [_sub_group_scope(), args[1], args[2]])
+        _add_call_attributes(callinst)
+        return callinst
+
+    return sig, _intrinsic_sub_group_broadcast_gen
+
+
+def _intrinsic_sub_group_vote_inst(ty_sub_group, ty_predicate, fn_name: str):
+    """Generates a call to a SPIR-V group vote instruction with the Subgroup
+    scope."""
+    _check_sub_group(ty_sub_group)
+    if not isinstance(ty_predicate, (types.Boolean, types.Integer)):
+        raise TypingError(
+            "Expected a predicate to be a Boolean or an Integer value, but "
+            f"encountered {ty_predicate}"
+        )
+    sig = types.boolean(ty_sub_group, types.boolean)
+
+    def _intrinsic_sub_group_vote_gen(context, builder, sig, args):
+        fn = get_or_insert_spv_sub_group_fn(
+            context,
+            builder.module,
+            fn_name,
+            types.boolean,
+            [_SCOPE_FLAG, types.boolean],
+        )
+        callinst = builder.call(fn, [_sub_group_scope(), args[1]])
+        _add_call_attributes(callinst)
+        return callinst
+
+    return sig, _intrinsic_sub_group_vote_gen
+
+
+@intrinsic(target=SPIRV_TARGET_NAME)
+def _intrinsic_sub_group_any(
+    ty_context, ty_sub_group, ty_predicate
+):  # pylint: disable=unused-argument
+    """Generates a __spirv_GroupAny call with the Subgroup scope."""
+    return _intrinsic_sub_group_vote_inst(
+        ty_sub_group, ty_predicate, "__spirv_GroupAny"
+    )
+
+
+@intrinsic(target=SPIRV_TARGET_NAME)
+def _intrinsic_sub_group_all(
+    ty_context, ty_sub_group, ty_predicate
+):  # pylint: disable=unused-argument
+    """Generates a __spirv_GroupAll call with the Subgroup scope."""
+    return _intrinsic_sub_group_vote_inst(
+        ty_sub_group, ty_predicate, "__spirv_GroupAll"
+    )
+
+
+def _intrinsic_sub_group_collective_inst(
+    ty_sub_group, ty_value, ty_op, group_operation: _SpvGroupOperation
+):
+    """Generates a call to the SPIR-V group instruction of an operation with
+    the Subgroup scope.
+
+    The operation has to be a string literal that is supported for the type
+    of the value, see
+    :func:`numba_dpex.kernel_api_impl.spirv.overloads._spv_group_inst_helper.is_group_inst_supported`.
+    """
+    _check_sub_group(ty_sub_group)
+    if not isinstance(ty_op, types.StringLiteral):
+        raise TypingError("The sub-group operation has to be a string literal.")
+
+    dtype = types.unliteral(ty_value)
+    op = ty_op.literal_value
+    if not is_group_inst_supported(op, dtype):
+        raise TypingError(
+            f"Sub-group operation {op} is not supported for {ty_value}."
+        )
+
+    inst_name = get_group_inst_name(op, dtype)
+    sig = dtype(ty_sub_group, dtype, ty_op)
+
+    def _intrinsic_sub_group_collective_gen(context, builder, sig, args):
+        fn = get_or_insert_spv_group_op_fn(
+            context, builder.module, inst_name, sig.return_type
+        )
+        callinst = builder.call(
+            fn,
+            [
+                _sub_group_scope(),
+                llvmir.Constant(llvmir.IntType(32), group_operation.value),
+                args[1],
+            ],
+        )
+        _add_call_attributes(callinst)
+        return callinst
+
+    return sig, _intrinsic_sub_group_collective_gen
+
+
+@intrinsic(target=SPIRV_TARGET_NAME, prefer_literal=True)
+def _intrinsic_sub_group_reduce(
+    ty_context, ty_sub_group, ty_value, ty_op
+):  # pylint: disable=unused-argument
+    """Generates a group instruction call with the Reduce group operation."""
+    return _intrinsic_sub_group_collective_inst(
+        ty_sub_group, ty_value, ty_op, _SpvGroupOperation.REDUCE
+    )
+
+
+@intrinsic(target=SPIRV_TARGET_NAME, prefer_literal=True)
+def _intrinsic_sub_group_inclusive_scan(
+    ty_context, ty_sub_group, ty_value, ty_op
+):  # pylint: disable=unused-argument
+    """Generates a group instruction call with the InclusiveScan group
+    operation."""
+    return _intrinsic_sub_group_collective_inst(
+        ty_sub_group, ty_value, ty_op, _SpvGroupOperation.INCLUSIVE_SCAN
+    )
+
+
+@intrinsic(target=SPIRV_TARGET_NAME, prefer_literal=True)
+def _intrinsic_sub_group_exclusive_scan(
+    ty_context, ty_sub_group, ty_value, ty_op
+):  # pylint: disable=unused-argument
+    """Generates a group instruction call with the ExclusiveScan group
+    operation."""
+    return _intrinsic_sub_group_collective_inst(
+        ty_sub_group, ty_value, ty_op, _SpvGroupOperation.EXCLUSIVE_SCAN
+    )
+
+
+@intrinsic(target=SPIRV_TARGET_NAME)
+def _intrinsic_get_sub_group(
+    ty_context, ty_nd_item: NdItemType  # pylint: disable=unused-argument
+):
+    """Generates the sub-group of an nd_item."""
+
+    if not isinstance(ty_nd_item, NdItemType):
+        raise TypingError(
+            f"Expected an NdItemType value, but encountered {ty_nd_item}"
+        )
+
+    ty_sub_group = SubGroupType()
+    sig = ty_sub_group(ty_nd_item)
+
+    # pylint: disable=unused-argument
+    def _intrinsic_get_sub_group_gen(context, builder, sig, args):
+        sub_group_struct = cgutils.create_struct_proxy(ty_sub_group)(
+            context, builder
+        )
+        # pylint: disable=protected-access
+        return sub_group_struct._getvalue()
+
+    return sig, _intrinsic_get_sub_group_gen
+
+
+@overload_method(NdItemType, "get_sub_group", target=SPIRV_TARGET_NAME)
+def ol_nd_item_get_sub_group(nd_item):
+    """SPIR-V overload for :meth:`numba_dpex.kernel_api.NdItem.get_sub_group`.
+
+    Generates the same LLVM IR instruction as dpcpp for the
+    `sycl::nd_item::get_sub_group` function.
+
+    Raises:
+        TypingError: When argument is not NdItem.
+    """
+    if not isinstance(nd_item, NdItemType):
+        # since it is a method overload, this error should not be reached
+        raise TypingError(
+            "Expected a nd_item should to be a NdItem value, but "
+            f"encountered {type(nd_item)}"
+        )
+
+    # pylint: disable=unused-argument
+    def ol_nd_item_get_sub_group_impl(nd_item):
+        # pylint: disable=no-value-for-parameter
+        return _intrinsic_get_sub_group(nd_item)
+
+    return ol_nd_item_get_sub_group_impl
+
+
+def _generate_query_overload(_intrinsic):
+    """Generates overload for a sub-group method without arguments that
+    generates specific IR from provided intrinsic."""
+
+    def ol_sub_group_query(sub_group):
+        _check_sub_group(sub_group)
+
+        def ol_sub_group_query_impl(sub_group):
+            # pylint: disable=no-value-for-parameter
+            return _intrinsic(sub_group)
+
+        return ol_sub_group_query_impl
+
+    return ol_sub_group_query
+
+
+def _generate_exchange_overload(_intrinsic):
+    """Generates overload for a sub-group method with a value and an index
+    argument that generates specific IR from provided intrinsic."""
+
+    def ol_sub_group_exchange(sub_group, value, index):
+        _check_sub_group(sub_group)
+
+        def ol_sub_group_exchange_impl(sub_group, value, index):
+            # pylint: disable=no-value-for-parameter
+            return _intrinsic(sub_group, value, index)
+
+        return ol_sub_group_exchange_impl
+
+    return ol_sub_group_exchange
+
+
+def _generate_vote_overload(_intrinsic):
+    """Generates overload for a sub-group vote method that generates specific
+    IR from provided intrinsic."""
+
+    def ol_sub_group_vote(sub_group, predicate):
+        _check_sub_group(sub_group)
+
+        def ol_sub_group_vote_impl(sub_group, predicate):
+            # pylint: disable=no-value-for-parameter
+            return _intrinsic(sub_group, predicate)
+
+        return ol_sub_group_vote_impl
+
+    return ol_sub_group_vote
+
+
+def register_sub_group_methods():
+    """Register the sub-group methods that map to a single intrinsic."""
+    _sub_group_overload_methods = [
+        ("get_local_id", _intrinsic_spirv_sub_group_local_id, 0),
+        ("get_local_range", _intrinsic_spirv_sub_group_size, 0),
+        ("get_max_local_range", _intrinsic_spirv_sub_group_max_size, 0),
+        ("get_group_id", _intrinsic_spirv_sub_group_id, 0),
+        ("get_group_range", _intrinsic_spirv_num_sub_groups, 0),
+        ("shuffle", _intrinsic_sub_group_shuffle, 2),
+        ("shuffle_down", _intrinsic_sub_group_shuffle_down, 2),
+        ("shuffle_up", _intrinsic_sub_group_shuffle_up, 2),
+        ("shuffle_xor", _intrinsic_sub_group_shuffle_xor, 2),
+        ("broadcast", _intrinsic_sub_group_broadcast, 2),
+        ("any", _intrinsic_sub_group_any, 1),
+        ("all", _intrinsic_sub_group_all, 1),
+    ]
+    _overload_generators = {
+        0: _generate_query_overload,
+        1: _generate_vote_overload,
+        2: _generate_exchange_overload,
+    }
+
+    for method, _intrinsic, nargs in _sub_group_overload_methods:
+        ol_func = _overload_generators[nargs](_intrinsic)
+
+        overload_method(SubGroupType, method, target=SPIRV_TARGET_NAME)(ol_func)
+
+
+register_sub_group_methods()
+
+
+@overload_method(
+    SubGroupType, "reduce", target=SPIRV_TARGET_NAME, prefer_literal=True
+)
+def ol_sub_group_reduce(sub_group, value, op):
+    """SPIR-V overload for :meth:`numba_dpex.kernel_api.SubGroup.reduce`.
+
+    Generates the same LLVM IR instruction as dpcpp for the
+    `sycl::reduce_over_group` function called on a `sycl::sub_group`.
+    """
+    _check_sub_group(sub_group)
+
+    def ol_sub_group_reduce_impl(sub_group, value, op):
+        # pylint: disable=no-value-for-parameter
+        return _intrinsic_sub_group_reduce(sub_group, value, op)
+
+    return ol_sub_group_reduce_impl
+
+
+@overload_method(
+    SubGroupType, "scan", target=SPIRV_TARGET_NAME, prefer_literal=True
+)
+def ol_sub_group_scan(sub_group, value, op, exclusive=False):
+    """SPIR-V overload for :meth:`numba_dpex.kernel_api.SubGroup.scan`.
+
+    Generates the same LLVM IR instruction as dpcpp for the
+    `sycl::inclusive_scan_over_group` and `sycl::exclusive_scan_over_group`
+    functions called on a `sycl::sub_group`.
+
+    Raises:
+        TypingError: When exclusive is not a boolean literal.
+    """
+    _check_sub_group(sub_group)
+
+    if isinstance(exclusive, bool):
+        is_exclusive = exclusive
+    elif isinstance(exclusive, types.Omitted):
+        is_exclusive = bool(exclusive.value)
+    elif isinstance(exclusive, types.BooleanLiteral):
+        is_exclusive = exclusive.literal_value
+    else:
+        raise TypingError(
+            "The exclusive argument of SubGroup.scan has to be a boolean "
+            f"literal, but encountered {exclusive}"
+        )
+
+    if is_exclusive:
+        # pylint: disable=unused-argument
+        def ol_sub_group_exclusive_scan_impl(
+            sub_group, value, op, exclusive=False
+        ):
+            # pylint: disable=no-value-for-parameter
+            return _intrinsic_sub_group_exclusive_scan(sub_group, value, op)
+
+        return ol_sub_group_exclusive_scan_impl
+
+    # pylint: disable=unused-argument
+    def ol_sub_group_inclusive_scan_impl(sub_group, value, op, exclusive=False):
+        # pylint: disable=no-value-for-parameter
+        return _intrinsic_sub_group_inclusive_scan(sub_group, value, op)
+
+    return ol_sub_group_inclusive_scan_impl
@@ -0,0 +1,333 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Implements the SPIR-V overloads for the kernel_api.Vec class and the vector
+load and store functions.
+
+A Vec is an LLVM vector value, so the element-wise operations are lowered to
+single LLVM vector instructions and the loads and stores to vector memory
+accesses that the LLVM IR to SPIR-V translator keeps as vector OpLoad and
+OpStore instructions.
+"""
+
+import operator
+
+import llvmlite.ir as llvmir
+from numba.core import types
+from numba.core.errors import TypingError
+from numba.core.typing.npydecl import parse_dtype as _ty_parse_dtype
+from numba.extending import intrinsic, overload
+from numba.np.arrayobj import make_array
+
+from numba_dpex.core.types import USMNdArray
+from numba_dpex.core.types.kernel_api.vec import VecType
+from numba_dpex.kernel_api import load_vec, store_vec, vec
+from numba_dpex.kernel_api.vec import _SUPPORTED_VEC_SIZES
+
+from ..target import SPIRV_TARGET_NAME
+
+
+def _check_size(ty_size):
+    if (
+        not isinstance(ty_size, types.IntegerLiteral)
+        or ty_size.literal_value not in _SUPPORTED_VEC_SIZES
+    ):
+        raise TypingError(
+            "Expected the vector size to be a literal integer of "
+            f"{_SUPPORTED_VEC_SIZES}, but encountered {ty_size}"
+        )
+    return ty_size.literal_value
+
+
+def _check_dtype(dtype):
+    if not isinstance(dtype, (types.Integer, types.Float)):
+        raise TypingError(
+            "Vectors support integer and floating point elements, but "
+            f"encountered {dtype}"
+        )
+
+
+def _check_array(ty_array, ty_index):
+    if not isinstance(ty_array, USMNdArray) or ty_array.layout != "C":
+        raise TypingError(
+            f"Expected a C-contiguous array, but encountered {ty_array}"
+        )
+    _check_dtype(ty_array.dtype)
+    if not isinstance(ty_index, types.Integer):
+        raise TypingError(
+            f"Expected an integer index, but encountered {ty_index}"
+        )
+
+
+def _splat(context, builder, ty_vec, value):
+    """Returns a vector whose elements are all set to a scalar value."""
+    vector = llvmir.Constant(context.get_value_type(ty_vec), llvmir.Undefined)
+    for i in range(ty_vec.count):
+        vector = builder.insert_element(
+            vector, value, context.get_constant(types.int32, i)
+        )
+    return vector
+
+
+def _vector_pointer(context, builder, ty_array, array, index, ty_vec):
+    """Returns a pointer to the vector that starts at the element index of the
+    flattened array data."""
+    ary = make_array(ty_array)(context, builder, value=array)
+    ptr = builder.gep(ary.data, [index])
+    return builder.bitcast(
+        ptr, context.get_value_type(ty_vec).as_pointer(ty_array.addrspace)
+    )
+
+
+def _element_alignment(ty_vec):
+    # Vectors start at any array element, so that only the alignment of the
+    # element type is guaranteed.
+    return ty_vec.dtype.bitwidth // 8
+
+
+@intrinsic(target=SPIRV_TARGET_NAME)
+def _intrinsic_vec(
+    ty_context, ty_dtype, ty_size, ty_value  # pylint: disable=unused-argument
+):
+    """Generates a vector with all elements set to the same value."""
+    dtype = _ty_parse_dtype(ty_dtype)
+    _check_dtype(dtype)
+    ty_vec = VecType(dtype, _check_size(ty_size))
+
+    if not isinstance(ty_value, (types.Number, types.Omitted)):
+        raise TypingError(
+            f"Expected a scalar vector value, but encountered {ty_value}"
+        )
+
+    sig = ty_vec(ty_dtype, ty_size, ty_value)
+
+    def _intrinsic_vec_gen(context, builder, sig, args):
+        if isinstance(ty_value, types.Omitted):
+            value = context.get_constant(dtype, ty_value.value)
+        else:
+            value = context.cast(builder, args[2], ty_value, dtype)
+
+        return _splat(context, builder, ty_vec, value)
+
+    return (
+        sig,
+        _intrinsic_vec_gen,
+    )
+
+
+@intrinsic(target=SPIRV_TARGET_NAME)
+def _intrinsic_load_vec(
+    ty_context, ty_array, ty_index, ty_size  # pylint: disable=unused-argument
+):
+    """Generates a vector load of consecutive array elements."""
+    _check_array(ty_array, ty_index)
+    ty_vec = VecType(ty_array.dtype, _check_size(ty_size))
+
+    sig = ty_vec(ty_array, types.intp, ty_size)
+
+    def _intrinsic_load_vec_gen(context, builder, sig, args):
+        ptr = _vector_pointer(
+            context, builder, ty_array, args[0], args[1], ty_vec
+        )
+        return builder.load(ptr, align=_element_alignment(ty_vec))
+
+    return (
+        sig,
+        _intrinsic_load_vec_gen,
+    )
+
+
+@intrinsic(target=SPIRV_TARGET_NAME)
+def _intrinsic_store_vec(
+    ty_context, ty_array, ty_index, ty_vec  # pylint: disable=unused-argument
+):
+    """Generates a vector store into consecutive array elements."""
+    _check_array(ty_array, ty_index)
+    if not isinstance(ty_vec, VecType) or ty_vec.dtype != ty_array.dtype:
+        raise TypingError(
+            f"Expected a vector of {ty_array.dtype} elements, but encountered "
+            f"{ty_vec}"
+        )
+
+    sig = types.void(ty_array, types.intp, ty_vec)
+
+    def _intrinsic_store_vec_gen(context, builder, sig, args):
+        ptr = _vector_pointer(
+            context, builder, ty_array, args[0], args[1], ty_vec
+        )
+        builder.store(args[2], ptr, align=_element_alignment(ty_vec))
+
+    return (
+        sig,
+        _intrinsic_store_vec_gen,
+    )
+
+
+@intrinsic(target=SPIRV_TARGET_NAME)
+def _intrinsic_vec_getitem(
+    ty_context, ty_vec, ty_index  # pylint: disable=unused-argument
+):
+    """Generates an extractelement instruction for a vector element."""
+    sig = ty_vec.dtype(ty_vec, types.intp)
+
+    def _intrinsic_vec_getitem_gen(context, builder, sig, args):
+        return builder.extract_element(args[0], args[1])
+
+    return (
+        sig,
+        _intrinsic_vec_getitem_gen,
+    )
+
+
+def _generate_vec_binary_intrinsic(int_inst, float_inst):
+    """Generates an intrinsic for an element-wise binary operation on vectors
+    that lowers to the LLVM instruction int_inst for integer vectors and to
+    float_inst for floating point vectors. Scalar operands are converted to
+    the element type and splatted into a vector."""
+
+    def _intrinsic_vec_binary_op(
+        ty_context, ty_lhs, ty_rhs  # pylint: disable=unused-argument
+    ):
+        ty_vec = ty_lhs if isinstance(ty_lhs, VecType) else ty_rhs
+        for ty in (ty_lhs, ty_rhs):
+            if isinstance(ty, VecType) and ty != ty_vec:
+                raise TypingError(
+                    "Element-wise operations require vectors of the same "
+                    f"type, but encountered {ty_lhs} and {ty_rhs}"
+                )
+            if not isinstance(ty, (VecType, types.Number)):
+                raise TypingError(
+                    "Expected a vector or a scalar operand, but encountered "
+                    f"{ty}"
+                )
+
+        inst = float_inst if isinstance(ty_vec.dtype, types.Float) else int_inst
+        if inst is None:
+            raise TypingError(
+                f"The operation is not supported for {ty_vec} vectors"
+            )
+
+        sig = ty_vec(ty_lhs, ty_rhs)
+
+        def _intrinsic_vec_binary_op_gen(context, builder, sig, args):
+            operands = [
+                (
+                    arg
+                    if isinstance(ty, VecType)
+                    else _splat(
+                        context,
+                        builder,
+                        ty_vec,
+                        context.cast(builder, arg, ty, ty_vec.dtype),
+                    )
+                )
+                for ty, arg in zip(sig.args, args)
+            ]
+            return getattr(builder, inst)(*operands)
+
+        return (
+            sig,
+            _intrinsic_vec_binary_op_gen,
+        )
+
+    return intrinsic(target=SPIRV_TARGET_NAME)(_intrinsic_vec_binary_op)
+
+
+@overload(vec, prefer_literal=True, target=SPIRV_TARGET_NAME)
+def ol_vec(dtype, size, value=0):
+    """SPIR-V overload for :func:`numba_dpex.kernel_api.vec`.
+
+    Generates an LLVM vector with all elements set to the value.
+    """
+
+    def ol_vec_impl(dtype, size, value=0):
+        # pylint: disable=no-value-for-parameter
+        return _intrinsic_vec(dtype, size, value)
+
+    return ol_vec_impl
+
+
+@overload(load_vec, prefer_literal=True, target=SPIRV_TARGET_NAME)
+def ol_load_vec(array, index, size):
+    """SPIR-V overload for :func:`numba_dpex.kernel_api.load_vec`.
+
+    Generates a load of an LLVM vector from the array data.
+    """
+    _check_array(array, index)
+
+    def ol_load_vec_impl(array, index, size):
+        # pylint: disable=no-value-for-parameter
+        return _intrinsic_load_vec(array, index, size)
+
+    return ol_load_vec_impl
+
+
+@overload(store_vec, target=SPIRV_TARGET_NAME)
+def ol_store_vec(array, index, value):
+    """SPIR-V overload for :func:`numba_dpex.kernel_api.store_vec`.
+
+    Generates a store of an LLVM vector into the array data.
+    """
+    _check_array(array, index)
+
+    def ol_store_vec_impl(array, index, value):
+        # pylint: disable=no-value-for-parameter
+        return _intrinsic_store_vec(array, index, value)
+
+    return ol_store_vec_impl
+
+
+@overload(operator.getitem, target=SPIRV_TARGET_NAME)
+def ol_vec_getitem(value, index):
+    """SPIR-V overload for :meth:`numba_dpex.kernel_api.Vec.__getitem__`."""
+    if not isinstance(value, VecType):
+        return None
+    if not isinstance(index, types.Integer):
+        raise TypingError(
+            f"Expected an integer vector index, but encountered {index}"
+        )
+
+    def ol_vec_getitem_impl(value, index):
+        # pylint: disable=no-value-for-parameter
+        return _intrinsic_vec_getitem(value, index)
+
+    return ol_vec_getitem_impl
+
+
+def _generate_vec_binary_overload(_intrinsic):
+    """Generates overload for an element-wise binary operator that generates
+    specific IR from provided intrinsic if one of the operands is a vector."""
+
+    def ol_vec_binary_op(lhs, rhs):
+        if not isinstance(lhs, VecType) and not isinstance(rhs, VecType):
+            return None
+
+        def ol_vec_binary_op_impl(lhs, rhs):
+            # pylint: disable=no-value-for-parameter
+            return _intrinsic(lhs, rhs)
+
+        return ol_vec_binary_op_impl
+
+    return ol_vec_binary_op
+
+
+def register_vec_operators():
+    """Register the element-wise arithmetic operators of vectors."""
+    _vec_operators = [
+        ((operator.add, operator.iadd), "add", "fadd"),
+        ((operator.sub, operator.isub), "sub", "fsub"),
+        ((operator.mul, operator.imul), "mul", "fmul"),
+        ((operator.truediv, operator.itruediv), None, "fdiv"),
+    ]
+
+    for operators, int_inst, float_inst in _vec_operators:
+        _intrinsic = _generate_vec_binary_intrinsic(int_inst, float_inst)
+
+        for op in operators:
+            ol_func = _generate_vec_binary_overload(_intrinsic)
+            overload(op, target=SPIRV_TARGET_NAME)(ol_func)
+
+
+register_vec_operators()
@@ -279,3 +279,187 @@ def get_or_insert_spv_atomic_fence_fn(module):
     fn.attributes.add("nounwind")
 
     return fn
+
+
+def get_or_insert_spv_group_op_fn(context, module, inst_name, dtype):
+    """
+    Gets or inserts a declaration for a SPIR-V group instruction call, e.g.,
+    __spirv_GroupIAdd, into the specified LLVM IR module.
+
+    The group instructions take the execution scope, the group operation and
+    the value contributed by the work-item, and return the combined value.
+    """
+    value_type = context.get_value_type(dtype)
+
+    mangled_fn_name = ext_itanium_mangler.mangle_ext(
+        inst_name,
+        ["__spv.Scope.Flag", types.uint32, dtype],
+    )
+
+    fn = cgutils.get_or_insert_function(
+        module,
+        llvmir.FunctionType(
+            value_type, [llvmir.IntType(32), llvmir.IntType(32), value_type]
+        ),
+        mangled_fn_name,
+    )
+    fn.calling_convention = CC_SPIR_FUNC
+
+    if _SUPPORT_CONVERGENT:
+        fn.attributes.add("convergent")
+    fn.attributes.add("nounwind")
+
+    return fn
+
+
+def get_or_insert_spv_sub_group_fn(
+    context, module, fn_name, return_type, arg_types
+):
+    """
+    Gets or inserts a declaration for a SPIR-V sub-group function call, e.g.,
+    __spirv_SubgroupShuffleINTEL, into the specified LLVM IR module.
+
+    The ``arg_types`` are the Numba types of the arguments, where the string
+    ``"__spv.Scope.Flag"`` stands for an i32 execution scope argument.
+    """
+    llvm_arg_types = [
+        (
+            llvmir.IntType(32)
+            if isinstance(arg_type, str)
+            else context.get_value_type(arg_type)
+        )
+        for arg_type in arg_types
+    ]
+    mangled_fn_name = ext_itanium_mangler.mangle_ext(fn_name, list(arg_types))
+
+    fn = cgutils.get_or_insert_function(
+        module,
+        llvmir.FunctionType(
+            context.get_value_type(return_type), llvm_arg_types
+        ),
+        mangled_fn_name,
+    )
+    fn.calling_convention = CC_SPIR_FUNC
+
+    if _SUPPORT_CONVERGENT:
+        fn.attributes.add("convergent")
+    fn.attributes.add("nounwind")
+
+    return fn
+
+
+def get_or_insert_spv_group_broadcast_fn(context, module, dtype, local_id_ty):
+    """
+    Gets or inserts a declaration for a __spirv_GroupBroadcast call into the
+    specified LLVM IR module.
+
+    The local id of the broadcasting work-item is passed as an i64 for a
+    ``types.uint64`` local_id_ty and as a vector of i64 with a coordinate per
+    dimension for a ``types.UniTuple`` local_id_ty.
+    """
+    value_type = context.get_value_type(dtype)
+    if isinstance(local_id_ty, types.UniTuple):
+        local_id_type = llvmir.VectorType(llvmir.IntType(64), local_id_ty.count)
+    else:
+        local_id_type = llvmir.IntType(64)
+
+    mangled_fn_name = ext_itanium_mangler.mangle_ext(
+        "__spirv_GroupBroadcast",
+        ["__spv.Scope.Flag", dtype, local_id_ty],
+    )
+
+    fn = cgutils.get_or_insert_function(
+        module,
+        llvmir.FunctionType(
+            value_type, [llvmir.IntType(32), value_type, local_id_type]
+        ),
+        mangled_fn_name,
+    )
+    fn.calling_convention = CC_SPIR_FUNC
+
+    if _SUPPORT_CONVERGENT:
+        fn.attributes.add("convergent")
+    fn.attributes.add("nounwind")
+
+    return fn
+
+
+def get_or_insert_spv_group_async_copy_fn(
+    context, module, dest_ptr_ty, src_ptr_ty, event_ty
+):
+    """
+    Gets or inserts a declaration for a __spirv_GroupAsyncCopy call into the
+    specified LLVM IR module.
+
+    The copy takes the execution scope, the destination and source pointers,
+    the number of elements, the stride and an event to add the copy to, and
+    returns the event of the copy.
+    """
+    event_type = context.get_value_type(event_ty)
+
+    mangled_fn_name = ext_itanium_mangler.mangle_ext(
+        "__spirv_GroupAsyncCopy",
+        [
+            "__spv.Scope.Flag",
+            dest_ptr_ty,
+            src_ptr_ty,
+            types.uint64,
+            types.uint64,
+            "ocl_event",
+        ],
+    )
+
+    fn = cgutils.get_or_insert_function(
+        module,
+        llvmir.FunctionType(
+            event_type,
+            [
+                llvmir.IntType(32),
+                context.get_value_type(dest_ptr_ty),
+                context.get_value_type(src_ptr_ty),
+                llvmir.IntType(64),
+                llvmir.IntType(64),
+                event_type,
+            ],
+        ),
+        mangled_fn_name,
+    )
+    fn.calling_convention = CC_SPIR_FUNC
+
+    if _SUPPORT_CONVERGENT:
+        fn.attributes.add("convergent")
+    fn.attributes.add("nounwind")
+
+    return fn
+
+
+def get_or_insert_spv_group_wait_events_fn(context, module, event_ty):
+    """
+    Gets or inserts a declaration for a __spirv_GroupWaitEvents call into the
+    specified LLVM IR module.
+
+    The wait takes the execution scope, the number of events and a pointer to
+    the list of events.
+    """
+    event_type = context.get_value_type(event_ty)
+
+    mangled_fn_name = ext_itanium_mangler.mangle_ext(
+        "__spirv_GroupWaitEvents",
+        ["__spv.Scope.Flag", types.int32, "ocl_event_ptr"],
+    )
+
+    fn = cgutils.get_or_insert_function(
+        module,
+        llvmir.FunctionType(
+            llvmir.VoidType(),
+            [llvmir.IntType(32), llvmir.IntType(32), event_type.as_pointer()],
+        ),
+        mangled_fn_name,
+    )
+    fn.calling_convention = CC_SPIR_FUNC
+
+    if _SUPPORT_CONVERGENT:
+        fn.attributes.add("convergent")
+    fn.attributes.add("nounwind")
+
+    return fn
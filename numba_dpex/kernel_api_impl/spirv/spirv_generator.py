@@ -8,11 +8,15 @@ a numba-dpex generated LLVM IR module.
 """
 
 import os
+import re
 import tempfile
 from subprocess import STDOUT, CalledProcessError, check_output
 
 from numba_dpex.core import config
 from numba_dpex.core.exceptions import InternalError
+from numba_dpex.kernel_api_impl.spirv.overloads._spv_group_inst_helper import (
+    KHR_GROUP_INST_SUFFIX,
+)
 from numba_dpex.kernel_api_impl.spirv.target import LLVM_SPIRV_ARGS
 
 try:
@@ -20,6 +24,8 @@ try:
 except ImportError as err:
     raise ImportError("Cannot import dpcpp-llvm-spirv package") from err
 
+_KHR_GROUP_INST_REGEX = re.compile(r"__spirv_Group\w+" + KHR_GROUP_INST_SUFFIX)
+
 
 def run_cmd(args, error_message=None):
     """
@@ -122,10 +128,19 @@ class Module:
         # https://github.com/IntelPython/numba-dpex/issues/1262
         llvm_spirv_args = [
             "--spirv-ext=+SPV_EXT_shader_atomic_float_add",
+            "--spirv-ext=+SPV_EXT_shader_atomic_float16_add",
             "--spirv-ext=+SPV_EXT_shader_atomic_float_min_max",
             "--spirv-ext=+SPV_INTEL_arbitrary_precision_integers",
+            "--spirv-ext=+SPV_INTEL_subgroups",
             "--spirv-ext=+SPV_INTEL_variable_length_array",
         ]
+        # The extension is only enabled for modules that use its group
+        # instructions, so that the other kernels do not require a device
+        # that supports it.
+        if _KHR_GROUP_INST_REGEX.search(str(self._llvmir)):
+            llvm_spirv_args.append(
+                "--spirv-ext=+SPV_KHR_uniform_group_instructions"
+            )
         for key in list(self.context.extra_compile_options.keys()):
             if key == LLVM_SPIRV_ARGS:
                 llvm_spirv_args = self.context.extra_compile_options[key]
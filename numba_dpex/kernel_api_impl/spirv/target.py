@@ -5,13 +5,14 @@
 """Implements a SPIR-V code generation-specific target and typing context.
 """
 
+import warnings
 from enum import IntEnum
 from functools import cached_property
 
 import dpnp
 from llvmlite import binding as ll
 from llvmlite import ir as llvmir
-from numba.core import cgutils
+from numba.core import cgutils, fastmathpass
 from numba.core import types as nb_types
 from numba.core import typing
 from numba.core.base import BaseContext
@@ -22,7 +23,7 @@ from numba.core.typing import cmathdecl, enumdecl
 
 from numba_dpex.core.datamodel.models import _init_kernel_data_model_manager
 from numba_dpex.core.debuginfo import DIBuilder as DpexDIbuilder
-from numba_dpex.core.types import IntEnumLiteral
+from numba_dpex.core.types import IntEnumLiteral, USMNdArray
 from numba_dpex.core.typing import dpnpdecl
 from numba_dpex.core.utils import itanium_mangler
 from numba_dpex.kernel_api.flag_enum import FlagEnum
@@ -182,7 +183,56 @@ class SPIRVTargetContext(BaseContext):
         # Set SPIR kernel calling convention
         fn.calling_convention = CC_SPIR_KERNEL
 
-    def _generate_spir_kernel_wrapper(self, func, argtypes):
+    def _set_array_data_arg_attributes(
+        self, wrapper, arginfo, argtypes, restrict, assume_aligned
+    ):
+        """Adds the ``noalias`` and ``align`` parameter attributes to the data
+        pointers of the array arguments of the kernel wrapper function.
+
+        The attributes are translated to the ``NoAlias`` function parameter
+        attribute and the ``Alignment`` decoration of the SPIR-V kernel
+        arguments, so that the device compiler may reorder, hoist and
+        vectorize the loads and stores of the arrays.
+
+        Args:
+            wrapper: LLVM function representing the "kernel" wrapper function.
+            arginfo: The ArgPacker that flattened the kernel arguments into
+                the arguments of the wrapper function.
+            argtypes: The numba types of the kernel arguments.
+            restrict (bool): Whether the arrays are assumed to not overlap.
+            assume_aligned (int): The alignment in bytes that the data
+                pointers of the global memory arrays are assumed to have, or
+                0.
+        """
+        if assume_aligned and (
+            assume_aligned < 0 or assume_aligned & (assume_aligned - 1)
+        ):
+            warnings.warn(
+                "Unsupported array alignment. Set a power of two number of "
+                "bytes"
+            )
+            assume_aligned = 0
+        if not restrict and not assume_aligned:
+            return
+
+        # pylint: disable=protected-access
+        valtree = arginfo._unflattener.unflatten(wrapper.args)
+        for argty, arg_vals in zip(argtypes, valtree):
+            if not isinstance(argty, USMNdArray):
+                continue
+            data_arg = arg_vals[
+                self.data_model_manager.lookup(argty).get_field_position("data")
+            ]
+            if restrict:
+                data_arg.add_attribute("noalias")
+            # The alignment of the local memory allocations is chosen by the
+            # device runtime, so that only global memory arrays get it.
+            if assume_aligned and argty.addrspace != address_space.LOCAL.value:
+                data_arg.attributes.align = assume_aligned
+
+    def _generate_spir_kernel_wrapper(
+        self, func, argtypes, restrict=False, assume_aligned=0
+    ):
         module = func.module
         arginfo = self.get_arg_packer(argtypes)
         wrapperfnty = llvmir.FunctionType(
@@ -200,6 +250,9 @@ class SPIRVTargetContext(BaseContext):
         func = llvmir.Function(wrapper_module, fnty, name=func.name)
         func.calling_convention = CC_SPIR_FUNC
         wrapper = llvmir.Function(wrapper_module, wrapperfnty, name=wrappername)
+        self._set_array_data_arg_attributes(
+            wrapper, arginfo, argtypes, restrict, assume_aligned
+        )
         builder = llvmir.IRBuilder(wrapper.append_basic_block("entry"))
 
         callargs = arginfo.from_arguments(builder, wrapper.args)
@@ -316,6 +369,12 @@ class SPIRVTargetContext(BaseContext):
         """Return the CodeGen object used by the SPIRVTargetContext."""
         return self._internal_codegen
 
+    def post_lowering(self, mod, library):
+        """Adds the fastmath flags of the function to the floating point
+        instructions and calls of the lowered LLVM module."""
+        if self.fastmath:
+            fastmathpass.rewrite_module(mod, self.fastmath)
+
     @property
     def target_data(self):
         return self._target_data
@@ -326,14 +385,22 @@ class SPIRVTargetContext(BaseContext):
         """
         return itanium_mangler.mangle(name, types, abi_tags=abi_tags, uid=uid)
 
-    def prepare_spir_kernel(self, func, argtypes):
+    def prepare_spir_kernel(
+        self, func, argtypes, restrict=False, assume_aligned=0
+    ):
         """Generates a wrapper function with \"spir_kernel\" calling conv that
         calls the compiled \"spir_func\" generated by numba_dpex for a kernel
         decorated function.
+
+        If ``restrict`` is set, the data pointers of the array arguments of
+        the wrapper get the ``noalias`` attribute. If ``assume_aligned`` is
+        set, they get the ``align`` attribute with the given number of bytes.
         """
         func.linkage = "linkonce_odr"
         func.module.data_layout = codegen.SPIR_DATA_LAYOUT[self.address_size]
-        wrapper = self._generate_spir_kernel_wrapper(func, argtypes)
+        wrapper = self._generate_spir_kernel_wrapper(
+            func, argtypes, restrict, assume_aligned
+        )
         return wrapper
 
     def set_spir_func_calling_conv(self, func):
@@ -13,7 +13,14 @@ def init_kernel_api_spirv_overloads():
     from .kernel_api_impl.spirv.overloads import (
         _atomic_fence_overloads,
         _atomic_ref_overloads,
+        _bfloat16_overloads,
+        _device_event_overloads,
+        _float16_overloads,
         _group_barrier_overloads,
+        _group_func_overloads,
         _index_space_id_overloads,
         _private_array_overloads,
+        _privatized_atomics_overloads,
+        _sub_group_overloads,
+        _vec_overloads,
     )
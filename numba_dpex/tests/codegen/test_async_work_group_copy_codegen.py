@@ -0,0 +1,37 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import dpctl
+from numba.core import types
+
+import numba_dpex as dpex
+from numba_dpex import DpctlSyclQueue, DpnpNdArray
+from numba_dpex import kernel_api as kapi
+from numba_dpex.core.types.kernel_api.index_space_ids import NdItemType
+from numba_dpex.core.types.kernel_api.local_accessor import LocalAccessorType
+from numba_dpex.kernel_api import NdItem
+
+
+def kernel_func(nd_item: NdItem, a, slm):
+    gr = nd_item.get_group()
+    event = kapi.async_work_group_copy(gr, slm, a, 16, 2)
+    kapi.wait_for(gr, event)
+    a[nd_item.get_global_id(0)] = slm[nd_item.get_local_id(0)]
+
+
+def test_async_work_group_copy_codegen():
+    """Tests that an asynchronous copy and the wait for it are generated as
+    calls to the SPIR-V group async copy and wait events instructions."""
+    queue_ty = DpctlSyclQueue(dpctl.SyclQueue())
+    arr_ty = DpnpNdArray(
+        ndim=1, dtype=types.float32, layout="C", queue=queue_ty
+    )
+    slm_ty = LocalAccessorType(ndim=1, dtype=types.float32)
+    disp = dpex.kernel(inline_threshold=3)(kernel_func)
+    kcres = disp.get_compile_result(types.void(NdItemType(1), arr_ty, slm_ty))
+    kernel_ir = kcres.library.get_llvm_str()
+
+    assert "__spirv_GroupAsyncCopy" in kernel_ir
+    assert "__spirv_GroupWaitEvents" in kernel_ir
+    assert '%"spirv.Event"* null' in kernel_ir
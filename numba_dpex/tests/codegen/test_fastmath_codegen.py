@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import math
+
+import dpctl
+import pytest
+from numba.core import types
+
+import numba_dpex as dpex
+from numba_dpex import DpctlSyclQueue, DpnpNdArray
+from numba_dpex.core.types.kernel_api.index_space_ids import ItemType
+from numba_dpex.kernel_api import Item
+from numba_dpex.tests._helper import override_config
+
+
+def kernel_func(item: Item, a, b):
+    i = item.get_id(0)
+    b[i] = math.exp(a[i]) * a[i] + math.sqrt(a[i])
+
+
+def _get_kernel_ir(dtype, **options):
+    queue_ty = DpctlSyclQueue(dpctl.SyclQueue())
+    arr_ty = DpnpNdArray(ndim=1, dtype=dtype, layout="C", queue=queue_ty)
+    disp = dpex.kernel(inline_threshold=3, **options)(kernel_func)
+    kcres = disp.get_compile_result(types.void(ItemType(1), arr_ty, arr_ty))
+    return kcres.library.get_llvm_str()
+
+
+def test_no_fastmath():
+    kernel_ir = _get_kernel_ir(types.float32)
+
+    assert "fmul float" in kernel_ir
+    assert "native_" not in kernel_ir
+
+
+@pytest.mark.parametrize("fastmath", [True, {"afn", "nnan"}])
+def test_fastmath_native_builtins(fastmath):
+    """Tests that the native builtins are used if the fastmath flags allow
+    approximate functions."""
+    kernel_ir = _get_kernel_ir(types.float32, fastmath=fastmath)
+
+    assert "_Z10native_expf" in kernel_ir
+    assert "_Z11native_sqrtf" in kernel_ir
+    assert "fmul float" not in kernel_ir
+
+
+def test_fastmath_flags():
+    """Tests that only the requested fast-math flags are set and that the
+    full-precision builtins are kept without the afn flag."""
+    kernel_ir = _get_kernel_ir(types.float32, fastmath={"nnan", "contract"})
+
+    assert "fmul nnan contract float" in kernel_ir or (
+        "fmul contract nnan float" in kernel_ir
+    )
+    assert "native_" not in kernel_ir
+
+
+def test_fastmath_half_builtins():
+    with override_config("APPROX_MATH_BUILTINS", "half"):
+        kernel_ir = _get_kernel_ir(types.float32, fastmath=True)
+
+    assert "_Z8half_expf" in kernel_ir
+
+
+def test_fastmath_float64():
+    """Tests that float64 functions keep the full-precision builtins, as
+    there are no native builtins for them."""
+    kernel_ir = _get_kernel_ir(types.float64, fastmath=True)
+
+    assert "fmul fast double" in kernel_ir
+    assert "native_" not in kernel_ir
@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import math
+
+import dpctl
+import pytest
+from numba.core import types
+
+import numba_dpex as dpex
+from numba_dpex import DpctlSyclQueue, DpnpNdArray
+from numba_dpex.core.types.kernel_api.index_space_ids import ItemType
+from numba_dpex.kernel_api import AtomicRef, Item
+from numba_dpex.tests._helper import skip_if_dtype_not_supported
+
+
+def kernel_func(item: Item, a, b, total):
+    i = item.get_id(0)
+    b[i] = math.sqrt(a[i] * a[i] + b[i])
+    AtomicRef(total, 0).fetch_add(b[i])
+
+
+def test_float16_codegen():
+    """Tests that float16 arithmetic, math functions and atomics are generated
+    as half precision instructions without conversions to float32."""
+    queue = dpctl.SyclQueue()
+    skip_if_dtype_not_supported(types.float16.name, queue)
+    queue_ty = DpctlSyclQueue(queue)
+    arr_ty = DpnpNdArray(
+        ndim=1, dtype=types.float16, layout="C", queue=queue_ty
+    )
+    disp = dpex.kernel(inline_threshold=3)(kernel_func)
+    kcres = disp.get_compile_result(
+        types.void(ItemType(1), arr_ty, arr_ty, arr_ty)
+    )
+    kernel_ir = kcres.library.get_llvm_str()
+
+    assert "fmul half" in kernel_ir
+    assert "fadd half" in kernel_ir
+    assert "@_Z4sqrtDh(half" in kernel_ir
+    assert "__spirv_AtomicFAddEXT" in kernel_ir
+    assert "fpext half" not in kernel_ir
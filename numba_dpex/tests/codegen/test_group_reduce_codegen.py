@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import dpctl
+import pytest
+from numba.core import types
+
+import numba_dpex as dpex
+from numba_dpex import DpctlSyclQueue, DpnpNdArray
+from numba_dpex import kernel_api as kapi
+from numba_dpex.core.types.kernel_api.index_space_ids import NdItemType
+from numba_dpex.kernel_api import NdItem
+from numba_dpex.kernel_api_impl.spirv.overloads._group_func_overloads import (
+    _intrinsic_group_reduce,
+)
+
+
+def kernel_add(nd_item: NdItem, a, b):
+    i = nd_item.get_global_id(0)
+    b[i] = _intrinsic_group_reduce(nd_item.get_group(), a[i], "add")
+
+
+def kernel_mul(nd_item: NdItem, a, b):
+    i = nd_item.get_global_id(0)
+    b[i] = _intrinsic_group_reduce(nd_item.get_group(), a[i], "mul")
+
+
+def kernel_min(nd_item: NdItem, a, b):
+    i = nd_item.get_global_id(0)
+    b[i] = _intrinsic_group_reduce(nd_item.get_group(), a[i], "min")
+
+
+def kernel_xor(nd_item: NdItem, a, b):
+    i = nd_item.get_global_id(0)
+    b[i] = _intrinsic_group_reduce(nd_item.get_group(), a[i], "xor")
+
+
+def kernel_reduce_over_group(nd_item: NdItem, a, b):
+    i = nd_item.get_global_id(0)
+    b[i] = kapi.reduce_over_group(nd_item.get_group(), a[i], "max")
+
+
+def kernel_inclusive_scan(nd_item: NdItem, a, b):
+    i = nd_item.get_global_id(0)
+    b[i] = kapi.inclusive_scan_over_group(nd_item.get_group(), a[i], "add")
+
+
+def kernel_exclusive_scan(nd_item: NdItem, a, b):
+    i = nd_item.get_global_id(0)
+    b[i] = kapi.exclusive_scan_over_group(nd_item.get_group(), a[i], "add")
+
+
+def kernel_broadcast(nd_item: NdItem, a, b):
+    i = nd_item.get_global_id(0)
+    b[i] = kapi.group_broadcast(nd_item.get_group(), a[i], 0)
+
+
+@pytest.mark.parametrize(
+    "kernel_func, dtype, inst_name",
+    [
+        (kernel_add, types.int64, "__spirv_GroupIAdd"),
+        (kernel_add, types.float32, "__spirv_GroupFAdd"),
+        (kernel_mul, types.float64, "__spirv_GroupFMulKHR"),
+        (kernel_min, types.int32, "__spirv_GroupSMin"),
+        (kernel_min, types.uint32, "__spirv_GroupUMin"),
+        (kernel_xor, types.int64, "__spirv_GroupBitwiseXorKHR"),
+        (kernel_reduce_over_group, types.float64, "__spirv_GroupFMax"),
+        (kernel_broadcast, types.int32, "__spirv_GroupBroadcast"),
+    ],
+)
+def test_group_reduce_codegen(kernel_func, dtype, inst_name):
+    """Tests that a group reduce is generated as a call to the expected SPIR-V
+    group instruction."""
+    queue_ty = DpctlSyclQueue(dpctl.SyclQueue())
+    arr_ty = DpnpNdArray(ndim=1, dtype=dtype, layout="C", queue=queue_ty)
+    disp = dpex.kernel(inline_threshold=3)(kernel_func)
+    kcres = disp.get_compile_result(types.void(NdItemType(1), arr_ty, arr_ty))
+    kernel_ir = kcres.library.get_llvm_str()
+
+    assert inst_name in kernel_ir
+
+
+@pytest.mark.parametrize(
+    "kernel_func, group_operation",
+    [
+        (kernel_add, 0),
+        (kernel_inclusive_scan, 1),
+        (kernel_exclusive_scan, 2),
+    ],
+)
+def test_group_scan_codegen(kernel_func, group_operation):
+    """Tests that the group instruction of a reduce or scan is called with the
+    Workgroup scope and the expected group operation."""
+    queue_ty = DpctlSyclQueue(dpctl.SyclQueue())
+    arr_ty = DpnpNdArray(ndim=1, dtype=types.int64, layout="C", queue=queue_ty)
+    disp = dpex.kernel(inline_threshold=3)(kernel_func)
+    kcres = disp.get_compile_result(types.void(NdItemType(1), arr_ty, arr_ty))
+    kernel_ir = kcres.library.get_llvm_str()
+
+    assert f"(i32 2, i32 {group_operation}, i64" in kernel_ir
@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import dpctl
+import pytest
+from numba.core import types
+
+import numba_dpex as dpex
+from numba_dpex import DpctlSyclQueue, DpnpNdArray, float32
+from numba_dpex import kernel_api as kapi
+from numba_dpex.core.types.kernel_api.index_space_ids import ItemType
+from numba_dpex.kernel_api import Item
+
+
+def kernel_func(item: Item, a, b):
+    i = item.get_id(0)
+    p = kapi.PrivateArray(8, float32)
+    for j in range(8):
+        p[j] = a[i * 8 + j]
+    acc = 0.0
+    for j in range(8):
+        acc += p[j] * p[7 - j]
+    b[i] = acc
+
+
+def _get_kernel_ir(**options):
+    queue_ty = DpctlSyclQueue(dpctl.SyclQueue())
+    arr_ty = DpnpNdArray(ndim=1, dtype=float32, layout="C", queue=queue_ty)
+    disp = dpex.kernel(inline_threshold=3, **options)(kernel_func)
+    kcres = disp.get_compile_result(types.void(ItemType(1), arr_ty, arr_ty))
+    return kcres.library.get_llvm_str()
+
+
+def test_loops_are_not_unrolled_by_default():
+    """Tests that the loops of a kernel stay loops without the unroll
+    option."""
+    assert "phi " in _get_kernel_ir()
+
+
+def test_unroll_option():
+    """Tests that the loops over a private array with a constant trip count
+    are fully unrolled with the unroll option, so that no loop remains."""
+    kernel_ir = _get_kernel_ir(unroll=True)
+
+    assert "phi " not in kernel_ir
+    assert "alloca" not in kernel_ir
+
+
+def test_opt_option():
+    """Tests that the opt option overrides the optimization level, *i.e.*,
+    the private array is kept in memory without optimizations."""
+    assert "alloca" in _get_kernel_ir(opt=0, unroll=True)
+
+
+def test_unsupported_opt_level_warning():
+    with pytest.warns(UserWarning):
+        _get_kernel_ir(opt=4)
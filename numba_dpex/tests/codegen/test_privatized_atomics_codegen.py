@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import dpctl
+from numba.core import types
+
+import numba_dpex as dpex
+from numba_dpex import DpctlSyclQueue, DpnpNdArray
+from numba_dpex import kernel_api as kapi
+from numba_dpex.core.types.kernel_api.index_space_ids import (
+    ItemType,
+    NdItemType,
+)
+from numba_dpex.core.types.kernel_api.local_accessor import LocalAccessorType
+from numba_dpex.kernel_api import AtomicRef, Item, NdItem
+from numba_dpex.tests._helper import override_config
+
+
+def atomic_sum(item: Item, a, total):
+    AtomicRef(total, 0).fetch_add(a[item.get_id(0)])
+
+
+def test_fetch_add_compare_exchange_loop_codegen():
+    """Tests that a float32 fetch_add is generated as a compare-exchange
+    loop on the bits of the values if NATIVE_FP_ATOMICS is 0."""
+    queue_ty = DpctlSyclQueue(dpctl.SyclQueue())
+    arr_ty = DpnpNdArray(
+        ndim=1, dtype=types.float32, layout="C", queue=queue_ty
+    )
+    with override_config("NATIVE_FP_ATOMICS", 0):
+        disp = dpex.kernel(inline_threshold=3)(atomic_sum)
+        kcres = disp.get_compile_result(types.void(ItemType(1), arr_ty, arr_ty))
+    kernel_ir = kcres.library.get_llvm_str()
+
+    assert "__spirv_AtomicLoad" in kernel_ir
+    assert "__spirv_AtomicCompareExchange" in kernel_ir
+    assert "fadd float" in kernel_ir
+    assert "__spirv_AtomicFAddEXT" not in kernel_ir
+
+
+def histogram(nd_item: NdItem, a, hist, local_hist):
+    kapi.privatize_atomics(nd_item, local_hist)
+    AtomicRef(local_hist, a[nd_item.get_global_id(0)]).fetch_add(1)
+    kapi.flush_atomics(nd_item, local_hist, hist)
+
+
+def test_privatized_atomics_codegen():
+    """Tests that the privatized histogram updates local memory atomically
+    and flushes it with global memory atomics after a barrier."""
+    queue_ty = DpctlSyclQueue(dpctl.SyclQueue())
+    arr_ty = DpnpNdArray(ndim=1, dtype=types.int32, layout="C", queue=queue_ty)
+    slm_ty = LocalAccessorType(ndim=1, dtype=types.int32)
+    disp = dpex.kernel(inline_threshold=3)(histogram)
+    kcres = disp.get_compile_result(
+        types.void(NdItemType(1), arr_ty, arr_ty, slm_ty)
+    )
+    kernel_ir = kcres.library.get_llvm_str()
+
+    assert "__spirv_ControlBarrier" in kernel_ir
+    assert "__spirv_AtomicIAddPU3AS3" in kernel_ir
+    assert "__spirv_AtomicIAddPU3AS1" in kernel_ir
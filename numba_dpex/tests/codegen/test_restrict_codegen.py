@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import dpctl
+import pytest
+from numba.core import types
+
+import numba_dpex as dpex
+from numba_dpex import DpctlSyclQueue, DpnpNdArray, float32
+from numba_dpex.core.types.kernel_api.index_space_ids import ItemType
+from numba_dpex.kernel_api import Item
+
+
+def kernel_func(item: Item, a, b, c):
+    i = item.get_id(0)
+    c[i] = a[i] + b[i]
+
+
+def _get_kernel_signature(**options):
+    """Returns the line of the LLVM IR that defines the spir_kernel function
+    of the kernel."""
+    queue_ty = DpctlSyclQueue(dpctl.SyclQueue())
+    arr_ty = DpnpNdArray(ndim=1, dtype=float32, layout="C", queue=queue_ty)
+    disp = dpex.kernel(inline_threshold=3, **options)(kernel_func)
+    kcres = disp.get_compile_result(
+        types.void(ItemType(1), arr_ty, arr_ty, arr_ty)
+    )
+    return next(
+        line
+        for line in kcres.library.get_llvm_str().splitlines()
+        if line.startswith("define spir_kernel")
+    )
+
+
+def test_no_array_attributes_by_default():
+    signature = _get_kernel_signature()
+
+    assert "noalias" not in signature
+    assert "align" not in signature
+
+
+def test_restrict_option():
+    """Tests that the data pointers of the three arrays get the noalias
+    attribute with the restrict option."""
+    signature = _get_kernel_signature(restrict=True)
+
+    assert signature.count("float addrspace(1)* noalias") == 3
+
+
+def test_assume_aligned_option():
+    signature = _get_kernel_signature(restrict=True, assume_aligned=64)
+
+    assert signature.count("noalias align 64") == 3
+
+
+def test_unsupported_alignment_warning():
+    with pytest.warns(UserWarning):
+        signature = _get_kernel_signature(assume_aligned=48)
+
+    assert "align" not in signature
@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import dpctl
+import pytest
+from numba.core import types
+
+import numba_dpex as dpex
+from numba_dpex import DpctlSyclQueue, DpnpNdArray
+from numba_dpex.core.types.kernel_api.index_space_ids import NdItemType
+from numba_dpex.kernel_api import NdItem
+
+
+def kernel_local_id(nd_item: NdItem, a, b):
+    i = nd_item.get_global_id(0)
+    b[i] = nd_item.get_sub_group().get_local_id()
+
+
+def kernel_shuffle(nd_item: NdItem, a, b):
+    i = nd_item.get_global_id(0)
+    b[i] = nd_item.get_sub_group().shuffle(a[i], 0)
+
+
+def kernel_shuffle_down(nd_item: NdItem, a, b):
+    i = nd_item.get_global_id(0)
+    b[i] = nd_item.get_sub_group().shuffle_down(a[i], 1)
+
+
+def kernel_shuffle_xor(nd_item: NdItem, a, b):
+    i = nd_item.get_global_id(0)
+    b[i] = nd_item.get_sub_group().shuffle_xor(a[i], 1)
+
+
+def kernel_broadcast(nd_item: NdItem, a, b):
+    i = nd_item.get_global_id(0)
+    b[i] = nd_item.get_sub_group().broadcast(a[i], 0)
+
+
+def kernel_any(nd_item: NdItem, a, b):
+    i = nd_item.get_global_id(0)
+    b[i] = nd_item.get_sub_group().any(a[i] > 0)
+
+
+def kernel_reduce(nd_item: NdItem, a, b):
+    i = nd_item.get_global_id(0)
+    b[i] = nd_item.get_sub_group().reduce(a[i], "max")
+
+
+def kernel_exclusive_scan(nd_item: NdItem, a, b):
+    i = nd_item.get_global_id(0)
+    b[i] = nd_item.get_sub_group().scan(a[i], "add", True)
+
+
+@pytest.mark.parametrize(
+    "kernel_func, dtype, inst_name",
+    [
+        (
+            kernel_local_id,
+            types.int64,
+            "__spirv_BuiltInSubgroupLocalInvocationId",
+        ),
+        (kernel_shuffle, types.float32, "__spirv_SubgroupShuffleINTEL"),
+        (kernel_shuffle_down, types.int32, "__spirv_SubgroupShuffleDownINTEL"),
+        (kernel_shuffle_xor, types.float64, "__spirv_SubgroupShuffleXorINTEL"),
+        (kernel_broadcast, types.int64, "__spirv_GroupBroadcast"),
+        (kernel_any, types.int64, "__spirv_GroupAny"),
+        (kernel_reduce, types.float32, "__spirv_GroupFMax"),
+        (kernel_exclusive_scan, types.int64, "__spirv_GroupIAdd"),
+    ],
+)
+def test_sub_group_codegen(kernel_func, dtype, inst_name):
+    """Tests that a sub-group method is generated as the expected SPIR-V
+    built-in or instruction."""
+    queue_ty = DpctlSyclQueue(dpctl.SyclQueue())
+    arr_ty = DpnpNdArray(ndim=1, dtype=dtype, layout="C", queue=queue_ty)
+    disp = dpex.kernel(inline_threshold=3)(kernel_func)
+    kcres = disp.get_compile_result(types.void(NdItemType(1), arr_ty, arr_ty))
+    kernel_ir = kcres.library.get_llvm_str()
+
+    assert inst_name in kernel_ir
@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import dpctl
+import pytest
+from numba.core import types
+
+import numba_dpex as dpex
+from numba_dpex import DpctlSyclQueue, DpnpNdArray
+from numba_dpex import kernel_api as kapi
+from numba_dpex.core.types.kernel_api.index_space_ids import ItemType
+from numba_dpex.kernel_api import Item
+
+
+def kernel_func(item: Item, a, b):
+    i = item.get_id(0) * 4
+    kapi.store_vec(a, i, kapi.load_vec(a, i, 4) + kapi.load_vec(b, i, 4))
+
+
+@pytest.mark.parametrize(
+    "dtype, llvm_type, inst",
+    [
+        (types.float32, "<4 x float>", "fadd"),
+        (types.int64, "<4 x i64>", "add"),
+    ],
+)
+def test_vec_codegen(dtype, llvm_type, inst):
+    """Tests that vector loads and stores and element-wise operations generate
+    LLVM vector instructions."""
+    queue_ty = DpctlSyclQueue(dpctl.SyclQueue())
+    arr_ty = DpnpNdArray(ndim=1, dtype=dtype, layout="C", queue=queue_ty)
+    disp = dpex.kernel(inline_threshold=3)(kernel_func)
+    kcres = disp.get_compile_result(types.void(ItemType(1), arr_ty, arr_ty))
+    kernel_ir = kcres.library.get_llvm_str()
+
+    assert f"load {llvm_type}, {llvm_type} addrspace(1)*" in kernel_ir
+    assert f"= {inst} {llvm_type}" in kernel_ir
+    assert f"store {llvm_type}" in kernel_ir
@@ -16,6 +16,11 @@ def test_llvm_symbol_registered():
         == runtime._dpexrt_python.DPEXRT_sycl_usm_ndarray_from_python
     )
 
+    assert (
+        llb.address_of_symbol("DPEXRT_sycl_usm_ndarray_from_python_borrowed")
+        == runtime._dpexrt_python.DPEXRT_sycl_usm_ndarray_from_python_borrowed
+    )
+
     assert (
         llb.address_of_symbol("DPEXRT_sycl_usm_ndarray_to_python_acqref")
         == runtime._dpexrt_python.DPEXRT_sycl_usm_ndarray_to_python_acqref
@@ -31,6 +36,11 @@ def test_llvm_symbol_registered():
         == runtime._dpexrt_python.DPEXRT_sycl_queue_from_python
     )
 
+    assert (
+        llb.address_of_symbol("DPEXRT_sycl_queue_from_python_borrowed")
+        == runtime._dpexrt_python.DPEXRT_sycl_queue_from_python_borrowed
+    )
+
     assert (
         llb.address_of_symbol("DPEXRT_sycl_queue_to_python")
         == runtime._dpexrt_python.DPEXRT_sycl_queue_to_python
@@ -55,3 +65,18 @@ def test_llvm_symbol_registered():
         llb.address_of_symbol("DPEXRT_MemInfo_fill")
         == runtime._dpexrt_python.DPEXRT_MemInfo_fill
     )
+
+    assert (
+        llb.address_of_symbol("DPEXRT_host_staging_buffer_acquire")
+        == runtime._dpexrt_python.DPEXRT_host_staging_buffer_acquire
+    )
+
+    assert (
+        llb.address_of_symbol("DPEXRT_host_staging_buffer_release")
+        == runtime._dpexrt_python.DPEXRT_host_staging_buffer_release
+    )
+
+    assert (
+        llb.address_of_symbol("DPEXRT_host_staging_pool_clear")
+        == runtime._dpexrt_python.DPEXRT_host_staging_pool_clear
+    )
@@ -0,0 +1,121 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for dpnp reductions along an axis inside dpjit."""
+
+import operator
+from types import SimpleNamespace
+
+import dpnp
+import numpy
+import pytest
+from numba import errors, types
+
+from numba_dpex import dpjit
+from numba_dpex.dpnp_iface.arraymath import _parse_acc_dtype
+from numba_dpex.tests._helper import override_config
+
+shapes = [(1, 1), (3, 7), (1000, 3), (3, 1000), (257, 255)]
+dtypes = [dpnp.int32, dpnp.int64, dpnp.float32, dpnp.float64]
+
+
+@dpjit
+def _sum(a, axis):
+    return dpnp.sum(a, axis=axis)
+
+
+@dpjit
+def _prod(a, axis):
+    return dpnp.prod(a, axis=axis)
+
+
+@dpjit
+def _min(a, axis):
+    return dpnp.min(a, axis=axis)
+
+
+@dpjit
+def _max(a, axis):
+    return dpnp.max(a, axis=axis)
+
+
+@dpjit
+def _mean(a, axis):
+    return dpnp.mean(a, axis=axis)
+
+
+@pytest.mark.parametrize("shape", shapes)
+@pytest.mark.parametrize("dtype", dtypes)
+@pytest.mark.parametrize("axis", [0, 1, -1])
+@pytest.mark.parametrize(
+    "func, np_func",
+    [
+        (_sum, numpy.sum),
+        (_min, numpy.min),
+        (_max, numpy.max),
+        (_mean, numpy.mean),
+    ],
+)
+def test_dpnp_axis_reduction(func, np_func, shape, dtype, axis):
+    """Tests dpnp reductions along an axis against NumPy."""
+    a_np = numpy.arange(numpy.prod(shape), dtype=dtype).reshape(shape) % 97
+    a = dpnp.asarray(a_np)
+
+    c = func(a, axis)
+    expected = np_func(a_np, axis=axis)
+
+    assert c.dtype == expected.dtype
+    assert numpy.allclose(dpnp.asnumpy(c), expected, rtol=1e-5)
+
+
+@pytest.mark.parametrize("khr_group_builtins", [0, 1])
+@pytest.mark.parametrize("axis", [0, 1])
+def test_dpnp_prod_axis(axis, khr_group_builtins):
+    """Tests dpnp.prod() along an axis, on values that keep the products
+    small, both with the group multiply instruction of the
+    SPV_KHR_uniform_group_instructions extension and without it."""
+    a_np = numpy.full((17, 9), 2, dtype=numpy.int64)
+    a_np[::2, ::3] = 1
+    a = dpnp.asarray(a_np)
+
+    # A new function is compiled for every configuration.
+    def prod(a, axis):
+        return dpnp.prod(a, axis=axis)
+
+    with override_config("REDUCTION_KHR_GROUP_BUILTINS", khr_group_builtins):
+        c = dpjit(prod)(a, axis)
+
+    assert numpy.array_equal(dpnp.asnumpy(c), numpy.prod(a_np, axis=axis))
+
+
+def test_dpnp_axis_reduction_empty_slice():
+    """Tests that sum is zero and max raises for empty slices."""
+    a = dpnp.empty((4, 0), dtype=dpnp.float32)
+
+    assert numpy.all(dpnp.asnumpy(_sum(a, 1)) == 0)
+    with pytest.raises(ValueError):
+        _max(a, 1)
+
+
+def test_dpnp_axis_reduction_unsupported_ndim():
+    """Tests that a reduction along an axis of a 3D array is not typed."""
+    a = dpnp.ones((2, 3, 4))
+
+    with pytest.raises(errors.TypingError):
+        _sum(a, 0)
+
+
+@pytest.mark.parametrize(
+    "fp64, expected", [(True, types.float64), (False, types.float32)]
+)
+def test_dpnp_mean_acc_dtype(fp64, expected):
+    """Tests that the mean of integers is accumulated in float32 on devices
+    without float64 support."""
+    queue = SimpleNamespace(device_has_aspect_fp64=fp64)
+
+    acc_dtype = _parse_acc_dtype(
+        "mean", operator.iadd, "add", True, types.int32, queue
+    )
+
+    assert acc_dtype == expected
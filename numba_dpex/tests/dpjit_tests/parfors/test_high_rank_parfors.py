@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for parfors of a rank greater than the three dimensions of a SYCL
+range."""
+
+import dpnp
+import numpy
+import pytest
+
+from numba_dpex import dpjit, prange
+
+shapes = [(2, 3, 4, 5), (3, 1, 4, 2, 5), (2, 2, 3, 2, 3, 2)]
+
+
+@dpjit
+def _add(a, b):
+    return a + b
+
+
+@pytest.mark.parametrize("shape", shapes)
+def test_high_rank_elementwise(shape):
+    """Tests an elementwise parfor over every element of a 4D, 5D and 6D
+    array."""
+    a_np = numpy.arange(numpy.prod(shape), dtype=numpy.float32).reshape(shape)
+    b_np = numpy.ones(shape, dtype=numpy.float32)
+
+    c = _add(dpnp.asarray(a_np), dpnp.asarray(b_np))
+
+    numpy.testing.assert_equal(dpnp.asnumpy(c), a_np + b_np)
+
+
+def test_high_rank_prange():
+    """Tests that every index of a 4D prange loop nest is visited once."""
+
+    @dpjit
+    def f(a):
+        for i in prange(a.shape[0]):
+            for j in prange(a.shape[1]):
+                for k in prange(a.shape[2]):
+                    for m in prange(a.shape[3]):
+                        a[i, j, k, m] += i * 1000 + j * 100 + k * 10 + m
+
+    shape = (3, 4, 5, 6)
+    a = dpnp.zeros(shape, dtype=dpnp.int64)
+    f(a)
+
+    i, j, k, m = numpy.indices(shape)
+    numpy.testing.assert_equal(dpnp.asnumpy(a), i * 1000 + j * 100 + k * 10 + m)
+
+
+def test_high_rank_prange_step():
+    """Tests a 4D prange loop nest whose innermost loop has a step."""
+
+    @dpjit
+    def f(a):
+        for i in prange(a.shape[0]):
+            for j in prange(a.shape[1]):
+                for k in prange(a.shape[2]):
+                    for m in prange(1, a.shape[3], 2):
+                        a[i, j, k, m] = 1
+
+    shape = (2, 3, 4, 7)
+    a = dpnp.zeros(shape, dtype=dpnp.int32)
+    f(a)
+
+    expected = numpy.zeros(shape, dtype=numpy.int32)
+    expected[..., 1::2] = 1
+    numpy.testing.assert_equal(dpnp.asnumpy(a), expected)
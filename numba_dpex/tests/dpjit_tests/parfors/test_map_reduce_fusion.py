@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the fusion of elementwise parfors into the reduction parfors that
+consume their output."""
+
+import dpnp
+import numpy
+import pytest
+
+from numba_dpex import dpjit, prange
+
+
+def _is_fused(func):
+    """Returns True if a parfor of the compiled function was fused with
+    another one."""
+    metadata = next(iter(func.get_metadata().values()))
+    return any(metadata["parfor_diagnostics"].fusion_info.values())
+
+
+@pytest.mark.parametrize("n", [1, 10, 1000])
+def test_fuse_into_sum_reduction(n):
+    """Tests that the producer of the reduced array is fused into a sum
+    reduction."""
+
+    @dpjit
+    def f(a, b):
+        x = (a - b) ** 2
+        s = 0
+        for i in prange(len(x)):
+            s += x[i]
+        return s
+
+    a_np = numpy.arange(n, dtype=numpy.float64)
+    b_np = numpy.ones(n, dtype=numpy.float64)
+
+    s = f(dpnp.asarray(a_np), dpnp.asarray(b_np))
+
+    numpy.testing.assert_allclose(s, ((a_np - b_np) ** 2).sum())
+    assert _is_fused(f)
+
+
+def test_2d_reduction_of_elementwise_result():
+    """Tests a reduction over the shape of a 2D array computed by an
+    elementwise parfor."""
+
+    @dpjit
+    def f(a):
+        x = a * 2 + 1
+        s = 0
+        for i in prange(x.shape[0]):
+            for j in prange(x.shape[1]):
+                s += x[i, j]
+        return s
+
+    a_np = numpy.arange(12 * 7, dtype=numpy.int64).reshape(12, 7)
+
+    s = f(dpnp.asarray(a_np))
+
+    assert s == (a_np * 2 + 1).sum()
+
+
+def test_fuse_keeps_returned_temporary():
+    """Tests that the producer's array is still written when it is used after
+    the reduction."""
+
+    @dpjit
+    def f(a):
+        x = a + 1
+        s = 0
+        for i in prange(len(x)):
+            s += x[i]
+        return x, s
+
+    a_np = numpy.arange(100, dtype=numpy.float32)
+
+    x, s = f(dpnp.asarray(a_np))
+
+    numpy.testing.assert_equal(dpnp.asnumpy(x), a_np + 1)
+    numpy.testing.assert_allclose(s, (a_np + 1).sum())
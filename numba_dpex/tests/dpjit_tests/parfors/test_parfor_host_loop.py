@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the host loops that small parfors on host accessible arrays are
+executed as."""
+
+import dpnp
+import numpy
+import pytest
+from numba import typeof, types
+
+from numba_dpex import dpjit, prange
+from numba_dpex.core.parfors.host_loop_builder import (
+    MAX_PARFOR_HOST_THRESHOLD,
+    host_loop_threshold,
+    is_host_accessible,
+)
+from numba_dpex.tests._helper import override_config
+
+
+@pytest.mark.parametrize("usm_type", ["shared", "host"])
+def test_is_host_accessible(usm_type):
+    """Tests that shared and host USM arrays are accessible from the host."""
+    a = dpnp.ones(10, usm_type=usm_type)
+
+    assert is_host_accessible([typeof(a), types.intp])
+
+
+@pytest.mark.parametrize(
+    "threshold, expected",
+    [
+        (0, 0),
+        (1024, 1024),
+        (MAX_PARFOR_HOST_THRESHOLD + 1, MAX_PARFOR_HOST_THRESHOLD),
+        (1 << 40, MAX_PARFOR_HOST_THRESHOLD),
+    ],
+)
+def test_host_loop_threshold_is_capped(threshold, expected):
+    """Tests that large parfors are offloaded whatever the threshold is, as
+    the host loops are serial."""
+    with override_config("PARFOR_HOST_THRESHOLD", threshold):
+        assert host_loop_threshold() == expected
+
+
+@pytest.mark.parametrize("n", [1, 10, 1023, 1024, 5000])
+@pytest.mark.parametrize("threshold", [0, 1024])
+def test_elementwise_host_loop(n, threshold):
+    """Tests parfors on both sides of the threshold."""
+
+    @dpjit
+    def f(a, b):
+        return a * 2 + b
+
+    a_np = numpy.arange(n, dtype=numpy.float32)
+    b_np = numpy.ones(n, dtype=numpy.float32)
+    a = dpnp.asarray(a_np, usm_type="shared")
+    b = dpnp.asarray(b_np, usm_type="shared")
+
+    with override_config("PARFOR_HOST_THRESHOLD", threshold):
+        c = f(a, b)
+
+    numpy.testing.assert_equal(dpnp.asnumpy(c), a_np * 2 + b_np)
+
+
+@pytest.mark.parametrize("shape", [(3, 4), (40, 50)])
+def test_prange_host_loop(shape):
+    """Tests a strided prange loop nest on shared USM arrays, the small shape
+    runs on the host and the large one on the device."""
+
+    @dpjit
+    def f(a):
+        for i in prange(a.shape[0] - 1, -1, -1):
+            for j in prange(1, a.shape[1], 2):
+                a[i, j] = i * 100 + j
+
+    a = dpnp.zeros(shape, dtype=dpnp.int64, usm_type="shared")
+    with override_config("PARFOR_HOST_THRESHOLD", 100):
+        f(a)
+
+    expected = numpy.zeros(shape, dtype=numpy.int64)
+    i, j = numpy.indices(shape)
+    expected[:, 1::2] = (i * 100 + j)[:, 1::2]
+    numpy.testing.assert_equal(dpnp.asnumpy(a), expected)
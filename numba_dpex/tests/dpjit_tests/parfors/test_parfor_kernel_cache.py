@@ -0,0 +1,109 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the reuse of the compiled kernels of structurally identical
+parfors."""
+
+import dpnp
+import numpy
+import pytest
+
+from numba_dpex import dpjit, prange
+from numba_dpex.core.parfors.parfor_kernel_cache import parfor_kernel_cache
+from numba_dpex.tests._helper import override_config
+
+
+@pytest.fixture
+def kernel_cache():
+    parfor_kernel_cache.clear()
+    yield parfor_kernel_cache
+    parfor_kernel_cache.clear()
+
+
+def test_elementwise_kernel_is_reused(kernel_cache):
+    """Tests that the same elementwise operation in two functions with
+    differently named variables shares the kernel."""
+
+    @dpjit
+    def f(a, b):
+        return a + b
+
+    @dpjit
+    def g(x, y):
+        return x + y
+
+    a = dpnp.arange(100, dtype=dpnp.float32)
+    b = dpnp.ones(100, dtype=dpnp.float32)
+
+    c = f(a, b)
+    misses = kernel_cache.misses
+    d = g(b, a)
+
+    assert kernel_cache.hits > 0
+    assert kernel_cache.misses == misses
+    expected = numpy.arange(100, dtype=numpy.float32) + 1
+    numpy.testing.assert_equal(dpnp.asnumpy(c), expected)
+    numpy.testing.assert_equal(dpnp.asnumpy(d), expected)
+
+
+def test_reduction_kernels_are_reused(kernel_cache):
+    """Tests that the kernels of a prange reduction are shared by two
+    functions."""
+
+    def make_sum():
+        @dpjit
+        def prange_sum(a):
+            s = 0
+            for i in prange(a.shape[0]):
+                s += a[i]
+            return s
+
+        return prange_sum
+
+    a = dpnp.arange(1000, dtype=dpnp.int64)
+
+    s1 = make_sum()(a)
+    hits = kernel_cache.hits
+    s2 = make_sum()(a)
+
+    assert kernel_cache.hits > hits
+    assert s1 == s2 == numpy.arange(1000).sum()
+
+
+def test_different_types_are_not_shared(kernel_cache):
+    """Tests that the same parfor on different dtypes is compiled for every
+    dtype."""
+
+    @dpjit
+    def f(a, b):
+        return a * b
+
+    for dtype in [dpnp.int32, dpnp.float32, dpnp.float64]:
+        a = dpnp.arange(10, dtype=dtype)
+        c = f(a, a)
+        numpy.testing.assert_equal(
+            dpnp.asnumpy(c), numpy.arange(10, dtype=dtype) ** 2
+        )
+
+    assert kernel_cache.hits == 0
+
+
+def test_disabled_cache(kernel_cache):
+    """Tests that no kernel is reused if the cache size is set to 0."""
+
+    @dpjit
+    def f(a):
+        return a - 1
+
+    @dpjit
+    def g(a):
+        return a - 1
+
+    a = dpnp.arange(10)
+    with override_config("PARFOR_KERNEL_CACHE_SIZE", 0):
+        f(a)
+        g(a)
+
+    assert kernel_cache.hits == 0
+    assert len(kernel_cache) == 0
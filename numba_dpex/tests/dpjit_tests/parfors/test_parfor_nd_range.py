@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for parfor kernels submitted as nd-range kernels with a padded global
+range."""
+
+import dpnp
+import numpy
+import pytest
+
+from numba_dpex import dpjit, prange
+from numba_dpex.core.parfors.kernel_builder import _nd_range_dim
+from numba_dpex.tests._helper import override_config
+
+shapes = [(1,), (1000,), (17, 33), (3, 300), (300, 3), (3, 5, 7), (2, 3, 4, 5)]
+
+
+@pytest.mark.parametrize(
+    "extent, budget, expected",
+    [
+        (0, 256, (0, 1)),
+        (1, 256, (1, 1)),
+        (5, 256, (8, 8)),
+        (1000, 256, (1024, 256)),
+        (1000, 1, (1000, 1)),
+        (3, 64, (4, 4)),
+    ],
+)
+def test_nd_range_dim(extent, budget, expected):
+    """Tests the selection of the padded global size and the local size of a
+    dimension."""
+    assert _nd_range_dim(extent, budget) == expected
+
+
+@pytest.mark.parametrize("shape", shapes)
+@pytest.mark.parametrize("nd_range", [0, 1])
+def test_elementwise_padded(shape, nd_range):
+    """Tests that the padding work-items of an nd-range parfor kernel do not
+    write outside of the arrays."""
+
+    @dpjit
+    def f(a, b):
+        return a * 2 + b
+
+    a_np = numpy.arange(numpy.prod(shape), dtype=numpy.float32).reshape(shape)
+    b_np = numpy.ones(shape, dtype=numpy.float32)
+
+    with override_config("PARFOR_ND_RANGE", nd_range):
+        c = f(dpnp.asarray(a_np), dpnp.asarray(b_np))
+
+    numpy.testing.assert_equal(dpnp.asnumpy(c), a_np * 2 + b_np)
+
+
+@pytest.mark.parametrize("max_wg_size", [1, 16, 1024])
+def test_prange_work_group_size(max_wg_size):
+    """Tests a strided prange loop nest with different work-group sizes."""
+
+    @dpjit
+    def f(a):
+        for i in prange(a.shape[0]):
+            for j in prange(1, a.shape[1], 3):
+                a[i, j] = i + j
+
+    shape = (37, 101)
+    a = dpnp.zeros(shape, dtype=dpnp.int64)
+    with override_config("PARFOR_MAX_WORK_GROUP_SIZE", max_wg_size):
+        f(a)
+
+    expected = numpy.zeros(shape, dtype=numpy.int64)
+    i, j = numpy.indices(shape)
+    expected[:, 1::3] = (i + j)[:, 1::3]
+    numpy.testing.assert_equal(dpnp.asnumpy(a), expected)
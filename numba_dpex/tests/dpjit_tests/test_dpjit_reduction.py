@@ -2,13 +2,25 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import operator
+from types import SimpleNamespace
+
 import dpnp
 import numba as nb
 import numpy
 import pytest
+from numba.core import types
+from numba.extending import intrinsic
 
 import numba_dpex as dpex
-from numba_dpex.tests._helper import get_all_dtypes
+from numba_dpex.core import config
+from numba_dpex.core.parfors.kernel_templates.reduction_template import (
+    _generate_work_group_reduce,
+)
+from numba_dpex.core.parfors.reduction_helper import _select_work_group_size
+from numba_dpex.core.runtime.context import DpexRTContext
+from numba_dpex.core.targets.dpjit_target import DPEX_TARGET_NAME
+from numba_dpex.tests._helper import get_all_dtypes, override_config
 
 N = 10
 
@@ -51,6 +63,18 @@ def vecadd_prange_float(a, b):
     return s - t
 
 
+@dpex.dpjit
+def vec_multi_reduction_prange(a, b):
+    s = a.dtype.type(0)
+    t = a.dtype.type(1)
+    u = numpy.float64(0)
+    for i in nb.prange(a.shape[0]):
+        s += a[i] + b[i]
+        t *= a[i] + b[i]
+        u += a[i] * b[i]
+    return s, t, u
+
+
 @pytest.fixture(
     params=get_all_dtypes(
         no_bool=True, no_float16=True, no_none=True, no_complex=True
@@ -105,3 +129,179 @@ def test_dpjit_array_arg_types_mul(input_arrays):
     c = vecmul_prange(a, b)
 
     assert s == c
+
+
+def test_dpjit_multiple_reduction_variables(input_arrays):
+    """Tests a prange loop with several reduction variables of different
+    types, whose results are copied back to the host in a single batch.
+
+    Args:
+        input_arrays (dpnp.ndarray): Array arguments to be passed to a kernel.
+    """
+    a, b = input_arrays
+
+    s, t, u = vec_multi_reduction_prange(a, b)
+
+    assert s == 55
+    assert t == 3628800
+    assert u == 45
+
+
+@intrinsic(target=DPEX_TARGET_NAME)
+def _host_staging_pool_size(
+    typingctx,  # pylint: disable=W0613
+):
+    sig = types.int64()
+
+    def codegen(ctx, builder, sig, llargs):  # pylint: disable=W0613
+        return DpexRTContext(ctx).host_staging_pool_size(builder)
+
+    return sig, codegen
+
+
+@intrinsic(target=DPEX_TARGET_NAME)
+def _host_staging_pool_clear(
+    typingctx,  # pylint: disable=W0613
+):
+    sig = types.void()
+
+    def codegen(ctx, builder, sig, llargs):  # pylint: disable=W0613
+        DpexRTContext(ctx).host_staging_pool_clear(builder)
+        return ctx.get_dummy_value()
+
+    return sig, codegen
+
+
+@dpex.dpjit
+def host_staging_pool_size():
+    return _host_staging_pool_size()  # pylint: disable=E1120
+
+
+@dpex.dpjit
+def host_staging_pool_clear():
+    _host_staging_pool_clear()  # pylint: disable=E1120
+
+
+def test_host_staging_pool_clear(input_arrays):
+    """Tests that clearing the staging pool frees the buffers that the
+    reductions released, and that later reductions allocate new ones."""
+    a, b = input_arrays
+
+    vec_multi_reduction_prange(a, b)
+    assert host_staging_pool_size() >= 1
+
+    host_staging_pool_clear()
+    assert host_staging_pool_size() == 0
+
+    s, _, _ = vec_multi_reduction_prange(a, b)
+    assert s == 55
+    assert host_staging_pool_size() == 1
+
+
+@pytest.mark.parametrize("size", [1, 7, 255, 1000, 4097, 1 << 20, 3_000_017])
+def test_dpjit_reduction_sizes(size):
+    """Tests reductions over sizes that are smaller than, not a multiple of,
+    and much larger than the work-group size of the reduction kernels, so
+    that the partial sums are reduced by several work-items of the final
+    reduction kernel.
+    """
+    a = dpnp.ones(size, dtype=dpnp.int64)
+    b = dpnp.zeros(size, dtype=dpnp.int64)
+
+    assert vecadd_prange2(a, a) == size
+
+    s, t, u = vec_multi_reduction_prange(a, b)
+    assert s == size
+    assert t == 1
+    assert u == 0
+
+
+def test_reduction_work_group_size():
+    """Tests that the work-group size of the reduction kernels is a power of
+    two that the device supports."""
+    device = dpnp.empty(1).sycl_device
+    wg_size = _select_work_group_size(
+        device.filter_string, config.REDUCTION_MAX_WORK_GROUP_SIZE
+    )
+
+    assert wg_size & (wg_size - 1) == 0
+    assert wg_size <= device.max_work_group_size
+
+
+@pytest.mark.parametrize("group_builtins", [0, 1])
+def test_dpjit_reduction_group_builtins(group_builtins):
+    """Tests reductions that combine work-group values either by SPIR-V group
+    reduce instructions or by a tree reduction in local memory.
+    """
+
+    def prange_sum_prod(a):
+        s = a.dtype.type(0)
+        t = a.dtype.type(1)
+        for i in nb.prange(a.shape[0]):
+            s += a[i]
+            t *= a[i]
+        return s, t
+
+    a = dpnp.ones(4097, dtype=dpnp.float32)
+    with override_config("REDUCTION_GROUP_BUILTINS", group_builtins):
+        s, t = dpex.dpjit(prange_sum_prod)(a)
+
+    assert s == 4097
+    assert t == 1
+
+
+@pytest.mark.parametrize("khr_group_builtins", [0, 1])
+def test_mul_reduction_uses_tree_without_khr_group_builtins(
+    khr_group_builtins,
+):
+    """Tests that a ``*=`` reduction, whose group instruction requires the
+    SPV_KHR_uniform_group_instructions extension, is combined by a tree
+    reduction unless REDUCTION_KHR_GROUP_BUILTINS is set, while a ``+=``
+    reduction always uses a group reduce instruction.
+    """
+    parfor_reddict = {
+        "s": SimpleNamespace(redop=operator.iadd),
+        "t": SimpleNamespace(redop=operator.imul),
+    }
+    typemap = {"s": types.float32, "t": types.float32}
+    with override_config("REDUCTION_KHR_GROUP_BUILTINS", khr_group_builtins):
+        txt, results = _generate_work_group_reduce(
+            ["s", "t"],
+            {"s": "s", "t": "t"},
+            parfor_reddict,
+            typemap,
+            {"s": "s_local", "t": "t_local"},
+        )
+
+    assert 's = group_reduce(group, s, "add")' in txt
+    if khr_group_builtins:
+        assert 't = group_reduce(group, t, "mul")' in txt
+        assert results["t"] == "t"
+    else:
+        assert "group_reduce(group, t" not in txt
+        assert "t_local[local_id0] *= t_local[local_id0 + stride0]" in txt
+        assert results["t"] == "t_local[0]"
+
+
+@pytest.mark.parametrize("shape", [(3, 5), (64, 129), (7, 11, 13)])
+def test_dpjit_reduction_multi_dimensional(shape):
+    """Tests reductions over multi-dimensional arrays and over nested prange
+    loops, whose iteration space is linearized by the reduction kernels.
+    """
+
+    def nested_prange_sum(a):
+        s = a.dtype.type(0)
+        for i in nb.prange(a.shape[0]):
+            for j in nb.prange(a.shape[1]):
+                s += a[i, j]
+        return s
+
+    def array_sum(a):
+        return a.sum()
+
+    a = dpnp.arange(numpy.prod(shape), dtype=dpnp.int64).reshape(shape)
+    expected = numpy.prod(shape) * (numpy.prod(shape) - 1) // 2
+
+    assert dpex.dpjit(array_sum)(a) == expected
+    if len(shape) == 2:
+        assert dpex.dpjit(nested_prange_sum)(a) == expected
@@ -50,3 +50,20 @@ def test_range_kernel_call3D():
     kapi.call_kernel(vecadd, kapi.NdRange((8, 8, 8), (2, 2, 2)), a, b, c)
 
     assert numpy.allclose(c, a + b)
+
+
+def test_group_barrier_in_ndrange_kernel():
+    def reverse(item: kapi.NdItem, a, slm):
+        i = item.get_local_id(0)
+        n = item.get_local_range(0)
+        slm[i] = a[item.get_global_id(0)]
+        kapi.group_barrier(item.get_group())
+        a[item.get_global_id(0)] = slm[n - 1 - i]
+
+    a = numpy.arange(64)
+    slm = kapi.LocalAccessor(16, a.dtype)
+
+    kapi.call_kernel(reverse, kapi.NdRange((64,), (16,)), a, slm)
+
+    expected = numpy.arange(64).reshape(4, 16)[:, ::-1].ravel()
+    assert numpy.array_equal(a, expected)
@@ -0,0 +1,127 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests the asynchronous work-group copies between global and local memory in
+compiled kernels and in the kernel_api simulator."""
+
+import dpnp
+import numpy as np
+import pytest
+
+import numba_dpex as dpex
+from numba_dpex import kernel_api as kapi
+from numba_dpex.kernel_api import LocalAccessor, NdItem, NdRange
+from numba_dpex.kernel_api import call_kernel as kapi_call_kernel
+from numba_dpex.tests._helper import has_cpu
+
+_SIZE = 64
+_GROUP_SIZE = 16
+
+
+_kernel_decorators = [(dpex.call_kernel, dpex.kernel)]
+# run simulator tests only with arrays allocated on cpu to avoid performance
+# issues
+if has_cpu():
+    _kernel_decorators.append((kapi_call_kernel, lambda a: a))
+
+
+@pytest.fixture(params=_kernel_decorators)
+def call_kernel_decorator(request):
+    return request.param
+
+
+def copy_to_local(nd_item: NdItem, a, b, slm):
+    gr = nd_item.get_group()
+    n = nd_item.get_local_range(0)
+    event = kapi.async_work_group_copy(
+        gr, slm, a, n, 1, 0, gr.get_group_id(0) * n
+    )
+    kapi.wait_for(gr, event)
+
+    b[nd_item.get_global_id(0)] = slm[n - 1 - nd_item.get_local_id(0)]
+
+
+def strided_copy_to_local(nd_item: NdItem, a, b, slm):
+    gr = nd_item.get_group()
+    n = nd_item.get_local_range(0)
+    event = kapi.async_work_group_copy(
+        gr, slm, a, n, 2, 0, gr.get_group_id(0) * n * 2
+    )
+    kapi.wait_for(gr, event)
+
+    b[nd_item.get_global_id(0)] = slm[nd_item.get_local_id(0)]
+
+
+def chained_copy_to_local(nd_item: NdItem, a, b, slm):
+    gr = nd_item.get_group()
+    n = nd_item.get_local_range(0)
+    half = n // 2
+    offset = gr.get_group_id(0) * n
+    event = kapi.async_work_group_copy(gr, slm, a, half, 1, half, offset)
+    event = kapi.async_work_group_copy(
+        gr, slm, a, half, 1, 0, offset + half, event
+    )
+    kapi.wait_for(gr, event)
+
+    b[nd_item.get_global_id(0)] = slm[nd_item.get_local_id(0)]
+
+
+def _reversed_groups(a):
+    return a.reshape(-1, _GROUP_SIZE)[:, ::-1].reshape(-1)
+
+
+def _swapped_halves(a):
+    groups = a.reshape(-1, 2, _GROUP_SIZE // 2)
+    return groups[:, ::-1, :].reshape(-1)
+
+
+@pytest.mark.parametrize(
+    "kernel_func, src_size, reference",
+    [
+        (copy_to_local, _SIZE, _reversed_groups),
+        (strided_copy_to_local, 2 * _SIZE, lambda a: a[::2]),
+        (chained_copy_to_local, _SIZE, _swapped_halves),
+    ],
+)
+def test_copy_to_local(call_kernel_decorator, kernel_func, src_size, reference):
+    call_kernel, decorator = call_kernel_decorator
+    a = dpnp.arange(src_size, dtype=dpnp.float32)
+    b = dpnp.zeros(_SIZE, dtype=dpnp.float32)
+    slm = LocalAccessor(_GROUP_SIZE, dtype=np.float32)
+
+    call_kernel(
+        decorator(kernel_func), NdRange((_SIZE,), (_GROUP_SIZE,)), a, b, slm
+    )
+
+    np.testing.assert_equal(dpnp.asnumpy(b), reference(dpnp.asnumpy(a)))
+
+
+def strided_copy_to_global(nd_item: NdItem, a, b, slm):
+    gr = nd_item.get_group()
+    n = nd_item.get_local_range(0)
+    offset = gr.get_group_id(0) * n
+    event = kapi.async_work_group_copy(gr, slm, a, n, 1, 0, offset)
+    kapi.wait_for(gr, event)
+
+    event = kapi.async_work_group_copy(gr, b, slm, n, 2, offset * 2, 0)
+    kapi.wait_for(gr, event)
+
+
+def test_strided_copy_to_global(call_kernel_decorator):
+    call_kernel, decorator = call_kernel_decorator
+    a = dpnp.arange(_SIZE, dtype=dpnp.int64)
+    b = dpnp.zeros(2 * _SIZE, dtype=dpnp.int64)
+    slm = LocalAccessor(_GROUP_SIZE, dtype=np.int64)
+
+    call_kernel(
+        decorator(strided_copy_to_global),
+        NdRange((_SIZE,), (_GROUP_SIZE,)),
+        a,
+        b,
+        slm,
+    )
+
+    expected = np.zeros(2 * _SIZE, dtype=np.int64)
+    expected[::2] = np.arange(_SIZE)
+    np.testing.assert_equal(dpnp.asnumpy(b), expected)
@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+import sys
+
+import dpnp
+
+import numba_dpex as dpex
+from numba_dpex import kernel_api as kapi
+
+N = 1024
+
+_OWNING_UNBOX_REGEX = re.compile(r"@DPEXRT_sycl_usm_ndarray_from_python\(")
+
+
+@dpex.kernel
+def vecadd_kernel(item: kapi.Item, a, b, c):
+    i = item.get_id(0)
+    c[i] = a[i] + b[i]
+
+
+def test_call_kernel_does_not_retain_arguments():
+    """Checks that call_kernel unboxes its arguments as borrowed references,
+    i.e., the kernel runs correctly and no reference to the arguments is left
+    behind once the call returns."""
+    a = dpnp.ones(N)
+    b = dpnp.ones(N)
+    c = dpnp.zeros(N)
+
+    # Warm up, so that compilation does not affect the reference counts.
+    dpex.call_kernel(vecadd_kernel, dpex.Range(N), a, b, c)
+
+    refcounts = [sys.getrefcount(x) for x in (a, b, c)]
+    for _ in range(10):
+        dpex.call_kernel(vecadd_kernel, dpex.Range(N), a, b, c)
+
+    assert [sys.getrefcount(x) for x in (a, b, c)] == refcounts
+    assert dpnp.all(c == 2)
+
+
+def test_call_kernel_unboxes_borrowed_arguments():
+    """Checks that the CPython wrapper of call_kernel unboxes the USM arrays
+    with the borrowed runtime function, which does not allocate a meminfo,
+    while the wrapper of call_kernel_async keeps the owning one."""
+    a = dpnp.ones(N)
+    b = dpnp.ones(N)
+    c = dpnp.zeros(N)
+
+    dpex.call_kernel(vecadd_kernel, dpex.Range(N), a, b, c)
+    dpex.call_kernel_async(vecadd_kernel, dpex.Range(N), (), a, b, c)[0].wait()
+
+    sync_ir = "".join(dpex.call_kernel.inspect_llvm().values())
+    async_ir = "".join(dpex.call_kernel_async.inspect_llvm().values())
+
+    assert "@DPEXRT_sycl_usm_ndarray_from_python_borrowed(" in sync_ir
+    assert not _OWNING_UNBOX_REGEX.search(sync_ir)
+    assert "@DPEXRT_sycl_usm_ndarray_from_python_borrowed(" not in async_ir
+    assert _OWNING_UNBOX_REGEX.search(async_ir)
+
+
+def test_call_kernel_async_keeps_arguments_alive():
+    """Checks that call_kernel_async still owns references to its arguments
+    until the kernel finishes."""
+    a = dpnp.ones(N)
+    b = dpnp.ones(N)
+    c = dpnp.zeros(N)
+
+    host_event, kernel_event = dpex.call_kernel_async(
+        vecadd_kernel, dpex.Range(N), (), a, b, c
+    )
+    host_event.wait()
+    kernel_event.wait()
+
+    assert dpnp.all(c == 2)
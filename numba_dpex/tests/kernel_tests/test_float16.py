@@ -0,0 +1,124 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests float16 arrays and the bfloat16 conversion functions in compiled
+kernels and in the kernel_api simulator."""
+
+import math
+
+import dpctl
+import dpnp
+import numpy as np
+import pytest
+from numba.core import datamodel, types
+from numba.core.errors import TypingError
+
+import numba_dpex as dpex
+from numba_dpex import kernel_api as kapi
+from numba_dpex.kernel_api import AtomicRef, Item, Range
+from numba_dpex.kernel_api import call_kernel as kapi_call_kernel
+from numba_dpex.tests._helper import has_cpu, skip_if_dtype_not_supported
+
+_SIZE = 64
+
+
+_kernel_decorators = [(dpex.call_kernel, dpex.kernel)]
+# run simulator tests only with arrays allocated on cpu to avoid performance
+# issues
+if has_cpu():
+    _kernel_decorators.append((kapi_call_kernel, lambda a: a))
+
+
+@pytest.fixture(params=_kernel_decorators)
+def call_kernel_decorator(request):
+    return request.param
+
+
+@pytest.fixture
+def skip_no_fp16():
+    skip_if_dtype_not_supported(dpnp.float16, dpctl.SyclDevice())
+
+
+def axpy(item: Item, a, x, y, out):
+    i = item.get_id(0)
+    out[i] = a[0] * x[i] + y[i]
+
+
+def test_float16_arithmetic(call_kernel_decorator, skip_no_fp16):
+    call_kernel, decorator = call_kernel_decorator
+    a = dpnp.full(1, 0.5, dtype=dpnp.float16)
+    x = dpnp.arange(_SIZE, dtype=dpnp.float16)
+    y = dpnp.ones(_SIZE, dtype=dpnp.float16)
+    out = dpnp.zeros(_SIZE, dtype=dpnp.float16)
+
+    call_kernel(decorator(axpy), Range(_SIZE), a, x, y, out)
+
+    expected = np.float16(0.5) * np.arange(_SIZE, dtype=np.float16) + 1
+    np.testing.assert_allclose(dpnp.asnumpy(out), expected, rtol=1e-3)
+
+
+def test_numba_float_model_unchanged():
+    """Checks that float16 is only supported by the data model manager of the
+    kernels, and that the data model manager of Numba's CPU target, which is
+    shared with dpjit functions, still rejects it."""
+    with pytest.raises(NotImplementedError):
+        datamodel.default_manager.lookup(types.float16)
+
+
+def sqrt_kernel(item: Item, a, b):
+    i = item.get_id(0)
+    b[i] = math.sqrt(a[i])
+
+
+def test_float16_math_function(skip_no_fp16):
+    a = dpnp.arange(_SIZE, dtype=dpnp.float16)
+    b = dpnp.zeros(_SIZE, dtype=dpnp.float16)
+
+    dpex.call_kernel(dpex.kernel(sqrt_kernel), Range(_SIZE), a, b)
+
+    expected = np.sqrt(np.arange(_SIZE, dtype=np.float16))
+    np.testing.assert_allclose(dpnp.asnumpy(b), expected, rtol=1e-3)
+
+
+def atomic_load(item: Item, a):
+    a[item.get_id(0)] = AtomicRef(a, 0).load()
+
+
+def test_float16_atomic_load_typing_error(skip_no_fp16):
+    """A negative test that verifies that a TypingError is raised for the
+    atomic operations that have no float16 SPIR-V instruction."""
+    a = dpnp.zeros(_SIZE, dtype=dpnp.float16)
+
+    with pytest.raises(TypingError):
+        dpex.call_kernel(dpex.kernel(atomic_load), Range(_SIZE), a)
+
+
+def bfloat16_round_trip(item: Item, a, bits, b):
+    i = item.get_id(0)
+    bits[i] = kapi.float32_to_bfloat16(a[i])
+    b[i] = kapi.bfloat16_to_float32(bits[i])
+
+
+def test_bfloat16_conversions(call_kernel_decorator):
+    call_kernel, decorator = call_kernel_decorator
+    values = np.array(
+        [1.0, 3.14159, -2.5, np.inf, np.nan, 1.00390625, 1.01171875, 3.4e38],
+        dtype=np.float32,
+    )
+    a = dpnp.asarray(values)
+    bits = dpnp.zeros(values.size, dtype=dpnp.uint16)
+    b = dpnp.zeros(values.size, dtype=dpnp.float32)
+
+    call_kernel(decorator(bfloat16_round_trip), Range(values.size), a, bits, b)
+
+    np.testing.assert_equal(
+        dpnp.asnumpy(bits),
+        np.array(
+            [0x3F80, 0x4049, 0xC020, 0x7F80, 0x7FC0, 0x3F80, 0x3F82, 0x7F80],
+            dtype=np.uint16,
+        ),
+    )
+    np.testing.assert_equal(
+        dpnp.asnumpy(b), kapi.bfloat16_to_float32(dpnp.asnumpy(bits))
+    )
@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests the work-group collective functions in compiled kernels and in the
+kernel_api simulator."""
+
+import dpnp
+import numpy as np
+import pytest
+
+import numba_dpex as dpex
+from numba_dpex import kernel_api as kapi
+from numba_dpex.kernel_api import NdItem, NdRange
+from numba_dpex.kernel_api import call_kernel as kapi_call_kernel
+from numba_dpex.tests._helper import has_cpu
+
+_SIZE = 64
+_GROUP_SIZE = 16
+
+
+_kernel_decorators = [(dpex.call_kernel, dpex.kernel)]
+# run simulator tests only with arrays allocated on cpu to avoid performance
+# issues
+if has_cpu():
+    _kernel_decorators.append((kapi_call_kernel, lambda a: a))
+
+
+@pytest.fixture(params=_kernel_decorators)
+def call_kernel_decorator(request):
+    return request.param
+
+
+def reduce_add(nd_item: NdItem, a, b):
+    i = nd_item.get_global_id(0)
+    b[i] = kapi.reduce_over_group(nd_item.get_group(), a[i], "add")
+
+
+def reduce_max(nd_item: NdItem, a, b):
+    i = nd_item.get_global_id(0)
+    b[i] = kapi.reduce_over_group(nd_item.get_group(), a[i], "max")
+
+
+def inclusive_scan_add(nd_item: NdItem, a, b):
+    i = nd_item.get_global_id(0)
+    b[i] = kapi.inclusive_scan_over_group(nd_item.get_group(), a[i], "add")
+
+
+def exclusive_scan_add(nd_item: NdItem, a, b):
+    i = nd_item.get_global_id(0)
+    b[i] = kapi.exclusive_scan_over_group(nd_item.get_group(), a[i], "add")
+
+
+def broadcast(nd_item: NdItem, a, b):
+    i = nd_item.get_global_id(0)
+    b[i] = kapi.group_broadcast(nd_item.get_group(), a[i], 3)
+
+
+def _by_group(func, a):
+    return np.concatenate(
+        [func(g) for g in a.reshape(-1, _GROUP_SIZE)]
+    ).reshape(a.shape)
+
+
+@pytest.mark.parametrize(
+    "kernel_func, reference",
+    [
+        (reduce_add, lambda g: np.full_like(g, g.sum())),
+        (reduce_max, lambda g: np.full_like(g, g.max())),
+        (inclusive_scan_add, np.cumsum),
+        (exclusive_scan_add, lambda g: np.cumsum(g) - g),
+        (broadcast, lambda g: np.full_like(g, g[3])),
+    ],
+)
+@pytest.mark.parametrize("dtype", [dpnp.int32, dpnp.int64, dpnp.float64])
+def test_group_algorithm(call_kernel_decorator, kernel_func, reference, dtype):
+    call_kernel, decorator = call_kernel_decorator
+    a = dpnp.arange(_SIZE, dtype=dtype)
+    b = dpnp.zeros(_SIZE, dtype=dtype)
+
+    call_kernel(decorator(kernel_func), NdRange((_SIZE,), (_GROUP_SIZE,)), a, b)
+
+    a_np = dpnp.asnumpy(a)
+    np.testing.assert_allclose(dpnp.asnumpy(b), _by_group(reference, a_np))
+
+
+def broadcast_2d(nd_item: NdItem, a):
+    i = nd_item.get_global_id(0)
+    j = nd_item.get_global_id(1)
+    a[i, j] = kapi.group_broadcast(
+        nd_item.get_group(), nd_item.get_local_linear_id(), 5
+    )
+
+
+def test_group_broadcast_2d(call_kernel_decorator):
+    call_kernel, decorator = call_kernel_decorator
+    a = dpnp.zeros((8, 12), dtype=dpnp.int64)
+
+    call_kernel(decorator(broadcast_2d), NdRange((8, 12), (4, 6)), a)
+
+    assert np.all(dpnp.asnumpy(a) == 5)
+
+
+def test_simulator_divergent_collective():
+    """Tests that the simulator reports a collective function that is not
+    called by all work-items of a work-group."""
+
+    def kernel(nd_item: NdItem, a):
+        if nd_item.get_local_id(0) == 0:
+            return
+        kapi.reduce_over_group(nd_item.get_group(), 1, "add")
+
+    with pytest.raises(RuntimeError):
+        kapi_call_kernel(kernel, NdRange((8,), (4,)), np.zeros(8))
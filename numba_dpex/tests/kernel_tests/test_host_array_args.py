@@ -0,0 +1,156 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import dpnp
+import numpy
+import pytest
+from numba import typeof
+
+import numba_dpex as dpex
+from numba_dpex import DpctlSyclQueue, DpnpNdArray
+from numba_dpex import kernel_api as kapi
+from numba_dpex.core import config
+from numba_dpex.core.host_array_cache import (
+    HostArrayTransferCache,
+    _find_written_params,
+    get_default_cache,
+    mark_host_array_dirty,
+    mirror_type,
+)
+
+N = 1024
+
+
+@dpex.kernel
+def vecadd_kernel(item: kapi.Item, a, b, c):
+    i = item.get_id(0)
+    c[i] = a[i] + b[i]
+
+
+@dpex.kernel
+def inplace_kernel(item: kapi.Item, a):
+    i = item.get_id(0)
+    a[i] += 1
+
+
+@pytest.fixture
+def host_array_args(monkeypatch):
+    monkeypatch.setattr(config, "HOST_ARRAY_ARGS", 1)
+    yield
+    get_default_cache().clear()
+
+
+def test_written_params_analysis():
+    """Checks that only the arrays written to by a kernel are reported."""
+    assert _find_written_params(vecadd_kernel.py_func) == frozenset((3,))
+    assert _find_written_params(inplace_kernel.py_func) == frozenset((1,))
+
+
+def test_numpy_array_args(host_array_args):
+    """Checks that NumPy arrays can be passed to call_kernel and that the
+    written array is copied back to the host."""
+    a = numpy.ones(N)
+    b = numpy.ones(N)
+    c = numpy.zeros(N)
+
+    dpex.call_kernel(vecadd_kernel, dpex.Range(N), a, b, c)
+
+    assert numpy.all(c == 2)
+    assert numpy.all(a == 1)
+
+
+def test_typing_numpy_array_does_not_transfer(host_array_args):
+    """Checks that typing a NumPy argument gives the type of its device copy
+    without uploading the array."""
+    a = numpy.ones((4, N), order="F")
+
+    typ = vecadd_kernel.typeof_pyval(a)
+
+    assert isinstance(typ, DpnpNdArray)
+    assert len(get_default_cache()) == 0
+
+    mirror = get_default_cache().to_device(a, dpnp.empty(1).sycl_queue)
+    assert typeof(mirror) == mirror_type(
+        typeof(a), DpctlSyclQueue(mirror.sycl_queue)
+    )
+
+
+def test_read_only_inputs_are_cached(host_array_args):
+    """Checks that unchanged inputs are uploaded once and that marking an
+    input dirty forces a new upload."""
+    cache = get_default_cache()
+    a = numpy.ones(N)
+    b = numpy.ones(N)
+    c = numpy.zeros(N)
+
+    dpex.call_kernel(vecadd_kernel, dpex.Range(N), a, b, c)
+    entries = len(cache)
+
+    dpex.call_kernel(vecadd_kernel, dpex.Range(N), a, b, c)
+    assert len(cache) == entries
+
+    a[:] = 2
+    mark_host_array_dirty(a)
+    dpex.call_kernel(vecadd_kernel, dpex.Range(N), a, b, c)
+
+    assert numpy.all(c == 3)
+
+
+def test_inplace_update_is_visible_on_host(host_array_args):
+    """Checks that repeated in-place kernel updates accumulate on the host."""
+    a = numpy.zeros(N, dtype=numpy.int64)
+
+    dpex.call_kernel(inplace_kernel, dpex.Range(N), a)
+    dpex.call_kernel(inplace_kernel, dpex.Range(N), a)
+
+    assert numpy.all(a == 2)
+
+
+def test_cache_entry_evicted_with_host_array():
+    """Checks that cache entries do not outlive the host buffer."""
+    cache = HostArrayTransferCache()
+    queue = dpnp.empty(1).sycl_queue
+    a = numpy.ones(N)
+
+    mirror = cache.to_device(a, queue)
+    assert cache.to_device(a, queue) is mirror
+    assert len(cache) == 1
+
+    del a
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used():
+    """Checks that the cache stays within its byte budget by dropping the
+    least recently used device copies."""
+    a = numpy.ones(N)
+    cache = HostArrayTransferCache(max_bytes=2 * a.nbytes)
+    queue = dpnp.empty(1).sycl_queue
+    b = numpy.ones(N)
+    c = numpy.ones(N)
+
+    mirror_a = cache.to_device(a, queue)
+    cache.to_device(b, queue)
+    assert cache.to_device(a, queue) is mirror_a
+
+    cache.to_device(c, queue)
+
+    assert len(cache) == 2
+    assert cache.nbytes == 2 * a.nbytes
+    assert cache.to_device(a, queue) is mirror_a
+
+
+def test_mirror_queue_follows_all_args(host_array_args):
+    """Checks that a NumPy argument preceding a USM array is typed with the
+    queue of the USM array, which is the queue its copy is allocated on."""
+    a = numpy.ones(N)
+    b = dpnp.ones(N)
+    c = numpy.zeros(N)
+
+    dpex.call_kernel(vecadd_kernel, dpex.Range(N), a, b, c)
+
+    assert numpy.all(c == 2)
+    for sig in vecadd_kernel.overloads:
+        if isinstance(sig[2], DpnpNdArray):
+            assert sig[1].queue == sig[2].queue
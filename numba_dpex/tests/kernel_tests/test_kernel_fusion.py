@@ -0,0 +1,128 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import dpnp
+import numpy as np
+import pytest
+
+import numba_dpex as dpex
+from numba_dpex import kernel_api as kapi
+from numba_dpex.kernel_api import Item, LocalAccessor, NdItem, NdRange, Range
+
+_SIZE = 128
+_GROUP_SIZE = 16
+
+
+@dpex.kernel
+def scale(item: Item, x, tmp):
+    i = item.get_id(0)
+    tmp[i] = 2 * x[i]
+
+
+@dpex.kernel
+def shift(it: Item, tmp, y):
+    i = it.get_id(0)
+    y[i] = tmp[i] + 1
+
+
+def square(item: Item, y):
+    i = item.get_id(0)
+    y[i] = y[i] * y[i]
+
+
+@pytest.mark.parametrize("inline_threshold", [0, 3])
+def test_fuse_range_kernels(inline_threshold):
+    """Tests that the stages of a fused kernel run in order for every
+    work-item, with parameters of the same name passed the same array."""
+    with pytest.warns(UserWarning):
+        fused = dpex.fuse(
+            scale, shift, square, inline_threshold=inline_threshold
+        )
+    x = dpnp.arange(_SIZE, dtype=dpnp.float32)
+    tmp = dpnp.zeros(_SIZE, dtype=dpnp.float32)
+    y = dpnp.zeros(_SIZE, dtype=dpnp.float32)
+
+    dpex.call_kernel(fused, Range(_SIZE), x, tmp, y)
+
+    expected = 2 * np.arange(_SIZE, dtype=np.float32) + 1
+    np.testing.assert_equal(dpnp.asnumpy(tmp), expected - 1)
+    np.testing.assert_equal(dpnp.asnumpy(y), expected * expected)
+
+
+def load_local(nd_item: NdItem, x, slm):
+    slm[nd_item.get_local_id(0)] = x[nd_item.get_global_id(0)]
+
+
+def reverse_local(nd_item: NdItem, slm, y):
+    n = nd_item.get_local_range(0)
+    y[nd_item.get_global_id(0)] = slm[n - 1 - nd_item.get_local_id(0)]
+
+
+def test_fuse_with_barrier():
+    """Tests that the barrier between the stages makes the local memory
+    stores of one stage visible to the other work-items of the work-group."""
+    fused = dpex.fuse(
+        load_local, reverse_local, barrier=True, arg_map=[(0, 1), (1, 2)]
+    )
+    x = dpnp.arange(_SIZE, dtype=dpnp.int64)
+    y = dpnp.zeros(_SIZE, dtype=dpnp.int64)
+    slm = LocalAccessor(_GROUP_SIZE, dtype=np.int64)
+
+    dpex.call_kernel(fused, NdRange((_SIZE,), (_GROUP_SIZE,)), x, slm, y)
+
+    expected = np.arange(_SIZE).reshape(-1, _GROUP_SIZE)[:, ::-1].reshape(-1)
+    np.testing.assert_equal(dpnp.asnumpy(y), expected)
+
+
+def add(item: Item, a, b, c):
+    i = item.get_id(0)
+    c[i] = a[i] + b[i]
+
+
+def test_fuse_with_arg_map():
+    """Tests that arg_map passes different arrays to parameters of the same
+    name, and one array to parameters of different names."""
+    fused = dpex.fuse(add, add, shift, arg_map=[(0, 1, 2), (2, 0, 3), (3, 4)])
+    a = dpnp.arange(_SIZE, dtype=dpnp.float32)
+    b = dpnp.ones(_SIZE, dtype=dpnp.float32)
+    c = dpnp.zeros(_SIZE, dtype=dpnp.float32)
+    d = dpnp.zeros(_SIZE, dtype=dpnp.float32)
+    e = dpnp.zeros(_SIZE, dtype=dpnp.float32)
+
+    dpex.call_kernel(fused, Range(_SIZE), a, b, c, d, e)
+
+    a_np = np.arange(_SIZE, dtype=np.float32)
+    np.testing.assert_equal(dpnp.asnumpy(c), a_np + 1)
+    np.testing.assert_equal(dpnp.asnumpy(d), 2 * a_np + 1)
+    np.testing.assert_equal(dpnp.asnumpy(e), 2 * a_np + 2)
+
+
+@pytest.mark.parametrize(
+    "arg_map", [[(0, 1)], [(0, 1), (1,)], [(0, 1), (1, -1)]]
+)
+def test_fuse_invalid_arg_map(arg_map):
+    with pytest.raises(ValueError):
+        dpex.fuse(scale, shift, arg_map=arg_map)
+
+
+def default_param(item: Item, x, value=1):
+    x[item.get_id(0)] = value
+
+
+def shadowing_param(it: Item, item):
+    item[it.get_id(0)] = 0
+
+
+@pytest.mark.parametrize(
+    "kernels, error",
+    [
+        ((), ValueError),
+        ((scale, default_param), ValueError),
+        ((scale, shadowing_param), ValueError),
+        ((scale, kapi.Range(1)), TypeError),
+    ],
+)
+def test_fuse_invalid_kernels(kernels, error):
+    with pytest.raises(error):
+        dpex.fuse(*kernels)
@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests the atomic updates privatized into local memory and the
+compare-exchange loops of the floating point atomic operations in compiled
+kernels and in the kernel_api simulator."""
+
+import dpnp
+import numpy as np
+import pytest
+from numba.core.errors import TypingError
+
+import numba_dpex as dpex
+from numba_dpex import kernel_api as kapi
+from numba_dpex.kernel_api import (
+    AddressSpace,
+    AtomicRef,
+    LocalAccessor,
+    NdItem,
+    NdRange,
+    Range,
+)
+from numba_dpex.kernel_api import call_kernel as kapi_call_kernel
+from numba_dpex.tests._helper import has_cpu, override_config
+
+_SIZE = 256
+_GROUP_SIZE = 32
+_NUM_BINS = 8
+
+
+_kernel_decorators = [(dpex.call_kernel, dpex.kernel)]
+# run simulator tests only with arrays allocated on cpu to avoid performance
+# issues
+if has_cpu():
+    _kernel_decorators.append((kapi_call_kernel, lambda a: a))
+
+
+@pytest.fixture(params=_kernel_decorators)
+def call_kernel_decorator(request):
+    return request.param
+
+
+def histogram(nd_item: NdItem, a, hist, local_hist):
+    kapi.privatize_atomics(nd_item, local_hist)
+    bin_ref = AtomicRef(
+        local_hist,
+        a[nd_item.get_global_id(0)],
+        address_space=AddressSpace.LOCAL,
+    )
+    bin_ref.fetch_add(1)
+    kapi.flush_atomics(nd_item, local_hist, hist)
+
+
+def test_privatized_histogram(call_kernel_decorator):
+    call_kernel, decorator = call_kernel_decorator
+    a = dpnp.arange(_SIZE, dtype=dpnp.int32) % _NUM_BINS
+    hist = dpnp.zeros(_NUM_BINS, dtype=dpnp.int32)
+    local_hist = LocalAccessor(_NUM_BINS, dtype=np.int32)
+
+    call_kernel(
+        decorator(histogram),
+        NdRange((_SIZE,), (_GROUP_SIZE,)),
+        a,
+        hist,
+        local_hist,
+    )
+
+    np.testing.assert_equal(
+        dpnp.asnumpy(hist),
+        np.full(_NUM_BINS, _SIZE // _NUM_BINS, dtype=np.int32),
+    )
+
+
+def group_max(nd_item: NdItem, a, result, local_max):
+    kapi.privatize_atomics(nd_item, local_max, "max")
+    AtomicRef(local_max, 0, address_space=AddressSpace.LOCAL).fetch_max(
+        a[nd_item.get_global_id(0)]
+    )
+    kapi.flush_atomics(nd_item, local_max, result, "max")
+
+
+def test_privatized_max(call_kernel_decorator):
+    call_kernel, decorator = call_kernel_decorator
+    a = dpnp.asarray(np.random.uniform(-1, 1, _SIZE).astype(np.float32))
+    result = dpnp.full(1, -np.inf, dtype=dpnp.float32)
+    local_max = LocalAccessor(1, dtype=np.float32)
+
+    call_kernel(
+        decorator(group_max),
+        NdRange((_SIZE,), (_GROUP_SIZE,)),
+        a,
+        result,
+        local_max,
+    )
+
+    np.testing.assert_equal(dpnp.asnumpy(result)[0], dpnp.asnumpy(a).max())
+
+
+def privatized_xor(nd_item: NdItem, a, result, local_result):
+    kapi.privatize_atomics(nd_item, local_result, "xor")
+    kapi.flush_atomics(nd_item, local_result, result, "xor")
+
+
+def test_privatized_bitwise_operation_typing_error():
+    """A negative test that verifies that a TypingError is raised for a
+    bitwise operation on a floating point array."""
+    a = dpnp.zeros(_SIZE, dtype=dpnp.float32)
+    result = dpnp.zeros(1, dtype=dpnp.float32)
+    local_result = LocalAccessor(1, dtype=np.float32)
+
+    with pytest.raises(TypingError):
+        dpex.call_kernel(
+            dpex.kernel(privatized_xor),
+            NdRange((_SIZE,), (_GROUP_SIZE,)),
+            a,
+            result,
+            local_result,
+        )
+
+
+def atomic_sum(item: kapi.Item, a, total):
+    AtomicRef(total, 0).fetch_add(a[item.get_id(0)])
+
+
+@pytest.mark.parametrize("dtype", [dpnp.float32, dpnp.float64])
+def test_fetch_add_compare_exchange_loop(dtype):
+    a = dpnp.ones(_SIZE, dtype=dtype)
+    total = dpnp.zeros(1, dtype=dtype)
+    if dtype == dpnp.float64 and not total.sycl_device.has_aspect_atomic64:
+        pytest.skip("Device does not support 64-bit atomic operations.")
+
+    with override_config("NATIVE_FP_ATOMICS", 0):
+        dpex.call_kernel(dpex.kernel(atomic_sum), Range(_SIZE), a, total)
+
+    assert dpnp.asnumpy(total)[0] == _SIZE
@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy
+import pytest
+
+import numba_dpex as dpex
+from numba_dpex import kernel_api as kapi
+
+N = 1000
+CHUNK = 128
+
+
+@dpex.kernel
+def square_kernel(item: kapi.Item, src, dst):
+    i = item.get_id(0)
+    dst[i] = src[i] * src[i]
+
+
+@dpex.kernel
+def increment_kernel(item: kapi.Item, x, val):
+    i = item.get_id(0)
+    x[i] += val
+
+
+@pytest.mark.parametrize("num_buffers", [1, 2, 3])
+def test_stream_map_out(num_buffers):
+    """Checks streaming a NumPy array, including a partial last chunk, into an
+    output array."""
+    a = numpy.arange(N, dtype=numpy.float32)
+    out = numpy.zeros_like(a)
+
+    res = dpex.stream_map(
+        square_kernel, a, CHUNK, out=out, num_buffers=num_buffers
+    )
+
+    assert res is out
+    assert numpy.allclose(out, a * a)
+
+
+def test_stream_map_inplace_with_args():
+    """Checks that in-place results are written back into the source and that
+    extra scalar arguments are passed to the kernel."""
+    a = numpy.arange(N, dtype=numpy.int64)
+    expected = a + 3
+
+    dpex.stream_map(increment_kernel, a, CHUNK, args=(3,))
+
+    assert numpy.all(a == expected)
+
+
+def test_stream_map_iterator_source():
+    """Checks streaming blocks produced by a generator."""
+    a = numpy.arange(N, dtype=numpy.float32)
+    out = numpy.zeros_like(a)
+
+    def blocks():
+        for start in range(0, N, 100):
+            yield a[start : start + 100]  # noqa: E203
+
+    dpex.stream_map(square_kernel, blocks(), CHUNK, out=out)
+
+    assert numpy.allclose(out, a * a)
+
+
+def test_stream_map_memmap(tmp_path):
+    """Checks streaming from a read-only memory mapped file."""
+    fname = tmp_path / "data.bin"
+    a = numpy.arange(N, dtype=numpy.float32)
+    a.tofile(fname)
+    data = numpy.memmap(fname, dtype=numpy.float32, mode="r")
+    out = numpy.zeros_like(a)
+
+    dpex.stream_map(square_kernel, data, CHUNK, out=out, num_buffers=3)
+
+    assert numpy.allclose(out, a * a)
+
+
+def test_stream_map_rejects_oversized_blocks():
+    a = numpy.arange(N, dtype=numpy.float32)
+
+    with pytest.raises(ValueError):
+        dpex.stream_map(square_kernel, iter([a]), CHUNK, out=a.copy())
+
+
+def test_stream_map_rejects_out_of_wrong_size():
+    a = numpy.arange(N, dtype=numpy.float32)
+
+    with pytest.raises(ValueError):
+        dpex.stream_map(square_kernel, a, CHUNK, out=numpy.zeros(N - 1))
+
+
+def test_stream_map_rejects_mismatching_blocks():
+    """Checks that a block with another dtype raises once the chunks before
+    it are in flight, after the pending chunks were waited for."""
+    a = numpy.arange(N, dtype=numpy.float32)
+    out = numpy.zeros_like(a)
+    blocks = [
+        a[:CHUNK],
+        a[CHUNK : 2 * CHUNK],  # noqa: E203
+        a[:CHUNK].astype(numpy.int64),
+    ]
+
+    with pytest.raises(ValueError):
+        dpex.stream_map(square_kernel, iter(blocks), CHUNK, out=out)
@@ -0,0 +1,133 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests the sub-group methods of NdItem in compiled kernels and in the
+kernel_api simulator.
+
+The size of a sub-group is chosen by the device, so the kernels only write
+results that do not depend on it.
+"""
+
+import dpnp
+import numpy as np
+import pytest
+
+import numba_dpex as dpex
+from numba_dpex.kernel_api import NdItem, NdRange
+from numba_dpex.kernel_api import call_kernel as kapi_call_kernel
+from numba_dpex.tests._helper import has_cpu
+
+_SIZE = 64
+_GROUP_SIZE = 32
+
+
+_kernel_decorators = [(dpex.call_kernel, dpex.kernel)]
+# run simulator tests only with arrays allocated on cpu to avoid performance
+# issues
+if has_cpu():
+    _kernel_decorators.append((kapi_call_kernel, lambda a: a))
+
+
+@pytest.fixture(params=_kernel_decorators)
+def call_kernel_decorator(request):
+    return request.param
+
+
+def sub_group_ids(nd_item: NdItem, a):
+    i = nd_item.get_global_id(0)
+    sg = nd_item.get_sub_group()
+    if (
+        sg.get_local_id() < sg.get_local_range()
+        and sg.get_local_range() <= sg.get_max_local_range()
+        and sg.get_group_id() < sg.get_group_range()
+    ):
+        a[i] = 1
+
+
+def sub_group_reduce(nd_item: NdItem, a):
+    i = nd_item.get_global_id(0)
+    sg = nd_item.get_sub_group()
+    a[i] = sg.reduce(1, "add") - sg.get_local_range()
+
+
+def sub_group_scan(nd_item: NdItem, a):
+    i = nd_item.get_global_id(0)
+    sg = nd_item.get_sub_group()
+    inclusive = sg.scan(1, "add")
+    exclusive = sg.scan(1, "add", True)
+    a[i] = (inclusive - 1 - sg.get_local_id()) + (exclusive - sg.get_local_id())
+
+
+def sub_group_shuffle(nd_item: NdItem, a):
+    i = nd_item.get_global_id(0)
+    sg = nd_item.get_sub_group()
+    a[i] = (sg.shuffle(i, sg.get_local_id()) - i) + (sg.shuffle_xor(i, 0) - i)
+
+
+def sub_group_shuffle_down_up(nd_item: NdItem, a):
+    i = nd_item.get_global_id(0)
+    sg = nd_item.get_sub_group()
+    down = sg.shuffle_down(i, 1)
+    up = sg.shuffle_up(i, 1)
+    lid = sg.get_local_id()
+    if lid + 1 < sg.get_local_range():
+        a[i] += down - i - 1
+    if lid > 0:
+        a[i] += up - i + 1
+
+
+def sub_group_broadcast(nd_item: NdItem, a):
+    i = nd_item.get_global_id(0)
+    sg = nd_item.get_sub_group()
+    a[i] = i - sg.get_local_id() - sg.broadcast(i, 0)
+
+
+def sub_group_vote(nd_item: NdItem, a):
+    i = nd_item.get_global_id(0)
+    sg = nd_item.get_sub_group()
+    if sg.all(i >= 0) and not sg.any(i < 0):
+        a[i] = 1
+
+
+@pytest.mark.parametrize(
+    "kernel_func, expected",
+    [
+        (sub_group_ids, 1),
+        (sub_group_reduce, 0),
+        (sub_group_scan, 0),
+        (sub_group_shuffle, 0),
+        (sub_group_shuffle_down_up, 0),
+        (sub_group_broadcast, 0),
+        (sub_group_vote, 1),
+    ],
+)
+def test_sub_group(call_kernel_decorator, kernel_func, expected):
+    call_kernel, decorator = call_kernel_decorator
+    a = dpnp.zeros(_SIZE, dtype=dpnp.int64)
+
+    call_kernel(decorator(kernel_func), NdRange((_SIZE,), (_GROUP_SIZE,)), a)
+
+    assert np.array_equal(dpnp.asnumpy(a), np.full(_SIZE, expected))
+
+
+def test_simulator_sub_group_scan_identity():
+    """Tests the identities returned by the exclusive scan of the simulator,
+    where every work-item forms a sub-group of size one."""
+    a = np.zeros(4, dtype=np.float64)
+    b = np.zeros(3, dtype=np.int32)
+
+    def kernel(nd_item: NdItem, a, b):
+        sg = nd_item.get_sub_group()
+        a[0] = sg.scan(a[0], "min", True)
+        a[1] = sg.scan(a[1], "max", True)
+        a[2] = sg.scan(a[2], "mul", True)
+        a[3] = sg.scan(a[3], "add", True)
+        b[0] = sg.scan(b[0], "min", True)
+        b[1] = sg.scan(b[1], "and", True)
+        b[2] = sg.scan(b[2], "xor", True)
+
+    kapi_call_kernel(kernel, NdRange((1,), (1,)), a, b)
+
+    assert np.array_equal(a, [np.inf, -np.inf, 1, 0])
+    assert np.array_equal(b, [np.iinfo(np.int32).max, -1, 0])
@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: 2024 Intel Corporation
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests the vector type and the vector loads and stores in compiled kernels
+and in the kernel_api simulator."""
+
+import dpnp
+import numpy as np
+import pytest
+
+import numba_dpex as dpex
+from numba_dpex import kernel_api as kapi
+from numba_dpex.kernel_api import Item, LocalAccessor, NdItem, NdRange, Range
+from numba_dpex.kernel_api import call_kernel as kapi_call_kernel
+from numba_dpex.tests._helper import has_cpu
+
+_SIZE = 64
+
+
+_kernel_decorators = [(dpex.call_kernel, dpex.kernel)]
+# run simulator tests only with arrays allocated on cpu to avoid performance
+# issues
+if has_cpu():
+    _kernel_decorators.append((kapi_call_kernel, lambda a: a))
+
+
+@pytest.fixture(params=_kernel_decorators)
+def call_kernel_decorator(request):
+    return request.param
+
+
+def triad(item: Item, a, b, c, s):
+    i = item.get_id(0) * 4
+    kapi.store_vec(a, i, kapi.load_vec(b, i, 4) + s * kapi.load_vec(c, i, 4))
+
+
+@pytest.mark.parametrize("dtype", [dpnp.float32, dpnp.float64, dpnp.int32])
+def test_vec_triad(call_kernel_decorator, dtype):
+    call_kernel, decorator = call_kernel_decorator
+    a = dpnp.zeros(_SIZE, dtype=dtype)
+    b = dpnp.arange(_SIZE, dtype=dtype)
+    c = dpnp.ones(_SIZE, dtype=dtype)
+
+    call_kernel(decorator(triad), Range(_SIZE // 4), a, b, c, 3)
+
+    np.testing.assert_equal(dpnp.asnumpy(a), np.arange(_SIZE) + 3)
+
+
+def vec_arithmetic(item: Item, a, b):
+    i = item.get_id(0) * 2
+    v = kapi.load_vec(a, i, 2)
+    w = kapi.vec(dpnp.float32, 2, 2.0)
+    w -= v
+    w = (w * v + 1) / 2
+    b[i] = w[0]
+    b[i + 1] = w[1]
+
+
+def test_vec_arithmetic(call_kernel_decorator):
+    call_kernel, decorator = call_kernel_decorator
+    a = dpnp.arange(_SIZE, dtype=dpnp.float32)
+    b = dpnp.zeros(_SIZE, dtype=dpnp.float32)
+
+    call_kernel(decorator(vec_arithmetic), Range(_SIZE // 2), a, b)
+
+    a_np = np.arange(_SIZE, dtype=np.float32)
+    np.testing.assert_allclose(dpnp.asnumpy(b), ((2 - a_np) * a_np + 1) / 2)
+
+
+def reverse_through_local(nd_item: NdItem, a, b, slm):
+    lid = nd_item.get_local_id(0)
+    gid = nd_item.get_global_id(0)
+    n = nd_item.get_local_range(0)
+    kapi.store_vec(slm, lid * 8, kapi.load_vec(a, gid * 8, 8))
+    kapi.group_barrier(nd_item.get_group())
+
+    v = kapi.load_vec(slm, (n - 1 - lid) * 8, 8)
+    kapi.store_vec(b, gid * 8, v)
+
+
+def test_vec_local_memory():
+    group_size = 4
+    a = dpnp.arange(_SIZE, dtype=dpnp.int64)
+    b = dpnp.zeros(_SIZE, dtype=dpnp.int64)
+    slm = LocalAccessor(group_size * 8, dtype=np.int64)
+
+    dpex.call_kernel(
+        dpex.kernel(reverse_through_local),
+        NdRange((_SIZE // 8,), (group_size,)),
+        a,
+        b,
+        slm,
+    )
+
+    expected = np.arange(_SIZE).reshape(-1, group_size, 8)[:, ::-1, :]
+    np.testing.assert_equal(dpnp.asnumpy(b), expected.reshape(-1))
+
+
+def test_vec_unsupported_size():
+    with pytest.raises(ValueError):
+        kapi.vec(np.float32, 3)
+
+
+def test_vec_integer_division():
+    with pytest.raises(TypeError):
+        kapi.vec(np.int32, 4, 1) / 2
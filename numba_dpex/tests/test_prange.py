@@ -9,6 +9,7 @@ import dpnp
 import numpy as np
 import pytest
 from numba import njit
+from numba.core import errors
 
 from numba_dpex import dpjit, prange
 
@@ -231,3 +232,95 @@ def test_two_consecutive_prange_2d():
 
     np.testing.assert_equal(c.asnumpy(), np.ones((n, n), dtype=np.int32) * 2)
     np.testing.assert_equal(d.asnumpy(), np.zeros((n, n), dtype=np.int32))
+
+
+@pytest.mark.parametrize(
+    "start, stop, step",
+    [(0, 10, 2), (3, 10, 1), (1, 10, 3), (9, -1, -1), (9, 0, -4), (5, 5, 2)],
+)
+def test_prange_step(start, stop, step):
+    @dpjit
+    def f(a, start, stop, step):
+        for i in prange(start, stop, step):
+            a[i] = i * 2
+        return
+
+    n = 10
+    a = dpnp.zeros(n, dtype=dpnp.int64)
+    f(a, start, stop, step)
+
+    expected = np.zeros(n, dtype=np.int64)
+    for i in range(start, stop, step):
+        expected[i] = i * 2
+    np.testing.assert_equal(a.asnumpy(), expected)
+
+
+def test_prange_constant_step():
+    @dpjit
+    def f(a):
+        for i in prange(1, a.shape[0], 2):
+            a[i] = -a[i]
+        return
+
+    a = dpnp.arange(11, dtype=dpnp.float32)
+    f(a)
+
+    expected = np.arange(11, dtype=np.float32)
+    expected[1::2] *= -1
+    np.testing.assert_equal(a.asnumpy(), expected)
+
+
+@pytest.mark.parametrize("step", [2, 7, -3])
+def test_prange_step_reduction(step):
+    @dpjit
+    def f(a, step):
+        s = 0
+        start = 0 if step > 0 else a.shape[0] - 1
+        stop = a.shape[0] if step > 0 else -1
+        for i in prange(start, stop, step):
+            s += a[i]
+        return s
+
+    a_np = np.arange(1000, dtype=np.int64)
+    a = dpnp.asarray(a_np)
+
+    if step > 0:
+        expected = a_np[::step].sum()
+    else:
+        expected = a_np[::-1][::-step].sum()
+    assert f(a, step) == expected
+
+
+def test_prange_zero_step():
+    @dpjit
+    def f(a):
+        for i in prange(0, a.shape[0], 0):
+            a[i] = 1
+        return
+
+    a = dpnp.zeros(4)
+    with pytest.raises(errors.UnsupportedRewriteError):
+        f(a)
+
+
+@pytest.mark.parametrize("reduction", [False, True])
+def test_prange_runtime_zero_step(reduction):
+    @dpjit
+    def f(a, step):
+        for i in prange(0, a.shape[0], step):
+            a[i] = 1
+        return
+
+    @dpjit
+    def g(a, step):
+        s = 0
+        for i in prange(0, a.shape[0], step):
+            s += a[i]
+        return s
+
+    a = dpnp.zeros(4)
+    with pytest.raises(ValueError, match="range\\(\\) arg 3 must not be zero"):
+        if reduction:
+            g(a, 0)
+        else:
+            f(a, 0)